@@ -0,0 +1,115 @@
+"""Benchmark batch uploads against uploading the same documents one by one.
+
+The sequential baseline parses each document inline on the event loop, as
+single uploads did before extraction moved to the process pool.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_batch_upload.py
+"""
+
+import io
+import time
+import asyncio
+import zipfile
+import tempfile
+from pathlib import Path
+
+from docx import Document
+from fastapi import UploadFile
+
+from utils.document_extractor import (
+    extract_document_text_sync,
+    shutdown_extraction_pool,
+)
+from job_analyzer.document_storage import document_manager
+
+DOCUMENTS = 64
+PARAGRAPHS = 400
+
+
+def make_docx(index: int) -> bytes:
+    """Build a distinct resume-like DOCX in memory."""
+    doc = Document()
+    doc.add_heading(f"Candidate {index}", level=1)
+    for i in range(PARAGRAPHS):
+        doc.add_paragraph(
+            f"Candidate {index} led project {i}: migrated services to Python, "
+            f"cut latency by {i % 50}% and mentored {i % 7} engineers."
+        )
+    table = doc.add_table(rows=20, cols=3)
+    for r, row in enumerate(table.rows):
+        for c, cell in enumerate(row.cells):
+            cell.text = f"skill {index}-{r}-{c}"
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def reset_store() -> None:
+    document_manager._document_store.clear()
+    document_manager._hash_index.clear()
+
+
+async def run_sequential(files: list[tuple[str, bytes]]) -> float:
+    """Upload files one at a time with inline extraction."""
+    reset_store()
+    pooled = document_manager.extract_document_text_in_pool
+
+    async def extract_inline(file_path, file_format=None) -> str:
+        return extract_document_text_sync(file_path, file_format)
+
+    document_manager.extract_document_text_in_pool = extract_inline
+    try:
+        started = time.perf_counter()
+        for name, contents in files:
+            await document_manager.save_uploaded_document(
+                UploadFile(file=io.BytesIO(contents), filename=name), summarize=False
+            )
+        return time.perf_counter() - started
+    finally:
+        document_manager.extract_document_text_in_pool = pooled
+
+
+async def run_batch(files: list[tuple[str, bytes]]) -> float:
+    """Upload the files as a single zip archive."""
+    reset_store()
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, contents in files:
+            zf.writestr(name, contents)
+    archive.seek(0)
+
+    started = time.perf_counter()
+    results = await document_manager.save_uploaded_documents_batch(
+        [UploadFile(file=archive, filename="batch.zip")], summarize=False
+    )
+    elapsed = time.perf_counter() - started
+
+    assert all(r.status == "created" for r in results), results
+    return elapsed
+
+
+async def main() -> None:
+    files = [(f"resume_{i}.docx", make_docx(i)) for i in range(DOCUMENTS)]
+    size_mb = sum(len(c) for _, c in files) / 1024 / 1024
+
+    with tempfile.TemporaryDirectory() as tmp:
+        document_manager.get_app_path = lambda: Path(tmp)
+        document_manager.get_extraction_cache = lambda: None
+
+        # Warm the pool so worker start-up is not billed to the first run
+        await run_batch(files[:4])
+
+        sequential = await run_sequential(files)
+        batch = await run_batch(files)
+
+    shutdown_extraction_pool()
+
+    print(f"{DOCUMENTS} DOCX files, {size_mb:.1f} MB total")
+    print(f"sequential uploads: {sequential * 1000:8.1f} ms")
+    print(f"batch (zip) upload: {batch * 1000:8.1f} ms  ({sequential / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
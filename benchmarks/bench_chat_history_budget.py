@@ -0,0 +1,99 @@
+"""Measure the tokens sent per chat message with and without the history budget.
+
+Simulates a 30-message conversation where each answer runs one tool that
+returns about 1500 tokens (a search result page) and the first message
+injects a resume. Before, the whole history (every tool result included)
+was sent with every message, so each call grew until it overflowed the
+context window. The budgeted history cuts consumed tool results and drops
+the oldest turns once it reaches its budget. The summary of dropped turns is
+replaced by a fixed 300-token stub, as no model runs here.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_chat_history_budget.py
+"""
+
+import time
+import asyncio
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from llm import chat_history as chat_history_module
+from llm.chat_history import ChatHistory, message_tokens
+from utils.app_config import AppConfig
+from utils.token_counter import count_tokens
+
+TURNS = 30
+CONTEXT_WINDOW = 16_000
+MAX_TOKENS = 2_000
+SYSTEM_PROMPT = "You are a helpful career assistant."
+RESUME = Path("tests/test_files/test_resume.txt").read_text()
+TOOL_OUTPUT = " ".join(f"result{i} company role salary" for i in range(300))
+
+
+class StubInference:
+    async def chat(self, messages):
+        return "summary " * 300
+
+
+def answer(turn: int) -> list:
+    tool_id = f"call_{turn}"
+    return [
+        AIMessage(
+            content="",
+            tool_calls=[{"id": tool_id, "name": "search", "args": {"q": f"q{turn}"}}],
+        ),
+        ToolMessage(tool_call_id=tool_id, content=TOOL_OUTPUT),
+        AIMessage(content=f"Here is what I found for question {turn}. " * 5),
+    ]
+
+
+def question(turn: int) -> str:
+    text = f"Question {turn} about salaries and openings?"
+    return f"[RESUME CONTENT]\n{RESUME}\n[END RESUME]\n\n{text}" if turn == 0 else text
+
+
+async def main() -> None:
+    chat_history_module.Inference = StubInference
+    app_config = AppConfig()
+    model = app_config.inference.active_config()
+    model.context_window, model.max_tokens = CONTEXT_WINDOW, MAX_TOKENS
+    budget = ChatHistory.budget(app_config)
+
+    unbounded = [SystemMessage(content=SYSTEM_PROMPT)]
+    chat = ChatHistory.from_config(SYSTEM_PROMPT, app_config)
+    sent_unbounded, sent_budgeted, overhead = [], [], 0.0
+
+    for turn in range(TURNS):
+        unbounded.append(HumanMessage(content=question(turn)))
+        sent_unbounded.append(sum(message_tokens(m) for m in unbounded))
+        unbounded.extend(answer(turn))
+
+        started = time.perf_counter()
+        chat.add_user_message(question(turn), ["resume"] if turn == 0 else ())
+        chat.compact()
+        sent_budgeted.append(chat.token_count)
+        chat.add_messages(answer(turn))
+        chat.compact()
+        overhead += time.perf_counter() - started
+        await asyncio.sleep(0)  # let the background summary run
+
+    print(f"history budget {budget} tokens, model context window {CONTEXT_WINDOW}")
+    print(f"{'message':>8}{'unbounded':>11}{'budgeted':>10}")
+    for turn in (0, 4, 9, 19, 29):
+        print(f"{turn + 1:>8}{sent_unbounded[turn]:>11}{sent_budgeted[turn]:>10}")
+    over = sum(tokens > CONTEXT_WINDOW - MAX_TOKENS for tokens in sent_unbounded)
+    print(
+        f"{'total':>8}{sum(sent_unbounded):>11}{sum(sent_budgeted):>10}"
+        f"   ({over} unbounded calls overflow the window)"
+    )
+    print(
+        f"history upkeep {overhead * 1000 / TURNS:.2f} ms per message, "
+        f"{chat.summarized_turns} turns summarized "
+        f"(summary {count_tokens(chat.summary)} tokens)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
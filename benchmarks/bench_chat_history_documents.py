@@ -0,0 +1,73 @@
+"""Measure chat history growth when documents are referenced on every message.
+
+Simulates a client that sends resume_id and jd_id with every WebSocket
+message. Before, each message carried the document context again; now each
+document (or each retrieved chunk) enters the history once. Reports the
+history size after each turn and the total document tokens re-sent to the
+LLM across the conversation (every call sends the whole history).
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_chat_history_documents.py
+"""
+
+import asyncio
+from pathlib import Path
+
+from llm.embedding import HashingEmbedder
+from utils.app_config import RetrievalConfig
+from utils.token_counter import count_tokens
+from utils.document_extractor import extract_document_text_sync
+from job_analyzer.retrieval import retriever as retriever_module
+from job_analyzer.retrieval.index import EmbeddingIndex
+from job_analyzer.retrieval.retriever import (
+    DocumentRetriever,
+    retrieve_new_document_context,
+)
+
+from bench_retrieval_context import TURNS, make_document, long_job_description
+
+RESUME_FIXTURE = Path("tests/test_files/test_resume.txt")
+# Each question asked twice, as users tend to follow up on the same topic
+CONVERSATION = [turn for turn in TURNS for _ in range(2)]
+
+
+async def history_tokens(documents, new_only: bool) -> list[int]:
+    retriever = retriever_module.get_document_retriever()
+    sent: dict[str, set[int]] = {d.id: set() for d in documents}
+    history, sizes = 0, []
+
+    for message in CONVERSATION:
+        for document in documents:
+            if new_only:
+                context = await retrieve_new_document_context(
+                    message, document, sent[document.id]
+                )
+            else:
+                context = await retriever.document_context(message, document)
+            history += count_tokens(context or f"[{document.id}, provided above]")
+        history += count_tokens(message)
+        sizes.append(history)
+
+    return sizes
+
+
+async def main() -> None:
+    retriever_module._document_retriever = DocumentRetriever(
+        HashingEmbedder(), EmbeddingIndex(), RetrievalConfig(full_text_max_tokens=400)
+    )
+    documents = [
+        make_document("resume", "resume", extract_document_text_sync(RESUME_FIXTURE)),
+        make_document("jd", "job_description", long_job_description()),
+    ]
+
+    for label, new_only in (("every message", False), ("once", True)):
+        sizes = await history_tokens(documents, new_only)
+        print(
+            f"documents attached {label:>13}: history after each turn "
+            f"{sizes}, {sum(sizes)} tokens sent over {len(sizes)} calls"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""Benchmark the streaming DOCX extractor against the python-docx object model.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_docx_extractor.py
+"""
+
+import os
+import time
+import struct
+import zlib
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from docx import Document
+from docx.shared import Inches
+
+from utils.docx_extractor import extract_text_from_docx
+
+FIXTURES = [Path("tests/test_files/test_resume.docx")]
+
+
+def extract_text_with_python_docx(docx_path: Path) -> str:
+    """Previous implementation: paragraphs first, then all tables."""
+    doc = Document(str(docx_path))
+    text_chunks = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
+    for table in doc.tables:
+        for row in table.rows:
+            row_text = " | ".join(
+                cell.text.strip() for cell in row.cells if cell.text.strip()
+            )
+            if row_text:
+                text_chunks.append(row_text)
+    return "\n\n".join(text_chunks).strip()
+
+
+def _noise_png(path: Path, size: int = 1024) -> None:
+    """Write an incompressible RGB PNG so the image part is realistically large."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+        )
+
+    raw = b"".join(b"\x00" + os.urandom(size * 3) for _ in range(size))
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+def build_synthetic_docx(path: Path, sections: int = 400, images: int = 8) -> None:
+    """Build a large DOCX with interleaved paragraphs, tables and images."""
+    image_path = path.with_suffix(".png")
+    _noise_png(image_path)
+
+    doc = Document()
+    for i in range(sections):
+        doc.add_heading(f"Section {i}", level=2)
+        for j in range(10):
+            doc.add_paragraph(
+                f"Paragraph {j} of section {i}: delivered measurable results "
+                "across Python, FastAPI, PostgreSQL and Kubernetes projects."
+            )
+        table = doc.add_table(rows=4, cols=3)
+        for r, row in enumerate(table.rows):
+            for c, cell in enumerate(row.cells):
+                cell.text = f"r{r}c{c} s{i}"
+        if i % max(1, sections // images) == 0:
+            doc.add_picture(str(image_path), width=Inches(2))
+    doc.save(str(path))
+    image_path.unlink()
+
+
+def measure(func: Callable[[Path], str], path: Path, repeat: int = 3):
+    """Return best wall time, peak traced memory and output length."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = func(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, len(text)
+
+
+def report(label: str, path: Path) -> None:
+    print(f"\n{label}: {path.name} ({path.stat().st_size / 1024:.0f} KiB)")
+    for name, func in (
+        ("python-docx", extract_text_with_python_docx),
+        ("streaming", extract_text_from_docx),
+    ):
+        seconds, peak, length = measure(func, path)
+        print(
+            f"  {name:<12} {seconds * 1000:9.1f} ms  "
+            f"peak {peak / 1024 / 1024:7.2f} MiB  {length} chars"
+        )
+
+
+if __name__ == "__main__":
+    for fixture in FIXTURES:
+        report("fixture", fixture)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        synthetic = Path(temp_dir) / "synthetic.docx"
+        build_synthetic_docx(synthetic)
+        report("synthetic", synthetic)
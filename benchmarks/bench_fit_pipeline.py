@@ -0,0 +1,198 @@
+"""Compare single-prompt fit scoring with the two-stage pipeline.
+
+Before, the fit score prompt was sent the raw resume and JD text and had the
+model parse both. The pipeline extracts the JD and resume concurrently,
+keeps the extractions on the stored documents and sends only their compact
+JSON to the scoring prompt. The local engine applies the scoring rules to the
+extractions without the scoring prompt.
+
+Scores 10 resumes (variants of the resume fixture) against each of 3 job
+descriptions, as when a candidate pool is matched against several openings. The LLM is a stub that records prompts and sleeps for a
+modelled latency: 300 ms per call, 0.2 ms per prompt token (prefill) and
+5 ms per output token. Token counts are real, latencies are not.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_fit_pipeline.py
+"""
+
+import json
+import time
+import asyncio
+from pathlib import Path
+
+from utils.token_counter import count_tokens
+from job_analyzer.analysis import fit_pipeline
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.external_api import llm_analysis
+from utils.app_config import AppConfig
+
+FIXTURES = Path("tests/test_files")
+CANDIDATES = 10
+JOBS = 3
+
+BASE_LATENCY = 0.3
+PREFILL_PER_TOKEN = 0.0002
+DECODE_PER_TOKEN = 0.005
+
+JOB_DESCRIPTION = """Senior Python Developer
+Northwind Payments · Berlin or Remote (EU) · Full-time
+
+About the Role
+You will join the Platform team that owns our payment APIs and the services
+behind them.
+
+Requirements
+• 5+ years of professional experience with Python
+• Experience with Django or FastAPI and PostgreSQL
+• Experience running services on AWS
+• Strong communication skills
+
+Nice to have
+• Experience with Kubernetes and Terraform
+• Background in payments
+
+Benefits
+• 30 days paid leave, learning budget, home office allowance
+"""
+
+JD_RESPONSE = {
+    "role_title": "Senior Python Developer",
+    "must_have_requirements": [
+        "5+ years of professional experience with Python",
+        "Experience with Django or FastAPI and PostgreSQL",
+        "Experience running services on AWS",
+    ],
+    "nice_to_have_requirements": ["Kubernetes", "Terraform", "Payments background"],
+    "technical_skills": ["Python", "Django", "FastAPI", "PostgreSQL", "AWS"],
+    "soft_skills": ["Communication"],
+    "experience_requirements": "5+ years",
+}
+RESUME_RESPONSE = {
+    "candidate_name": "Jane Doe",
+    "work_experience": [
+        {
+            "job_title": "Senior Software Engineer",
+            "company": "Tech Corp",
+            "duration": "2020-Present",
+        },
+        {
+            "job_title": "Software Engineer",
+            "company": "StartUp Inc",
+            "duration": "2017-2020",
+        },
+    ],
+    "technical_skills": ["Python", "Django", "PostgreSQL", "AWS", "Docker"],
+    "soft_skills": ["Leadership", "Communication"],
+    "education": [
+        {"degree": "B.S. Computer Science", "institution": "State University"}
+    ],
+}
+FIT_RESPONSE = {
+    "overall_score": 78,
+    "score_breakdown": {
+        "hard_skills": 32,
+        "experience": 24,
+        "education": 8,
+        "soft_skills": 14,
+    },
+    "deal_breakers_found": [],
+    "reasoning_trace": "Python, Django, PostgreSQL and AWS match; FastAPI missing.",
+    "final_recommendation": "Potential Fit",
+    "data_sufficiency": "High",
+}
+
+stats = {"calls": 0, "prompt_tokens": 0, "scoring_prompt_tokens": []}
+
+
+async def fake_llm(prompt: str) -> str:
+    if "<job_description>" in prompt:
+        response = json.dumps(JD_RESPONSE)
+    elif "<candidate_resume>" in prompt:
+        response = json.dumps(RESUME_RESPONSE)
+    else:
+        response = json.dumps(FIT_RESPONSE)
+        stats["scoring_prompt_tokens"].append(count_tokens(prompt))
+
+    prompt_tokens = count_tokens(prompt)
+    stats["calls"] += 1
+    stats["prompt_tokens"] += prompt_tokens
+    await asyncio.sleep(
+        BASE_LATENCY
+        + prompt_tokens * PREFILL_PER_TOKEN
+        + count_tokens(response) * DECODE_PER_TOKEN
+    )
+    return response
+
+
+def document(doc_id: str, file_type: str, text: str) -> UploadedDocument:
+    return UploadedDocument(
+        id=doc_id,
+        file_hash=doc_id,
+        original_filename=f"{doc_id}.txt",
+        file_type=file_type,
+        file_format="txt",
+        extracted_text=text,
+    )
+
+
+async def timed(coroutine) -> float:
+    started = time.perf_counter()
+    await coroutine
+    return time.perf_counter() - started
+
+
+async def run(name: str, score) -> None:
+    stats.update(calls=0, prompt_tokens=0, scoring_prompt_tokens=[])
+    resume_text = (FIXTURES / "test_resume.txt").read_text()
+    jds = [
+        document(f"jd-{j}", "job_description", f"{JOB_DESCRIPTION}\nReq. {j}")
+        for j in range(JOBS)
+    ]
+    resumes = [
+        document(f"resume-{i}", "resume", f"{resume_text}\nReference number {i}")
+        for i in range(CANDIDATES)
+    ]
+
+    latencies = [await timed(score(resume, jd)) for jd in jds for resume in resumes]
+
+    print(
+        f"{name:<16}{(stats['scoring_prompt_tokens'] or [0])[0]:>9}{stats['calls']:>7}"
+        f"{stats['prompt_tokens']:>10}{latencies[0]:>9.2f}"
+        f"{sum(latencies[1:CANDIDATES]) / (CANDIDATES - 1):>9.2f}"
+        f"{sum(latencies[CANDIDATES:]) / (len(latencies) - CANDIDATES):>9.2f}"
+        f"{sum(latencies):>9.1f}"
+    )
+
+
+async def main() -> None:
+    llm_analysis._call_llm_for_analysis = fake_llm
+    llm_analysis.get_response_cache = lambda: None
+
+    async def single_prompt(resume, jd):
+        return await llm_analysis.calculate_fit_score_api(
+            resume.analysis_text, jd.analysis_text
+        )
+
+    print(f"{CANDIDATES} resumes scored against each of {JOBS} JDs, one at a time")
+    print(
+        f"{'':<16}{'scoring':>9}{'calls':>7}{'prompt':>10}{'first':>9}"
+        f"{'1st JD':>9}{'next JDs':>9}{'total':>9}"
+    )
+    print(
+        f"{'':<16}{'tokens':>9}{'':>7}{'tokens':>10}{'s':>9}{'s/pair':>9}"
+        f"{'s/pair':>9}{'s':>9}"
+    )
+    await run("single prompt", single_prompt)
+    for engine in ("llm", "local"):
+        app_config = AppConfig.load_default().model_copy(deep=True)
+        app_config.document.scoring.engine = engine
+
+        async def two_stage(resume, jd, app_config=app_config):
+            return await fit_pipeline.score_documents(resume, jd, app_config=app_config)
+
+        await run(f"two-stage {engine}", two_stage)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
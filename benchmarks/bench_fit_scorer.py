@@ -0,0 +1,125 @@
+"""Time the local fit scorer on batches of extracted resumes.
+
+Scoring with the LLM engine costs one scoring prompt per resume (about 1000
+prompt tokens and 1.2 s with the latencies modelled in bench_fit_pipeline).
+The local engine applies the same rules to the extracted data in process.
+Resumes are variants of one extraction with a shuffled subset of skills, so
+skill normalization is cached across the batch as it is when a candidate
+pool shares most skill names.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_fit_scorer.py
+"""
+
+import time
+import random
+
+from job_analyzer.scoring import scorer
+from job_analyzer.external_api.models import (
+    Education,
+    JobDescriptionAnalysis,
+    ResumeReview,
+    WorkExperience,
+)
+
+BATCH_SIZES = (10, 100, 1000)
+REPEATS = 5
+
+JD = JobDescriptionAnalysis(
+    role_title="Senior Python Developer",
+    must_have_requirements=[
+        "5+ years of professional Python development",
+        "Production experience with PostgreSQL",
+        "Experience running services on AWS",
+    ],
+    nice_to_have_requirements=["FastAPI", "Kafka", "Kubernetes"],
+    deal_breakers=["Python"],
+    technical_skills=[
+        "Python",
+        "Django",
+        "FastAPI",
+        "PostgreSQL",
+        "AWS",
+        "Docker",
+        "Kubernetes",
+        "Kafka",
+        "Redis",
+        "CI/CD",
+    ],
+    soft_skills=["Communication", "Mentoring", "Collaboration"],
+    experience_requirements="5+ years of backend development",
+    education_requirements="Bachelor's degree in Computer Science or similar",
+    certification_requirements=["AWS Certified Developer"],
+    industry_domain="Fintech payments",
+)
+
+SKILLS = [
+    "Python 3",
+    "Django",
+    "FastAPI",
+    "Postgres",
+    "Amazon Web Services",
+    "Docker",
+    "k8s",
+    "Apache Kafka",
+    "Redis",
+    "GitHub Actions",
+    "React.js",
+    "TypeScript",
+    "Terraform",
+    "Celery",
+]
+
+
+def resume(i: int, rng: random.Random) -> ResumeReview:
+    start = 2010 + i % 12
+    return ResumeReview(
+        candidate_name=f"Candidate {i}",
+        work_experience=[
+            WorkExperience(
+                job_title=rng.choice(["Software Engineer", "Senior Engineer"]),
+                company=rng.choice(["PayCo Payments", "Shopline", "DataWorks"]),
+                duration=f"Jan {start} - Present",
+                responsibilities="Built REST APIs on postgres and ran CI/CD pipelines.",
+            ),
+            WorkExperience(
+                job_title="Junior Developer",
+                duration=f"{start - 2} - {start}",
+                responsibilities="Maintained internal tools.",
+            ),
+        ],
+        technical_skills=rng.sample(SKILLS, rng.randint(4, 10)),
+        soft_skills=rng.sample(
+            ["communication skills", "mentorship", "team player", "leadership"], 2
+        ),
+        education=[Education(degree=rng.choice(["B.Sc. Computer Science", "MSc"]))],
+        certifications=rng.sample(["AWS Certified Developer", "CKA"], 1),
+    )
+
+
+def best_of(call) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    rng = random.Random(0)
+
+    print(f"{'resumes':>8}{'batch ms':>10}{'ms/resume':>11}{'one by one ms':>15}")
+    for size in BATCH_SIZES:
+        resumes = [resume(i, rng) for i in range(size)]
+        batch = best_of(lambda: scorer.score_resumes(JD, resumes))
+        single = best_of(lambda: [scorer.score_fit(JD, r) for r in resumes])
+        print(
+            f"{size:>8}{batch * 1000:>10.1f}{batch * 1000 / size:>11.3f}"
+            f"{single * 1000:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
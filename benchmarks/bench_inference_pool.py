@@ -0,0 +1,63 @@
+"""Measure per-message setup cost of the chat LLM client, pooled vs unpooled.
+
+Before pooling, every chat message built a new ChatOpenAI client (with new
+HTTP connection pools) and bound the 10 chat tools to it again. Times that
+against Inference() from the registry, which reuses the client and the
+cached tool binding. No request is sent to a model.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_inference_pool.py
+"""
+
+import os
+import time
+import asyncio
+
+from langchain_core.tools import tool
+
+from llm.inference import Inference, get_inference_registry
+from llm.openai.inference import OpenAIInference
+from utils.app_config import AppConfig, InferenceEngine
+
+MESSAGES = 200
+
+
+def make_tools(count: int = 10) -> list:
+    tools = []
+    for i in range(count):
+
+        @tool(f"chat_tool_{i}")
+        def chat_tool(query: str, limit: int = 10, days: int = 30) -> str:
+            """Search a data source for the query and return matching records."""
+            return query
+
+        tools.append(chat_tool)
+    return tools
+
+
+def per_message_ms(setup) -> float:
+    setup()
+    started = time.perf_counter()
+    for _ in range(MESSAGES):
+        setup()
+    return (time.perf_counter() - started) * 1000 / MESSAGES
+
+
+def main() -> None:
+    os.environ.setdefault("OPENAI_KEY", "bench-key")
+    config = AppConfig.load_default()
+    config.inference.inference_engine = InferenceEngine.OPENAI
+    tools = make_tools()
+
+    unpooled = per_message_ms(lambda: OpenAIInference(config).tools(tools))
+    pooled = per_message_ms(lambda: Inference(config).with_tools(tools))
+
+    print(f"setup per chat message ({MESSAGES} messages, {len(tools)} tools)")
+    print(f"  new client + bind_tools : {unpooled:7.2f} ms")
+    print(f"  pooled registry         : {pooled:7.3f} ms")
+    asyncio.run(get_inference_registry().aclose())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Time ranking one job description against a large pool of resumes.
+
+Scoring every resume of the pool means one resume extraction per resume.
+The ranking pre-filters the pool by the JD skills each resume's text
+mentions (no LLM call, kept on the document after the first ranking) and
+extracts and scores only the top_k. The LLM is a stub sleeping 300 ms per
+call with 4 calls in flight; the local scoring engine is used.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_ranking.py
+"""
+
+import json
+import time
+import random
+import asyncio
+from pathlib import Path
+
+from job_analyzer.analysis import ranking
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.external_api import llm_analysis
+
+FIXTURES = Path("tests/test_files")
+POOL = 2000
+TOP_K = 20
+LLM_LATENCY = 0.3
+
+JD_RESPONSE = {
+    "role_title": "Senior Python Developer",
+    "must_have_requirements": ["5+ years of Python", "PostgreSQL", "AWS"],
+    "technical_skills": ["Python", "Django", "FastAPI", "PostgreSQL", "AWS", "Docker"],
+    "experience_requirements": "5+ years",
+}
+RESUME_RESPONSE = {"candidate_name": "Candidate", "technical_skills": ["Python"]}
+SKILLS = ["Python", "Django", "FastAPI", "Postgres", "AWS", "Docker", "React", "Java"]
+
+calls = {"count": 0}
+
+
+async def fake_llm(prompt: str) -> str:
+    calls["count"] += 1
+    await asyncio.sleep(LLM_LATENCY)
+    if "<job_description>" in prompt:
+        return json.dumps(JD_RESPONSE)
+    return json.dumps(RESUME_RESPONSE)
+
+
+def document(doc_id: str, file_type: str, text: str) -> UploadedDocument:
+    return UploadedDocument(
+        id=doc_id,
+        file_hash=doc_id,
+        original_filename=f"{doc_id}.txt",
+        file_type=file_type,
+        file_format="txt",
+        extracted_text=text,
+    )
+
+
+async def rank(jd, resumes) -> tuple[float, float, float]:
+    started = time.perf_counter()
+    first_score = None
+    async for event in ranking.rank_candidates(jd, resumes, TOP_K):
+        if event["event"] == "shortlist":
+            shortlisted = time.perf_counter() - started
+        elif event["event"] == "score" and first_score is None:
+            first_score = time.perf_counter() - started
+    return shortlisted, first_score, time.perf_counter() - started
+
+
+async def main() -> None:
+    llm_analysis._call_llm_for_analysis = fake_llm
+    llm_analysis.get_response_cache = lambda: None
+
+    rng = random.Random(0)
+    resume_text = (FIXTURES / "test_resume.txt").read_text()
+    resumes = [
+        document(
+            f"resume-{i}",
+            "resume",
+            f"{resume_text}\nSkills: {', '.join(rng.sample(SKILLS, 3))}\n#{i}",
+        )
+        for i in range(POOL)
+    ]
+
+    print(
+        f"{POOL} resumes, top {TOP_K} scored, {LLM_LATENCY * 1000:.0f} ms per LLM call"
+    )
+    print(f"{'':<22}{'calls':>7}{'shortlist s':>13}{'first s':>9}{'total s':>9}")
+    for run in ("first ranking", "same pool, new JD"):
+        calls["count"] = 0
+        jd = document(f"jd-{run}", "job_description", f"Senior Python Developer {run}")
+        shortlisted, first, total = await rank(jd, resumes)
+        print(
+            f"{run:<22}{calls['count']:>7}{shortlisted:>13.2f}{first:>9.2f}{total:>9.2f}"
+        )
+
+    modelled = POOL / 4 * LLM_LATENCY + LLM_LATENCY
+    print(
+        f"{'score every resume':<22}{POOL + 1:>7}{'':>13}{'':>9}{modelled:>9.1f} (modelled)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+"""Measure document tokens injected per chat turn with and without retrieval.
+
+Without retrieval the whole resume and job description are prepended to every
+user message. With retrieval only the top-k chunks relevant to the message are.
+Uses the dependency-free hashing embedder, so no API key is needed.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_retrieval_context.py
+"""
+
+import time
+import asyncio
+from pathlib import Path
+
+from llm.embedding import HashingEmbedder
+from utils.app_config import RetrievalConfig
+from utils.token_counter import count_tokens
+from utils.document_extractor import extract_document_text_sync
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.retrieval.index import EmbeddingIndex
+from job_analyzer.retrieval.retriever import DocumentRetriever
+
+RESUME_FIXTURE = Path("tests/test_files/test_resume.txt")
+
+TURNS = [
+    "Does my experience match the Kafka and streaming requirements?",
+    "Which AWS or Kubernetes certifications do I have?",
+    "What degree does the job require and do I meet it?",
+    "Rewrite my most recent role's bullet points with metrics.",
+    "Is there anything about on-call or travel in the job description?",
+]
+
+
+def make_document(doc_id: str, doc_type: str, text: str) -> UploadedDocument:
+    return UploadedDocument(
+        id=doc_id,
+        file_hash=doc_id,
+        original_filename=f"{doc_id}.txt",
+        file_type=doc_type,
+        file_format="txt",
+        extracted_text=text,
+    )
+
+
+def long_resume() -> str:
+    """The fixture resume followed by a long, varied project history."""
+    projects = [
+        f"PROJECT {i}\nLed a team of {i % 6 + 2} engineers to deliver "
+        f"{['a billing', 'a search', 'an analytics', 'a payments', 'a messaging'][i % 5]} "
+        f"platform handling {i * 3 + 10}k requests per second, improving p99 latency "
+        f"by {i % 40 + 5}% and reducing cloud spend by ${i * 7 + 20}k per year."
+        for i in range(60)
+    ]
+    return RESUME_FIXTURE.read_text(encoding="utf-8") + "\n\n" + "\n\n".join(projects)
+
+
+def long_job_description() -> str:
+    sections = {
+        "ABOUT US": "We are a fintech company building real-time payment rails.",
+        "RESPONSIBILITIES": "Design Kafka based streaming pipelines, own services end to end, participate in a weekly on-call rotation.",
+        "REQUIREMENTS": "Bachelor's degree in Computer Science or equivalent. 5+ years of Python. Experience with Kafka, Spark and Kubernetes.",
+        "NICE TO HAVE": "AWS certification, Terraform, experience with PCI compliance.",
+        "BENEFITS": "Remote friendly, up to 10% travel, 401k matching, learning budget.",
+    }
+    boilerplate = "Our culture values ownership, curiosity and kindness. " * 6
+    return "\n\n".join(
+        f"{title}\n{body}\n{boilerplate}" for title, body in sections.items()
+    )
+
+
+async def main() -> None:
+    resume = make_document(
+        "resume", "resume", extract_document_text_sync(RESUME_FIXTURE)
+    )
+    long_doc = make_document("resume-long", "resume", long_resume())
+    jd = make_document("jd", "job_description", long_job_description())
+
+    config = RetrievalConfig(full_text_max_tokens=1500)
+    retriever = DocumentRetriever(HashingEmbedder(), EmbeddingIndex(), config)
+
+    for documents in ([resume, jd], [long_doc, jd]):
+        before = sum(count_tokens(d.extracted_text) for d in documents)
+        after = []
+
+        started = time.perf_counter()
+        for message in TURNS:
+            contexts = [await retriever.document_context(message, d) for d in documents]
+            after.append(sum(count_tokens(c) for c in contexts))
+        elapsed_ms = (time.perf_counter() - started) * 1000 / len(TURNS)
+
+        names = " + ".join(
+            f"{d.id} ({count_tokens(d.extracted_text)} tokens)" for d in documents
+        )
+        print(names)
+        print(f"  document tokens per turn, full text: {before}")
+        print(
+            f"  document tokens per turn, retrieval: {sum(after) / len(after):.0f} "
+            f"(min {min(after)}, max {max(after)}), {elapsed_ms:.1f} ms/turn"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
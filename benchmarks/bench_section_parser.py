@@ -0,0 +1,148 @@
+"""Measure analysis prompt tokens with and without section compaction.
+
+Runs review_resume_api on the resume fixtures (txt, pdf, docx) and
+analyze_job_description_api on a typical job description, with the LLM call
+replaced by a stub that records the prompt. Reports prompt tokens for the raw
+document and for the compacted one, and the time spent parsing.
+
+LLM latency is not measured (no model is called); prompt processing time
+scales with the prompt tokens reported here.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_section_parser.py
+"""
+
+import time
+import asyncio
+import logging
+from pathlib import Path
+
+from job_analyzer.external_api import llm_analysis
+from utils.token_counter import count_tokens
+from utils.document_extractor import extract_document_text_sync
+from utils.section_parser import compact_for_prompt
+
+FIXTURES = Path("tests/test_files")
+PARSE_RUNS = 200
+
+JOB_DESCRIPTION = """Senior Data Engineer
+Northwind Payments · Berlin or Remote (EU) · Full-time
+
+About Us
+Northwind Payments moves money for over 40,000 merchants across Europe. Founded in
+2016, we are a team of 300 people from 45 countries, backed by leading investors,
+and we were named one of the fastest growing fintech companies three years running.
+Our mission is to make accepting payments as simple as sending an email.
+
+About the Role
+You will join the Data Platform team that owns our streaming pipelines, the
+warehouse and the tooling analysts and data scientists use every day.
+
+What you'll do
+• Design, build and operate streaming pipelines on Kafka and Spark
+• Own our Snowflake warehouse models and their data quality checks
+• Partner with analysts and data scientists to ship reliable datasets
+• Mentor engineers and lead design reviews
+
+Requirements
+• 5+ years of experience building data pipelines in Python or Scala
+• Strong SQL and data modelling skills
+• Experience with Airflow or a similar orchestrator
+• Experience running workloads on AWS or GCP
+• Excellent communication skills in English
+
+Nice to have
+• Experience with Terraform and Kubernetes
+• Background in payments or financial services
+
+Compensation
+€85,000 – €105,000 per year plus equity, depending on experience.
+
+Benefits
+• 30 days of paid vacation plus public holidays
+• €1,500 yearly learning budget and conference tickets
+• Home office setup budget and co-working membership
+• Company pension plan with employer contributions
+• Public transport ticket or bike leasing
+• Two team off-sites per year in a European city
+• Mental health support through our wellbeing partner
+• Flexible working hours and four weeks of work from anywhere
+
+How to apply
+Send us your CV in English. We review every application within two weeks and
+our process has four steps: a recruiter call, a take-home exercise, a technical
+interview and a values interview with two future teammates.
+
+Equal Opportunity Employer
+Northwind Payments is an equal opportunity employer. We do not discriminate on the
+basis of race, religion, colour, national origin, gender, sexual orientation, age,
+marital status, veteran status or disability status. We encourage applications from
+people of all backgrounds and will make reasonable adjustments throughout the process.
+"""
+
+
+async def prompt_tokens(api, text: str) -> int:
+    prompts = []
+
+    async def record(prompt: str) -> str:
+        prompts.append(prompt)
+        return "{}"
+
+    original = llm_analysis._call_llm_for_analysis
+    llm_analysis._call_llm_for_analysis = record
+    try:
+        await api(text)
+    finally:
+        llm_analysis._call_llm_for_analysis = original
+    return count_tokens(prompts[0])
+
+
+async def measure(name: str, api, text: str, sections: tuple[str, ...]) -> None:
+    compacted = await prompt_tokens(api, text)
+
+    original = llm_analysis.compact_for_prompt
+    llm_analysis.compact_for_prompt = lambda text, sections: text
+    try:
+        raw = await prompt_tokens(api, text)
+    finally:
+        llm_analysis.compact_for_prompt = original
+
+    started = time.perf_counter()
+    for _ in range(PARSE_RUNS):
+        compact_for_prompt(text, sections)
+    parse_ms = (time.perf_counter() - started) * 1000 / PARSE_RUNS
+
+    document_raw = count_tokens(text)
+    document_compact = count_tokens(compact_for_prompt(text, sections))
+    print(
+        f"{name:<18} document {document_raw:>5} -> {document_compact:>5} tokens "
+        f"({1 - document_compact / document_raw:>4.0%} less), "
+        f"prompt {raw:>5} -> {compacted:>5} tokens "
+        f"({1 - compacted / raw:>4.0%} less), parse {parse_ms:.2f} ms"
+    )
+
+
+async def main() -> None:
+    # The stubbed LLM returns no fields; skip the parse warnings
+    logging.getLogger(llm_analysis.__name__).setLevel(logging.ERROR)
+
+    for extension in ("txt", "pdf", "docx"):
+        text = extract_document_text_sync(str(FIXTURES / f"test_resume.{extension}"))
+        await measure(
+            f"resume ({extension})",
+            llm_analysis.review_resume_api,
+            text,
+            llm_analysis.RESUME_REVIEW_SECTIONS,
+        )
+
+    await measure(
+        "job description",
+        llm_analysis.analyze_job_description_api,
+        JOB_DESCRIPTION,
+        llm_analysis.JD_ANALYSIS_SECTIONS,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
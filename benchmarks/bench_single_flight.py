@@ -0,0 +1,95 @@
+"""Count LLM calls saved by coalescing concurrent identical requests.
+
+Simulates a recruiter batch-scoring 50 resumes against one job description:
+every candidate's task analyzes the JD and reviews its own resume at the same
+time, and the JD is also summarized by 10 concurrent uploads. The LLM is
+replaced by a stub with a fixed latency, and the response cache is off, so
+every request starts cold. Runs once with each request making its own call
+and once through the single-flight tables.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_single_flight.py
+"""
+
+import time
+import asyncio
+
+from utils import document_summarizer
+from utils.single_flight import SingleFlight
+from job_analyzer.external_api import llm_analysis
+
+CANDIDATES = 50
+UPLOADS = 10
+LATENCY = 0.2  # seconds per LLM call
+
+JD = "Senior Data Engineer at Northwind. Requirements: Python, Kafka, Spark, SQL."
+JD_RESPONSE = '{"role_title": "Senior Data Engineer", "technical_skills": ["Python"]}'
+RESUME_RESPONSE = '{"candidate_name": "Candidate", "technical_skills": ["Python"]}'
+
+provider_calls = 0
+
+
+async def fake_analysis_call(prompt: str) -> str:
+    global provider_calls
+    provider_calls += 1
+    await asyncio.sleep(LATENCY)
+    return JD_RESPONSE if "<job_description>" in prompt else RESUME_RESPONSE
+
+
+class FakeInference:
+    async def chat(self, messages) -> str:
+        global provider_calls
+        provider_calls += 1
+        await asyncio.sleep(LATENCY)
+        return "Summary of the posting."
+
+
+class NoFlight(SingleFlight):
+    """Every request makes its own call, as before coalescing."""
+
+    async def do(self, key, call):
+        self.calls += 1
+        return await call()
+
+
+async def candidate(index: int) -> None:
+    await asyncio.gather(
+        llm_analysis.analyze_job_description_api(JD),
+        llm_analysis.review_resume_api(f"Candidate {index}, Python and SQL."),
+    )
+
+
+async def load() -> tuple[int, float]:
+    global provider_calls
+    provider_calls = 0
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(candidate(i) for i in range(CANDIDATES)),
+        *(
+            document_summarizer._generate_summary(JD, "job_description")
+            for _ in range(UPLOADS)
+        ),
+    )
+    return provider_calls, time.perf_counter() - started
+
+
+def main() -> None:
+    llm_analysis._call_llm_for_analysis = fake_analysis_call
+    llm_analysis.get_response_cache = lambda: None
+    document_summarizer.Inference = FakeInference
+
+    requests = CANDIDATES * 2 + UPLOADS
+    print(f"{requests} concurrent LLM requests, {LATENCY * 1000:.0f} ms each")
+    for name, flights in (("per request", NoFlight), ("single flight", SingleFlight)):
+        llm_analysis.analysis_flights = flights("analysis")
+        document_summarizer.summary_flights = flights("summary")
+        calls, elapsed = asyncio.run(load())
+        print(
+            f"  {name:<14} provider calls: {calls:>4}  "
+            f"saved: {requests - calls:>4}  wall: {elapsed:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
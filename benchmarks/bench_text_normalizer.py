@@ -0,0 +1,82 @@
+"""Measure the characters and tokens text normalization removes before LLM calls.
+
+Normalizes the resume fixtures (txt, pdf, docx) as extracted, and a synthetic
+14-page job posting export with a running header and footer on every page,
+words hyphenated at line ends and tracking-laden links on each page.
+Reports characters and tokens before and after, the time spent, and whether
+the document still needs map-reduce summarization at the default
+max_document_tokens.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_text_normalizer.py
+"""
+
+import time
+from pathlib import Path
+
+from utils.document_extractor import extract_document_text_sync
+from utils.document_summarizer import needs_summarization
+from utils.text_normalizer import PAGE_BREAK, normalize_text
+
+FIXTURES = Path("tests/test_files")
+RUNS = 20
+
+TEAMS = ["Settlement", "Risk", "Payouts", "Onboarding", "Ledger", "Fraud", "Billing"]
+PAGE_BODY = """{section}
+Northwind Payments is hiring a Senior Data Engineer to own stream-
+ing pipelines for merchant settlement. You will design, build and op-
+erate Kafka and Spark jobs, keep our Snowflake warehouse models cor-
+rect, and partner with analysts on reliable datasets.
+• 5+ years building data pipelines in Python or Scala
+• Strong SQL and data modelling skills .
+• Experience with Airflow   or a similar orchestrator
+Apply: https://www.northwind.example/careers/jobs/4821/?utm_source=linkedin&utm_medium=job&utm_campaign=q3&gh_src=abc
+______________________________________________
+[Link: https://www.northwind.example/careers/jobs/4821/?utm_source=linkedin&utm_medium=job&utm_campaign=q3&gh_src=abc]
+[Link: https://www.northwind.example/privacy/]"""
+
+
+def synthetic_posting(pages: int = 14) -> str:
+    return PAGE_BREAK.join(
+        f"Northwind Payments — Careers — Senior Data Engineer (Req. 4821)\n"
+        f"Printed from northwind.example on 2024-05-02\n"
+        f"{PAGE_BODY.format(section=f'Team: {TEAMS[page % len(TEAMS)]}')}\n"
+        f"Northwind Payments GmbH · Confidential · Page {page} of {pages}"
+        for page in range(1, pages + 1)
+    )
+
+
+def main() -> None:
+    documents = {
+        f"resume.{extension}": extract_document_text_sync(
+            FIXTURES / f"test_resume.{extension}"
+        )
+        for extension in ("txt", "pdf", "docx")
+    }
+    documents["posting (14 pages)"] = synthetic_posting()
+
+    print(
+        f"{'document':<20}{'chars':>15}{'tokens':>15}{'saved':>8}{'ms':>7}"
+        f"  summarize (before -> after)"
+    )
+    for name, text in documents.items():
+        normalize_text(text)
+        started = time.perf_counter()
+        for _ in range(RUNS):
+            result = normalize_text(text)
+        elapsed_ms = (time.perf_counter() - started) * 1000 / RUNS
+
+        stats = result.stats
+        saved = stats.tokens_saved / max(stats.tokens_before, 1)
+        print(
+            f"{name:<20}{stats.chars_before:>7} -> {stats.chars_after:<5}"
+            f"{stats.tokens_before:>7} -> {stats.tokens_after:<5}"
+            f"{saved:>7.0%}{elapsed_ms:>7.1f}  "
+            f"{needs_summarization(text, token_count=stats.tokens_before)} -> "
+            f"{needs_summarization(result.text, token_count=stats.tokens_after)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
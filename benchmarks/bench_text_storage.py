@@ -0,0 +1,79 @@
+"""Compare memory and access latency of plain and compressed document text.
+
+Uses the fixture resumes in tests/test_files plus copies with non-ASCII names
+and places, repeated to typical resume lengths. Reports the in-memory size of
+the text as a str and as a compressed blob for each codec, and the time to
+read extracted_text on a cache miss (decompression) and on an LRU hit.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_text_storage.py
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from utils import text_compression
+from utils.app_config import TextStorageConfig
+from utils.document_extractor import extract_document_text_sync
+from utils.text_compression import DecompressedTextCache, compress_text
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "test_files"
+READS = 1000
+
+
+def corpus() -> dict[str, str]:
+    texts = {}
+    for path in sorted(FIXTURES.glob("test_resume.*")):
+        text = extract_document_text_sync(str(path))
+        texts[path.name] = text
+        texts[f"{path.name} x5"] = "\n".join([text] * 5)
+        texts[f"{path.name} non-ascii x5"] = "\n".join(
+            [f"José Ñúñez · Zürich · 東京\n{text}"] * 5
+        )
+    return texts
+
+
+def read_us(cache: DecompressedTextCache, key: str, blob: bytes, hit: bool) -> float:
+    started = time.perf_counter()
+    for _ in range(READS):
+        if not hit:
+            cache.discard(key)
+        cache.get(key, blob)
+    return (time.perf_counter() - started) * 1e6 / READS
+
+
+def main() -> None:
+    texts = corpus()
+    print(
+        f"{'document':<32} {'str':>8} {'codec':>6} {'blob':>8} {'ratio':>6} "
+        f"{'miss us':>8} {'hit us':>7}"
+    )
+
+    for codec in ("zstd", "zlib"):
+        with patch.object(text_compression, "_config", TextStorageConfig(codec=codec)):
+            total_str = total_blob = 0
+            for name, text in texts.items():
+                blob = compress_text(text)
+                cache = DecompressedTextCache(max_entries=16)
+                miss = read_us(cache, name, blob, hit=False)
+                hit = read_us(cache, name, blob, hit=True)
+
+                total_str += sys.getsizeof(text)
+                total_blob += sys.getsizeof(blob)
+                print(
+                    f"{name:<32} {sys.getsizeof(text):>8} {codec:>6} "
+                    f"{sys.getsizeof(blob):>8} "
+                    f"{sys.getsizeof(text) / sys.getsizeof(blob):>5.1f}x "
+                    f"{miss:>8.1f} {hit:>7.2f}"
+                )
+            print(
+                f"{'total':<32} {total_str:>8} {codec:>6} {total_blob:>8} "
+                f"{total_str / total_blob:>5.1f}x\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
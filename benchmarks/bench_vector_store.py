@@ -0,0 +1,110 @@
+"""Compare per-worker memory of the in-memory index and the mmap vector store.
+
+Starts several worker processes that each open the same set of vectors and
+run searches, and reports each worker's private (anonymous) resident memory
+and its shared file-backed resident memory from /proc (Linux only).
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_vector_store.py
+"""
+
+import time
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+
+from job_analyzer.retrieval.index import EmbeddingIndex
+from job_analyzer.retrieval.vector_store import MmapVectorStore
+
+VECTORS = 100_000
+DIMENSION = 768
+OWNERS = 1_000
+WORKERS = 4
+QUERIES = 50
+
+
+def rss_kb() -> dict[str, int]:
+    status = Path("/proc/self/status").read_text().splitlines()
+    fields = dict(line.split(":", 1) for line in status)
+    return {k: int(fields[k].split()[0]) for k in ("RssAnon", "RssFile")}
+
+
+def make_vectors(seed: int = 0) -> np.ndarray:
+    return (
+        np.random.default_rng(seed).normal(size=(VECTORS, DIMENSION)).astype(np.float32)
+    )
+
+
+def add_all(index, vectors: np.ndarray) -> None:
+    per_owner = VECTORS // OWNERS
+    for owner in range(OWNERS):
+        rows = vectors[owner * per_owner : (owner + 1) * per_owner]
+        index.add(f"doc-{owner}", [f"doc-{owner}:{i}" for i in range(len(rows))], rows)
+
+
+def worker(kind: str, path: str, results) -> None:
+    base = rss_kb()
+    if kind == "memory":
+        # Every worker builds its own copy, as each process did before
+        index = EmbeddingIndex(ann_enabled=False)
+        add_all(index, make_vectors())
+    else:
+        index = MmapVectorStore(Path(path))
+
+    queries = np.random.default_rng(1).normal(size=(QUERIES, DIMENSION))
+    started = time.perf_counter()
+    for query in queries:
+        index.search(query, k=5)
+    search_ms = (time.perf_counter() - started) * 1000 / QUERIES
+
+    used = rss_kb()
+    results.put(
+        (
+            (used["RssAnon"] - base["RssAnon"]) / 1024,
+            (used["RssFile"] - base["RssFile"]) / 1024,
+            search_ms,
+        )
+    )
+
+
+def run(kind: str, path: str) -> None:
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=worker, args=(kind, path, results))
+        for _ in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    stats = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    private = sum(s[0] for s in stats)
+    shared = max(s[1] for s in stats)
+    search_ms = sum(s[2] for s in stats) / len(stats)
+    print(
+        f"{kind:>6}: private {private:7.1f} MB total over {WORKERS} workers, "
+        f"shared file pages {shared:6.1f} MB, search {search_ms:.1f} ms"
+    )
+
+
+def main() -> None:
+    size_mb = VECTORS * DIMENSION * 4 / 1024 / 1024
+    print(
+        f"{VECTORS} x {DIMENSION} float32 vectors ({size_mb:.0f} MB), {WORKERS} workers"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        add_all(MmapVectorStore(Path(tmp)), make_vectors())
+        print(f"store build: {(time.perf_counter() - started):.1f} s")
+
+        run("memory", tmp)
+        run("mmap", tmp)
+
+
+if __name__ == "__main__":
+    main()
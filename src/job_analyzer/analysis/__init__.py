@@ -0,0 +1 @@
+# Candidate analysis package
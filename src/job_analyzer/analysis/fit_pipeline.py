@@ -0,0 +1,169 @@
+"""Two-stage fit scoring of stored documents: extract each once, then score."""
+
+import asyncio
+import logging
+from typing import Optional
+
+from utils.app_config import AppConfig, get_app_config
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.external_api.llm_analysis import (
+    EXTRACTION_FAILED_TITLES,
+    PROMPT_VERSIONS,
+    analyze_job_description_api,
+    review_resume_api,
+    calculate_fit_score_from_analyses,
+)
+from job_analyzer.external_api.models import (
+    FitScore,
+    JobDescriptionAnalysis,
+    ResumeReview,
+)
+from job_analyzer.scoring.scorer import narrate_reasoning, score_fit
+
+logger = logging.getLogger(__name__)
+
+# Document metadata key of the structured extraction
+STRUCTURED_METADATA_KEY = "structured_analysis"
+
+
+def _extraction_version(template: str, app_config: Optional[AppConfig]) -> str:
+    """Template version and model a stored extraction was made with."""
+    app_config = app_config or get_app_config()
+    return f"{PROMPT_VERSIONS[template]}-{app_config.inference.active_config().model}"
+
+
+def _stored_extraction(document: UploadedDocument, version: str) -> Optional[dict]:
+    stored = (document.metadata or {}).get(STRUCTURED_METADATA_KEY)
+    if stored and stored.get("version") == version:
+        return stored["result"]
+    return None
+
+
+def _store_extraction(document: UploadedDocument, version: str, result: dict) -> None:
+    if document.metadata is None:
+        document.metadata = {}
+    document.metadata[STRUCTURED_METADATA_KEY] = {"version": version, "result": result}
+
+
+async def structured_job_description(
+    document: UploadedDocument,
+    bypass_cache: bool = False,
+    app_config: Optional[AppConfig] = None,
+) -> JobDescriptionAnalysis:
+    """
+    Structured data of a stored job description, extracted on first use.
+
+    The extraction is kept in the document's metadata, so it lives and dies
+    with the document.
+
+    Args:
+        document: Stored job description.
+        bypass_cache: Extract again instead of reusing a stored extraction.
+        app_config: Configuration of the model. Defaults to the app config.
+
+    Returns:
+        JobDescriptionAnalysis of the document.
+    """
+    version = _extraction_version("jd_analysis", app_config)
+    stored = None if bypass_cache else _stored_extraction(document, version)
+    if stored is not None:
+        return JobDescriptionAnalysis(**stored)
+
+    analysis = await analyze_job_description_api(document.analysis_text, bypass_cache)
+    if analysis.role_title not in EXTRACTION_FAILED_TITLES:
+        _store_extraction(document, version, analysis.model_dump(mode="json"))
+    return analysis
+
+
+async def structured_resume(
+    document: UploadedDocument,
+    bypass_cache: bool = False,
+    app_config: Optional[AppConfig] = None,
+) -> ResumeReview:
+    """
+    Structured data of a stored resume, extracted on first use.
+
+    The extraction is kept in the document's metadata, so it lives and dies
+    with the document.
+
+    Args:
+        document: Stored resume.
+        bypass_cache: Extract again instead of reusing a stored extraction.
+        app_config: Configuration of the model. Defaults to the app config.
+
+    Returns:
+        ResumeReview of the document.
+    """
+    version = _extraction_version("resume_review", app_config)
+    stored = None if bypass_cache else _stored_extraction(document, version)
+    if stored is not None:
+        return ResumeReview(**stored)
+
+    review = await review_resume_api(document.analysis_text, bypass_cache)
+    if review != ResumeReview():  # empty when extraction failed
+        _store_extraction(document, version, review.model_dump(mode="json"))
+    return review
+
+
+async def score_documents(
+    resume: UploadedDocument,
+    job_description: UploadedDocument,
+    bypass_cache: bool = False,
+    app_config: Optional[AppConfig] = None,
+) -> FitScore:
+    """
+    Score a stored resume against a stored job description.
+
+    Both documents are extracted concurrently (or taken from their metadata)
+    and the extractions are scored, see score_analyses.
+
+    Args:
+        resume: Stored resume.
+        job_description: Stored job description.
+        bypass_cache: Extract and score again instead of reusing cached results.
+        app_config: Configuration of the model. Defaults to the app config.
+
+    Returns:
+        FitScore of the candidate.
+    """
+    app_config = app_config or get_app_config()
+    jd, review = await asyncio.gather(
+        structured_job_description(job_description, bypass_cache, app_config),
+        structured_resume(resume, bypass_cache, app_config),
+    )
+    logger.debug(f"Scoring resume {resume.id} against JD {job_description.id}")
+    return await score_analyses(jd, review, bypass_cache, app_config)
+
+
+async def score_analyses(
+    jd: JobDescriptionAnalysis,
+    resume: ResumeReview,
+    bypass_cache: bool = False,
+    app_config: Optional[AppConfig] = None,
+) -> FitScore:
+    """
+    Score extracted resume data against extracted JD data.
+
+    The local engine applies the scoring rules without an LLM call, asking
+    the LLM only for the reasoning trace if llm_reasoning is set. The llm
+    engine sends the compact extractions to the scoring prompt.
+
+    Args:
+        jd: Structured JD data.
+        resume: Structured resume data.
+        bypass_cache: Score again instead of reusing a cached LLM score.
+        app_config: Configuration of the scoring. Defaults to the app config.
+
+    Returns:
+        FitScore of the candidate.
+    """
+    app_config = app_config or get_app_config()
+    scoring_config = app_config.document.scoring
+
+    if scoring_config.engine == "llm":
+        return await calculate_fit_score_from_analyses(resume, jd, bypass_cache)
+
+    score = score_fit(jd, resume)
+    if scoring_config.llm_reasoning:
+        score = await narrate_reasoning(jd, resume, score)
+    return score
@@ -0,0 +1,155 @@
+"""Rank many stored resumes against one stored job description."""
+
+import time
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Optional
+
+import numpy as np
+
+from utils.app_config import AppConfig, get_app_config
+from job_analyzer.analysis.fit_pipeline import (
+    score_documents,
+    structured_job_description,
+)
+from job_analyzer.document_storage.document_manager import get_ready_document
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.external_api.models import JobDescriptionAnalysis
+from job_analyzer.scoring.scorer import hard_skill_weights, skill_coverage
+from job_analyzer.scoring.skills import mentioned_skills
+
+logger = logging.getLogger(__name__)
+
+# Document metadata key of the skills found in the document's text
+SKILLS_METADATA_KEY = "mentioned_skills"
+
+
+def document_skills(document: UploadedDocument) -> set[str]:
+    """
+    Skills mentioned in a stored document's text, found on first use.
+
+    Found with the skill dictionary and synonym table only, so no LLM call is
+    made, and kept in the document's metadata for the next ranking.
+
+    Args:
+        document: Stored document.
+
+    Returns:
+        Lowercase canonical skill names.
+    """
+    skills = (document.metadata or {}).get(SKILLS_METADATA_KEY)
+    if skills is None:
+        skills = sorted(mentioned_skills(document.extracted_text))
+        if document.metadata is None:
+            document.metadata = {}
+        document.metadata[SKILLS_METADATA_KEY] = skills
+    return set(skills)
+
+
+def shortlist(
+    jd: JobDescriptionAnalysis, resumes: list[UploadedDocument], top_k: int
+) -> list[tuple[UploadedDocument, float]]:
+    """
+    Pre-filter resumes by how many of the JD's technical skills they mention.
+
+    Args:
+        jd: Structured JD data.
+        resumes: Stored resumes to choose from.
+        top_k: Number of resumes to keep.
+
+    Returns:
+        The top_k resumes with their weighted skill overlap (0-1), best first.
+        Resumes with equal overlap keep their input order.
+    """
+    overlap = skill_coverage(
+        hard_skill_weights(jd), [document_skills(resume) for resume in resumes]
+    )
+    best = np.argsort(-overlap, kind="stable")[:top_k]
+    return [(resumes[i], float(overlap[i])) for i in best]
+
+
+async def rank_candidates(
+    job_description: UploadedDocument,
+    resumes: list[UploadedDocument],
+    top_k: Optional[int] = None,
+    bypass_cache: bool = False,
+    app_config: Optional[AppConfig] = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Rank resumes against a job description, streaming results as they come.
+
+    The JD is extracted once, every resume is pre-filtered by skill overlap
+    with its text, and only the shortlist goes through the fit pipeline
+    (resume extraction and scoring), with at most ranking.max_concurrency
+    candidates in flight.
+
+    Args:
+        job_description: Stored job description.
+        resumes: Stored resumes to rank.
+        top_k: Number of resumes to score in full. Defaults to ranking.top_k.
+        bypass_cache: Extract and score again instead of reusing cached results.
+        app_config: Configuration of the ranking. Defaults to the app config.
+
+    Yields:
+        A "shortlist" event with the pre-filtered candidates, a "score" event
+        per candidate in order of completion (an "error" event if its scoring
+        failed), and a final "done" event.
+    """
+    app_config = app_config or get_app_config()
+    config = app_config.document.ranking
+    started = time.perf_counter()
+
+    jd = await structured_job_description(job_description, bypass_cache, app_config)
+    shortlisted = shortlist(jd, resumes, top_k or config.top_k)
+    logger.info(
+        f"Shortlisted {len(shortlisted)} of {len(resumes)} resumes "
+        f"for JD {job_description.id}"
+    )
+    yield {
+        "event": "shortlist",
+        "job_description_id": job_description.id,
+        "candidates": len(resumes),
+        "shortlisted": [
+            {"resume_id": resume.id, "prefilter_score": round(overlap, 4)}
+            for resume, overlap in shortlisted
+        ],
+    }
+
+    semaphore = asyncio.Semaphore(max(1, config.max_concurrency))
+
+    async def score(resume: UploadedDocument, overlap: float) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                resume = await get_ready_document(resume.id) or resume
+                fit = await score_documents(
+                    resume, job_description, bypass_cache, app_config
+                )
+            except Exception as e:
+                logger.error(f"Failed to score resume {resume.id}: {str(e)}")
+                return {"event": "error", "resume_id": resume.id, "detail": str(e)}
+
+            return {
+                "event": "score",
+                "resume_id": resume.id,
+                "prefilter_score": round(overlap, 4),
+                **fit.as_context(),
+            }
+
+    tasks = [
+        asyncio.ensure_future(score(resume, overlap)) for resume, overlap in shortlisted
+    ]
+    scored = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            event = await next_done
+            scored += event["event"] == "score"
+            yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    yield {
+        "event": "done",
+        "scored": scored,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
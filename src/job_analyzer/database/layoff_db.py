@@ -7,12 +7,11 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 
-from job_analyzer.database.models import LayOff
+from job_analyzer.database.models import LayOff, LayOffImport
 from utils.vars import get_layoff_db
 from sqlalchemy import and_
 from datetime import datetime, timedelta
 
-
 layoff_db_context: ContextVar[AsyncSession] = ContextVar("layoff_context")
 
 layoff_db_engine = create_async_engine(get_layoff_db())
@@ -103,14 +102,71 @@ async def add_layoff(layoff: LayOff, session: Optional[AsyncSession] = None) ->
 
 async def add_layoff_bulk(
     layoffs: list[LayOff], session: Optional[AsyncSession] = None
-) -> None:
-    """Add list of multiple record to the database."""
+) -> int:
+    """Add list of multiple record to the database.
+
+    Records whose row_signature is already stored, or repeated in the list, are
+    skipped so importing the same data twice does not duplicate rows. Records
+    without a signature are always added.
+
+    Returns:
+        Number of records added.
+    """
+
+    if session is None:
+        session = layoff_db_context.get()
+
+    async with session.begin():
+        signatures = {l.row_signature for l in layoffs if l.row_signature}
+        existing_signatures: set[str] = set()
+        if signatures:
+            stmt = select(LayOff.row_signature).where(
+                LayOff.row_signature.in_(signatures)
+            )
+            result = await session.execute(stmt)
+            existing_signatures = {row[0] for row in result.fetchall()}
+
+        new_layoffs = []
+        for layoff in layoffs:
+            if layoff.row_signature:
+                if layoff.row_signature in existing_signatures:
+                    continue
+                existing_signatures.add(layoff.row_signature)
+            new_layoffs.append(layoff)
 
+        session.add_all(new_layoffs)
+
+    return len(new_layoffs)
+
+
+async def is_layoff_file_imported(
+    file_hash: str, session: Optional[AsyncSession] = None
+) -> bool:
+    """Check whether a layoff CSV with this content hash was already imported."""
+    if session is None:
+        session = layoff_db_context.get()
+
+    async with session.begin():
+        result = await session.execute(
+            select(LayOffImport.file_hash).where(LayOffImport.file_hash == file_hash)
+        )
+        return result.first() is not None
+
+
+async def add_layoff_import(
+    file_hash: str,
+    filename: Optional[str],
+    rows: int,
+    session: Optional[AsyncSession] = None,
+) -> None:
+    """Record a layoff CSV as imported, so uploading it again is a duplicate."""
     if session is None:
         session = layoff_db_context.get()
 
     async with session.begin():
-        session.add_all(layoffs)
+        await session.merge(
+            LayOffImport(file_hash=file_hash, filename=filename, rows=rows)
+        )
 
 
 async def add_partial_layoff(
@@ -185,3 +185,14 @@ class LayOff(Base):
 
         composite_string = f"{company.strip().lower()}|{date.isoformat()}|{country.strip().lower()}|{date_added.isoformat()}"
         return hashlib.md5(composite_string.encode()).hexdigest()
+
+
+class LayOffImport(Base):
+    """Layoff CSV file already imported, identified by its content hash"""
+
+    __tablename__ = "layoff_imports"
+
+    file_hash = Column(String(32), primary_key=True)
+    filename = Column(String, nullable=True)
+    rows = Column(Integer, nullable=False, default=0)
+    imported_at = Column(DateTime, nullable=False, default=datetime.now)
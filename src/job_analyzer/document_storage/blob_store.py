@@ -0,0 +1,228 @@
+"""Content-addressed store for uploaded files."""
+
+import os
+import re
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Optional
+
+import xxhash
+
+from utils.vars import get_app_path
+from utils.constants import UPLOADED_FILE_FOLDER
+
+logger = logging.getLogger(__name__)
+
+_DIGEST = re.compile(r"[0-9a-f]{8,128}")
+TEMP_SUFFIX = ".tmp"
+
+
+class BlobStore:
+    """
+    Stores file contents under their content hash in sharded directories.
+
+    A blob with digest 0123abcd... lives at <root>/01/23/0123abcd..., so no
+    directory grows past 256 entries before the blobs themselves are spread
+    out. Blobs are written to a temporary file in their shard and renamed into
+    place, so a blob is either absent or complete. Storing content that is
+    already present only refreshes its modification time.
+
+    Holders of a blob (a stored document, a CSV import in progress) take a
+    reference with acquire and drop it with release. References are kept in
+    memory; collect_garbage deletes every file under the root that nobody
+    references and that was not stored or acquired since the cutoff. That
+    includes leftover temporary files and files of the old flat layout.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._refs: dict[str, int] = {}
+
+    def path_for(self, digest: str) -> Path:
+        """
+        Path of a blob, whether or not it exists.
+
+        Args:
+            digest: Lowercase hex content hash.
+
+        Returns:
+            Path of the blob.
+
+        Raises:
+            ValueError: If the digest is not a hex string.
+        """
+        if not _DIGEST.fullmatch(digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest: str) -> bool:
+        """Check whether a blob is stored."""
+        return self.path_for(digest).is_file()
+
+    def put(self, data: bytes, digest: Optional[str] = None) -> str:
+        """
+        Store content unless it is already present.
+
+        Args:
+            data: Content to store.
+            digest: xxh64 hex digest of data, if already computed.
+
+        Returns:
+            Digest of the stored blob.
+        """
+        digest = digest or xxhash.xxh64(data).hexdigest()
+        path = self.path_for(digest)
+
+        with self._lock:
+            if path.is_file():
+                os.utime(path)
+                return digest
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(
+                f".{digest}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}"
+            )
+            try:
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except OSError:
+                temp_path.unlink(missing_ok=True)
+                raise
+
+        logger.debug(f"Stored blob {digest} ({len(data)} bytes)")
+        return digest
+
+    def acquire(self, digest: str) -> int:
+        """
+        Take a reference to a blob so garbage collection keeps it.
+
+        Args:
+            digest: Digest of the blob.
+
+        Returns:
+            Number of references held after this one.
+        """
+        path = self.path_for(digest)
+        with self._lock:
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+            if path.is_file():
+                os.utime(path)
+            return self._refs[digest]
+
+    def release(self, digest: str) -> int:
+        """
+        Drop a reference taken with acquire.
+
+        Args:
+            digest: Digest of the blob.
+
+        Returns:
+            Number of references still held.
+        """
+        with self._lock:
+            count = self._refs.get(digest, 0) - 1
+            if count > 0:
+                self._refs[digest] = count
+                return count
+
+            self._refs.pop(digest, None)
+            return 0
+
+    def refcount(self, digest: str) -> int:
+        """Number of references held to a blob."""
+        with self._lock:
+            return self._refs.get(digest, 0)
+
+    def discard(self, digest: str) -> bool:
+        """
+        Delete a blob right away if nobody references it.
+
+        Args:
+            digest: Digest of the blob.
+
+        Returns:
+            True if the blob was deleted.
+        """
+        path = self.path_for(digest)
+        with self._lock:
+            if self._refs.get(digest):
+                return False
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                return False
+
+        self._remove_empty_shards(path.parent)
+        logger.debug(f"Deleted blob {digest}")
+        return True
+
+    def collect_garbage(self, older_than: datetime) -> tuple[int, int]:
+        """
+        Delete unreferenced files last stored or acquired before a cutoff.
+
+        Args:
+            older_than: Files modified before this time are deleted.
+
+        Returns:
+            Number of files deleted and bytes freed.
+        """
+        if not self.root.exists():
+            return 0, 0
+
+        cutoff = older_than.timestamp()
+        deleted = freed = 0
+
+        for directory, _, filenames in os.walk(self.root, topdown=False):
+            directory = Path(directory)
+            for filename in filenames:
+                path = directory / filename
+                with self._lock:
+                    if self._refs.get(filename):
+                        continue
+                    try:
+                        stat = path.stat()
+                        if stat.st_mtime >= cutoff:
+                            continue
+                        path.unlink()
+                    except FileNotFoundError:
+                        continue
+
+                deleted += 1
+                freed += stat.st_size
+
+            if directory != self.root:
+                self._remove_empty_shards(directory)
+
+        if deleted:
+            logger.info(f"Blob store garbage collection freed {deleted} files")
+        return deleted, freed
+
+    def _remove_empty_shards(self, directory: Path) -> None:
+        while directory != self.root and self.root in directory.parents:
+            try:
+                directory.rmdir()
+            except OSError:  # not empty, or already removed
+                return
+            directory = directory.parent
+
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """
+    Get the process-wide store for uploaded files.
+
+    Returns:
+        BlobStore rooted at the uploaded files folder.
+    """
+    global _blob_store
+
+    if _blob_store is None:
+        _blob_store = BlobStore(get_app_path().joinpath(UPLOADED_FILE_FOLDER))
+
+    return _blob_store
@@ -1,24 +1,46 @@
 """Document storage manager for handling uploaded files."""
 
 import uuid
+import asyncio
 import logging
+import zipfile
 from pathlib import Path
-from typing import Optional, Dict
+from datetime import datetime
+from typing import Optional, Dict, AsyncIterator
 import xxhash
 
 from fastapi import UploadFile
 
-from utils.vars import get_app_path
-from utils.constants import UPLOADED_FILE_FOLDER
-from utils.document_extractor import extract_document_text
-from utils.document_summarizer import prepare_document_for_analysis
-from job_analyzer.document_storage.models import UploadedDocument
+from utils.app_config import get_app_config
+from utils.document_extractor import extract_document_text_in_pool, extractor_version
+from utils.text_normalizer import NormalizedText, normalize_text, normalizer_version
+from utils.document_summarizer import (
+    prepare_document_for_analysis,
+    needs_summarization,
+    SUMMARIZER_VERSION,
+    TRUNCATION_MARKER,
+)
+from job_analyzer.document_storage.models import UploadedDocument, BatchUploadResult
+from job_analyzer.document_storage.blob_store import get_blob_store
+from job_analyzer.document_storage.extraction_cache import (
+    ExtractionCache,
+    get_extraction_cache,
+)
+from job_analyzer.retrieval.retriever import discard_document
 
 logger = logging.getLogger(__name__)
 
+SUPPORTED_FORMATS = ["pdf", "docx", "txt"]
+
 # In-memory storage for documents For now
 _document_store: Dict[str, UploadedDocument] = {}
 
+# Content hash -> document ID, for deduplication
+_hash_index: Dict[str, str] = {}
+
+# Pending background summarizations, keyed by document ID
+_summary_tasks: Dict[str, asyncio.Task] = {}
+
 
 async def save_uploaded_document(
     file: UploadFile,
@@ -29,6 +51,9 @@ async def save_uploaded_document(
     """
     Save an uploaded document and extract its text.
 
+    The document is returned as soon as its text is extracted; summarization
+    of long documents runs in the background (see get_ready_document).
+
     Args:
         file: The uploaded file
         doc_type: Type of document (resume, job_description, other)
@@ -44,40 +69,78 @@ async def save_uploaded_document(
         )
         # Read file content
         contents = await file.read()
-        file_hash = xxhash.xxh64(contents).hexdigest()
 
-        # Check if already exists
-        existing_doc = _find_document_by_hash(file_hash)
-        if existing_doc:
-            logger.info(f"Document already exists with hash {file_hash}")
-            return existing_doc
-
-        # Determine file format
-        filename = file.filename or "unknown"
-        file_extension = Path(filename).suffix.lower().lstrip(".")
-        if file_extension not in ["pdf", "docx", "txt"]:
-            raise ValueError(f"Unsupported file format: {file_extension}")
+        return await save_document_bytes(
+            contents,
+            file.filename or "unknown",
+            doc_type=doc_type,
+            session_id=session_id,
+            summarize=summarize,
+        )
 
-        # Save to disk temporarily
-        upload_dir = get_app_path().joinpath(UPLOADED_FILE_FOLDER)
-        upload_dir.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        logger.error(f"Error saving document: {str(e)}", exc_info=True)
+        raise
 
-        temp_filename = f"{file_hash}.{file_extension}"
-        temp_path = upload_dir / temp_filename
 
-        with open(temp_path, "wb") as f:
-            f.write(contents)
+async def save_document_bytes(
+    contents: bytes,
+    filename: str,
+    doc_type: str = "other",
+    session_id: Optional[str] = None,
+    summarize: bool = True,
+    file_hash: Optional[str] = None,
+) -> UploadedDocument:
+    """
+    Save document content and extract its text.
 
-        logger.info(f"Saved file to {temp_path}")
+    Args:
+        contents: Raw file content
+        filename: Original filename, used to determine the file format
+        doc_type: Type of document (resume, job_description, other)
+        session_id: Optional session identifier
+        summarize: Whether to summarize the document if it's too long
+        file_hash: xxh64 hex digest of contents, if already computed
 
-        # Extract text
-        extracted_text = await extract_document_text(temp_path)
+    Returns:
+        UploadedDocument with metadata and extracted text
+    """
+    file_hash = file_hash or xxhash.xxh64(contents).hexdigest()
+
+    # Check if already exists
+    existing_doc = _find_document_by_hash(file_hash)
+    if existing_doc:
+        logger.info(f"Document already exists with hash {file_hash}")
+        existing_doc.last_accessed = datetime.now()
+        return existing_doc
+
+    # Determine file format
+    file_extension = Path(filename).suffix.lower().lstrip(".")
+    if file_extension not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported file format: {file_extension}")
+
+    # Store the file and hold it until the document is deleted
+    blob_store = get_blob_store()
+    blob_store.put(contents, file_hash)
+    blob_store.acquire(file_hash)
+    file_path = blob_store.path_for(file_hash)
+
+    logger.info(f"Saved file to {file_path}")
+
+    # Extract text, reusing cached results before doing any parsing. The
+    # reference is dropped if anything fails before the document holds it.
+    version = extractor_version(file_extension)
+    try:
+        extracted_text = await _extract_text_cached(
+            file_path, file_hash, version, file_extension
+        )
+        normalized = await _normalize(extracted_text, filename)
 
-        # Summarize if needed
-        if summarize:
-            extracted_text = await prepare_document_for_analysis(
-                extracted_text, doc_type=doc_type
-            )
+        # Another upload of the same content may have finished while extracting
+        existing_doc = _find_document_by_hash(file_hash)
+        if existing_doc:
+            blob_store.release(file_hash)
+            return existing_doc
 
         # Create document record
         doc_id = str(uuid.uuid4())
@@ -87,20 +150,192 @@ async def save_uploaded_document(
             original_filename=filename,
             file_type=doc_type,
             file_format=file_extension,
-            extracted_text=extracted_text,
+            extracted_text=normalized.text,
+            status="extracted",
             session_id=session_id,
-            metadata={"file_path": str(temp_path)},
+            file_size=len(contents),
+            metadata={
+                "file_path": str(file_path),
+                "file_hash": file_hash,
+                "file_size": len(contents),
+                "normalization": normalized.stats.to_dict(),
+            },
         )
+    except Exception:
+        blob_store.release(file_hash)
+        raise
 
-        # Store in memory
-        _document_store[doc_id] = document
-        logger.info(f"Stored document {doc_id} ({doc_type})")
+    # Store in memory
+    _store_document(document)
+    logger.info(f"Stored document {doc_id} ({doc_type})")
 
-        return document
+    _schedule_summary(
+        document,
+        f"{version}+{normalizer_version()}",
+        summarize,
+        normalized.stats.tokens_after,
+    )
 
-    except Exception as e:
-        logger.error(f"Error saving document: {str(e)}", exc_info=True)
-        raise
+    return document
+
+
+async def save_uploaded_documents_batch(
+    files: list[UploadFile],
+    doc_type: str = "resume",
+    session_id: Optional[str] = None,
+    summarize: bool = True,
+) -> list[BatchUploadResult]:
+    """
+    Save many uploaded documents, or the entries of a single zip archive.
+
+    Entries are read one at a time and deduplicated by content hash before any
+    work is done. Extraction is fanned out over the extraction process pool,
+    with at most batch_upload.max_concurrency documents in flight so memory
+    stays bounded for large archives.
+
+    Args:
+        files: Uploaded files; a single .zip file is expanded into its entries
+        doc_type: Type of the documents (resume, job_description, other)
+        session_id: Optional session identifier
+        summarize: Whether to summarize documents that are too long
+
+    Returns:
+        One BatchUploadResult per file or archive entry, in input order
+    """
+    config = get_app_config().document.batch_upload
+    max_file_size = config.max_file_size_mb * 1024 * 1024
+    semaphore = asyncio.Semaphore(max(1, config.max_concurrency))
+
+    results: list[BatchUploadResult] = []
+    tasks: list[asyncio.Task] = []
+    seen_hashes: Dict[str, BatchUploadResult] = {}
+    in_batch_duplicates: list[tuple[BatchUploadResult, BatchUploadResult]] = []
+
+    async def process(
+        result: BatchUploadResult, contents: bytes, file_hash: str
+    ) -> None:
+        try:
+            document = await save_document_bytes(
+                contents,
+                result.filename,
+                doc_type=doc_type,
+                session_id=session_id,
+                summarize=summarize,
+                file_hash=file_hash,
+            )
+            result.status = "created"
+            result.document_id = document.id
+            result.document_status = document.status
+            result.text_length = document.text_length
+        except Exception as e:
+            logger.warning(f"Batch upload failed for {result.filename}: {str(e)}")
+            result.status = "error"
+            result.error = str(e)
+        finally:
+            semaphore.release()
+
+    async for filename, contents, error in _iter_batch_entries(
+        files, max_file_size, config.max_files
+    ):
+        result = BatchUploadResult(filename=filename, status="error", error=error)
+        results.append(result)
+        if contents is None:
+            continue
+
+        file_hash = xxhash.xxh64(contents).hexdigest()
+        existing_doc = _find_document_by_hash(file_hash)
+        first = seen_hashes.get(file_hash)
+        if existing_doc or first:
+            result.status = "duplicate"
+            result.error = None
+            if existing_doc:
+                result.document_id = existing_doc.id
+                result.document_status = existing_doc.status
+            else:
+                in_batch_duplicates.append((result, first))
+            continue
+
+        seen_hashes[file_hash] = result
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(process(result, contents, file_hash)))
+
+    await asyncio.gather(*tasks)
+
+    for result, first in in_batch_duplicates:
+        result.document_id = first.document_id
+        result.document_status = first.document_status
+        if first.status == "error":
+            result.status = "error"
+            result.error = first.error
+
+    logger.info(
+        f"Batch upload processed {len(results)} files: "
+        f"{sum(r.status == 'created' for r in results)} created, "
+        f"{sum(r.status == 'duplicate' for r in results)} duplicates, "
+        f"{sum(r.status == 'error' for r in results)} errors"
+    )
+    return results
+
+
+async def _iter_batch_entries(
+    files: list[UploadFile], max_file_size: int, max_files: int
+) -> AsyncIterator[tuple[str, Optional[bytes], Optional[str]]]:
+    """
+    Yield (filename, contents, error) for each uploaded file or zip entry.
+
+    Contents is None when the entry is rejected; error then says why.
+    """
+    count = 0
+
+    is_archive = len(files) == 1 and (files[0].filename or "").lower().endswith(".zip")
+
+    if is_archive:
+        try:
+            archive = zipfile.ZipFile(files[0].file)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Invalid zip archive: {str(e)}")
+
+        with archive:
+            for info in archive.infolist():
+                name = info.filename
+                if info.is_dir() or _is_hidden_entry(name):
+                    continue
+
+                count += 1
+                if count > max_files:
+                    yield name, None, f"Batch limit of {max_files} files exceeded"
+                    continue
+                if info.file_size > max_file_size:
+                    yield name, None, "File too large"
+                    continue
+
+                with archive.open(info) as entry:
+                    contents = await asyncio.to_thread(entry.read, max_file_size + 1)
+                if len(contents) > max_file_size:
+                    yield name, None, "File too large"
+                    continue
+
+                yield Path(name).name, contents, None
+        return
+
+    for file in files:
+        name = file.filename or "unknown"
+        count += 1
+        if count > max_files:
+            yield name, None, f"Batch limit of {max_files} files exceeded"
+            continue
+
+        contents = await file.read(max_file_size + 1)
+        if len(contents) > max_file_size:
+            yield name, None, "File too large"
+            continue
+
+        yield name, contents, None
+
+
+def _is_hidden_entry(name: str) -> bool:
+    """Archive metadata entries (e.g. __MACOSX, .DS_Store) are not documents."""
+    return any(part.startswith((".", "__MACOSX")) for part in Path(name).parts)
 
 
 async def save_text_document(
@@ -134,14 +369,10 @@ async def save_text_document(
         existing_doc = _find_document_by_hash(text_hash)
         if existing_doc:
             logger.info(f"Text document already exists with hash {text_hash}")
+            existing_doc.last_accessed = datetime.now()
             return existing_doc
 
-        # Summarize if needed
-        processed_text = text
-        if summarize:
-            processed_text = await prepare_document_for_analysis(
-                text, doc_type=doc_type
-            )
+        normalized = await _normalize(text, filename)
 
         # Create document record
         doc_id = str(uuid.uuid4())
@@ -151,15 +382,26 @@ async def save_text_document(
             original_filename=filename,
             file_type=doc_type,
             file_format="text",
-            extracted_text=processed_text,
+            extracted_text=normalized.text,
+            status="extracted",
             session_id=session_id,
-            metadata={"source": "paste"},
+            metadata={
+                "source": "paste",
+                "normalization": normalized.stats.to_dict(),
+            },
         )
 
         # Store in memory
-        _document_store[doc_id] = document
+        _store_document(document)
         logger.info(f"Stored text document {doc_id} ({doc_type})")
 
+        _schedule_summary(
+            document,
+            f"text+{normalizer_version()}",
+            summarize,
+            normalized.stats.tokens_after,
+        )
+
         return document
 
     except Exception as e:
@@ -167,6 +409,152 @@ async def save_text_document(
         raise
 
 
+async def _extract_text_cached(
+    file_path: Path, file_hash: str, version: str, file_format: str
+) -> str:
+    """Extract text from a file, reusing the extraction cache when possible."""
+    cache = get_extraction_cache()
+    key = ExtractionCache.make_key(file_hash, "text", version)
+
+    if cache:
+        cached_text = cache.get(key)
+        if cached_text is not None:
+            logger.info(f"Reusing cached extraction for {file_hash}")
+            return cached_text
+
+    extracted_text = await extract_document_text_in_pool(file_path, file_format)
+
+    if cache:
+        cache.put(key, extracted_text)
+
+    return extracted_text
+
+
+async def _normalize(text: str, filename: str) -> NormalizedText:
+    """Normalize extracted text off the event loop and log what it saved."""
+    normalized = await asyncio.to_thread(normalize_text, text)
+    stats = normalized.stats
+    logger.info(
+        f"Normalized {filename}: {stats.chars_saved} chars and "
+        f"{stats.tokens_saved} tokens saved ({stats.tokens_after} tokens left)"
+    )
+    return normalized
+
+
+def _summary_cache_key(content_hash: str, doc_type: str, source_version: str) -> str:
+    """Build the cache key of a document summary."""
+    return ExtractionCache.make_key(
+        content_hash, f"summary-{doc_type}", f"{source_version}+{SUMMARIZER_VERSION}"
+    )
+
+
+def _get_cached_summary(
+    content_hash: str, doc_type: str, source_version: str
+) -> Optional[str]:
+    """Get a cached summary for the content, if any."""
+    cache = get_extraction_cache()
+    if not cache:
+        return None
+
+    summary = cache.get(_summary_cache_key(content_hash, doc_type, source_version))
+    if summary is not None:
+        logger.info(f"Reusing cached summary for {content_hash}")
+    return summary
+
+
+async def _summarize_cached(
+    text: str, content_hash: str, doc_type: str, source_version: str
+) -> str:
+    """Summarize text and cache the result unless summarization fell back to truncation."""
+    summary = await prepare_document_for_analysis(text, doc_type=doc_type)
+
+    cache = get_extraction_cache()
+    if cache and not summary.startswith(TRUNCATION_MARKER):
+        cache.put(_summary_cache_key(content_hash, doc_type, source_version), summary)
+
+    return summary
+
+
+def _schedule_summary(
+    document: UploadedDocument,
+    source_version: str,
+    summarize: bool,
+    token_count: Optional[int] = None,
+) -> None:
+    """Mark the document ready or start summarizing it in the background."""
+    if not summarize or not needs_summarization(
+        document.extracted_text, token_count=token_count
+    ):
+        document.status = "ready"
+        return
+
+    cached_summary = _get_cached_summary(
+        document.file_hash, document.file_type, source_version
+    )
+    if cached_summary is not None:
+        document.summary = cached_summary
+        document.status = "ready"
+        return
+
+    task = asyncio.create_task(_summarize_in_background(document, source_version))
+    _summary_tasks[document.id] = task
+    task.add_done_callback(lambda _: _summary_tasks.pop(document.id, None))
+    logger.debug(f"Scheduled background summarization for document {document.id}")
+
+
+async def _summarize_in_background(
+    document: UploadedDocument, source_version: str
+) -> None:
+    """Summarize a stored document and update its status."""
+    document.status = "summarizing"
+
+    try:
+        document.summary = await _summarize_cached(
+            document.extracted_text,
+            document.file_hash,
+            document.file_type,
+            source_version,
+        )
+        document.status = "ready"
+        logger.info(f"Document {document.id} summarized")
+    except Exception as e:
+        document.status = "failed"
+        logger.error(
+            f"Background summarization failed for {document.id}: {str(e)}",
+            exc_info=True,
+        )
+
+
+async def get_ready_document(
+    doc_id: str, timeout: Optional[float] = None
+) -> Optional[UploadedDocument]:
+    """
+    Retrieve a document by ID, waiting for a pending summarization to finish.
+
+    Use this instead of get_document when the analysis text (summary) is needed.
+
+    Args:
+        doc_id: Document ID
+        timeout: Maximum seconds to wait for the summary. Waits indefinitely if None.
+
+    Returns:
+        UploadedDocument if found, None otherwise. If the wait times out the
+        document is returned as-is and its analysis text is the full text.
+    """
+    document = get_document(doc_id)
+    task = _summary_tasks.get(doc_id)
+
+    if document and task and not task.done():
+        logger.debug(f"Waiting for summarization of document {doc_id}")
+        try:
+            # Shield so a cancelled caller does not cancel the shared summarization
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out waiting for summary of document {doc_id}")
+
+    return document
+
+
 def get_document(doc_id: str) -> Optional[UploadedDocument]:
     """
     Retrieve a document by ID.
@@ -183,39 +571,113 @@ def get_document(doc_id: str) -> Optional[UploadedDocument]:
 
     if doc:
         logger.debug(f"Document found: {doc.original_filename}")
+        doc.last_accessed = datetime.now()
     else:
         logger.debug("Document not found")
     return doc
 
 
+def open_document_file(doc_id: str) -> Optional[tuple[UploadedDocument, Path]]:
+    """
+    Get the stored source file of a document without reading it.
+
+    The file is held in the blob store until close_document_file is called,
+    so it cannot be deleted while it is being streamed.
+
+    Args:
+        doc_id: Document ID
+
+    Returns:
+        The document and the path of its file, or None if the document does
+        not exist or has no stored file (e.g. pasted text)
+    """
+    document = get_document(doc_id)
+    if not document or "file_path" not in document.metadata:
+        return None
+
+    blob_store = get_blob_store()
+    blob_store.acquire(document.file_hash)
+    file_path = blob_store.path_for(document.file_hash)
+
+    if not file_path.is_file():
+        logger.warning(f"Stored file of document {doc_id} is missing")
+        blob_store.release(document.file_hash)
+        return None
+
+    return document, file_path
+
+
+def close_document_file(document: UploadedDocument) -> None:
+    """Release a file opened with open_document_file."""
+    get_blob_store().release(document.file_hash)
+
+
+def list_documents() -> list[UploadedDocument]:
+    """
+    List all stored documents.
+
+    Returns:
+        Stored documents, in insertion order
+    """
+    return list(_document_store.values())
+
+
+def _store_document(document: UploadedDocument) -> None:
+    """Add a document to the store and evict others if it exceeds a quota."""
+    _document_store[document.id] = document
+    _hash_index[document.file_hash] = document.id
+
+    from job_analyzer.document_storage.janitor import get_document_janitor
+
+    janitor = get_document_janitor()
+    if janitor.config.enabled:
+        janitor.enforce_quotas(keep=document)
+
+
 def _find_document_by_hash(file_hash: str) -> Optional[UploadedDocument]:
     """Find a document by its file hash."""
-    for doc in _document_store.values():
-        if doc.file_hash == file_hash:
-            return doc
-    return None
+    doc_id = _hash_index.get(file_hash)
+    return _document_store.get(doc_id) if doc_id else None
 
 
-def delete_document(doc_id: str) -> bool:
+def delete_document(doc_id: str, purge_cache: bool = False) -> bool:
     """
-    Delete a document.
+    Delete a document with its file and vectors.
+
+    The cached extraction and summaries are keyed by content, so they are kept
+    for a re-upload of the same file and left to the cache's own LRU bound,
+    unless purge_cache is set (e.g. when a user deletes their document).
 
     Args:
         doc_id: Document ID
+        purge_cache: Also delete the cached extraction and summaries
 
     Returns:
         True if deleted, False if not found
     """
     if doc_id in _document_store:
         doc = _document_store.pop(doc_id)
+        if _hash_index.get(doc.file_hash) == doc_id:
+            del _hash_index[doc.file_hash]
+
+        task = _summary_tasks.pop(doc_id, None)
+        if task and not task.done():
+            task.cancel()
+
+        discard_document(doc)
+        doc.release_text()
+
+        cache = get_extraction_cache() if purge_cache else None
+        if cache:
+            cache.delete_content(doc.file_hash)
 
-        # Delete file if it exists
+        # Delete the file unless something else still references it
         if "file_path" in doc.metadata:
             try:
-                file_path = Path(doc.metadata["file_path"])
-                if file_path.exists():
-                    file_path.unlink()
-                    logger.info(f"Deleted file: {file_path}")
+                blob_store = get_blob_store()
+                if blob_store.release(doc.file_hash) == 0:
+                    if blob_store.discard(doc.file_hash):
+                        logger.info(f"Deleted file: {doc.metadata['file_path']}")
             except Exception as e:
                 logger.error(f"Error deleting file: {str(e)}")
 
@@ -0,0 +1,251 @@
+"""Content-addressed on-disk cache for extracted and summarized document text."""
+
+import os
+import re
+import zlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+from collections import OrderedDict
+
+from utils.vars import get_app_path
+from utils.constants import EXTRACTION_CACHE_FOLDER
+from utils.app_config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_SUFFIX = ".zlib"
+_UNSAFE_KEY_CHARS = re.compile(r"[^A-Za-z0-9._+-]")
+
+
+class ExtractionCache:
+    """
+    Disk cache of zlib-compressed text entries with size-based LRU eviction.
+
+    Entries are keyed by content hash, the kind of text stored (extracted text or
+    a summary) and the version of the code that produced it. The modification
+    time of each entry is used as its last access time so that the LRU order
+    survives restarts and is shared by every worker using the same directory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_bytes: int,
+        compression_level: int = 6,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.compression_level = compression_level
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()  # key -> size
+        self._total_size = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_entries()
+
+    @staticmethod
+    def make_key(content_hash: str, kind: str, version: str) -> str:
+        """
+        Build a cache key.
+
+        Args:
+            content_hash: xxh64 hex digest of the source content.
+            kind: What is cached, e.g. "text" or "summary-resume".
+            version: Version of the extractor/summarizer producing the entry.
+
+        Returns:
+            Filesystem-safe cache key.
+        """
+        return _UNSAFE_KEY_CHARS.sub("_", f"{content_hash}-{kind}-{version}")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached text entry.
+
+        Args:
+            key: Cache key built with make_key.
+
+        Returns:
+            Cached text if present, None otherwise.
+        """
+        path = self._path_for(key)
+
+        try:
+            compressed = path.read_bytes()
+            text = zlib.decompress(compressed).decode("utf-8")
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+                self._forget(key)
+            return None
+        except (zlib.error, UnicodeDecodeError) as e:
+            logger.warning(f"Discarding corrupt cache entry {key}: {str(e)}")
+            self.delete(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+            if key not in self._entries:
+                self._total_size += len(compressed)
+            self._entries[key] = len(compressed)
+            self._entries.move_to_end(key)
+
+        logger.debug(f"Extraction cache hit: {key}")
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """
+        Store a text entry, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key built with make_key.
+            text: Text to store.
+        """
+        compressed = zlib.compress(text.encode("utf-8"), self.compression_level)
+        if len(compressed) > self.max_size_bytes:
+            logger.debug(f"Entry {key} larger than cache size, not caching")
+            return
+
+        path = self._path_for(key)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(compressed)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.error(f"Failed to write cache entry {key}: {str(e)}")
+            temp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._total_size -= self._entries.pop(key, 0)
+            self._entries[key] = len(compressed)
+            self._total_size += len(compressed)
+            self._evict()
+
+        logger.debug(f"Cached {key} ({len(text)} chars, {len(compressed)} bytes)")
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a cache entry.
+
+        Args:
+            key: Cache key built with make_key.
+
+        Returns:
+            True if an entry was deleted, False if not found.
+        """
+        with self._lock:
+            self._forget(key)
+
+        try:
+            self._path_for(key).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def delete_content(self, content_hash: str) -> int:
+        """
+        Delete every entry derived from the given content hash.
+
+        Args:
+            content_hash: xxh64 hex digest of the source content.
+
+        Returns:
+            Number of entries deleted.
+        """
+        prefix = f"{content_hash}-"
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+
+        return sum(1 for key in keys if self.delete(key))
+
+    @property
+    def total_size(self) -> int:
+        """Total compressed size of the cached entries in bytes."""
+        return self._total_size
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def _forget(self, key: str) -> None:
+        self._total_size -= self._entries.pop(key, 0)
+
+    def _load_entries(self) -> None:
+        """Index existing entries, oldest access first."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append(
+                (stat.st_mtime, path.name[: -len(CACHE_FILE_SUFFIX)], stat.st_size)
+            )
+
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._total_size += size
+
+        logger.debug(
+            f"Loaded {len(self._entries)} extraction cache entries ({self._total_size} bytes)"
+        )
+        self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until under the size limit."""
+        while self._total_size > self.max_size_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_size -= size
+            try:
+                self._path_for(key).unlink()
+                logger.debug(f"Evicted extraction cache entry {key}")
+            except FileNotFoundError:
+                pass
+
+
+_extraction_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache(
+    app_config: Optional[AppConfig] = None,
+) -> Optional[ExtractionCache]:
+    """
+    Get the process-wide extraction cache.
+
+    Args:
+        app_config: Configuration to build the cache from. Defaults to the app config.
+
+    Returns:
+        ExtractionCache instance, or None if caching is disabled.
+    """
+    global _extraction_cache
+
+    if _extraction_cache is None:
+        app_config = app_config or AppConfig.load_default()
+        cache_config = app_config.document.extraction_cache
+
+        if not cache_config.enabled:
+            return None
+
+        _extraction_cache = ExtractionCache(
+            cache_dir=get_app_path().joinpath(EXTRACTION_CACHE_FOLDER),
+            max_size_bytes=cache_config.max_size_mb * 1024 * 1024,
+            compression_level=cache_config.compression_level,
+        )
+        logger.info(f"Extraction cache initialized at {_extraction_cache.cache_dir}")
+
+    return _extraction_cache
@@ -0,0 +1,214 @@
+"""Background expiry and quota enforcement for stored documents."""
+
+import time
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+from utils.app_config import AppConfig, RetentionConfig
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.document_storage.blob_store import get_blob_store
+from job_analyzer.document_storage.document_manager import (
+    list_documents,
+    delete_document,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JanitorMetrics:
+    """Counters of what the janitor has evicted since startup."""
+
+    sweeps: int = 0
+    evictions: dict[str, int] = field(
+        default_factory=lambda: {"expired": 0, "session_quota": 0, "global_quota": 0}
+    )
+    orphan_files_deleted: int = 0
+    bytes_freed: int = 0
+    last_sweep_at: Optional[datetime] = None
+    last_sweep_ms: float = 0.0
+
+
+class DocumentJanitor:
+    """
+    Evicts stored documents so memory and disk use stay bounded.
+
+    Each sweep, in order:
+
+    1. deletes documents not accessed for ttl_minutes,
+    2. evicts the least recently used documents of every session over
+       session_quota_mb,
+    3. evicts the least recently used documents overall while the store is over
+       global_quota_mb,
+    4. garbage collects the blob store: files in uploaded_files/ that nothing
+       references and that were not stored or used within the TTL (e.g. left
+       over from a previous run, or imported layoff CSVs).
+
+    Quotas are also enforced right after each new document is stored. Eviction
+    goes through delete_document, which removes the file and the document's
+    vectors together. The cached extraction and summaries are kept, so a
+    re-upload of an evicted file skips extraction and summarization.
+    """
+
+    def __init__(self, config: RetentionConfig):
+        self.config = config
+        self.metrics = JanitorMetrics()
+        self._task: Optional[asyncio.Task] = None
+
+    def sweep(self, now: Optional[datetime] = None) -> int:
+        """
+        Run one eviction pass.
+
+        Args:
+            now: Current time. Defaults to datetime.now().
+
+        Returns:
+            Number of documents evicted.
+        """
+        started = time.perf_counter()
+        now = now or datetime.now()
+        ttl = timedelta(minutes=self.config.ttl_minutes)
+
+        expired = [d for d in list_documents() if now - d.last_accessed > ttl]
+        for document in expired:
+            self._evict(document, "expired")
+
+        evicted = len(expired) + self.enforce_quotas()
+        self._delete_orphan_files(now - ttl)
+
+        self.metrics.sweeps += 1
+        self.metrics.last_sweep_at = now
+        self.metrics.last_sweep_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        if evicted:
+            logger.info(f"Document janitor evicted {evicted} documents")
+        return evicted
+
+    def enforce_quotas(self, keep: Optional[UploadedDocument] = None) -> int:
+        """
+        Evict least recently used documents until every quota is met.
+
+        Args:
+            keep: Document that must not be evicted, e.g. the one just stored.
+
+        Returns:
+            Number of documents evicted.
+        """
+        evicted = 0
+        session_quota = self.config.session_quota_mb * 1024 * 1024
+        global_quota = self.config.global_quota_mb * 1024 * 1024
+
+        sessions: dict[str, list[UploadedDocument]] = {}
+        for document in list_documents():
+            if document.session_id:
+                sessions.setdefault(document.session_id, []).append(document)
+
+        for documents in sessions.values():
+            evicted += self._evict_lru(documents, session_quota, "session_quota", keep)
+
+        evicted += self._evict_lru(list_documents(), global_quota, "global_quota", keep)
+        return evicted
+
+    def usage(self) -> dict:
+        """Current number of documents, sessions and bytes stored."""
+        documents = list_documents()
+        return {
+            "documents": len(documents),
+            "sessions": len({d.session_id for d in documents if d.session_id}),
+            "bytes": sum(d.storage_bytes for d in documents),
+        }
+
+    def start(self) -> None:
+        """Start sweeping periodically in the background."""
+        if self.config.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Document janitor started (every {self.config.sweep_interval_seconds}s)"
+            )
+
+    async def stop(self) -> None:
+        """Stop the background sweeps."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Document janitor stopped")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.sweep_interval_seconds)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Document janitor sweep failed: {str(e)}", exc_info=True)
+
+    def _evict_lru(
+        self,
+        documents: list[UploadedDocument],
+        quota: int,
+        reason: str,
+        keep: Optional[UploadedDocument],
+    ) -> int:
+        used = sum(d.storage_bytes for d in documents)
+        evicted = 0
+
+        for document in sorted(documents, key=lambda d: d.last_accessed):
+            if used <= quota:
+                break
+            if keep is not None and document.id == keep.id:
+                continue
+            used -= document.storage_bytes
+            self._evict(document, reason)
+            evicted += 1
+
+        return evicted
+
+    def _evict(self, document: UploadedDocument, reason: str) -> None:
+        size = document.storage_bytes
+        if delete_document(document.id):
+            self.metrics.evictions[reason] += 1
+            self.metrics.bytes_freed += size
+            logger.debug(f"Evicted document {document.id} ({reason}, {size} bytes)")
+
+    def _delete_orphan_files(self, older_than: datetime) -> None:
+        deleted, freed = get_blob_store().collect_garbage(older_than)
+        self.metrics.orphan_files_deleted += deleted
+        self.metrics.bytes_freed += freed
+
+
+_document_janitor: Optional[DocumentJanitor] = None
+
+
+def get_document_janitor(app_config: Optional[AppConfig] = None) -> DocumentJanitor:
+    """
+    Get the process-wide document janitor.
+
+    Args:
+        app_config: Configuration to build the janitor from. Defaults to the app config.
+
+    Returns:
+        DocumentJanitor instance.
+    """
+    global _document_janitor
+
+    if _document_janitor is None:
+        app_config = app_config or AppConfig.load_default()
+        _document_janitor = DocumentJanitor(app_config.document.retention)
+
+    return _document_janitor
+
+
+def janitor_metrics() -> dict:
+    """Eviction counters and current usage, for the metrics endpoint."""
+    janitor = get_document_janitor()
+    metrics = asdict(janitor.metrics)
+    if metrics["last_sweep_at"]:
+        metrics["last_sweep_at"] = metrics["last_sweep_at"].isoformat()
+
+    return {"enabled": janitor.config.enabled, **metrics, **janitor.usage()}
@@ -1,12 +1,22 @@
 """Document storage models for uploaded resumes and job descriptions."""
 
+import uuid
 from datetime import datetime
-from typing import Optional, Literal
-from pydantic import BaseModel, Field
+from typing import Any, Optional, Literal
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from utils.text_compression import compress_text, get_text_cache
+
+DocumentStatus = Literal["extracted", "summarizing", "ready", "failed"]
 
 
 class UploadedDocument(BaseModel):
-    """Model for uploaded document metadata."""
+    """
+    Model for uploaded document metadata.
+
+    The extracted text is passed in as extracted_text but held as a compressed
+    UTF-8 blob; reading extracted_text decompresses it through a small LRU.
+    """
 
     id: str = Field(description="Unique document ID (UUID)")
     file_hash: str = Field(description="Hash of file content for deduplication")
@@ -17,12 +27,72 @@ class UploadedDocument(BaseModel):
     file_format: Literal["pdf", "docx", "txt", "text"] = Field(
         description="File format"
     )
-    extracted_text: str = Field(description="Extracted text content")
+    text_blob: bytes = Field(
+        description="Compressed extracted text content", repr=False, exclude=True
+    )
+    text_length: int = Field(0, description="Length of the extracted text")
+    summary: Optional[str] = Field(
+        None, description="Summary used for analysis when the text is too long"
+    )
+    status: DocumentStatus = Field(
+        "ready", description="Processing status (extracted, summarizing, ready, failed)"
+    )
     upload_timestamp: datetime = Field(default_factory=datetime.now)
+    last_accessed: datetime = Field(
+        default_factory=datetime.now, description="Last time the document was used"
+    )
+    file_size: int = Field(0, description="Size of the stored file in bytes")
     session_id: Optional[str] = Field(None, description="Optional session identifier")
     metadata: Optional[dict] = Field(
         default_factory=dict, description="Additional metadata"
     )
 
+    _text_key: str = PrivateAttr(default_factory=lambda: uuid.uuid4().hex)
+
     class Config:
         json_encoders = {datetime: lambda v: v.isoformat()}
+
+    @model_validator(mode="before")
+    @classmethod
+    def _compress_extracted_text(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "extracted_text" in data:
+            data = dict(data)
+            text = data.pop("extracted_text")
+            data["text_blob"] = compress_text(text)
+            data["text_length"] = len(text)
+        return data
+
+    @property
+    def extracted_text(self) -> str:
+        """Extracted text content."""
+        return get_text_cache().get(self._text_key, self.text_blob)
+
+    @property
+    def analysis_text(self) -> str:
+        """Text to hand to the LLM: the summary if one was made, else the full text."""
+        return self.summary or self.extracted_text
+
+    @property
+    def storage_bytes(self) -> int:
+        """Bytes the document occupies: its file on disk plus its text in memory."""
+        summary_bytes = len(self.summary.encode("utf-8")) if self.summary else 0
+        return self.file_size + len(self.text_blob) + summary_bytes
+
+    def release_text(self) -> None:
+        """Drop the decompressed text from the cache, e.g. when deleting the document."""
+        get_text_cache().discard(self._text_key)
+
+
+class BatchUploadResult(BaseModel):
+    """Outcome of a single file in a batch upload."""
+
+    filename: str = Field(description="Filename (archive entry name for zip uploads)")
+    status: Literal["created", "duplicate", "error"] = Field(
+        description="created, duplicate (already stored) or error"
+    )
+    document_id: Optional[str] = Field(None, description="Stored document ID")
+    document_status: Optional[DocumentStatus] = Field(
+        None, description="Processing status of the stored document"
+    )
+    text_length: Optional[int] = Field(None, description="Extracted text length")
+    error: Optional[str] = Field(None, description="Error message if failed")
@@ -1,12 +1,18 @@
 """LLM-based analysis API for job descriptions and resumes."""
 
 import json
+import asyncio
 import logging
 from typing import Optional
 
+from pydantic import BaseModel, ValidationError
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from llm.inference import Inference
+from llm.response_cache import ResponseCache, get_response_cache
+from utils.app_config import get_app_config
+from utils.single_flight import SingleFlight
+from utils.section_parser import compact_for_prompt
 from job_analyzer.external_api.models import (
     JobDescriptionAnalysis,
     ResumeReview,
@@ -15,6 +21,50 @@ from job_analyzer.external_api.models import (
 
 logger = logging.getLogger(__name__)
 
+# Sections of each document type that the analysis prompts need. Resume
+# contact details and references, and JD benefits, compensation, EEO
+# statements and application instructions are left out. The resume summary
+# is kept: it often states total years of experience and seniority.
+JD_ANALYSIS_SECTIONS = (
+    "header",
+    "summary",
+    "about",
+    "role",
+    "responsibilities",
+    "requirements",
+    "preferred",
+    "skills",
+    "experience",
+    "education",
+    "certifications",
+    "additional",
+)
+RESUME_REVIEW_SECTIONS = (
+    "header",
+    "summary",
+    "skills",
+    "experience",
+    "education",
+    "certifications",
+    "projects",
+    "achievements",
+    "additional",
+)
+
+# Version of each prompt template in the response cache key. Bump it when the
+# template changes so cached responses to the old template are not reused.
+PROMPT_VERSIONS = {
+    "jd_analysis": "1",
+    "resume_review": "1",
+    "fit_score": "1",
+}
+
+# role_title of a JobDescriptionAnalysis whose extraction failed
+EXTRACTION_FAILED_TITLES = ("Could not extract", "Error during extraction")
+
+# Analysis LLM calls in flight, shared by concurrent identical requests
+analysis_flights = SingleFlight("analysis")
+
 
 async def _call_llm_for_analysis(prompt: str) -> str:
     """
@@ -69,12 +119,78 @@ def _extract_json_from_response(response: str) -> Optional[dict]:
     return None
 
 
-async def analyze_job_description_api(jd_text: str) -> JobDescriptionAnalysis:
+async def _analyze(
+    template: str, prompt: str, schema: type[BaseModel], bypass_cache: bool = False
+) -> Optional[dict]:
+    """
+    Run an analysis prompt and parse the JSON object in the response.
+
+    Analysis prompts are deterministic extractions, so parsed responses are
+    cached by template version, model, temperature and prompt, and a cache
+    hit skips the LLM entirely. Responses without a JSON object, or whose
+    JSON does not validate against the schema, are not cached. Concurrent
+    identical prompts (e.g. one JD analyzed for every candidate of a batch)
+    share a single LLM call.
+
+    Args:
+        template: Name of the prompt template, a key of PROMPT_VERSIONS.
+        prompt: The structured prompt for the LLM.
+        schema: Model the parsed JSON must validate against.
+        bypass_cache: Always call the LLM, and do not cache the response.
+
+    Returns:
+        Optional[dict]: Parsed JSON dict or None if extraction or validation fails.
+
+    Raises:
+        RuntimeError: If the LLM call fails.
+    """
+    model_config = get_app_config().inference.active_config()
+    key = ResponseCache.make_key(
+        template,
+        PROMPT_VERSIONS[template],
+        model_config.model,
+        model_config.temperature,
+        prompt,
+    )
+    cache = None if bypass_cache else get_response_cache()
+
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get, key)
+        if cached is not None:
+            logger.info(
+                f"Response cache hit for {template} (hit rate {cache.hit_rate:.0%})"
+            )
+            return json.loads(cached)
+
+    async def call() -> Optional[dict]:
+        result = _extract_json_from_response(await _call_llm_for_analysis(prompt))
+        if not result:
+            return None
+
+        try:
+            schema.model_validate(result)
+        except ValidationError as e:
+            logger.warning(f"LLM response does not match {schema.__name__}: {str(e)}")
+            return None
+
+        if cache is not None:
+            await asyncio.to_thread(cache.put, key, json.dumps(result))
+        return result
+
+    return await analysis_flights.do((key, bypass_cache), call)
+
+
+async def analyze_job_description_api(
+    jd_text: str, bypass_cache: bool = False
+) -> JobDescriptionAnalysis:
     """
     Analyze a job description to extract key information using LLM.
 
+    Only the sections in JD_ANALYSIS_SECTIONS are sent to the LLM.
+
     Args:
         jd_text: The full text of the job description.
+        bypass_cache: Always call the LLM instead of using a cached response.
 
     Returns:
         JobDescriptionAnalysis: Structured analysis of the job description.
@@ -134,30 +250,40 @@ Return ONLY the raw JSON object.
 
     try:
         logger.debug("Calling LLM for job description analysis")
-        response = await _call_llm_for_analysis(prompt.format(jd_text=jd_text))
-        result = _extract_json_from_response(response)
+        jd_text = compact_for_prompt(jd_text, JD_ANALYSIS_SECTIONS)
+        # str.replace, since the JSON schema braces would break str.format
+        result = await _analyze(
+            "jd_analysis",
+            prompt.replace("{jd_text}", jd_text),
+            JobDescriptionAnalysis,
+            bypass_cache,
+        )
 
         if result:
             return JobDescriptionAnalysis(**result)
         else:
             logger.warning("Failed to parse JSON from LLM response")
             return JobDescriptionAnalysis(
-                role_title="Could not extract",
+                role_title=EXTRACTION_FAILED_TITLES[0],
             )
     except Exception as e:
         logger.error(f"Error during job description analysis: {str(e)}", exc_info=True)
         return JobDescriptionAnalysis(
-            role_title="Error during extraction",
+            role_title=EXTRACTION_FAILED_TITLES[1],
         )
 
 
-async def review_resume_api(resume_text: str) -> ResumeReview:
+async def review_resume_api(
+    resume_text: str, bypass_cache: bool = False
+) -> ResumeReview:
     """
     Evaluate a resume against a job description using LLM.
 
+    Only the sections in RESUME_REVIEW_SECTIONS are sent to the LLM.
+
     Args:
         resume_text: The full text of the resume.
-        jd_text: The full text of the job description.
+        bypass_cache: Always call the LLM instead of using a cached response.
 
     Returns:
         ResumeReview: Structured review with strengths, gaps, and suggestions.
@@ -228,8 +354,13 @@ Return ONLY the raw JSON object.
 
     try:
         logger.debug("Calling LLM for resume review")
-        response = await _call_llm_for_analysis(prompt.format(resume_text=resume_text))
-        result = _extract_json_from_response(response)
+        resume_text = compact_for_prompt(resume_text, RESUME_REVIEW_SECTIONS)
+        result = await _analyze(
+            "resume_review",
+            prompt.replace("{resume_text}", resume_text),
+            ResumeReview,
+            bypass_cache,
+        )
 
         if result:
             return ResumeReview(**result)
@@ -241,13 +372,16 @@ Return ONLY the raw JSON object.
         return ResumeReview()
 
 
-async def calculate_fit_score_api(resume_text: str, jd_text: str) -> FitScore:
+async def calculate_fit_score_api(
+    resume_text: str, jd_text: str, bypass_cache: bool = False
+) -> FitScore:
     """
     Calculate a fit score for a candidate based on resume and JD using LLM.
 
     Args:
         resume_text: The full text of the resume.
         jd_text: The full text of the job description.
+        bypass_cache: Always call the LLM instead of using a cached response.
 
     Returns:
         FitScore: Score (0-100), confidence level, and explanation.
@@ -316,10 +450,12 @@ Return ONLY the raw JSON object.
 
     try:
         logger.debug("Calling LLM for fit score calculation")
-        response = await _call_llm_for_analysis(
-            prompt.format(jd_text=jd_text, resume_text=resume_text)
+        result = await _analyze(
+            "fit_score",
+            prompt.replace("{jd_text}", jd_text).replace("{resume_text}", resume_text),
+            FitScore,
+            bypass_cache,
         )
-        result = _extract_json_from_response(response)
 
         if result:
             return FitScore(**result)
@@ -351,3 +487,42 @@ Return ONLY the raw JSON object.
             final_recommendation="No Fit",
             data_sufficiency="Low",
         )
+
+
+def compact_analysis_json(analysis: JobDescriptionAnalysis | ResumeReview) -> str:
+    """
+    Serialize an extraction for a prompt, leaving out empty fields.
+
+    Args:
+        analysis: Structured JD or resume data.
+
+    Returns:
+        Compact JSON string.
+    """
+    return json.dumps(
+        analysis.model_dump(mode="json", exclude_defaults=True),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+async def calculate_fit_score_from_analyses(
+    resume: ResumeReview, jd: JobDescriptionAnalysis, bypass_cache: bool = False
+) -> FitScore:
+    """
+    Calculate a fit score from already extracted resume and JD data.
+
+    The scoring prompt is written for the output of the JD and resume
+    extraction prompts, so only their compact JSON is sent.
+
+    Args:
+        resume: Structured resume data from review_resume_api.
+        jd: Structured JD data from analyze_job_description_api.
+        bypass_cache: Always call the LLM instead of using a cached response.
+
+    Returns:
+        FitScore: Score (0-100), confidence level, and explanation.
+    """
+    return await calculate_fit_score_api(
+        compact_analysis_json(resume), compact_analysis_json(jd), bypass_cache
+    )
@@ -0,0 +1 @@
+# Document retrieval package
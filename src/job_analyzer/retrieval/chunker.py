@@ -0,0 +1,63 @@
+"""Split documents into overlapping, token-bounded chunks for embedding."""
+
+from utils.token_counter import count_tokens, split_text_by_tokens
+from job_analyzer.retrieval.models import DocumentChunk
+
+
+def chunk_text(
+    document_id: str,
+    text: str,
+    chunk_tokens: int,
+    overlap_tokens: int = 0,
+) -> list[DocumentChunk]:
+    """
+    Split a document into chunks on section boundaries.
+
+    Each chunk after the first starts with the last overlap_tokens tokens
+    (whole words) of the previous chunk so that facts spanning a boundary stay
+    retrievable from either side.
+
+    Args:
+        document_id: ID of the document being chunked.
+        text: Full document text.
+        chunk_tokens: Maximum tokens per chunk, excluding the overlap.
+        overlap_tokens: Tokens of the previous chunk repeated at the start.
+
+    Returns:
+        Chunks in document order.
+    """
+    pieces = split_text_by_tokens(text, chunk_tokens)
+    chunks: list[DocumentChunk] = []
+
+    for index, piece in enumerate(pieces):
+        chunk_text = piece.strip()
+        if index > 0 and overlap_tokens > 0:
+            overlap = _tail(pieces[index - 1], overlap_tokens)
+            if overlap:
+                chunk_text = f"{overlap}\n{chunk_text}"
+
+        chunks.append(
+            DocumentChunk(
+                document_id=document_id,
+                index=index,
+                text=chunk_text,
+                token_count=count_tokens(chunk_text),
+            )
+        )
+
+    return chunks
+
+
+def _tail(text: str, max_tokens: int) -> str:
+    """Last whole words of text that fit max_tokens."""
+    words = text.split()
+    tail: list[str] = []
+    tokens = 0
+
+    for word in reversed(words):
+        tokens += count_tokens(f" {word}")
+        if tokens > max_tokens:
+            break
+        tail.append(word)
+
+    return " ".join(reversed(tail))
@@ -0,0 +1,256 @@
+"""In-memory embedding index with brute-force NumPy search and optional HNSW."""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Iterable
+
+import numpy as np
+import xxhash
+
+try:
+    import hnswlib
+except ImportError:  # optional dependency
+    hnswlib = None
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingIndex:
+    """
+    Cosine-similarity index over embedding vectors grouped by owner.
+
+    Vectors are normalized on insert and kept in one contiguous float32 matrix,
+    so a search is a single matrix-vector product followed by a partial sort.
+    Each vector belongs to an owner (a document ID) and searches can be limited
+    to a set of owners.
+
+    When hnswlib is installed and the index holds at least ann_min_vectors
+    vectors, searches go through an HNSW graph instead. The graph is rebuilt
+    lazily after vectors are removed. When ann_path is given the graph is saved
+    there with a fingerprint of the vectors it was built from, and reused on
+    the next build if the vectors are unchanged (e.g. after a restart).
+    """
+
+    def __init__(
+        self,
+        ann_enabled: bool = True,
+        ann_min_vectors: int = 20000,
+        ann_path: Optional[Path] = None,
+    ):
+        self.ann_enabled = ann_enabled and hnswlib is not None
+        self.ann_min_vectors = ann_min_vectors
+        self.ann_path = ann_path
+
+        self._lock = threading.RLock()
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._size = 0
+        self._keys: list[str] = []
+        self._owners: list[str] = []
+        self._positions: dict[str, list[int]] = {}  # owner -> row positions
+        self._ann = None
+        self._ann_size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dimension(self) -> int:
+        return self._vectors.shape[1]
+
+    def contains(self, owner: str) -> bool:
+        """Check whether any vectors are indexed for an owner."""
+        return owner in self._positions
+
+    def add(self, owner: str, keys: list[str], vectors: np.ndarray) -> None:
+        """
+        Add the vectors of an owner, replacing any it already had.
+
+        Args:
+            owner: Owner of the vectors, e.g. a document ID.
+            keys: One key per vector, returned by search.
+            vectors: 2D array of shape (len(keys), dimension).
+        """
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+        if vectors.ndim != 2 or len(vectors) != len(keys):
+            raise ValueError("Expected one vector per key")
+
+        with self._lock:
+            if self._size and vectors.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Vector dimension {vectors.shape[1]} does not match index dimension {self.dimension}"
+                )
+
+            self.remove(owner)
+            self._reserve(len(vectors), vectors.shape[1])
+
+            start = self._size
+            self._vectors[start : start + len(vectors)] = vectors
+            self._size += len(vectors)
+            self._keys.extend(keys)
+            self._owners.extend([owner] * len(keys))
+            self._positions[owner] = list(range(start, self._size))
+
+            if self._ann is not None:
+                self._ann_add(vectors, start)
+
+    def remove(self, owner: str) -> int:
+        """
+        Remove all vectors of an owner.
+
+        Args:
+            owner: Owner of the vectors.
+
+        Returns:
+            Number of vectors removed.
+        """
+        with self._lock:
+            positions = self._positions.pop(owner, None)
+            if not positions:
+                return 0
+
+            keep = np.ones(self._size, dtype=bool)
+            keep[positions] = False
+            kept = np.flatnonzero(keep)
+
+            self._vectors[: len(kept)] = self._vectors[kept]
+            self._keys = [self._keys[i] for i in kept]
+            self._owners = [self._owners[i] for i in kept]
+            self._size = len(kept)
+            self._positions = {}
+            for position, row_owner in enumerate(self._owners):
+                self._positions.setdefault(row_owner, []).append(position)
+
+            # Row positions moved; the graph is rebuilt on the next search
+            self._ann = None
+            return len(positions)
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        owners: Optional[Iterable[str]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the k vectors most similar to the query.
+
+        Args:
+            query: Query vector.
+            k: Number of results.
+            owners: Only search vectors of these owners. Searches all if None.
+
+        Returns:
+            (key, cosine similarity) pairs, most similar first.
+        """
+        query = _normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+
+        with self._lock:
+            if self._size == 0 or k <= 0:
+                return []
+
+            rows = None
+            if owners is not None:
+                rows = [p for owner in owners for p in self._positions.get(owner, [])]
+                if not rows:
+                    return []
+
+            if self._use_ann():
+                return self._ann_search(query, k, rows)
+
+            if rows is None:
+                scores = self._vectors[: self._size] @ query
+                candidates = np.arange(self._size)
+            else:
+                candidates = np.asarray(rows)
+                scores = self._vectors[candidates] @ query
+
+            k = min(k, len(scores))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            return [(self._keys[candidates[i]], float(scores[i])) for i in top]
+
+    def _reserve(self, count: int, dimension: int) -> None:
+        """Grow the vector matrix geometrically so appends stay amortized O(1)."""
+        needed = self._size + count
+        capacity = self._vectors.shape[0]
+        if needed <= capacity and self._vectors.shape[1] == dimension:
+            return
+
+        new_capacity = max(needed, capacity * 2, 64)
+        grown = np.empty((new_capacity, dimension), dtype=np.float32)
+        if self._size:
+            grown[: self._size] = self._vectors[: self._size]
+        self._vectors = grown
+
+    def _use_ann(self) -> bool:
+        if not self.ann_enabled or self._size < self.ann_min_vectors:
+            return False
+
+        if self._ann is None:
+            self._build_ann()
+        return True
+
+    def _build_ann(self) -> None:
+        """Build (or load) the HNSW graph over all vectors."""
+        ann = hnswlib.Index(space="ip", dim=self.dimension)
+        fingerprint = xxhash.xxh64(self._vectors[: self._size].tobytes()).hexdigest()
+        fingerprint_path = (
+            self.ann_path.with_suffix(".fingerprint") if self.ann_path else None
+        )
+
+        if (
+            fingerprint_path
+            and fingerprint_path.exists()
+            and fingerprint_path.read_text() == fingerprint
+        ):
+            try:
+                ann.load_index(str(self.ann_path), max_elements=self._size * 2)
+                self._ann, self._ann_size = ann, self._size
+                logger.info(f"Loaded ANN index from {self.ann_path}")
+                return
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable ANN index {self.ann_path}: {e}")
+                ann = hnswlib.Index(space="ip", dim=self.dimension)
+
+        ann.init_index(
+            max_elements=max(self._size * 2, 1024), ef_construction=200, M=16
+        )
+        ann.add_items(self._vectors[: self._size], np.arange(self._size))
+        ann.set_ef(64)
+        self._ann, self._ann_size = ann, self._size
+        logger.info(f"Built ANN index over {self._size} vectors")
+
+        if self.ann_path:
+            self.ann_path.parent.mkdir(parents=True, exist_ok=True)
+            ann.save_index(str(self.ann_path))
+            fingerprint_path.write_text(fingerprint)
+
+    def _ann_add(self, vectors: np.ndarray, start: int) -> None:
+        needed = start + len(vectors)
+        if needed > self._ann.get_max_elements():
+            self._ann.resize_index(needed * 2)
+        self._ann.add_items(vectors, np.arange(start, needed))
+        self._ann_size = needed
+
+    def _ann_search(
+        self, query: np.ndarray, k: int, rows: Optional[list[int]]
+    ) -> list[tuple[str, float]]:
+        allowed = set(rows) if rows is not None else None
+        k = min(k, len(allowed) if allowed is not None else self._size)
+        labels, distances = self._ann.knn_query(
+            query,
+            k=k,
+            filter=(lambda label: label in allowed) if allowed is not None else None,
+        )
+        # Inner product space reports 1 - similarity as the distance
+        return [
+            (self._keys[label], float(1.0 - distance))
+            for label, distance in zip(labels[0], distances[0])
+        ]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
@@ -0,0 +1,16 @@
+"""Models for document chunks used in retrieval."""
+
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class DocumentChunk(BaseModel):
+    """A contiguous piece of a document's text."""
+
+    document_id: str = Field(description="ID of the document the chunk belongs to")
+    index: int = Field(description="Position of the chunk within the document")
+    text: str = Field(description="Chunk text")
+    token_count: int = Field(description="Number of tokens in the chunk")
+    score: Optional[float] = Field(
+        None, description="Similarity to the query, set on retrieved chunks"
+    )
@@ -0,0 +1,346 @@
+"""Retrieve the chunks of uploaded documents that are relevant to a question."""
+
+import asyncio
+import logging
+from typing import Optional
+
+import numpy as np
+
+from llm.embedding import Embedder, create_embedder, embedding_model_name
+from utils.vars import get_app_path
+from utils.constants import RETRIEVAL_INDEX_FOLDER, VECTOR_STORE_FOLDER
+from utils.app_config import AppConfig, RetrievalConfig, get_app_config
+from utils.token_counter import count_tokens
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.retrieval.chunker import chunk_text
+from job_analyzer.retrieval.index import EmbeddingIndex
+from job_analyzer.retrieval.models import DocumentChunk
+from job_analyzer.retrieval.vector_store import MmapVectorStore
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SEPARATOR = "\n[...]\n"
+# Marks a document sent whole in retrieve_new_document_context
+WHOLE_DOCUMENT = -1
+
+
+class DocumentRetriever:
+    """
+    Chunk, embed and index documents, and retrieve their most relevant chunks.
+
+    Documents are indexed lazily the first time they are queried. Documents
+    short enough to fit config.full_text_max_tokens are never indexed, since
+    sending them whole costs no more than a handful of chunks.
+
+    Vectors are keyed by document content hash, so re-uploads and other
+    workers sharing an on-disk store reuse them; chunking is deterministic, so
+    only the chunk texts are rebuilt locally.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        index: EmbeddingIndex | MmapVectorStore,
+        config: RetrievalConfig,
+    ):
+        self.embedder = embedder
+        self.index = index
+        self.config = config
+
+        self._chunks: dict[str, list[DocumentChunk]] = {}  # document ID -> chunks
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def index_document(self, document: UploadedDocument) -> int:
+        """
+        Chunk and embed a document unless it is already indexed.
+
+        Args:
+            document: Document to index.
+
+        Returns:
+            Number of chunks indexed for the document.
+        """
+        owner = self.owner_for(document)
+        lock = self._locks.setdefault(owner, asyncio.Lock())
+
+        async with lock:
+            if owner in self._chunks and self.index.contains(owner):
+                return len(self._chunks[owner])
+
+            chunks = chunk_text(
+                document.id,
+                document.extracted_text,
+                self.config.chunk_tokens,
+                self.config.chunk_overlap_tokens,
+            )
+            if not chunks:
+                return 0
+
+            if self.index.contains(owner):
+                logger.info(f"Reusing stored vectors for document {document.id}")
+            else:
+                vectors = await self.embedder.aembed_documents([c.text for c in chunks])
+                self.index.add(
+                    owner,
+                    [f"{owner}:{c.index}" for c in chunks],
+                    np.asarray(vectors, np.float32),
+                )
+                logger.info(f"Indexed document {document.id} as {len(chunks)} chunks")
+
+            self._chunks[owner] = chunks
+            return len(chunks)
+
+    async def retrieve(
+        self,
+        query: str,
+        documents: list[UploadedDocument],
+        top_k: Optional[int] = None,
+    ) -> list[DocumentChunk]:
+        """
+        Retrieve the chunks of the given documents most relevant to a query.
+
+        Args:
+            query: The user's question or message.
+            documents: Documents to search.
+            top_k: Number of chunks per document. Defaults to the config.
+
+        Returns:
+            Retrieved chunks with their scores, grouped by document in the given
+            order and in document order within each document.
+        """
+        top_k = top_k or self.config.top_k
+        await asyncio.gather(*(self.index_document(d) for d in documents))
+
+        query_vector = np.asarray(await self.embedder.aembed_query(query), np.float32)
+
+        retrieved: list[DocumentChunk] = []
+        for document in documents:
+            owner = self.owner_for(document)
+            document_chunks = self._chunks.get(owner, [])
+            hits = self.index.search(query_vector, top_k, owners=[owner])
+            chunks = [
+                document_chunks[index].model_copy(
+                    update={"document_id": document.id, "score": score}
+                )
+                for key, score in hits
+                if (index := int(key.rsplit(":", 1)[1])) < len(document_chunks)
+            ]
+            retrieved.extend(sorted(chunks, key=lambda c: c.index))
+
+        return retrieved
+
+    def remove_document(self, document: UploadedDocument) -> None:
+        """Drop a document's chunks and vectors."""
+        owner = self.owner_for(document)
+        self.index.remove(owner)
+        self._locks.pop(owner, None)
+        self._chunks.pop(owner, None)
+
+    def owner_for(self, document: UploadedDocument) -> str:
+        """Key of a document's vectors: its content and the chunking settings."""
+        return (
+            f"doc-{document.file_hash}-"
+            f"{self.config.chunk_tokens}-{self.config.chunk_overlap_tokens}"
+        )
+
+    async def relevant_chunks(
+        self, query: str, document: UploadedDocument
+    ) -> Optional[list[DocumentChunk]]:
+        """
+        Chunks of a document to put in the prompt for a query.
+
+        Args:
+            query: The user's question or message.
+            document: Document to take the chunks from.
+
+        Returns:
+            The chunks most relevant to the query, or None if the document
+            should be sent whole: it is short, retrieval is disabled, or
+            retrieval failed.
+        """
+        full_tokens = count_tokens(document.extracted_text)
+        if not self.config.enabled or full_tokens <= self.config.full_text_max_tokens:
+            return None
+
+        try:
+            chunks = await self.retrieve(query, [document])
+        except Exception as e:
+            logger.error(
+                f"Retrieval failed for document {document.id}, sending it whole: {str(e)}",
+                exc_info=True,
+            )
+            return None
+
+        logger.info(
+            f"Retrieved {len(chunks)} chunks ({sum(c.token_count for c in chunks)} tokens) "
+            f"from document {document.id} ({full_tokens} tokens in full)"
+        )
+        return chunks
+
+    async def document_context(self, query: str, document: UploadedDocument) -> str:
+        """
+        Text of a document to put in the prompt for a query.
+
+        Short documents are returned whole. Longer documents are reduced to the
+        chunks most relevant to the query. If retrieval fails the analysis text
+        (summary or full text) is used instead, waiting a bounded time for a
+        pending summary.
+
+        Args:
+            query: The user's question or message.
+            document: Document to take the context from.
+
+        Returns:
+            Context text for the prompt.
+        """
+        chunks = await self.relevant_chunks(query, document)
+        if chunks is None:
+            return await whole_document_text(document, self.config)
+
+        return CHUNK_SEPARATOR.join(c.text for c in chunks)
+
+
+_document_retriever: Optional[DocumentRetriever] = None
+
+
+def get_document_retriever(
+    app_config: Optional[AppConfig] = None,
+) -> DocumentRetriever:
+    """
+    Get the process-wide document retriever.
+
+    Args:
+        app_config: Configuration to build the retriever from. Defaults to the app config.
+
+    Returns:
+        DocumentRetriever instance.
+    """
+    global _document_retriever
+
+    if _document_retriever is None:
+        app_config = app_config or get_app_config()
+        config = app_config.document.retrieval
+
+        store_config = app_config.embed.vector_store
+
+        if store_config.enabled:
+            index = MmapVectorStore(
+                get_app_path().joinpath(
+                    VECTOR_STORE_FOLDER, embedding_model_name(app_config)
+                ),
+                compact_min_dead_ratio=store_config.compact_min_dead_ratio,
+                compact_min_rows=store_config.compact_min_rows,
+            )
+        else:
+            index = EmbeddingIndex(
+                ann_enabled=config.ann_enabled,
+                ann_min_vectors=config.ann_min_vectors,
+                ann_path=get_app_path().joinpath(RETRIEVAL_INDEX_FOLDER, "chunks.hnsw"),
+            )
+
+        _document_retriever = DocumentRetriever(
+            embedder=create_embedder(app_config),
+            index=index,
+            config=config,
+        )
+        logger.info(f"Document retriever initialized with {type(index).__name__}")
+
+    return _document_retriever
+
+
+async def whole_document_text(
+    document: UploadedDocument, config: RetrievalConfig
+) -> str:
+    """
+    Analysis text of a document that is sent whole instead of as chunks.
+
+    Retrieval only needs the extracted text, so callers look documents up
+    without waiting for their summary. A document sent whole waits up to
+    config.summary_wait_seconds for a pending summary, then uses whatever
+    analysis text it has.
+
+    Args:
+        document: Document to send.
+        config: Retrieval configuration.
+
+    Returns:
+        The summary, or the full text if there is none.
+    """
+    from job_analyzer.document_storage.document_manager import get_ready_document
+
+    ready = await get_ready_document(document.id, config.summary_wait_seconds)
+    return (ready or document).analysis_text
+
+
+def discard_document(document: UploadedDocument) -> None:
+    """Remove a deleted document from the retriever, if one was created."""
+    if _document_retriever is not None:
+        _document_retriever.remove_document(document)
+
+
+async def retrieve_document_context(query: str, document: UploadedDocument) -> str:
+    """
+    Text of a document to put in the prompt for a query.
+
+    See DocumentRetriever.document_context. Falls back to the analysis text if
+    the retriever cannot be created (e.g. the embedding API key is missing).
+
+    Args:
+        query: The user's question or message.
+        document: Document to take the context from.
+
+    Returns:
+        Context text for the prompt.
+    """
+    try:
+        retriever = get_document_retriever()
+    except Exception as e:
+        logger.error(f"Document retriever unavailable: {str(e)}")
+        return await whole_document_text(document, get_app_config().document.retrieval)
+
+    return await retriever.document_context(query, document)
+
+
+async def retrieve_new_document_context(
+    query: str, document: UploadedDocument, sent: set[int]
+) -> Optional[str]:
+    """
+    Text of a document to add to a conversation for a query, leaving out what
+    the conversation already holds.
+
+    A document sent whole is never sent again. For long documents only the
+    relevant chunks not sent on an earlier turn are returned.
+
+    Args:
+        query: The user's question or message.
+        document: Document to take the context from.
+        sent: Indexes of the chunks already in the conversation, or
+            WHOLE_DOCUMENT once the document was sent whole. Updated in place.
+
+    Returns:
+        Context text for the prompt, or None if nothing new is relevant.
+    """
+    if WHOLE_DOCUMENT in sent:
+        return None
+
+    try:
+        retriever = get_document_retriever()
+    except Exception as e:
+        logger.error(f"Document retriever unavailable: {str(e)}")
+        chunks, config = None, get_app_config().document.retrieval
+    else:
+        chunks, config = (
+            await retriever.relevant_chunks(query, document),
+            retriever.config,
+        )
+
+    if chunks is None:
+        sent.add(WHOLE_DOCUMENT)
+        return await whole_document_text(document, config)
+
+    new_chunks = [c for c in chunks if c.index not in sent]
+    if not new_chunks:
+        return None
+
+    sent.update(c.index for c in new_chunks)
+    return CHUNK_SEPARATOR.join(c.text for c in new_chunks)
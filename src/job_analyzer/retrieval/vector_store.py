@@ -0,0 +1,376 @@
+"""Append-only, memory-mapped on-disk store for embedding vectors."""
+
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Optional, Iterable, Iterator
+
+import numpy as np
+
+from job_analyzer.retrieval.index import _normalize
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; single-process use only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = "CURRENT"
+LOCK_FILE = ".lock"
+
+
+class MmapVectorStore:
+    """
+    Vector store whose float32 vectors live in a flat, memory-mapped file.
+
+    The store directory holds one generation of files:
+
+    - vectors-<gen>.f32: normalized vectors, one row after another
+    - ids-<gen>.jsonl: a log of {"op": "add", "key", "owner"} records (one per
+      row, in row order) and {"op": "delete", "owner"} tombstones
+    - CURRENT: the live generation and the vector dimension
+
+    Writers append vector bytes before the log records that reference them,
+    under an exclusive file lock, so a reader that replays the log never sees a
+    row whose bytes are missing. Bytes left past the last logged row by a
+    failed write are truncated before the next append. Every process maps the same file read-only, so
+    workers share the vector pages through the OS page cache instead of each
+    holding a copy. Before each operation a process replays any log records
+    appended by other processes.
+
+    Deleted rows stay in the file until the dead fraction reaches
+    compact_min_dead_ratio. Compaction then writes the live rows to a new
+    generation and switches CURRENT atomically. Processes still mapping the
+    old files keep working until they refresh.
+
+    Exposes the same interface as EmbeddingIndex.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compact_min_dead_ratio: float = 0.3,
+        compact_min_rows: int = 1000,
+    ):
+        self.path = Path(path)
+        self.compact_min_dead_ratio = compact_min_dead_ratio
+        self.compact_min_rows = compact_min_rows
+
+        self._lock = threading.RLock()
+        self._generation = -1
+        self._dimension = 0
+        self._log_offset = 0
+        self._reset_rows()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._refresh()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return int(self._live[: self._rows].sum())
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def contains(self, owner: str) -> bool:
+        """Check whether any vectors are stored for an owner."""
+        with self._lock:
+            self._refresh()
+            return owner in self._positions
+
+    def add(self, owner: str, keys: list[str], vectors: np.ndarray) -> None:
+        """
+        Add the vectors of an owner, replacing any it already had.
+
+        Args:
+            owner: Owner of the vectors, e.g. a document ID.
+            keys: One key per vector, returned by search.
+            vectors: 2D array of shape (len(keys), dimension).
+        """
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+        if vectors.ndim != 2 or len(vectors) != len(keys):
+            raise ValueError("Expected one vector per key")
+
+        with self._lock, self._file_lock():
+            self._refresh()
+
+            if self._generation < 0:
+                self._start_generation(0, vectors.shape[1])
+            elif vectors.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Vector dimension {vectors.shape[1]} does not match store dimension {self._dimension}"
+                )
+
+            records = []
+            if owner in self._positions:
+                records.append({"op": "delete", "owner": owner})
+            records.extend({"op": "add", "key": k, "owner": owner} for k in keys)
+
+            self._drop_unlogged_tail()
+            with open(self._vectors_path(), "ab") as f:
+                f.write(np.ascontiguousarray(vectors).tobytes())
+            self._append_log(records)
+
+            self._refresh()
+            self._maybe_compact()
+
+    def remove(self, owner: str) -> int:
+        """
+        Remove all vectors of an owner.
+
+        Args:
+            owner: Owner of the vectors.
+
+        Returns:
+            Number of vectors removed.
+        """
+        with self._lock, self._file_lock():
+            self._refresh()
+            positions = self._positions.get(owner)
+            if not positions:
+                return 0
+
+            self._drop_unlogged_tail()
+            self._append_log([{"op": "delete", "owner": owner}])
+            self._refresh()
+            self._maybe_compact()
+            return len(positions)
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        owners: Optional[Iterable[str]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the k stored vectors most similar to the query.
+
+        Args:
+            query: Query vector.
+            k: Number of results.
+            owners: Only search vectors of these owners. Searches all if None.
+
+        Returns:
+            (key, cosine similarity) pairs, most similar first.
+        """
+        query = _normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+
+        with self._lock:
+            self._refresh()
+            if self._vectors is None or k <= 0:
+                return []
+
+            if owners is None:
+                candidates = np.flatnonzero(self._live[: self._rows])
+                if len(candidates) == self._rows:
+                    scores = self._vectors[: self._rows] @ query
+                else:
+                    scores = self._vectors[candidates] @ query
+            else:
+                rows = [p for owner in owners for p in self._positions.get(owner, [])]
+                candidates = np.asarray(rows, dtype=np.int64)
+                scores = self._vectors[candidates] @ query
+
+            if len(candidates) == 0:
+                return []
+
+            k = min(k, len(candidates))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            return [(self._keys[candidates[i]], float(scores[i])) for i in top]
+
+    def compact(self) -> None:
+        """Rewrite the live rows into a new generation, dropping deleted rows."""
+        with self._lock, self._file_lock():
+            self._refresh()
+            self._compact()
+
+    def _maybe_compact(self) -> None:
+        dead = self._rows - int(self._live[: self._rows].sum())
+        if (
+            self._rows >= self.compact_min_rows
+            and dead >= self._rows * self.compact_min_dead_ratio
+        ):
+            self._compact()
+
+    def _compact(self) -> None:
+        if self._generation < 0:
+            return
+
+        live = np.flatnonzero(self._live[: self._rows])
+        old_generation = self._generation
+        new_generation = old_generation + 1
+
+        with open(self._vectors_path(new_generation), "wb") as f:
+            for start in range(0, len(live), 4096):
+                f.write(self._vectors[live[start : start + 4096]].tobytes())
+
+        with open(self._log_path(new_generation), "w", encoding="utf-8") as f:
+            for row in live:
+                f.write(
+                    json.dumps(
+                        {
+                            "op": "add",
+                            "key": self._keys[row],
+                            "owner": self._owners[row],
+                        }
+                    )
+                    + "\n"
+                )
+
+        self._write_current(new_generation, self._dimension)
+        self._refresh()
+
+        for old_path in (
+            self._vectors_path(old_generation),
+            self._log_path(old_generation),
+        ):
+            old_path.unlink(missing_ok=True)
+
+        logger.info(
+            f"Compacted vector store {self.path}: {len(live)} live rows kept, "
+            f"generation {new_generation}"
+        )
+
+    def _start_generation(self, generation: int, dimension: int) -> None:
+        self._vectors_path(generation).touch()
+        self._log_path(generation).touch()
+        self._write_current(generation, dimension)
+        self._refresh()
+
+    def _write_current(self, generation: int, dimension: int) -> None:
+        current = self.path / CURRENT_FILE
+        temp = current.with_name(f".{CURRENT_FILE}.{os.getpid()}.tmp")
+        temp.write_text(json.dumps({"generation": generation, "dimension": dimension}))
+        os.replace(temp, current)
+
+    def _drop_unlogged_tail(self) -> None:
+        """
+        Cut what a failed write left past the last complete log record.
+
+        Rows are numbered by counting add records, so vector bytes whose log
+        write failed would shift every row appended after them, and a partial
+        log line would corrupt the next record. Called under the file lock
+        after a refresh, when nothing past these offsets belongs to any row.
+        """
+        row_bytes = self._rows * self._dimension * np.dtype(np.float32).itemsize
+        for path, size in (
+            (self._vectors_path(), row_bytes),
+            (self._log_path(), self._log_offset),
+        ):
+            if path.stat().st_size > size:
+                logger.warning(
+                    f"Dropping {path.stat().st_size - size} unlogged bytes from {path}"
+                )
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+
+    def _append_log(self, records: list[dict]) -> None:
+        lines = "".join(json.dumps(r) + "\n" for r in records)
+        with open(self._log_path(), "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def _refresh(self) -> None:
+        """Pick up generation switches and log records written by any process."""
+        current = self.path / CURRENT_FILE
+        try:
+            state = json.loads(current.read_text())
+        except FileNotFoundError:
+            return
+
+        if state["generation"] != self._generation:
+            self._generation = state["generation"]
+            self._dimension = state["dimension"]
+            self._log_offset = 0
+            self._reset_rows()
+
+        try:
+            with open(self._log_path(), "rb") as f:
+                f.seek(self._log_offset)
+                data = f.read()
+        except FileNotFoundError:
+            # Compacted by another process between reading CURRENT and the log
+            self._generation = -1
+            return self._refresh()
+
+        # Only consume complete lines; a writer may be mid-append
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return
+        self._log_offset += end
+
+        for line in data[:end].splitlines():
+            record = json.loads(line)
+            if record["op"] == "add":
+                self._add_row(record["key"], record["owner"])
+            elif record["op"] == "delete":
+                for row in self._positions.pop(record["owner"], []):
+                    self._live[row] = False
+
+        self._map_vectors()
+
+    def _add_row(self, key: str, owner: str) -> None:
+        row = self._rows
+        if row >= len(self._live):
+            self._live = np.concatenate(
+                [self._live, np.zeros(max(len(self._live), 1024), dtype=bool)]
+            )
+        self._live[row] = True
+        self._keys.append(key)
+        self._owners.append(owner)
+        self._positions.setdefault(owner, []).append(row)
+        self._rows += 1
+
+    def _map_vectors(self) -> None:
+        mapped = 0 if self._vectors is None else len(self._vectors)
+        if self._rows == mapped:
+            return
+
+        self._vectors = (
+            np.memmap(
+                self._vectors_path(),
+                dtype=np.float32,
+                mode="r",
+                shape=(self._rows, self._dimension),
+            )
+            if self._rows
+            else None
+        )
+
+    def _reset_rows(self) -> None:
+        self._rows = 0
+        self._keys: list[str] = []
+        self._owners: list[str] = []
+        self._positions: dict[str, list[int]] = {}
+        self._live = np.zeros(0, dtype=bool)
+        self._vectors: Optional[np.memmap] = None
+
+    def _vectors_path(self, generation: Optional[int] = None) -> Path:
+        generation = self._generation if generation is None else generation
+        return self.path / f"vectors-{generation}.f32"
+
+    def _log_path(self, generation: Optional[int] = None) -> Path:
+        generation = self._generation if generation is None else generation
+        return self.path / f"ids-{generation}.jsonl"
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock shared by every process writing to the store."""
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.path / LOCK_FILE, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1 @@
+# Deterministic fit scoring package
@@ -0,0 +1,483 @@
+"""Rule-based fit scoring of structured JD and resume data, without an LLM."""
+
+import re
+import logging
+from datetime import date
+from typing import Optional
+
+import numpy as np
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from llm.inference import Inference
+from utils.section_parser import find_date_ranges
+from job_analyzer.external_api.llm_analysis import EXTRACTION_FAILED_TITLES
+from job_analyzer.external_api.models import (
+    FitScore,
+    JobDescriptionAnalysis,
+    ResumeReview,
+    ScoreBreakdown,
+)
+from job_analyzer.scoring.skills import mentioned_skills, skill_set
+
+logger = logging.getLogger(__name__)
+
+# Points of each category, as in the LLM scoring policy
+HARD_SKILLS_POINTS = 40
+EXPERIENCE_POINTS = 30
+EDUCATION_POINTS = 10
+SOFT_SKILLS_POINTS = 20
+
+# Split of the experience points
+YEARS_POINTS = 18
+SENIORITY_POINTS = 7
+DOMAIN_POINTS = 5
+
+# Weight of a skill named in a must-have requirement, against 1 for the others
+MUST_HAVE_WEIGHT = 2.0
+
+SENIORITY_LEVELS = {
+    "intern": 0,
+    "trainee": 0,
+    "junior": 1,
+    "jr": 1,
+    "entry": 1,
+    "graduate": 1,
+    "associate": 1,
+    "mid": 2,
+    "senior": 3,
+    "sr": 3,
+    "lead": 4,
+    "staff": 4,
+    "manager": 4,
+    "principal": 5,
+    "architect": 5,
+    "head": 5,
+    "director": 6,
+    "vp": 7,
+    "chief": 8,
+}
+# Level of a title without a seniority word, e.g. "Software Engineer"
+DEFAULT_SENIORITY = 2
+
+DEGREE_LEVELS = (
+    (re.compile(r"\b(?:ph\.?\s?d|doctora(?:te|l))\b", re.I), 4),
+    (re.compile(r"\b(?:master'?s?|m\.?\s?sc?|m\.?\s?tech|mba|m\.?\s?eng)\b", re.I), 3),
+    (
+        re.compile(
+            r"\b(?:bachelor'?s?|b\.?\s?sc?|b\.?\s?tech|b\.?\s?e|b\.?\s?a)\b", re.I
+        ),
+        2,
+    ),
+    (re.compile(r"\b(?:associate'?s?|diploma)\b", re.I), 1),
+)
+
+_YEARS = re.compile(r"(\d+(?:\.\d+)?)\s*\+?\s*(?:-\s*\d+\s*)?(?:years?|yrs?)\b", re.I)
+_WORD = re.compile(r"[a-z][a-z0-9+#.-]{3,}")
+_STOPWORDS = frozenset(
+    "must have with experience years year industry domain knowledge "
+    "working work strong ability able should required preferred plus "
+    "from that this their they will into within least".split()
+)
+
+
+def score_resumes(
+    jd: JobDescriptionAnalysis, resumes: list[ResumeReview]
+) -> list[FitScore]:
+    """
+    Score resumes against a job description by the rules of the scoring prompt.
+
+    Skill names are normalized through the synonym table and the skills of
+    every resume are compared with the JD at once as a matrix, so scoring a
+    batch is a few array operations rather than one LLM call per resume.
+
+    Args:
+        jd: Structured JD data from analyze_job_description_api.
+        resumes: Structured resume data from review_resume_api.
+
+    Returns:
+        FitScore of each resume, in order.
+    """
+    if not resumes:
+        return []
+
+    hard_weights = hard_skill_weights(jd)
+    soft_weights = {key: 1.0 for key in skill_set(jd.soft_skills)}
+    certificate_weights = {key: 1.0 for key in skill_set(jd.certification_requirements)}
+
+    evidence = [_resume_text(resume) for resume in resumes]
+    mentioned = [mentioned_skills(text) for text in evidence]
+    hard_skills = [
+        skill_set(resume.technical_skills) | found
+        for resume, found in zip(resumes, mentioned)
+    ]
+    soft_skills = [
+        skill_set(resume.soft_skills) | found
+        for resume, found in zip(resumes, mentioned)
+    ]
+    certificates = [
+        skill_set(resume.certifications) | found
+        for resume, found in zip(resumes, mentioned)
+    ]
+
+    hard = HARD_SKILLS_POINTS * skill_coverage(hard_weights, hard_skills)
+    soft = SOFT_SKILLS_POINTS * skill_coverage(soft_weights, soft_skills)
+    certified = skill_coverage(certificate_weights, certificates)
+
+    required_years = _required_years(jd.experience_requirements)
+    required_level = _seniority(jd.role_title) if _known_title(jd) else None
+    required_degree = _degree_level(jd.education_requirements or "")
+    domain_words = _content_words(jd.industry_domain or "")
+
+    scores = []
+    for i, resume in enumerate(resumes):
+        years = _years_of_experience(resume)
+        level = max(
+            (_seniority(job.job_title) for job in resume.work_experience),
+            default=None,
+        )
+        experience, experience_notes = _experience_points(
+            required_years, years, required_level, level, domain_words, evidence[i]
+        )
+        education, education_notes = _education_points(
+            jd, required_degree, resume, certified[i]
+        )
+        missing_deal_breakers = [
+            requirement
+            for requirement in jd.deal_breakers
+            if not _satisfies(
+                requirement, hard_skills[i] | soft_skills[i], years, evidence[i]
+            )
+        ]
+
+        points = (hard[i], experience, education, soft[i])
+        overall = 0 if missing_deal_breakers else min(100, round(sum(points)))
+
+        trace = [
+            _skills_note(
+                "Hard skills", hard[i], HARD_SKILLS_POINTS, hard_weights, hard_skills[i]
+            ),
+            f"Experience {experience:.1f}/{EXPERIENCE_POINTS}: {experience_notes}.",
+            f"Education {education:.1f}/{EDUCATION_POINTS}: {education_notes}.",
+            _skills_note(
+                "Soft skills", soft[i], SOFT_SKILLS_POINTS, soft_weights, soft_skills[i]
+            ),
+        ]
+        if missing_deal_breakers:
+            trace.append(
+                f"Deal breakers missing, score set to 0: {'; '.join(missing_deal_breakers)}."
+            )
+
+        scores.append(
+            FitScore(
+                overall_score=overall,
+                score_breakdown=ScoreBreakdown(
+                    hard_skills=min(HARD_SKILLS_POINTS, round(hard[i])),
+                    experience=min(EXPERIENCE_POINTS, round(experience)),
+                    education=min(EDUCATION_POINTS, round(education)),
+                    soft_skills=min(SOFT_SKILLS_POINTS, round(soft[i])),
+                ),
+                deal_breakers_found=missing_deal_breakers,
+                reasoning_trace=" ".join(trace),
+                final_recommendation=_recommendation(overall),
+                data_sufficiency=_data_sufficiency(jd, resume),
+            )
+        )
+
+    logger.debug(f"Scored {len(resumes)} resumes against '{jd.role_title}' locally")
+    return scores
+
+
+def score_fit(jd: JobDescriptionAnalysis, resume: ResumeReview) -> FitScore:
+    """
+    Score one resume against a job description, see score_resumes.
+
+    Args:
+        jd: Structured JD data.
+        resume: Structured resume data.
+
+    Returns:
+        FitScore of the resume.
+    """
+    return score_resumes(jd, [resume])[0]
+
+
+async def narrate_reasoning(
+    jd: JobDescriptionAnalysis, resume: ResumeReview, score: FitScore
+) -> FitScore:
+    """
+    Replace the rule-based reasoning trace of a score with an LLM-written one.
+
+    The scores themselves are kept; the model only explains them.
+
+    Args:
+        jd: Structured JD data the score was computed from.
+        resume: Structured resume data the score was computed from.
+        score: Score from score_resumes.
+
+    Returns:
+        The score with a narrative reasoning_trace, or unchanged if the LLM
+        call fails.
+    """
+    prompt = (
+        "Explain this candidate fit score to a recruiter in at most five "
+        "sentences of plain text. Do not change or dispute the numbers.\n\n"
+        f"Role: {jd.role_title}\n"
+        f"Candidate: {resume.candidate_name or 'Unknown'}\n"
+        f"Score: {score.model_dump_json(exclude={'reasoning_trace'})}\n"
+        f"Scoring notes: {score.reasoning_trace}"
+    )
+    try:
+        narrative = await Inference().chat(
+            [
+                SystemMessage(content="You summarize hiring fit scores."),
+                HumanMessage(content=prompt),
+            ]
+        )
+    except Exception as e:
+        logger.error(f"Failed to narrate fit score: {str(e)}")
+        return score
+
+    if not narrative.strip():
+        return score
+    return score.model_copy(update={"reasoning_trace": narrative.strip()})
+
+
+def skill_coverage(weights: dict[str, float], candidates: list[set[str]]) -> np.ndarray:
+    """
+    Weighted share of the required skills each candidate has.
+
+    Args:
+        weights: Weight of each required skill key.
+        candidates: Skill keys of each candidate.
+
+    Returns:
+        Share (0-1) per candidate, 1 for everyone if no skill is required.
+    """
+    if not weights:
+        return np.ones(len(candidates))
+
+    vocabulary = {key: column for column, key in enumerate(weights)}
+    matches = np.zeros((len(candidates), len(vocabulary)), dtype=bool)
+    for row, keys in enumerate(candidates):
+        columns = [vocabulary[key] for key in keys if key in vocabulary]
+        matches[row, columns] = True
+
+    weight = np.fromiter(weights.values(), dtype=float, count=len(weights))
+    return matches @ weight / weight.sum()
+
+
+def hard_skill_weights(jd: JobDescriptionAnalysis) -> dict[str, float]:
+    """Weight of each technical skill of a JD, more for skills in must-haves."""
+    weights = {key: 1.0 for key in skill_set(jd.technical_skills)}
+    for requirement in jd.must_have_requirements:
+        for key in mentioned_skills(requirement):
+            weights[key] = MUST_HAVE_WEIGHT
+    return weights
+
+
+def _resume_text(resume: ResumeReview) -> str:
+    """Free text of a resume, searched for skills and domain words."""
+    parts = [
+        text
+        for job in resume.work_experience
+        for text in (job.job_title, job.company, job.responsibilities)
+        if text
+    ]
+    parts += resume.projects + resume.achievements + resume.certifications
+    parts += [education.degree for education in resume.education]
+    if resume.additional_info:
+        parts.append(resume.additional_info)
+    return "\n".join(parts)
+
+
+def _known_title(jd: JobDescriptionAnalysis) -> bool:
+    return jd.role_title not in EXTRACTION_FAILED_TITLES
+
+
+def _seniority(title: str) -> int:
+    words = re.findall(r"[a-z]+", title.lower())
+    levels = [SENIORITY_LEVELS[word] for word in words if word in SENIORITY_LEVELS]
+    return max(levels, default=DEFAULT_SENIORITY)
+
+
+def _degree_level(text: str) -> Optional[int]:
+    for pattern, level in DEGREE_LEVELS:
+        if pattern.search(text):
+            return level
+    return None
+
+
+def _required_years(requirement: Optional[str]) -> Optional[float]:
+    match = _YEARS.search(requirement or "")
+    return float(match.group(1)) if match else None
+
+
+def _years_of_experience(resume: ResumeReview) -> float:
+    """Years covered by the resume's jobs, with overlapping jobs counted once."""
+    this_year = date.today().year
+    periods = []
+    stated = 0.0
+    for job in resume.work_experience:
+        ranges = find_date_ranges(job.duration or "")
+        if ranges:
+            periods += [(r.start_year, r.end_year or this_year) for r in ranges]
+        elif years := _required_years(job.duration):
+            stated += years  # "3 years", no dates
+
+    covered = 0
+    end_of_covered = None
+    for start, end in sorted(periods):
+        if end_of_covered is not None and start < end_of_covered:
+            start = end_of_covered
+        if end > start:
+            covered += end - start
+        end_of_covered = max(end, end_of_covered or end)
+    return covered + stated
+
+
+def _experience_points(
+    required_years: Optional[float],
+    years: float,
+    required_level: Optional[int],
+    level: Optional[int],
+    domain_words: set[str],
+    evidence: str,
+) -> tuple[float, str]:
+    notes = []
+
+    if required_years:
+        years_points = YEARS_POINTS * min(1.0, years / required_years)
+        notes.append(f"{years:g} of {required_years:g} years")
+    else:
+        years_points = YEARS_POINTS
+        notes.append("no years required")
+
+    if required_level is None or required_level <= DEFAULT_SENIORITY:
+        seniority_points = SENIORITY_POINTS if level is not None else 0.0
+    elif level is None:
+        seniority_points = 0.0
+    else:
+        gap = max(0, required_level - level)
+        seniority_points = SENIORITY_POINTS * max(0.0, 1 - gap / 2)
+    notes.append(
+        "no work history"
+        if level is None
+        else f"seniority {level} for {required_level}"
+    )
+
+    if domain_words:
+        found = domain_words & set(_WORD.findall(evidence.lower()))
+        domain_points = DOMAIN_POINTS * len(found) / len(domain_words)
+        notes.append(f"domain {'matched' if found else 'not found'}")
+    else:
+        domain_points = DOMAIN_POINTS
+
+    return years_points + seniority_points + domain_points, ", ".join(notes)
+
+
+def _education_points(
+    jd: JobDescriptionAnalysis,
+    required_degree: Optional[int],
+    resume: ResumeReview,
+    certified: float,
+) -> tuple[float, str]:
+    """Degree and certification points, sharing the category between stated requirements."""
+    parts = []
+    notes = []
+
+    if jd.education_requirements:
+        level = max(
+            (_degree_level(education.degree) or 0 for education in resume.education),
+            default=None,
+        )
+        if level is None:
+            parts.append(0.0)
+            notes.append("no education listed")
+        elif required_degree is None:
+            parts.append(1.0)
+            notes.append("education listed")
+        else:
+            parts.append(min(1.0, level / required_degree))
+            notes.append(f"degree level {level} for {required_degree}")
+
+    if jd.certification_requirements:
+        parts.append(certified)
+        notes.append(f"{certified:.0%} of certifications")
+
+    if not parts:
+        return float(EDUCATION_POINTS), "none required"
+    return EDUCATION_POINTS * sum(parts) / len(parts), ", ".join(notes)
+
+
+def _satisfies(requirement: str, skills: set[str], years: float, evidence: str) -> bool:
+    """Whether a resume shows a deal-breaker requirement."""
+    keys = mentioned_skills(requirement)
+    if keys:
+        return bool(keys & skills)
+
+    required_years = _required_years(requirement)
+    if required_years:
+        return years >= required_years
+
+    words = _content_words(requirement)
+    if not words:
+        return True
+    found = words & (set(_WORD.findall(evidence.lower())) | skills)
+    return len(found) / len(words) >= 0.6
+
+
+def _content_words(text: str) -> set[str]:
+    return {word for word in _WORD.findall(text.lower()) if word not in _STOPWORDS}
+
+
+def _skills_note(
+    label: str,
+    points: float,
+    out_of: int,
+    weights: dict[str, float],
+    skills: set[str],
+) -> str:
+    if not weights:
+        return f"{label} {points:.1f}/{out_of}: none required."
+
+    matched = [key for key in weights if key in skills]
+    missing = [
+        f"{key} (must-have)" if weights[key] > 1 else key
+        for key in weights
+        if key not in skills
+    ]
+    return (
+        f"{label} {points:.1f}/{out_of}: matched {', '.join(matched) or 'none'}; "
+        f"missing {', '.join(missing) or 'none'}."
+    )
+
+
+def _recommendation(overall: int) -> str:
+    if overall >= 80:
+        return "Strong Fit"
+    if overall >= 60:
+        return "Potential Fit"
+    if overall >= 40:
+        return "Weak Fit"
+    return "No Fit"
+
+
+def _data_sufficiency(jd: JobDescriptionAnalysis, resume: ResumeReview) -> str:
+    fields = [
+        _known_title(jd),
+        bool(jd.technical_skills or jd.must_have_requirements),
+        bool(jd.experience_requirements),
+        bool(jd.education_requirements or jd.certification_requirements),
+        bool(jd.soft_skills),
+        bool(resume.work_experience),
+        bool(resume.technical_skills),
+        bool(resume.education or resume.certifications),
+        bool(resume.soft_skills),
+        any(job.duration for job in resume.work_experience),
+    ]
+    filled = sum(fields) / len(fields)
+    if filled >= 0.7:
+        return "High"
+    if filled >= 0.4:
+        return "Medium"
+    return "Low"
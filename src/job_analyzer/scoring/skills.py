@@ -0,0 +1,176 @@
+"""Normalize skill names so a JD and a resume naming a skill differently match."""
+
+import re
+from functools import lru_cache
+
+from utils.section_parser import SKILL_DICTIONARY, find_skills
+
+# Spelling, abbreviation -> canonical name (a SKILL_DICTIONARY entry where
+# there is one). Keys are normalized with _normalize.
+SKILL_SYNONYMS: dict[str, str] = {
+    # Languages
+    "python3": "Python",
+    "py": "Python",
+    "js": "JavaScript",
+    "ecmascript": "JavaScript",
+    "es6": "JavaScript",
+    "ts": "TypeScript",
+    "golang": "Go",
+    "c plus plus": "C++",
+    "cpp": "C++",
+    "c sharp": "C#",
+    "csharp": "C#",
+    "shell": "Bash",
+    "shell scripting": "Bash",
+    "t-sql": "SQL",
+    "pl/sql": "SQL",
+    # Frameworks and libraries
+    "react.js": "React",
+    "reactjs": "React",
+    "angularjs": "Angular",
+    "angular.js": "Angular",
+    "vue.js": "Vue",
+    "vuejs": "Vue",
+    "node": "Node.js",
+    "nodejs": "Node.js",
+    "nextjs": "Next.js",
+    "dotnet": ".NET",
+    "asp.net": ".NET",
+    ".net core": ".NET",
+    "spring boot": "Spring",
+    "sklearn": "Scikit-learn",
+    "scikit learn": "Scikit-learn",
+    "torch": "PyTorch",
+    "tf": "TensorFlow",
+    "apache spark": "Spark",
+    "pyspark": "Spark",
+    "apache kafka": "Kafka",
+    "apache airflow": "Airflow",
+    # Data stores
+    "postgres": "PostgreSQL",
+    "postgresql": "PostgreSQL",
+    "psql": "PostgreSQL",
+    "mongo": "MongoDB",
+    "elastic": "Elasticsearch",
+    "elastic search": "Elasticsearch",
+    "dynamo": "DynamoDB",
+    "google bigquery": "BigQuery",
+    # Platforms and tools
+    "amazon web services": "AWS",
+    "microsoft azure": "Azure",
+    "google cloud": "GCP",
+    "google cloud platform": "GCP",
+    "k8s": "Kubernetes",
+    "github": "Git",
+    "gitlab": "Git",
+    "ci cd": "CI/CD",
+    "cicd": "CI/CD",
+    "continuous integration": "CI/CD",
+    "restful": "REST",
+    "rest api": "REST",
+    "rest apis": "REST",
+    "restful apis": "REST",
+    "micro services": "Microservices",
+    "ml": "Machine Learning",
+    "dl": "Deep Learning",
+    "natural language processing": "NLP",
+    "data analytics": "Data Analysis",
+    "bi": "Business Intelligence",
+    "powerbi": "Power BI",
+    "ms excel": "Excel",
+    "microsoft excel": "Excel",
+    "ms office": "Microsoft Office",
+    "g suite": "Google Workspace",
+    "gsuite": "Google Workspace",
+    # Practices
+    "scrum master": "Scrum",
+    "test driven development": "TDD",
+    "test-driven development": "TDD",
+    "pm": "Project Management",
+    # Soft skills
+    "communication skills": "Communication",
+    "written communication": "Communication",
+    "verbal communication": "Communication",
+    "problem solving": "Problem-Solving",
+    "problem solver": "Problem-Solving",
+    "analytical thinking": "Problem-Solving",
+    "team work": "Teamwork",
+    "team player": "Teamwork",
+    "collaborative": "Collaboration",
+    "cross-functional collaboration": "Collaboration",
+    "leading teams": "Leadership",
+    "team leadership": "Leadership",
+    "people management": "Leadership",
+    "mentorship": "Mentoring",
+    "coaching": "Mentoring",
+    "stakeholder communication": "Stakeholder Management",
+    "prioritization": "Time Management",
+}
+
+_CANONICAL = {skill.lower(): skill for skill in SKILL_DICTIONARY}
+_PUNCTUATION = re.compile(r"[,;:()!?\[\]]|\.(?!\w)")
+_VERSION = re.compile(r"\s*\(?v?\d+(?:\.\d+)*\+?\)?$")
+_QUALIFIER = re.compile(
+    r"^(?:(?:strong|excellent|good|solid|proven|advanced|basic|working|hands-on)\s+)+"
+    r"|\s+(?:skills?|experience|knowledge|proficiency)$"
+)
+
+
+def _normalize(name: str) -> str:
+    name = " ".join(name.lower().replace("_", " ").split())
+    name = _QUALIFIER.sub("", name)
+    return _VERSION.sub("", name).strip(" .,;:")
+
+
+@lru_cache(maxsize=4096)
+def skill_keys(name: str) -> frozenset[str]:
+    """
+    Canonical keys of the skills a skill entry or requirement names.
+
+    "Postgres 14", "PostgreSQL" and "postgresql" all give {"postgresql"}. A
+    requirement naming several dictionary skills ("Experience with AWS or
+    GCP") gives each of them. Anything else is kept as its normalized text,
+    so uncommon skills still match when both sides spell them alike.
+
+    Args:
+        name: Skill name or requirement text.
+
+    Returns:
+        Lowercase canonical skill names.
+    """
+    normalized = _normalize(name)
+    if not normalized:
+        return frozenset()
+
+    canonical = SKILL_SYNONYMS.get(normalized) or _CANONICAL.get(normalized)
+    if canonical:
+        return frozenset({canonical.lower()})
+
+    found = find_skills(name) or find_skills(normalized)
+    if found:
+        return frozenset(skill.lower() for skill in found)
+
+    return frozenset({normalized})
+
+
+def skill_set(names: list[str]) -> set[str]:
+    """Canonical keys of a list of skill names."""
+    return {key for name in names for key in skill_keys(name)}
+
+
+def mentioned_skills(text: str) -> set[str]:
+    """
+    Canonical keys of the dictionary skills and synonyms mentioned in free text.
+
+    Args:
+        text: Text to search, e.g. job responsibilities.
+
+    Returns:
+        Lowercase canonical skill names.
+    """
+    found = {skill.lower() for skill in find_skills(text)}
+    words = f" {' '.join(_PUNCTUATION.sub(' ', text.lower()).split())} "
+    for synonym, canonical in SKILL_SYNONYMS.items():
+        if len(synonym) > 2 and f" {synonym} " in words:
+            found.add(canonical.lower())
+    return found
@@ -1,38 +1,233 @@
+import time
+import asyncio
+import logging
 from typing import Optional, Callable, Coroutine, Any
 
+from fastapi import WebSocket
 from langchain_core.messages import ToolMessage
+from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
 from langchain.tools import BaseTool
 
+from llm.base.callbacks import CallBackHandler
+from llm.base.tool_calls import ToolCallAccumulator
+from utils.app_config import AppConfig, AgentConfig
+
+logger = logging.getLogger(__name__)
+
 
 class BaseInference:
-    """Base class for inference engines."""
+    """
+    Base class for inference engines.
 
-    def __init__(self):
-        self.llm: Optional[BaseChatModel] = None
+    Engines only build their provider's chat model client; binding tools,
+    chat completion and the tool-calling agent loop are shared.
+    """
+
+    def __init__(self, app_config: AppConfig, llm: Optional[BaseChatModel] = None):
+        self.app_config = app_config
+        self.llm: Optional[BaseChatModel] = llm
+        self.llm_with_tools: Optional[Runnable] = None
+        self.function_call_handler: Optional[
+            Callable[[str, str, str], Coroutine[Any, Any, ToolMessage]]
+        ] = None
 
     def tools(self, tools: list[BaseTool]) -> "BaseInference":
-        """Set tools for the language model."""
+        """Bind tools to the language model."""
+
+        assert self.llm is not None, "LLM must be created to bind tools."
+
+        self.llm_with_tools = self.llm.bind_tools(tools)
+
+        return self
+
+    def bound_tools(self, llm_with_tools: Runnable) -> "BaseInference":
+        """Use a tool binding of this model made elsewhere, e.g. a cached one."""
+
+        self.llm_with_tools = llm_with_tools
 
-        raise NotImplementedError("This method should be implemented by subclasses.")
+        return self
 
     def tools_handler(
         self, tool_handler: Callable[[str, str, str], Coroutine[Any, Any, ToolMessage]]
     ) -> "BaseInference":
         """Set Function Call handler for tools"""
 
-        raise NotImplementedError("This method should be implemented by subclasses.")
+        self.function_call_handler = tool_handler
+
+        return self
+
+    async def call_tools(
+        self,
+        tool_calls: list[tuple[str, str, str]],
+        config: AgentConfig,
+        budget_seconds: Optional[float] = None,
+    ) -> list[ToolMessage]:
+        """
+        Run the tool calls of one model turn concurrently.
+
+        The calls of a turn are independent (the model asked for all of them
+        before seeing any result), so they run together, at most
+        config.max_parallel_tool_calls at a time. A call that fails or takes
+        longer than config.tool_timeout_seconds yields an error ToolMessage
+        instead of failing the turn.
+
+        Args:
+            tool_calls: (tool ID, tool name, JSON arguments) of each call.
+            config: Agent configuration with the concurrency cap and timeout.
+            budget_seconds: Time left in the agent loop, if shorter than the
+                tool timeout.
+
+        Returns:
+            One ToolMessage per call, in the order of the calls.
+        """
+        assert self.function_call_handler is not None
+        handler = self.function_call_handler
+        semaphore = asyncio.Semaphore(max(1, config.max_parallel_tool_calls))
+        timeout = config.tool_timeout_seconds
+        if budget_seconds is not None:
+            timeout = max(0.0, min(timeout, budget_seconds))
+
+        async def call(tool_id: str, tool_name: str, args: str) -> ToolMessage:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    message = await asyncio.wait_for(
+                        handler(tool_id, tool_name, args), timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Tool {tool_name} timed out after {timeout:.1f}s")
+                    return ToolMessage(
+                        tool_call_id=tool_id,
+                        content=f"Tool {tool_name} timed out",
+                        status="error",
+                    )
+                except Exception as e:
+                    logger.error(f"Tool {tool_name} failed: {str(e)}", exc_info=True)
+                    return ToolMessage(
+                        tool_call_id=tool_id,
+                        content=f"Tool {tool_name} failed: {str(e)}",
+                        status="error",
+                    )
+
+                logger.info(
+                    f"Tool {tool_name} completed in {(time.perf_counter() - started) * 1000:.0f} ms"
+                )
+                return message
+
+        return list(await asyncio.gather(*(call(*c) for c in tool_calls)))
 
-    async def stream(self, websocket, messages: list[BaseMessage]) -> str:
-        """Stream the response from the language model."""
+    async def stream(
+        self,
+        websocket: WebSocket,
+        messages: list[BaseMessage],
+        new_messages: Optional[list[BaseMessage]] = None,
+    ) -> str:
+        """
+        Stream the model's answer to a websocket, running the tools it calls.
 
-        raise NotImplementedError("This method should be implemented by subclasses.")
+        Each iteration streams one model turn. When the turn calls tools, the
+        turn and the tool results are appended to a single message buffer and
+        the model is called again, for at most config.max_depth turns. Once
+        config.turn_budget_seconds have passed no further turn is started, and
+        tool calls are cut off at that deadline.
+
+        Args:
+            websocket: Websocket to stream the text to.
+            messages: Conversation so far. Not modified.
+            new_messages: If given, receives the messages the loop adds to the
+                conversation: each tool-calling turn with its tool results,
+                then the final answer.
+
+        Returns:
+            All text streamed to the websocket.
+        """
+        assert self.llm_with_tools is not None, "Tools must be bound to stream."
+
+        config = self.app_config.inference.agent
+        deadline = time.monotonic() + config.turn_budget_seconds
+        run_config: RunnableConfig = {"callbacks": [CallBackHandler(websocket)]}
+        buffer = list(messages)
+        added_from = len(buffer)
+        response_str = ""
+
+        for depth in range(config.max_depth):
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    f"Agent loop stopped at depth {depth}: "
+                    f"{config.turn_budget_seconds}s budget spent"
+                )
+                break
+
+            logger.debug(f"Agent loop at depth {depth}, message count: {len(buffer)}")
+            turn_text, accumulator = await self._stream_turn(
+                websocket, buffer, run_config
+            )
+            response_str += turn_text
+
+            tool_calls = accumulator.tool_calls()
+            if not tool_calls:
+                buffer.append(AIMessage(content=turn_text))
+                break
+
+            logger.info(f"Processing {len(tool_calls)} tool calls")
+            buffer.append(accumulator.message(turn_text))
+            buffer.extend(
+                await self.call_tools(
+                    [(call.id, call.name, call.args) for call in tool_calls],
+                    config,
+                    deadline - time.monotonic(),
+                )
+            )
+        else:
+            logger.warning(f"Max depth {config.max_depth} reached in agent loop")
+
+        if new_messages is not None:
+            new_messages.extend(buffer[added_from:])
+        return response_str
+
+    async def _stream_turn(
+        self,
+        websocket: WebSocket,
+        messages: list[BaseMessage],
+        run_config: RunnableConfig,
+    ) -> tuple[str, ToolCallAccumulator]:
+        """
+        Stream one model turn to the websocket.
+
+        Returns:
+            Text of the turn and the tool calls it made.
+        """
+        assert self.llm_with_tools is not None
+
+        turn_text = ""
+        tool_calls = ToolCallAccumulator()
+
+        async for chunk in self.llm_with_tools.astream(messages, run_config):
+            if isinstance(chunk, AIMessageChunk):
+                tool_calls.add(chunk)
+
+                if isinstance(chunk.content, str) and chunk.content:
+                    turn_text += chunk.content
+                    await websocket.send_text(chunk.content)
+
+        return turn_text, tool_calls
 
     async def chat(self, messages: list[BaseMessage]) -> str:
-        """Handle chat completion logic."""
+        """Generate a response from the language model based on the provided messages."""
+
+        if self.llm:
+            logger.debug(f"Invoking chat with {len(messages)} messages")
+            response = await self.llm.ainvoke(messages)
+
+            return (
+                response.content
+                if isinstance(response.content, str)
+                else str(response.content)
+            )
 
-        raise NotImplementedError("This method should be implemented by subclasses.")
+        return ""
 
     def get_llm(self) -> Optional[BaseChatModel]:
         return self.llm
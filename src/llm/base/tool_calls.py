@@ -0,0 +1,114 @@
+"""Assemble the tool calls of a streamed model turn."""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ToolCall:
+    """A tool call assembled from its streamed fragments."""
+
+    id: str
+    name: str
+    args: str  # JSON, as streamed
+
+
+class ToolCallAccumulator:
+    """
+    Collect the tool_call_chunks of a streamed turn into complete tool calls.
+
+    Providers streaming parallel calls (OpenAI-compatible APIs) send each
+    argument fragment with the index of the call it belongs to, and only the
+    first fragment of a call carries its ID and name; fragments of different
+    calls may interleave. Fragments are therefore grouped by index. Providers
+    that send every call whole in one chunk without an index (Gemini) get one
+    call per fragment, merged by ID if a call is repeated.
+    """
+
+    def __init__(self):
+        self._calls: dict[int, dict] = {}  # index -> id, name, args fragments
+        self._ids: dict[str, int] = {}
+        self._next_index = 0
+
+    def add(self, chunk: AIMessageChunk) -> None:
+        """
+        Add the tool call fragments of a streamed chunk.
+
+        Args:
+            chunk: Chunk of the model's streamed turn.
+        """
+        for fragment in chunk.tool_call_chunks:
+            index = self._index_for(fragment.get("index"), fragment.get("id"))
+            call = self._calls.setdefault(index, {"id": "", "name": "", "args": []})
+
+            if fragment.get("id") and not call["id"]:
+                call["id"] = fragment["id"]
+                self._ids[fragment["id"]] = index
+            if fragment.get("name") and not call["name"]:
+                call["name"] = fragment["name"]
+            if fragment.get("args"):
+                call["args"].append(fragment["args"])
+
+    def tool_calls(self) -> list[ToolCall]:
+        """
+        Complete tool calls in the order the model made them.
+
+        Returns:
+            Tool calls that received a name. A call streamed without an ID
+            gets a generated one, so its result can still be matched to it.
+        """
+        calls = []
+        for index in sorted(self._calls):
+            call = self._calls[index]
+            if not call["name"]:
+                logger.warning(f"Dropping streamed tool call {index} without a name")
+                continue
+            calls.append(
+                ToolCall(
+                    id=call["id"] or f"call_{index}",
+                    name=call["name"],
+                    args="".join(call["args"]),
+                )
+            )
+        return calls
+
+    def message(self, content: str) -> AIMessage:
+        """
+        Assistant message of the turn, to put before the tool results.
+
+        Args:
+            content: Text the model streamed in the turn.
+
+        Returns:
+            AIMessage carrying the turn's tool calls, which providers require
+            before the ToolMessages answering them.
+        """
+        return AIMessage(
+            content=content,
+            tool_calls=[
+                {"id": call.id, "name": call.name, "args": _parse_args(call.args)}
+                for call in self.tool_calls()
+            ],
+        )
+
+    def _index_for(self, index: Optional[int], tool_id: Optional[str]) -> int:
+        if index is None:
+            if tool_id and tool_id in self._ids:
+                return self._ids[tool_id]
+            index = self._next_index
+        self._next_index = max(self._next_index, index + 1)
+        return index
+
+
+def _parse_args(args: str) -> dict:
+    try:
+        parsed = json.loads(args) if args else {}
+    except json.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
@@ -0,0 +1,325 @@
+"""Chat history kept under a token budget for every call to the model."""
+
+import json
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from llm.inference import Inference
+from utils.app_config import AppConfig, ChatHistoryConfig, get_app_config
+from utils.token_counter import count_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+# Role and separator tokens the chat format adds around each message
+MESSAGE_OVERHEAD_TOKENS = 4
+# Smallest history budget, whatever the model configuration says
+MIN_HISTORY_TOKENS = 512
+# Tokens of each message rendered into the summarization prompt
+SUMMARY_INPUT_MESSAGE_TOKENS = 200
+
+TRUNCATED_TOOL_OUTPUT = "[...tool output truncated...]"
+SUMMARY_HEADING = "Summary of the earlier conversation:"
+
+
+def message_tokens(message: BaseMessage) -> int:
+    """
+    Count the tokens a message adds to a model call.
+
+    Args:
+        message: Chat message.
+
+    Returns:
+        Tokens of its content, its tool calls and the chat format overhead.
+    """
+    content = (
+        message.content if isinstance(message.content, str) else str(message.content)
+    )
+    tokens = count_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+
+    if isinstance(message, AIMessage) and message.tool_calls:
+        tokens += count_tokens(
+            json.dumps([[call["name"], call["args"]] for call in message.tool_calls])
+        )
+    return tokens
+
+
+@dataclass
+class _Turn:
+    """A user message and every message of the answer to it."""
+
+    messages: list[BaseMessage] = field(default_factory=list)
+    tokens: int = 0
+    document_ids: set[str] = field(default_factory=set)
+
+    def add(self, message: BaseMessage) -> None:
+        self.messages.append(message)
+        self.tokens += message_tokens(message)
+
+
+class ChatHistory:
+    """
+    Conversation of one chat connection, kept under a token budget.
+
+    The history is a system prompt followed by whole turns: a user message
+    and the tool calls, tool results and answer that followed it. Once a turn
+    is answered its tool results have been consumed, so they are cut to
+    tool_output_tokens. When the history exceeds its budget, the oldest turns
+    are dropped (the latest turn is always kept) and, if enabled, summarized
+    in the background into a short summary appended to the system prompt.
+    """
+
+    def __init__(self, system_prompt: str, max_tokens: int, config: ChatHistoryConfig):
+        self.max_tokens = max_tokens
+        self.config = config
+        self.summary = ""
+        self.summarized_turns = 0
+
+        self._system_prompt = ""
+        self._system_tokens = 0
+        self._summary_tokens = 0
+        self._turns: deque[_Turn] = deque()
+        self._pending: list[_Turn] = []  # dropped turns not yet summarized
+        self._summary_task: Optional[asyncio.Task] = None
+
+        self.set_system_prompt(system_prompt)
+
+    @classmethod
+    def from_config(
+        cls, system_prompt: str, app_config: Optional[AppConfig] = None
+    ) -> "ChatHistory":
+        """
+        Create a history with the budget of the configured model.
+
+        Args:
+            system_prompt: System prompt of the conversation.
+            app_config: Configuration to use. Defaults to the app config.
+
+        Returns:
+            Empty ChatHistory.
+        """
+        app_config = app_config or get_app_config()
+        config = app_config.inference.chat_history
+        return cls(system_prompt, cls.budget(app_config), config)
+
+    @staticmethod
+    def budget(app_config: AppConfig) -> int:
+        """
+        Tokens the history may use in a call to the configured model.
+
+        chat_history.max_tokens if set; otherwise the context window less the
+        room for the response (max_tokens, at most half the window) and the
+        reserved tokens.
+
+        Args:
+            app_config: Configuration of the model.
+
+        Returns:
+            Token budget of the history.
+        """
+        config = app_config.inference.chat_history
+        if config.max_tokens > 0:
+            return config.max_tokens
+
+        model = app_config.inference.active_config()
+        response_tokens = min(model.max_tokens, model.context_window // 2)
+        return max(
+            MIN_HISTORY_TOKENS,
+            model.context_window - response_tokens - config.reserved_tokens,
+        )
+
+    @property
+    def token_count(self) -> int:
+        """Tokens of the history as sent to the model."""
+        return (
+            self._system_tokens
+            + self._summary_tokens
+            + sum(turn.tokens for turn in self._turns)
+        )
+
+    def set_system_prompt(self, system_prompt: str) -> None:
+        """Replace the system prompt, e.g. when it depends on the date."""
+        if system_prompt != self._system_prompt:
+            self._system_prompt = system_prompt
+            self._system_tokens = message_tokens(SystemMessage(content=system_prompt))
+
+    def add_user_message(self, content: str, document_ids: Iterable[str] = ()) -> None:
+        """
+        Start a turn with a user message.
+
+        Args:
+            content: Text of the message, with any injected document context.
+            document_ids: Documents whose content the message injected.
+        """
+        turn = _Turn(document_ids=set(document_ids))
+        turn.add(HumanMessage(content=content))
+        self._turns.append(turn)
+
+    def add_messages(self, messages: Iterable[BaseMessage]) -> None:
+        """
+        Add the answer to the latest user message.
+
+        Args:
+            messages: Tool calls, tool results and answer of the model, in
+                order. Tool results are cut to tool_output_tokens, as the
+                model has already answered from them.
+        """
+        if not self._turns:
+            self._turns.append(_Turn())
+
+        turn = self._turns[-1]
+        for message in messages:
+            if isinstance(message, ToolMessage):
+                message = self._truncate_tool_output(message)
+            turn.add(message)
+
+    def messages(self) -> list[BaseMessage]:
+        """
+        Messages to send to the model.
+
+        Returns:
+            The system prompt, with the summary of dropped turns if any, then
+            the messages of the kept turns.
+        """
+        system_prompt = self._system_prompt
+        if self.summary:
+            system_prompt += f"\n\n{SUMMARY_HEADING}\n{self.summary}"
+
+        messages: list[BaseMessage] = [SystemMessage(content=system_prompt)]
+        for turn in self._turns:
+            messages.extend(turn.messages)
+        return messages
+
+    def compact(self) -> set[str]:
+        """
+        Drop the oldest turns until the history fits its budget.
+
+        The latest turn is always kept. Dropped turns are summarized in the
+        background when summarization is enabled.
+
+        Returns:
+            IDs of the documents whose injected content was dropped, so the
+            caller can send them again when they are next referenced.
+        """
+        dropped: list[_Turn] = []
+        while len(self._turns) > 1 and self.token_count > self.max_tokens:
+            dropped.append(self._turns.popleft())
+
+        if not dropped:
+            return set()
+
+        logger.info(
+            f"Dropped {len(dropped)} turns from chat history, "
+            f"{self.token_count} of {self.max_tokens} tokens left"
+        )
+        if self.config.summarize:
+            self._pending.extend(dropped)
+            self._schedule_summary()
+
+        return {document_id for turn in dropped for document_id in turn.document_ids}
+
+    async def wait_for_summary(self) -> None:
+        """Wait for the background summary of dropped turns, if one is running."""
+        if self._summary_task is not None:
+            await asyncio.shield(self._summary_task)
+
+    def close(self) -> None:
+        """Stop a running summary, e.g. when the connection closes."""
+        if self._summary_task is not None and not self._summary_task.done():
+            self._summary_task.cancel()
+
+    def _truncate_tool_output(self, message: ToolMessage) -> ToolMessage:
+        content = (
+            message.content
+            if isinstance(message.content, str)
+            else str(message.content)
+        )
+        if count_tokens(content) <= self.config.tool_output_tokens:
+            return message
+
+        truncated = truncate_to_tokens(content, self.config.tool_output_tokens)
+        return message.model_copy(
+            update={"content": f"{truncated}\n{TRUNCATED_TOOL_OUTPUT}"}
+        )
+
+    def _schedule_summary(self) -> None:
+        if self._summary_task is not None and not self._summary_task.done():
+            return  # the running summary picks up the new turns
+
+        try:
+            self._summary_task = asyncio.get_running_loop().create_task(
+                self._summarize_pending()
+            )
+        except RuntimeError:
+            logger.warning("No event loop to summarize dropped chat turns")
+            self._pending.clear()
+
+    async def _summarize_pending(self) -> None:
+        while self._pending:
+            turns, self._pending = self._pending, []
+            try:
+                summary = await self._summarize(turns)
+            except Exception as e:
+                logger.error(f"Failed to summarize dropped chat turns: {str(e)}")
+                continue
+
+            if summary:
+                self.summary = truncate_to_tokens(summary, self.config.summary_tokens)
+                self._summary_tokens = count_tokens(
+                    f"\n\n{SUMMARY_HEADING}\n{self.summary}"
+                )
+                self.summarized_turns += len(turns)
+                logger.debug(
+                    f"Summarized {self.summarized_turns} chat turns "
+                    f"in {self._summary_tokens} tokens"
+                )
+
+    async def _summarize(self, turns: list[_Turn]) -> str:
+        lines = []
+        for turn in turns:
+            for message in turn.messages:
+                lines.append(_render(message))
+
+        prompt = (
+            "Update the summary of a conversation between a user and an "
+            "assistant with the messages below. Keep facts, names, numbers, "
+            "decisions and open questions the rest of the conversation may "
+            f"need. Answer with the summary only, in at most "
+            f"{self.config.summary_tokens} tokens.\n\n"
+            f"<summary>\n{self.summary or 'None yet.'}\n</summary>\n\n"
+            "<messages>\n" + "\n".join(lines) + "\n</messages>"
+        )
+        response = await Inference().chat(
+            [
+                SystemMessage(content="You summarize conversations concisely."),
+                HumanMessage(content=prompt),
+            ]
+        )
+        return response.strip()
+
+
+def _render(message: BaseMessage) -> str:
+    """One line of a message for the summarization prompt."""
+    content = (
+        message.content if isinstance(message.content, str) else str(message.content)
+    )
+    content = truncate_to_tokens(content, SUMMARY_INPUT_MESSAGE_TOKENS)
+
+    if isinstance(message, HumanMessage):
+        return f"User: {content}"
+    if isinstance(message, ToolMessage):
+        return f"Tool result: {content}"
+    if isinstance(message, AIMessage) and message.tool_calls:
+        names = ", ".join(call["name"] for call in message.tool_calls)
+        return f"Assistant called {names}. {content}".rstrip()
+    return f"Assistant: {content}"
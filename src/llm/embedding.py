@@ -0,0 +1,157 @@
+"""Text embedding clients selected by the `embed` section of the app config."""
+
+import re
+import logging
+from typing import Optional, Protocol
+
+import numpy as np
+import xxhash
+from pydantic.types import SecretStr
+
+from utils.app_config import AppConfig, InferenceEngine
+from utils.vars import get_openai_key, get_azure_openai_key, get_gemini_api_key
+
+logger = logging.getLogger(__name__)
+
+HASHING_DIMENSION = 512
+_HASHING_TOKENS = re.compile(r"\w+", re.UNICODE)
+
+
+class Embedder(Protocol):
+    """Anything that can turn texts into embedding vectors."""
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]: ...
+
+    async def aembed_query(self, text: str) -> list[float]: ...
+
+
+class HashingEmbedder:
+    """
+    Dependency-free embedder using the hashing trick over words and word bigrams.
+
+    Used for the LOCAL embedding engine until a local embedding model is served.
+    It captures lexical overlap only, which is enough to rank resume and job
+    description sections against a question, and it needs no network access.
+    """
+
+    def __init__(self, dimension: int = HASHING_DIMENSION):
+        self.dimension = dimension
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a single text into a normalized float32 vector."""
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        words = _HASHING_TOKENS.findall(text.lower())
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+        for feature in features:
+            digest = xxhash.xxh64_intdigest(feature.encode("utf-8"))
+            sign = 1.0 if digest & 1 else -1.0
+            vector[(digest >> 1) % self.dimension] += sign
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed(text).tolist() for text in texts]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return self.embed(text).tolist()
+
+
+def create_embedder(app_config: Optional[AppConfig] = None) -> Embedder:
+    """
+    Create the embedding client for the configured embedding engine.
+
+    Args:
+        app_config: Application configuration. Defaults to the app config.
+
+    Returns:
+        Embedder for the selected engine.
+    """
+    app_config = app_config or AppConfig.load_default()
+    embed = app_config.embed
+    config = embed.embedding_config
+
+    match embed.embedding_engine:
+        case InferenceEngine.OPENAI:
+            from langchain_openai import OpenAIEmbeddings
+
+            embedder = OpenAIEmbeddings(
+                model=config.openai_embedding_config.model,
+                api_key=SecretStr(get_openai_key()),
+                base_url=config.openai_embedding_config.api_base,
+                dimensions=config.openai_embedding_config.dimension,
+            )
+
+        case InferenceEngine.AZURE_OPENAI:
+            from langchain_openai import AzureOpenAIEmbeddings
+
+            embedder = AzureOpenAIEmbeddings(
+                model=config.azure_embedding_config.model,
+                azure_endpoint=config.azure_embedding_config.api_base,
+                azure_deployment=config.azure_embedding_config.deployment_name,
+                api_version=config.azure_embedding_config.api_version,
+                api_key=SecretStr(get_azure_openai_key()),
+                dimensions=config.azure_embedding_config.dimension,
+            )
+
+        case InferenceEngine.GEMINI:
+            from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+            embedder = GoogleGenerativeAIEmbeddings(
+                model=config.gemini_embedding_config.model,
+                google_api_key=get_gemini_api_key(),
+                output_dimensionality=config.gemini_embedding_config.dimension,
+            )
+
+        case InferenceEngine.LOCAL:
+            embedder = HashingEmbedder(
+                config.local_embedding_config.dimension or HASHING_DIMENSION
+            )
+
+        case _:
+            logger.error(
+                f"Unknown embedding engine specified: {embed.embedding_engine}"
+            )
+            raise ValueError("Unknown embedding engine")
+
+    logger.info(
+        f"Embedder initialized with engine: {embed.embedding_engine}, "
+        f"model: {embedding_model_name(app_config)}"
+    )
+    return embedder
+
+
+def embedding_model_name(app_config: Optional[AppConfig] = None) -> str:
+    """
+    Identify the configured embedding model and dimension.
+
+    Vectors from different models are not comparable, so stored vectors are
+    kept apart per model name.
+
+    Args:
+        app_config: Application configuration. Defaults to the app config.
+
+    Returns:
+        Name such as "OPENAI-text-embedding-3" or "LOCAL-hashing-512".
+    """
+    app_config = app_config or AppConfig.load_default()
+    embed = app_config.embed
+    config = embed.embedding_config
+
+    match embed.embedding_engine:
+        case InferenceEngine.AZURE_OPENAI:
+            model = config.azure_embedding_config.deployment_name
+            dimension = config.azure_embedding_config.dimension
+        case InferenceEngine.GEMINI:
+            model = config.gemini_embedding_config.model
+            dimension = config.gemini_embedding_config.dimension
+        case InferenceEngine.LOCAL:
+            dimension = config.local_embedding_config.dimension or HASHING_DIMENSION
+            model = "hashing"
+        case _:
+            model = config.openai_embedding_config.model
+            dimension = config.openai_embedding_config.dimension
+
+    name = f"{embed.embedding_engine.value}-{model}"
+    return f"{name}-{dimension}" if dimension else name
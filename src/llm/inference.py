@@ -1,47 +1,254 @@
+import asyncio
+import threading
 from typing import Union, Callable, Optional, Coroutine, Any
 
+import httpx
 from langchain_core.tools import BaseTool
+from langchain_core.runnables import Runnable
 from langchain_core.messages import ToolMessage
+from langchain_core.language_models import BaseChatModel
 
 from llm.base.inference import BaseInference
 from llm.local.inference import LocalInference
 from llm.gemini.inference import GeminiInference
 from llm.openai.inference import OpenAIInference
-from utils.app_config import AppConfig, InferenceEngine
+from utils.app_config import AppConfig, InferenceEngine, InferencePoolConfig
 import logging
 
 logger = logging.getLogger(__name__)
 
+ENGINES: dict[InferenceEngine, type[BaseInference]] = {
+    InferenceEngine.LOCAL: LocalInference,
+    InferenceEngine.GEMINI: GeminiInference,
+    InferenceEngine.OPENAI: OpenAIInference,
+}
+
+# Seconds to wait for the warm-up request before giving up on it
+WARM_UP_TIMEOUT = 5.0
+
+
+class InferenceRegistry:
+    """
+    Process-wide pool of chat model clients and their tool bindings.
+
+    Building a chat model client creates new HTTP connection pools, and
+    bind_tools converts every tool to a schema again. The registry builds one
+    client per engine and model configuration and one binding per client and
+    tool set, and every Inference reuses them. OpenAI-compatible clients share
+    one httpx.AsyncClient, so keep-alive connections outlive single requests.
+
+    Engines hold per-request state (the tool handler), so each Inference still
+    gets its own engine object around the shared client.
+    """
+
+    def __init__(self, pool_config: InferencePoolConfig):
+        self.pool_config = pool_config
+        self._lock = threading.Lock()
+        self._clients: dict[tuple[str, str], BaseChatModel] = {}
+        self._bindings: dict[tuple[int, tuple[str, ...]], Runnable] = {}
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
+
+    def engine(self, app_config: AppConfig) -> BaseInference:
+        """
+        Create an engine for a request around the pooled client.
+
+        Args:
+            app_config: Configuration selecting the engine and model.
+
+        Returns:
+            Engine instance sharing the long-lived client.
+        """
+        return self._engine_class(app_config)(app_config, llm=self.client(app_config))
+
+    def client(self, app_config: AppConfig) -> BaseChatModel:
+        """
+        Get the long-lived client of the configured engine and model.
+
+        Args:
+            app_config: Configuration selecting the engine and model.
+
+        Returns:
+            Chat model client, created on first use.
+        """
+        engine_class = self._engine_class(app_config)
+        key = (
+            app_config.inference.inference_engine.value,
+            app_config.inference.inference_config.model_dump_json(),
+        )
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                if engine_class is GeminiInference:
+                    client = GeminiInference.create_client(app_config)
+                else:
+                    client = engine_class.create_client(
+                        app_config, self._shared_http_client()
+                    )
+                self._clients[key] = client
+                logger.info(f"Inference registry created a {key[0]} client")
+
+        return client
+
+    def bind_tools(self, llm: BaseChatModel, tools: list[BaseTool]) -> Runnable:
+        """
+        Get the tool binding of a pooled client, binding the tools on first use.
+
+        Args:
+            llm: Client returned by client().
+            tools: Tools to bind.
+
+        Returns:
+            Runnable of the client with the tools bound.
+        """
+        key = (id(llm), tuple(tool.name for tool in tools))
+
+        with self._lock:
+            binding = self._bindings.get(key)
+            if binding is None:
+                binding = llm.bind_tools(tools)  # type: ignore[attr-defined]
+                self._bindings[key] = binding
+                logger.debug(f"Bound {len(tools)} tools to a pooled client")
+
+        return binding
+
+    def start_warm_up(self, app_config: AppConfig) -> None:
+        """Create the configured client and open its connection in the background."""
+        if self._warm_up_task is None or self._warm_up_task.done():
+            self._warm_up_task = asyncio.create_task(self.warm_up(app_config))
+
+    async def warm_up(self, app_config: AppConfig) -> None:
+        """
+        Create the configured client and open a keep-alive connection to its
+        endpoint, so the first chat message does not pay for TCP and TLS setup.
+
+        Args:
+            app_config: Configuration selecting the engine and model.
+        """
+        try:
+            llm = self.client(app_config)
+        except Exception as e:
+            logger.warning(f"LLM client warm-up skipped: {str(e)}")
+            return
+
+        base_url = getattr(llm, "openai_api_base", None)
+        if self._http_client is None or not base_url:
+            return
+
+        try:
+            await self._http_client.head(base_url, timeout=WARM_UP_TIMEOUT)
+            logger.info(f"LLM connection to {base_url} warmed up")
+        except httpx.HTTPError as e:
+            logger.warning(f"LLM connection warm-up to {base_url} failed: {str(e)}")
+
+    async def aclose(self) -> None:
+        """Close every pooled client and its connections."""
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+            try:
+                await self._warm_up_task
+            except asyncio.CancelledError:
+                pass
+
+        with self._lock:
+            clients = list(self._clients.values())
+            http_client, self._http_client = self._http_client, None
+            self._clients.clear()
+            self._bindings.clear()
+
+        for client in clients:
+            # google-genai clients own their own async transport
+            aio = getattr(getattr(client, "client", None), "aio", None)
+            if aio is not None and hasattr(aio, "aclose"):
+                try:
+                    await aio.aclose()
+                except Exception as e:
+                    logger.warning(f"Failed to close LLM client: {str(e)}")
+
+        if http_client is not None:
+            await http_client.aclose()
+
+        logger.info(f"Inference registry closed {len(clients)} clients")
+
+    def _shared_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.pool_config.max_connections,
+                    max_keepalive_connections=self.pool_config.max_keepalive_connections,
+                    keepalive_expiry=self.pool_config.keepalive_expiry_seconds,
+                ),
+                timeout=httpx.Timeout(600.0, connect=10.0),
+            )
+        return self._http_client
+
+    @staticmethod
+    def _engine_class(app_config: AppConfig) -> type[BaseInference]:
+        engine_class = ENGINES.get(app_config.inference.inference_engine)
+        if engine_class is None:
+            logger.error(
+                f"Unknown inference engine specified: {app_config.inference.inference_engine}"
+            )
+            raise ValueError("Unknown inference engine")
+        return engine_class
+
+
+_inference_registry: Optional[InferenceRegistry] = None
+
+
+def get_inference_registry(
+    app_config: Optional[AppConfig] = None,
+) -> InferenceRegistry:
+    """
+    Get the process-wide inference registry.
+
+    Args:
+        app_config: Configuration to build the registry from. Defaults to the app config.
+
+    Returns:
+        InferenceRegistry instance.
+    """
+    global _inference_registry
+
+    if _inference_registry is None:
+        app_config = app_config or AppConfig.load_default()
+        _inference_registry = InferenceRegistry(app_config.inference.pool)
+
+    return _inference_registry
+
+
+async def shutdown_inference_registry() -> None:
+    """Close the pooled LLM clients, if the registry was created."""
+    global _inference_registry
+
+    if _inference_registry is not None:
+        await _inference_registry.aclose()
+        _inference_registry = None
+
 
 class Inference:
     def __init__(self, app_config: AppConfig = AppConfig.load_default()):
         self.app_config = app_config
-        self.llm: Union[BaseInference, None] = None
         self.function_call_handler: Optional[
             Callable[[str, str, str], Coroutine[Any, Any, ToolMessage]]
         ] = None
 
-        match self.app_config.inference.inference_engine:
-            case InferenceEngine.LOCAL:
-                self.llm = LocalInference()
-            case InferenceEngine.GEMINI:
-                self.llm = GeminiInference()
-            case InferenceEngine.OPENAI:
-                self.llm = OpenAIInference()
-            case _:
-                logger.error(
-                    f"Unknown inference engine specified: {self.app_config.inference.inference_engine}"
-                )
-                raise ValueError("Unknown inference engine")
-
-        logger.info(
+        # Engines are cheap; the client inside comes from the registry
+        self.llm: Union[BaseInference, None] = get_inference_registry().engine(
+            app_config
+        )
+
+        logger.debug(
             f"Inference initialized with engine: {self.app_config.inference.inference_engine}"
         )
 
     def with_tools(self, tools: list[BaseTool]) -> "Inference":
-        """Add tools to the inference engine."""
-        if self.llm is not None:
-            self.llm.tools(tools)
+        """Add tools to the inference engine, reusing the cached tool binding."""
+        if self.llm is not None and self.llm.get_llm() is not None:
+            self.llm.bound_tools(
+                get_inference_registry().bind_tools(self.llm.get_llm(), tools)
+            )
 
         return self
 
@@ -59,11 +266,11 @@ class Inference:
 
         return self
 
-    async def stream(self, websocket, chat_history) -> str:
+    async def stream(self, websocket, chat_history, new_messages=None) -> str:
         """Stream the response from the LLM."""
         if self.llm is not None:
             logger.debug("Streaming response from LLM")
-            return await self.llm.stream(websocket, chat_history)
+            return await self.llm.stream(websocket, chat_history, new_messages)
         else:
             logger.error("LLM instance is not initialized during stream call")
             raise ValueError("LLM instance is not initialized")
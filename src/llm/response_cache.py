@@ -0,0 +1,206 @@
+"""Exact-match cache of LLM responses to deterministic prompts."""
+
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+from collections import OrderedDict
+
+import xxhash
+
+from utils.vars import get_app_path
+from utils.constants import RESPONSE_CACHE_FOLDER
+from utils.app_config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_FILE = "responses.sqlite3"
+
+
+class ResponseCache:
+    """
+    Two-tier cache of LLM responses: an in-memory LRU in front of SQLite.
+
+    Entries are keyed by the prompt template and its version, the model, the
+    temperature and a hash of the prompt, so any change to one of them misses.
+    The SQLite file is shared by every worker using the same directory and
+    survives restarts; it keeps the max_disk_entries most recently used
+    entries.
+    """
+
+    def __init__(self, db_path: Path, memory_entries: int, max_disk_entries: int):
+        self.db_path = Path(db_path)
+        self.memory_entries = memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, str] = OrderedDict()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def make_key(
+        template: str,
+        template_version: str,
+        model: str,
+        temperature: float,
+        prompt: str,
+    ) -> str:
+        """
+        Build a cache key.
+
+        Args:
+            template: Name of the prompt template, e.g. "jd_analysis".
+            template_version: Version of the template, bumped when it changes.
+            model: Model answering the prompt.
+            temperature: Sampling temperature of the model.
+            prompt: Prompt sent to the model.
+
+        Returns:
+            Cache key.
+        """
+        prompt_hash = xxhash.xxh3_128_hexdigest(prompt.encode("utf-8"))
+        return f"{template}-{template_version}-{model}-{temperature}-{prompt_hash}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key built with make_key.
+
+        Returns:
+            Cached response if present, None otherwise.
+        """
+        with self._lock:
+            response = self._memory.get(key)
+            if response is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return response
+
+            row = self._db.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._db.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+            self.disk_hits += 1
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response in both tiers.
+
+        Args:
+            key: Cache key built with make_key.
+            response: Response to store.
+        """
+        with self._lock:
+            self._remember(key, response)
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, last_used) "
+                    "VALUES (?, ?, ?)",
+                    (key, response, time.time()),
+                )
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                    "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to store cached response {key}: {str(e)}")
+
+    def clear(self) -> None:
+        """Delete every cached response."""
+        with self._lock:
+            self._memory.clear()
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from either tier."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """Hit and miss counts of the cache since startup."""
+        with self._lock:
+            disk_entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hit_rate, 4),
+                "memory_entries": len(self._memory),
+                "disk_entries": disk_entries[0],
+            }
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._db.close()
+
+    def _remember(self, key: str, response: str) -> None:
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache(
+    app_config: Optional[AppConfig] = None,
+) -> Optional[ResponseCache]:
+    """
+    Get the process-wide LLM response cache.
+
+    Args:
+        app_config: Configuration to build the cache from. Defaults to the app config.
+
+    Returns:
+        ResponseCache instance, or None if caching is disabled.
+    """
+    global _response_cache
+
+    if _response_cache is None:
+        app_config = app_config or AppConfig.load_default()
+        cache_config = app_config.inference.response_cache
+
+        if not cache_config.enabled:
+            return None
+
+        _response_cache = ResponseCache(
+            db_path=get_app_path().joinpath(RESPONSE_CACHE_FOLDER, RESPONSE_CACHE_FILE),
+            memory_entries=cache_config.memory_entries,
+            max_disk_entries=cache_config.max_disk_entries,
+        )
+        logger.info(f"LLM response cache initialized at {_response_cache.db_path}")
+
+    return _response_cache
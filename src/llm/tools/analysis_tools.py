@@ -1,16 +1,19 @@
 """LangChain tools for job description and resume analysis."""
 
 import json
+import asyncio
 import logging
 
 from langchain_core.tools import tool
 from langchain_core.messages import ToolMessage
 
+from job_analyzer.analysis.fit_pipeline import score_analyses, score_documents
+from job_analyzer.document_storage.document_manager import get_ready_document
 from job_analyzer.external_api.llm_analysis import (
     analyze_job_description_api,
     review_resume_api,
-    calculate_fit_score_api,
 )
+from job_analyzer.external_api.models import FitScore
 
 logger = logging.getLogger(__name__)
 
@@ -53,24 +56,58 @@ async def analyze_resume_tool(resume_text: str) -> str:
 
 
 @tool(
-    description="Calculates a fit score (0-100) for a candidate based on their resume and a job description, with confidence level and detailed explanation."
+    description="Calculates a fit score (0-100) for a candidate based on their resume and a job description, with confidence level and detailed explanation. Prefer passing the document IDs of uploaded documents over their text."
 )
-async def analyze_candidate_fit_tool(resume_text: str, jd_text: str) -> str:
+async def analyze_candidate_fit_tool(
+    resume_text: str = "",
+    jd_text: str = "",
+    resume_document_id: str = "",
+    jd_document_id: str = "",
+) -> str:
     """
     Calculate a candidate's fit score for a role.
 
     Args:
         resume_text (str): The complete text of the candidate's resume.
         jd_text (str): The complete text of the job description.
+        resume_document_id (str): ID of an uploaded resume, instead of its text.
+        jd_document_id (str): ID of an uploaded job description, instead of its text.
 
     Returns:
         str: A JSON-formatted string containing the fit score (0-100),
             confidence level, and a detailed explanation.
     """
-    result = await calculate_fit_score_api(resume_text, jd_text)
+    result = await _candidate_fit(
+        resume_text, jd_text, resume_document_id, jd_document_id
+    )
     return json.dumps(result.as_context())
 
 
+async def _candidate_fit(
+    resume_text: str, jd_text: str, resume_document_id: str, jd_document_id: str
+) -> FitScore:
+    """
+    Score a candidate through the two-stage pipeline.
+
+    Uploaded documents keep their extractions, so scoring them again only
+    runs the scoring step. Text given directly is extracted through the
+    response cache.
+    """
+    resume = (
+        await get_ready_document(resume_document_id) if resume_document_id else None
+    )
+    jd = await get_ready_document(jd_document_id) if jd_document_id else None
+
+    if resume and jd:
+        return await score_documents(resume, jd)
+
+    jd_analysis, review = await asyncio.gather(
+        analyze_job_description_api(jd.analysis_text if jd else jd_text),
+        review_resume_api(resume.analysis_text if resume else resume_text),
+    )
+    return await score_analyses(jd_analysis, review)
+
+
 async def analysis_call_handler(
     function_id: str, function_name: str, function_args: str
 ) -> ToolMessage:
@@ -110,9 +147,12 @@ async def analysis_call_handler(
                 )
 
             case "analyze_candidate_fit_tool":
-                resume_text = json_args.get("resume_text", "")
-                jd_text = json_args.get("jd_text", "")
-                result = await calculate_fit_score_api(resume_text, jd_text)
+                result = await _candidate_fit(
+                    json_args.get("resume_text", ""),
+                    json_args.get("jd_text", ""),
+                    json_args.get("resume_document_id", ""),
+                    json_args.get("jd_document_id", ""),
+                )
 
                 return ToolMessage(
                     tool_call_id=function_id,
@@ -6,20 +6,28 @@ import logging
 from langchain_core.tools import tool
 from langchain_core.messages import ToolMessage
 
+from utils.app_config import get_app_config
 from job_analyzer.document_storage.document_manager import get_document
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.retrieval.retriever import (
+    retrieve_document_context,
+    whole_document_text,
+)
 
 logger = logging.getLogger(__name__)
 
 
 @tool(
-    description="Retrieve an uploaded document (resume, job description, etc.) by its document ID. Use this when the user references a document ID in their message."
+    description="Retrieve an uploaded document (resume, job description, etc.) by its document ID. Use this when the user references a document ID in their message. Pass the user's question as query to get only the relevant parts of long documents."
 )
-async def get_uploaded_document_tool(document_id: str) -> str:
+async def get_uploaded_document_tool(document_id: str, query: str = "") -> str:
     """
     Retrieve an uploaded document by ID.
 
     Args:
         document_id (str): The UUID of the uploaded document.
+        query (str): What to look for in the document. If empty, the whole
+            document (or its summary, for long documents) is returned.
 
     Returns:
         str: JSON with document content and metadata.
@@ -27,15 +35,7 @@ async def get_uploaded_document_tool(document_id: str) -> str:
     document = get_document(document_id)
 
     if document:
-        return json.dumps(
-            {
-                "status": "found",
-                "document_id": document.id,
-                "filename": document.original_filename,
-                "type": document.file_type,
-                "content": document.extracted_text,
-            }
-        )
+        return json.dumps(await _document_result(document, query))
     else:
         return json.dumps(
             {
@@ -46,6 +46,28 @@ async def get_uploaded_document_tool(document_id: str) -> str:
         )
 
 
+async def _document_result(document: UploadedDocument, query: str) -> dict:
+    """
+    Build the tool result, limited to the relevant chunks when a query is given.
+
+    Chunk retrieval only needs the extracted text, so only a document sent
+    whole waits (a bounded time) for a pending summary.
+    """
+    content = (
+        await retrieve_document_context(query, document)
+        if query
+        else await whole_document_text(document, get_app_config().document.retrieval)
+    )
+
+    return {
+        "status": "found",
+        "document_id": document.id,
+        "filename": document.original_filename,
+        "type": document.file_type,
+        "content": content,
+    }
+
+
 async def document_retrieval_call_handler(
     function_id: str, function_name: str, function_args: str
 ) -> ToolMessage:
@@ -66,16 +88,11 @@ async def document_retrieval_call_handler(
         match function_name:
             case "get_uploaded_document_tool":
                 document_id = json_args.get("document_id", "")
+                query = json_args.get("query", "")
                 document = get_document(document_id)
 
                 if document:
-                    result = {
-                        "status": "found",
-                        "document_id": document.id,
-                        "filename": document.original_filename,
-                        "type": document.file_type,
-                        "content": document.extracted_text,
-                    }
+                    result = await _document_result(document, query)
                     return ToolMessage(
                         tool_call_id=function_id,
                         status="success",
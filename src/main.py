@@ -8,6 +8,9 @@ import logging
 from utils.vars import get_app_path
 from utils.constants import UPLOADED_FILE_FOLDER
 from utils.app_config import AppConfig
+from utils.document_extractor import shutdown_extraction_pool
+from llm.inference import get_inference_registry, shutdown_inference_registry
+from job_analyzer.document_storage.janitor import get_document_janitor
 from routes.app_route import router
 from job_analyzer.database.models import Base
 from job_analyzer.database.layoff_db import (
@@ -42,14 +45,26 @@ async def lifespan(app: FastAPI):
 
     logging.info("Database initialization complete.")
 
+    janitor = get_document_janitor(config)
+    janitor.start()
+
+    if config.inference.pool.warm_up:
+        get_inference_registry(config).start_warm_up(config)
+
     yield
 
+    await janitor.stop()
+
+    await shutdown_inference_registry()
+
     logging.info("Application shutdown: Disposing database engine...")
 
     await layoff_db_engine.dispose()
 
     logging.info("Engine Disposed")
 
+    shutdown_extraction_pool()
+
 
 app = FastAPI(lifespan=lifespan)
 
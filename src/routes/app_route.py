@@ -6,12 +6,13 @@ from fastapi import (
     WebSocketDisconnect,
     HTTPException,
     UploadFile,
+    Request,
     status,
 )
 
 from routes.router_helper import ConnectionManager, handle_layoff_file_upload
 from job_analyzer.database.layoff_db import get_recent_layoff
-from routes.models import APISTATUS
+from routes.models import APISTATUS, RankRequest
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +84,8 @@ async def upload_resume(file: UploadFile, session_id: str | None = None):
             "status": "success",
             "document_id": document.id,
             "filename": document.original_filename,
-            "text_length": len(document.extracted_text),
+            "text_length": document.text_length,
+            "document_status": document.status,
         }
 
     except ValueError as e:
@@ -114,7 +116,8 @@ async def upload_job_description(file: UploadFile, session_id: str | None = None
             "status": "success",
             "document_id": document.id,
             "filename": document.original_filename,
-            "text_length": len(document.extracted_text),
+            "text_length": document.text_length,
+            "document_status": document.status,
         }
 
     except ValueError as e:
@@ -148,7 +151,8 @@ async def upload_text(
             "status": "success",
             "document_id": document.id,
             "filename": document.original_filename,
-            "text_length": len(document.extracted_text),
+            "text_length": document.text_length,
+            "document_status": document.status,
         }
 
     except Exception as e:
@@ -156,6 +160,224 @@ async def upload_text(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@router.post("/upload/batch", tags=["Documents"])
+async def upload_batch(
+    files: list[UploadFile],
+    doc_type: str = "resume",
+    session_id: str | None = None,
+):
+    """
+    Upload many documents at once, either as multiple files or a single zip archive.
+    """
+    logger.info(f"Received batch upload of {len(files)} file(s) ({doc_type})")
+
+    try:
+        from job_analyzer.document_storage.document_manager import (
+            save_uploaded_documents_batch,
+        )
+
+        results = await save_uploaded_documents_batch(
+            files, doc_type=doc_type, session_id=session_id
+        )
+
+        return {
+            "status": "success",
+            "total": len(results),
+            "created": sum(r.status == "created" for r in results),
+            "duplicates": sum(r.status == "duplicate" for r in results),
+            "errors": sum(r.status == "error" for r in results),
+            "results": [r.model_dump() for r in results],
+        }
+
+    except ValueError as e:
+        logger.warning(f"Invalid batch upload: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error processing batch upload: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@router.get("/documents/storage/metrics", tags=["Documents"])
+async def get_document_storage_metrics():
+    """
+    Get document storage usage and eviction counters.
+    """
+    from job_analyzer.document_storage.janitor import janitor_metrics
+
+    return janitor_metrics()
+
+
+@router.post("/analysis/fit", tags=["Analysis"])
+async def score_candidate_fit(
+    resume_id: str, job_description_id: str, bypass_cache: bool = False
+):
+    """
+    Score an uploaded resume against an uploaded job description.
+    """
+    from job_analyzer.analysis.fit_pipeline import score_documents
+    from job_analyzer.document_storage.document_manager import get_ready_document
+
+    resume = await get_ready_document(resume_id)
+    job_description = await get_ready_document(job_description_id)
+    if not resume or not job_description:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
+        )
+
+    fit = await score_documents(resume, job_description, bypass_cache)
+    return {
+        "resume_id": resume.id,
+        "job_description_id": job_description.id,
+        **fit.as_context(),
+    }
+
+
+@router.post("/rank", tags=["Analysis"])
+async def rank_candidates(request: RankRequest):
+    """
+    Rank resumes against a job description.
+
+    Resumes are pre-filtered by skill overlap and the top_k are scored in
+    full. Results are streamed as newline-delimited JSON events while the
+    candidates are scored: the shortlist first, then each score as it
+    completes, then a summary.
+    """
+    from fastapi.responses import StreamingResponse
+    from utils.app_config import get_app_config
+    from job_analyzer.analysis.ranking import rank_candidates as rank
+    from job_analyzer.document_storage.document_manager import (
+        get_document,
+        get_ready_document,
+        list_documents,
+    )
+
+    job_description = await get_ready_document(request.job_description_id)
+    if not job_description:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
+        )
+
+    if request.resume_ids:
+        resumes = [get_document(resume_id) for resume_id in request.resume_ids]
+        missing = [
+            resume_id
+            for resume_id, resume in zip(request.resume_ids, resumes)
+            if resume is None
+        ]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Documents not found: {', '.join(missing)}",
+            )
+    else:
+        resumes = [doc for doc in list_documents() if doc.file_type == "resume"]
+
+    max_resumes = get_app_config().document.ranking.max_resumes
+    if len(resumes) > max_resumes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {max_resumes} resumes can be ranked at once",
+        )
+
+    async def events():
+        async for event in rank(
+            job_description, resumes, request.top_k, request.bypass_cache
+        ):
+            yield json_lib.dumps(event) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@router.get("/analysis/cache/metrics", tags=["Analysis"])
+async def get_analysis_cache_metrics():
+    """
+    Get hit and miss counters of the LLM analysis response cache.
+    """
+    from llm.response_cache import get_response_cache
+
+    cache = get_response_cache()
+    if cache is None:
+        return {"enabled": False}
+
+    return {"enabled": True, **cache.stats()}
+
+
+@router.get("/documents/{document_id}", tags=["Documents"])
+async def get_document_status(document_id: str):
+    """
+    Get the processing status of an uploaded document.
+    """
+    from job_analyzer.document_storage.document_manager import get_document
+
+    document = get_document(document_id)
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
+        )
+
+    return {
+        "document_id": document.id,
+        "filename": document.original_filename,
+        "type": document.file_type,
+        "text_length": document.text_length,
+        "status": document.status,
+    }
+
+
+@router.api_route(
+    "/documents/{document_id}/file", methods=["GET", "HEAD"], tags=["Documents"]
+)
+async def download_document(document_id: str, request: Request, inline: bool = False):
+    """
+    Download the original file of an uploaded document.
+
+    The file is streamed from disk (sent with sendfile when the server
+    supports it) and honours Range requests. The ETag is the content hash, so
+    clients can revalidate with If-None-Match or resume with If-Range.
+    """
+    from fastapi.responses import FileResponse, Response
+    from starlette.background import BackgroundTask
+    from job_analyzer.document_storage.document_manager import (
+        open_document_file,
+        close_document_file,
+    )
+
+    opened = open_document_file(document_id)
+    if opened is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Document file not found"
+        )
+
+    document, file_path = opened
+    headers = {
+        "etag": f'"{document.metadata.get("file_hash", document.file_hash)}"',
+        "cache-control": "private, no-cache",
+    }
+
+    if _etag_matches(request.headers.get("if-none-match"), headers["etag"]):
+        close_document_file(document)
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return FileResponse(
+        file_path,
+        headers=headers,
+        filename=document.original_filename,
+        content_disposition_type="inline" if inline else "attachment",
+        background=BackgroundTask(close_document_file, document),
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
 @router.get("/layoffs/")
 async def read_recent_layoffs(days: int = 7, limit: int = 10):
     """
@@ -206,42 +428,10 @@ async def websocket_chat(websocket: WebSocket):
 
                 # Inject document context if IDs provided
                 if resume_id or jd_id:
-                    from job_analyzer.document_storage.document_manager import (
-                        get_document,
+                    message_text = await manager.attach_documents(
+                        websocket, message_text, resume_id=resume_id, jd_id=jd_id
                     )
 
-                    context_parts = []
-
-                    if resume_id:
-                        resume_doc = await get_document(resume_id)
-                        if resume_doc:
-                            context_parts.append(
-                                f"[RESUME CONTENT]\n{resume_doc.extracted_text}\n[END RESUME]"
-                            )
-                            logger.info(
-                                f"Injected resume document: {resume_doc.original_filename}"
-                            )
-                        else:
-                            logger.warning(f"Resume document {resume_id} not found")
-
-                    if jd_id:
-                        jd_doc = await get_document(jd_id)
-                        if jd_doc:
-                            context_parts.append(
-                                f"[JOB DESCRIPTION]\n{jd_doc.extracted_text}\n[END JOB DESCRIPTION]"
-                            )
-                            logger.info(
-                                f"Injected JD document: {jd_doc.original_filename}"
-                            )
-                        else:
-                            logger.warning(f"JD document {jd_id} not found")
-
-                    # Prepend document context to message
-                    if context_parts:
-                        message_text = (
-                            "\n\n".join(context_parts) + "\n\n" + message_text
-                        )
-
                 await manager.handle_chat_completion(websocket, message_text)
 
             except WebSocketDisconnect:
@@ -1,4 +1,7 @@
 from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
 
 
 class APISTATUS(Enum):
@@ -6,3 +9,13 @@ class APISTATUS(Enum):
     NOT_CREATED = "NOT_CREATED"
     DUPLICATE = "DUPLICATE"
     OK = "OK"
+
+
+class RankRequest(BaseModel):
+    """Request to rank resumes against a job description."""
+
+    job_description_id: str
+    # Every stored resume when empty
+    resume_ids: list[str] = Field(default_factory=list)
+    top_k: Optional[int] = Field(default=None, ge=1)
+    bypass_cache: bool = False
@@ -1,18 +1,14 @@
 import logging
-from pathlib import Path
+from typing import Optional
 
 import xxhash
 from fastapi import WebSocket, UploadFile
-from langchain_core.messages import (
-    BaseMessage,
-    HumanMessage,
-    SystemMessage,
-)
+from langchain_core.messages import BaseMessage
 from routes.models import APISTATUS
 
 logger = logging.getLogger(__name__)
-from utils.vars import get_app_path
 from llm.inference import Inference
+from llm.chat_history import ChatHistory
 from llm.tools.layoff_tools import (
     get_recent_layoff_tool,
     get_recent_layoff_tool_fields,
@@ -36,11 +32,29 @@ from llm.tools.analysis_tools import (
 )
 from llm.tools.document_tools import get_uploaded_document_tool
 from job_analyzer.database.models import LayOff
-from job_analyzer.database.layoff_db import add_layoff_bulk
+from job_analyzer.database.layoff_db import (
+    add_layoff_bulk,
+    add_layoff_import,
+    is_layoff_file_imported,
+)
+from job_analyzer.document_storage.blob_store import get_blob_store
 from llm.tools.tool_helper import functional_call_handler as tool_handler
-from utils.constants import UPLOADED_FILE_FOLDER
 from utils.llm_config import get_system_prompt
 
+# Tools offered in chat; bound to the pooled LLM client once per process
+CHAT_TOOLS = [
+    get_recent_layoff_tool,
+    get_recent_layoff_tool_fields,
+    search_recent_news_tool,
+    search_recent_web_content_tool,
+    google_search_tool,
+    search_job_salary_tool,
+    analyze_job_description_tool,
+    analyze_resume_tool,
+    analyze_candidate_fit_tool,
+    get_uploaded_document_tool,
+]
+
 
 class ConnectionManager:
     """WebSocket Connection Manager"""
@@ -48,10 +62,11 @@ class ConnectionManager:
     def __init__(self):
         logger.debug("Initializing WebSocket Connection Manager")
         self.active_connections: list[WebSocket] = []
-        self.chat_history: dict[WebSocket, list[BaseMessage]] = {}
-        self.document_context: dict[WebSocket, dict[str, str]] = (
-            {}
-        )  # Stores uploaded document IDs
+        self.chat_history: dict[WebSocket, ChatHistory] = {}
+        # Document ID -> indexes of its chunks already in the chat history
+        self.document_context: dict[WebSocket, dict[str, set[int]]] = {}
+        # Documents injected into the message about to be sent
+        self.attached_documents: dict[WebSocket, set[str]] = {}
 
     async def connect(self, websocket: WebSocket):
         """Handle websocket connection"""
@@ -60,9 +75,9 @@ class ConnectionManager:
 
         await websocket.accept()
         self.active_connections.append(websocket)
-        self.chat_history[websocket] = [
-            SystemMessage(content="You are a helpful assistant.")
-        ]
+        self.chat_history[websocket] = ChatHistory.from_config(
+            "You are a helpful assistant."
+        )
 
         logger.debug(
             f"Client {client_id} connected. Active connections: {len(self.active_connections)}"
@@ -75,9 +90,9 @@ class ConnectionManager:
 
         try:
             self.active_connections.remove(websocket)
-            del self.chat_history[websocket]
-            if websocket in self.document_context:
-                del self.document_context[websocket]
+            self.chat_history.pop(websocket).close()
+            self.document_context.pop(websocket, None)
+            self.attached_documents.pop(websocket, None)
             logger.debug(
                 f"Client {client_id} disconnected. Remaining connections: {len(self.active_connections)}"
             )
@@ -97,43 +112,115 @@ class ConnectionManager:
                 client_id = id(connection)
                 logger.error(f"Failed to broadcast to client {client_id}: {str(e)}")
 
+    async def attach_documents(
+        self,
+        websocket: WebSocket,
+        message: str,
+        resume_id: Optional[str] = None,
+        jd_id: Optional[str] = None,
+    ) -> str:
+        """
+        Prepend the context of the referenced documents to a chat message.
+
+        Each document's content is added to the chat history once per
+        connection: later messages referencing it only carry chunks relevant
+        to the new message that were not sent before, or a short reference.
+
+        Args:
+            websocket: Connection the message was received on.
+            message: The user's message.
+            resume_id: ID of the uploaded resume to use, if any.
+            jd_id: ID of the uploaded job description to use, if any.
+
+        Returns:
+            The message with document context prepended.
+        """
+        from job_analyzer.document_storage.document_manager import get_document
+        from job_analyzer.retrieval.retriever import retrieve_new_document_context
+
+        sent_chunks = self.document_context.setdefault(websocket, {})
+        context_parts = []
+
+        for document_id, kind, label, end_label in (
+            (resume_id, "Resume", "RESUME CONTENT", "END RESUME"),
+            (jd_id, "JD", "JOB DESCRIPTION", "END JOB DESCRIPTION"),
+        ):
+            if not document_id:
+                continue
+
+            # Retrieval reads the extracted text; only a document sent whole
+            # waits (a bounded time) for its background summary
+            document = get_document(document_id)
+            if document is None:
+                logger.warning(f"{kind} document {document_id} not found")
+                continue
+
+            sent = sent_chunks.setdefault(document.id, set())
+            first = not sent
+            text = await retrieve_new_document_context(message, document, sent)
+
+            if text is not None:
+                self.attached_documents.setdefault(websocket, set()).add(document.id)
+                prefix = label if first else f"MORE {label}"
+                context_parts.append(f"[{prefix}]\n{text}\n[{end_label}]")
+                logger.info(
+                    f"Injected {kind} document {document.original_filename} "
+                    f"({'first time' if first else 'new chunks only'})"
+                )
+            elif not first:
+                context_parts.append(
+                    f"[{label}: {document.original_filename}, provided above]"
+                )
+                logger.debug(f"{kind} document {document.id} already in chat history")
+
+        if not context_parts:
+            return message
+        return "\n\n".join(context_parts) + "\n\n" + message
+
+    def forget_documents(self, websocket: WebSocket, document_ids: set[str]) -> None:
+        """
+        Mark documents as no longer in the chat history.
+
+        Called with the documents of turns dropped from the history, so their
+        content is sent again the next time a message references them.
+
+        Args:
+            websocket: Connection whose history dropped the documents.
+            document_ids: IDs of the dropped documents.
+        """
+        sent_chunks = self.document_context.get(websocket, {})
+        for document_id in document_ids:
+            if sent_chunks.pop(document_id, None) is not None:
+                logger.debug(f"Document {document_id} left the chat history")
+
     async def handle_chat_completion(self, websocket: WebSocket, message: str):
         """Handle chat completion logic"""
         client_id = id(websocket)
         logger.debug(f"Processing chat completion for client {client_id}")
         logger.debug(f"Received message: {message[:100]}...")  # Log first 100 chars
 
-        self.chat_history[websocket][0] = SystemMessage(content=get_system_prompt())
-        self.chat_history[websocket].append(HumanMessage(content=message))
+        history = self.chat_history[websocket]
+        history.set_system_prompt(get_system_prompt())
+        history.add_user_message(message, self.attached_documents.pop(websocket, ()))
+        self.forget_documents(websocket, history.compact())
         logger.debug(
-            f"Updated chat history for client {client_id}. History length: {len(self.chat_history[websocket])}"
+            f"Updated chat history for client {client_id}. History tokens: {history.token_count}"
         )
 
         try:
             logger.debug(f"Setting up inference engine for client {client_id}")
             inference = (
-                Inference()
-                .with_tools(
-                    [
-                        get_recent_layoff_tool,
-                        get_recent_layoff_tool_fields,
-                        search_recent_news_tool,
-                        search_recent_web_content_tool,
-                        google_search_tool,
-                        search_job_salary_tool,
-                        analyze_job_description_tool,
-                        analyze_resume_tool,
-                        analyze_candidate_fit_tool,
-                        get_uploaded_document_tool,
-                    ]
-                )
-                .with_tool_handler(tool_handler)
+                Inference().with_tools(CHAT_TOOLS).with_tool_handler(tool_handler)
             )
 
             logger.debug(f"Starting inference stream for client {client_id}")
-            await inference.stream(websocket, self.chat_history[websocket])
+            answer: list[BaseMessage] = []
+            await inference.stream(websocket, history.messages(), answer)
             logger.debug(f"Completed inference stream for client {client_id}")
 
+            history.add_messages(answer)
+            self.forget_documents(websocket, history.compact())
+
         except Exception as e:
             logger.error(
                 f"Error during chat completion for client {client_id}: {str(e)}",
@@ -149,25 +236,18 @@ async def handle_layoff_file_upload(file: UploadFile) -> APISTATUS:
     try:
         contents = await file.read()
         file_hash = xxhash.xxh64(contents).hexdigest()
-        file_extension = Path(file.filename or "abc.csv").suffix
 
-        upload_path = (
-            get_app_path()
-            .joinpath(UPLOADED_FILE_FOLDER)
-            .joinpath(f"temp_{file_hash}.{file_extension}")
-        )
-        logger.debug(f"Generated upload path: {upload_path}")
-
-        if upload_path.exists():
+        if await is_layoff_file_imported(file_hash):
             logger.warning(f"Duplicate file detected with hash {file_hash}")
             return APISTATUS.DUPLICATE
 
+        blob_store = get_blob_store()
+
         try:
-            logger.debug(f"Writing file contents to {upload_path}")
-            with open(upload_path, "wb") as f:
-                f.write(contents)
+            logger.debug(f"Storing file contents as blob {file_hash}")
+            blob_store.put(contents, file_hash)
         except PermissionError as e:
-            logger.error(f"Permission denied while writing to {upload_path}: {str(e)}")
+            logger.error(f"Permission denied while storing blob {file_hash}: {str(e)}")
             return APISTATUS.PERMISSIONERROR
         except Exception as e:
             logger.error(
@@ -175,15 +255,25 @@ async def handle_layoff_file_upload(file: UploadFile) -> APISTATUS:
             )
             raise
 
-        logger.debug(f"Parsing CSV file: {upload_path}")
-        layoff_parsed = LayOff.from_csv(upload_path)
-        logger.info(
-            f"Successfully parsed {len(layoff_parsed)} layoff records from {file.filename}"
-        )
+        # The import record, not the blob, marks the file as imported: the
+        # blob is garbage collected once the import is done.
+        upload_path = blob_store.path_for(file_hash)
+        blob_store.acquire(file_hash)
+        try:
+            logger.debug(f"Parsing CSV file: {upload_path}")
+            layoff_parsed = LayOff.from_csv(upload_path)
+            logger.info(
+                f"Successfully parsed {len(layoff_parsed)} layoff records from {file.filename}"
+            )
 
-        logger.debug("Adding parsed records to database")
-        await add_layoff_bulk(layoff_parsed)
-        logger.info(f"Successfully added {len(layoff_parsed)} records to database")
+            logger.debug("Adding parsed records to database")
+            added = await add_layoff_bulk(layoff_parsed)
+            await add_layoff_import(file_hash, file.filename, added)
+            logger.info(
+                f"Successfully added {added} of {len(layoff_parsed)} records to database"
+            )
+        finally:
+            blob_store.release(file_hash)
 
         return APISTATUS.OK
 
@@ -2,6 +2,7 @@ import logging
 import tomllib
 import tomli_w
 from enum import Enum
+from typing import Optional
 from pydantic import BaseModel, Field
 from pathlib import Path
 
@@ -84,15 +85,78 @@ class InferenceConfig(BaseModel):
     gemini: GeminiInferenceConfig = GeminiInferenceConfig()
 
 
+class InferencePoolConfig(BaseModel):
+    """HTTP connection pool shared by the long-lived LLM clients."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 120.0
+    warm_up: bool = True
+
+
+class AgentConfig(BaseModel):
+    """Tool calling in the chat streaming loop."""
+
+    max_depth: int = 5
+    turn_budget_seconds: float = 120.0
+    max_parallel_tool_calls: int = 4
+    tool_timeout_seconds: float = 30.0
+
+
+class ResponseCacheConfig(BaseModel):
+    """Exact-match cache of LLM responses to the analysis prompts."""
+
+    enabled: bool = True
+    memory_entries: int = 256
+    max_disk_entries: int = 10000
+
+
+class ChatHistoryConfig(BaseModel):
+    """Token budget of the chat history sent with every message."""
+
+    # 0 to derive it from the model's context_window and max_tokens
+    max_tokens: int = 0
+    # Left for the tool definitions sent with every call
+    reserved_tokens: int = 1024
+    # Tool results are cut to this once the model has answered from them
+    tool_output_tokens: int = 300
+    # Summarize turns that fall out of the budget instead of dropping them
+    summarize: bool = True
+    summary_tokens: int = 300
+
+
 class Inference(BaseModel):
     hosted: ModelHosted = ModelHosted.OPENAI_HOSTED
     inference_engine: InferenceEngine = InferenceEngine.OPENAI
     inference_config: InferenceConfig = Field(default_factory=InferenceConfig)
+    pool: InferencePoolConfig = Field(default_factory=InferencePoolConfig)
+    agent: AgentConfig = Field(default_factory=AgentConfig)
+    response_cache: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)
+    chat_history: ChatHistoryConfig = Field(default_factory=ChatHistoryConfig)
 
     @staticmethod
     def default() -> "Inference":
         return Inference()
 
+    def active_config(
+        self,
+    ) -> (
+        OpenAIInferenceConfig
+        | AzureOpenAIInferenceConfig
+        | LocalInferenceConfig
+        | GeminiInferenceConfig
+    ):
+        """Get the inference config of the selected inference engine."""
+        match self.inference_engine:
+            case InferenceEngine.AZURE_OPENAI:
+                return self.inference_config.azure_openai
+            case InferenceEngine.LOCAL:
+                return self.inference_config.local
+            case InferenceEngine.GEMINI:
+                return self.inference_config.gemini
+            case _:
+                return self.inference_config.openai
+
 
 class AzureEmbeddingConfig(BaseModel):
     api_base: str = "https://api.openai.azure.com/"
@@ -136,10 +200,19 @@ class EmbeddingConfig(BaseModel):
     )
 
 
+class VectorStoreConfig(BaseModel):
+    """Configuration for the memory-mapped on-disk embedding store."""
+
+    enabled: bool = True
+    compact_min_dead_ratio: float = 0.3
+    compact_min_rows: int = 1000
+
+
 class Embedding(BaseModel):
     hosted: ModelHosted = ModelHosted.OPENAI_HOSTED
     embedding_engine: InferenceEngine = InferenceEngine.OPENAI
     embedding_config: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
+    vector_store: VectorStoreConfig = Field(default_factory=VectorStoreConfig)
 
     @staticmethod
     def default() -> "Embedding":
@@ -193,6 +266,111 @@ class LoggingConfig(BaseModel):
         return LoggingConfig()
 
 
+class ExtractionCacheConfig(BaseModel):
+    """Configuration for the on-disk extraction/summary cache."""
+
+    enabled: bool = True
+    max_size_mb: int = 256
+    compression_level: int = 6
+
+
+class SummarizerConfig(BaseModel):
+    """Configuration for map-reduce summarization of long documents."""
+
+    max_document_tokens: int = 4000
+    chunk_tokens: int = 2000
+    max_concurrency: int = 4
+
+
+class BatchUploadConfig(BaseModel):
+    """Limits for batch and archive uploads."""
+
+    max_files: int = 500
+    max_file_size_mb: int = 20
+    max_concurrency: int = 8
+
+
+class RetrievalConfig(BaseModel):
+    """Configuration for retrieving relevant document chunks into prompts."""
+
+    enabled: bool = True
+    chunk_tokens: int = 300
+    chunk_overlap_tokens: int = 40
+    top_k: int = 4
+    full_text_max_tokens: int = 1500
+    # Seconds to wait for a pending summary before sending a document whole
+    summary_wait_seconds: float = 30.0
+    ann_enabled: bool = True
+    ann_min_vectors: int = 20000
+
+
+class RetentionConfig(BaseModel):
+    """Expiry and quotas for stored documents, enforced by the document janitor."""
+
+    enabled: bool = True
+    ttl_minutes: int = 1440
+    session_quota_mb: int = 50
+    global_quota_mb: int = 1024
+    sweep_interval_seconds: int = 300
+
+
+class TextStorageConfig(BaseModel):
+    """Compression of document text held in memory (codec: zstd or zlib)."""
+
+    codec: str = "zstd"
+    level: int = 3
+    cache_entries: int = 16
+
+
+class NormalizerConfig(BaseModel):
+    """Cleanup of extracted text before it is stored and summarized."""
+
+    enabled: bool = True
+    remove_repeated_lines: bool = True
+    shorten_urls: bool = True
+
+
+class ScoringConfig(BaseModel):
+    """Candidate fit scoring."""
+
+    # "local" (rule-based, no LLM call) or "llm" (scoring prompt)
+    engine: str = "local"
+    # Have the LLM write the reasoning trace of local scores
+    llm_reasoning: bool = False
+
+
+class RankingConfig(BaseModel):
+    """Ranking many resumes against one job description."""
+
+    # Resumes kept by the skill-overlap pre-filter and scored in full
+    top_k: int = 20
+    max_concurrency: int = 4
+    max_resumes: int = 5000
+
+
+class DocumentConfig(BaseModel):
+    """Configuration for uploaded document processing."""
+
+    extraction_workers: int = 4
+    # "pypdf2" or "layout" (reading-order aware, faster on multi-column pages)
+    pdf_extractor: str = "pypdf2"
+    extraction_cache: ExtractionCacheConfig = Field(
+        default_factory=ExtractionCacheConfig
+    )
+    summarizer: SummarizerConfig = Field(default_factory=SummarizerConfig)
+    batch_upload: BatchUploadConfig = Field(default_factory=BatchUploadConfig)
+    retrieval: RetrievalConfig = Field(default_factory=RetrievalConfig)
+    retention: RetentionConfig = Field(default_factory=RetentionConfig)
+    text_storage: TextStorageConfig = Field(default_factory=TextStorageConfig)
+    normalizer: NormalizerConfig = Field(default_factory=NormalizerConfig)
+    scoring: ScoringConfig = Field(default_factory=ScoringConfig)
+    ranking: RankingConfig = Field(default_factory=RankingConfig)
+
+    @staticmethod
+    def default() -> "DocumentConfig":
+        return DocumentConfig()
+
+
 class AppSetting(BaseModel):
     app_name: str = "Job Analyzer"
     app_author: str = "Abugh"
@@ -210,6 +388,7 @@ class AppConfig(BaseModel):
     app_setting: AppSetting = Field(default_factory=AppSetting.default)
     inference: Inference = Field(default_factory=Inference.default)
     embed: Embedding = Field(default_factory=Embedding.default)
+    document: DocumentConfig = Field(default_factory=DocumentConfig.default)
 
     def save_config(self, toml_file_path: Path = app_config_path()):
         """Saves the configuration to a TOML file."""
@@ -297,3 +476,24 @@ class AppConfig(BaseModel):
         logger = logging.getLogger(__name__)
         logger.info("Creating new default configuration instance")
         return AppConfig()
+
+
+_app_config: Optional[AppConfig] = None
+
+
+def get_app_config() -> AppConfig:
+    """
+    Get the default configuration, loaded once per process.
+
+    Use it on paths that run per document or per candidate instead of
+    AppConfig.load_default, which re-reads and parses the TOML file.
+
+    Returns:
+        The shared AppConfig instance. Treat it as read-only.
+    """
+    global _app_config
+
+    if _app_config is None:
+        _app_config = AppConfig.load_default()
+
+    return _app_config
@@ -1,4 +1,8 @@
 UPLOADED_FILE_FOLDER = "uploaded_files"
+EXTRACTION_CACHE_FOLDER = "extraction_cache"
+RETRIEVAL_INDEX_FOLDER = "retrieval_index"
+VECTOR_STORE_FOLDER = "vector_store"
+RESPONSE_CACHE_FOLDER = "response_cache"
 
 # Make sure to modify utils/llm_config.py, #get_system_prompt()
 SYSTEM_MESSAGE = """
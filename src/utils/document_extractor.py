@@ -1,20 +1,69 @@
 """Unified document text extractor supporting PDF, DOCX, and TXT formats."""
 
+import asyncio
 import logging
 from pathlib import Path
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
 
-from utils.pdf_extractor import extract_text_from_pdf
+from utils.pdf_extractor import extract_text_from_pdf, extract_text_from_pdf_layout
 from utils.docx_extractor import extract_text_from_docx
+from utils.app_config import AppConfig
 
 logger = logging.getLogger(__name__)
 
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+_pdf_extractor: Optional[str] = None
 
-async def extract_document_text(file_path: str | Path) -> str:
+# Bump the version of a format whenever its extractor output changes so that
+# cached extraction results produced by the old implementation are ignored.
+EXTRACTOR_VERSIONS = {
+    "pdf": "pypdf2-2",
+    "pdf-layout": "layout-2",
+    "docx": "ooxml-stream-1",
+    "txt": "utf8-1",
+}
+
+
+def extractor_version(file_format: str) -> str:
     """
-    Extract text from PDF, DOCX, or TXT files.
+    Get the extractor version for a file format.
+
+    Args:
+        file_format: File extension without the leading dot (pdf, docx, txt).
+
+    Returns:
+        Version string identifying the extractor implementation.
+    """
+    file_format = file_format.lower().lstrip(".")
+    if file_format == "pdf" and pdf_extractor_name() == "layout":
+        file_format = "pdf-layout"
+    return EXTRACTOR_VERSIONS.get(file_format, "unknown")
+
+
+def pdf_extractor_name() -> str:
+    """Name of the configured PDF extractor: "layout" or "pypdf2"."""
+    global _pdf_extractor
+
+    if _pdf_extractor is None:
+        _pdf_extractor = AppConfig.load_default().document.pdf_extractor
+        if _pdf_extractor not in ("layout", "pypdf2"):
+            logger.warning(f"Unknown PDF extractor {_pdf_extractor}, using pypdf2")
+            _pdf_extractor = "pypdf2"
+
+    return _pdf_extractor
+
+
+def extract_document_text_sync(
+    file_path: str | Path, file_format: Optional[str] = None
+) -> str:
+    """
+    Extract text from PDF, DOCX, or TXT files in the calling thread.
 
     Args:
         file_path: Path to the document file.
+        file_format: Format of the file (pdf, docx, txt). Defaults to the file
+            suffix; needed for files stored without one, e.g. blobs.
 
     Returns:
         Extracted text content.
@@ -28,12 +77,14 @@ async def extract_document_text(file_path: str | Path) -> str:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    suffix = file_path.suffix.lower()
+    suffix = f".{file_format}" if file_format else file_path.suffix.lower()
 
     try:
         match suffix:
             case ".pdf":
                 logger.debug(f"Extracting text from PDF: {file_path.name}")
+                if pdf_extractor_name() == "layout":
+                    return extract_text_from_pdf_layout(file_path)
                 return extract_text_from_pdf(file_path)
 
             case ".docx":
@@ -52,3 +103,84 @@ async def extract_document_text(file_path: str | Path) -> str:
     except Exception as e:
         logger.error(f"Error extracting text from {file_path}: {str(e)}", exc_info=True)
         raise RuntimeError(f"Document extraction failed: {str(e)}")
+
+
+async def extract_document_text(
+    file_path: str | Path, file_format: Optional[str] = None
+) -> str:
+    """
+    Extract text from PDF, DOCX, or TXT files without blocking the event loop.
+
+    Parsing runs in the extraction process pool, see
+    extract_document_text_in_pool.
+
+    Args:
+        file_path: Path to the document file.
+        file_format: Format of the file. Defaults to the file suffix.
+
+    Returns:
+        Extracted text content.
+
+    Raises:
+        ValueError: If file type is not supported.
+        RuntimeError: If extraction fails.
+    """
+    return await extract_document_text_in_pool(file_path, file_format)
+
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """
+    Get the process pool used for CPU-bound document parsing.
+
+    Returns:
+        Shared ProcessPoolExecutor sized by the document.extraction_workers setting.
+    """
+    global _extraction_pool
+
+    if _extraction_pool is None:
+        workers = AppConfig.load_default().document.extraction_workers
+        _extraction_pool = ProcessPoolExecutor(max_workers=max(1, workers))
+        logger.info(f"Extraction process pool started with {workers} workers")
+
+    return _extraction_pool
+
+
+async def extract_document_text_in_pool(
+    file_path: str | Path, file_format: Optional[str] = None
+) -> str:
+    """
+    Extract text in the extraction process pool without blocking the event loop.
+
+    Plain text files are read in a thread since they need no parsing.
+
+    Args:
+        file_path: Path to the document file.
+        file_format: Format of the file. Defaults to the file suffix.
+
+    Returns:
+        Extracted text content.
+
+    Raises:
+        ValueError: If file type is not supported.
+        RuntimeError: If extraction fails.
+    """
+    file_path = Path(file_path)
+    file_format = file_format or file_path.suffix.lower().lstrip(".")
+
+    if file_format == "txt":
+        return await asyncio.to_thread(extract_document_text_sync, file_path, "txt")
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_extraction_pool(), extract_document_text_sync, file_path, file_format
+    )
+
+
+def shutdown_extraction_pool() -> None:
+    """Shut down the extraction process pool, if it was started."""
+    global _extraction_pool
+
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=True, cancel_futures=True)
+        _extraction_pool = None
+        logger.info("Extraction process pool shut down")
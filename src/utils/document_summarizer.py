@@ -1,92 +1,289 @@
 """Document summarization utility to manage LLM context limits."""
 
+import time
+import asyncio
 import logging
 from typing import Optional
+from dataclasses import dataclass, field
 
+import xxhash
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from llm.inference import Inference
+from utils.app_config import AppConfig, get_app_config
+from utils.single_flight import SingleFlight
+from utils.token_counter import count_tokens, split_text_by_tokens, truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
 # Token limits (conservative estimates)
 MAX_TOKENS_PER_DOCUMENT = 4000  # Leave room for other context
-CHARS_PER_TOKEN = 4  # Rough estimate
-MAX_CHARS = MAX_TOKENS_PER_DOCUMENT * CHARS_PER_TOKEN
+
+# Bump whenever prompts or summarization logic change to invalidate cached summaries
+SUMMARIZER_VERSION = "2"
+TRUNCATION_MARKER = "[TRUNCATED DUE TO LENGTH]"
+
+# Summarization LLM calls in flight, shared by concurrent identical prompts
+summary_flights = SingleFlight("summary")
+
+SUMMARY_PROMPTS = {
+    "resume": """Summarize this resume, preserving ALL key information:
+- Work experience (companies, roles, durations, key achievements)
+- Skills (technical and soft)
+- Education (degrees, institutions)
+- Certifications
+- Projects and achievements
+
+Keep the summary comprehensive but concise. Do not lose critical details.""",
+    "job_description": """Summarize this job description, preserving ALL requirements:
+- Role title and level
+- Required skills and experience
+- Must-have vs nice-to-have requirements
+- Deal-breakers and mandatory qualifications
+- Education and certification requirements
+
+Be thorough - include all specific requirements.""",
+    "document": """Summarize this document comprehensively, preserving all key information and important details.""",
+}
+
+MAP_INSTRUCTIONS = """This is part {part} of {total} of a longer {doc_type}.
+Condense it into dense notes that keep every name, date, number, skill,
+requirement and qualification it mentions. Do not add information that is not
+in this part."""
+
+REDUCE_INSTRUCTIONS = """These are notes taken from consecutive parts of a {doc_type}.
+Merge them into a single set of notes, removing repetition but keeping every
+name, date, number, skill, requirement and qualification."""
+
+
+@dataclass
+class SummaryStats:
+    """Per-stage statistics of a summarization run."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    chunks: int = 0
+    reduce_levels: int = 0
+    llm_calls: int = 0
+    stage_latency_ms: dict[str, float] = field(default_factory=dict)
+
+    def record(self, stage: str, started: float) -> None:
+        """Record the latency of a stage that started at the given perf counter."""
+        self.stage_latency_ms[stage] = round(
+            self.stage_latency_ms.get(stage, 0.0)
+            + (time.perf_counter() - started) * 1000,
+            1,
+        )
+
+
+@dataclass
+class SummaryResult:
+    """Summary text and the statistics of how it was produced."""
+
+    text: str
+    stats: SummaryStats
+
+
+def needs_summarization(
+    text: str, max_tokens: Optional[int] = None, token_count: Optional[int] = None
+) -> bool:
+    """
+    Check whether a document is too long to be sent to the LLM as-is.
+
+    Args:
+        text: The full document text.
+        max_tokens: Maximum tokens before summarization. Defaults to the config.
+        token_count: Token count of the text, if already known.
+
+    Returns:
+        True if summarize_document would summarize the text.
+    """
+    max_tokens = max_tokens or get_app_config().document.summarizer.max_document_tokens
+    if token_count is None:
+        token_count = count_tokens(text)
+    return token_count > max_tokens
 
 
 async def summarize_document(
     text: str,
     doc_type: str = "document",
-    max_length: int = MAX_CHARS,
+    max_tokens: Optional[int] = None,
 ) -> str:
     """
-    Summarize a document if it exceeds the maximum length.
+    Summarize a document if it exceeds the maximum token count.
 
     Args:
         text: The full document text.
         doc_type: Type of document (resume, job_description, etc.)
-        max_length: Maximum character length before summarization.
+        max_tokens: Maximum tokens before summarization. Defaults to the config.
 
     Returns:
         Original text if under limit, otherwise summarized version.
     """
-    if len(text) <= max_length:
+    app_config = get_app_config()
+    max_tokens = max_tokens or app_config.document.summarizer.max_document_tokens
+    token_count = count_tokens(text)
+
+    if token_count <= max_tokens:
         logger.debug(
-            f"Document size ({len(text)} chars) within limit, no summarization needed"
+            f"Document size ({token_count} tokens) within limit, no summarization needed"
         )
         return text
 
     logger.info(
-        f"Document size ({len(text)} chars) exceeds limit ({max_length}), summarizing..."
+        f"Document size ({token_count} tokens) exceeds limit ({max_tokens}), summarizing..."
     )
 
     try:
-        summary = await _generate_summary(text, doc_type)
-        logger.info(f"Summarized from {len(text)} to {len(summary)} characters")
-        return summary
+        result = await map_reduce_summarize(text, doc_type, app_config=app_config)
+        stats = result.stats
+        logger.info(
+            f"Summarized from {stats.input_tokens} to {stats.output_tokens} tokens "
+            f"({stats.chunks} chunks, {stats.reduce_levels} reduce levels, "
+            f"{stats.llm_calls} LLM calls, latency ms: {stats.stage_latency_ms})"
+        )
+        return result.text
     except Exception as e:
         logger.error(f"Summarization failed: {str(e)}")
         # Fallback: truncate with warning
-        truncated = text[:max_length]
-        logger.warning(f"Falling back to truncation at {max_length} chars")
-        return f"[TRUNCATED DUE TO LENGTH]\n\n{truncated}\n\n[...Content truncated...]"
+        truncated = truncate_to_tokens(text, max_tokens)
+        logger.warning(f"Falling back to truncation at {max_tokens} tokens")
+        return f"{TRUNCATION_MARKER}\n\n{truncated}\n\n[...Content truncated...]"
 
 
-async def _generate_summary(text: str, doc_type: str) -> str:
+async def map_reduce_summarize(
+    text: str,
+    doc_type: str = "document",
+    app_config: Optional[AppConfig] = None,
+) -> SummaryResult:
     """
-    Generate a summary using LLM.
+    Summarize a document of any size with a map-reduce strategy.
+
+    The text is split on section boundaries into chunks that fit the model
+    context, each chunk is condensed concurrently (map), and the notes are
+    merged in groups until they fit a single prompt (reduce). The final prompt
+    produces the structured summary for the document type.
 
     Args:
         text: The full document text.
-        doc_type: Type of document for context-aware summarization.
+        doc_type: Type of document (resume, job_description, etc.)
+        app_config: Application configuration. Defaults to the app config.
 
     Returns:
-        Summarized text.
+        SummaryResult with the summary text and per-stage statistics.
     """
-    prompts = {
-        "resume": """Summarize this resume, preserving ALL key information:
-- Work experience (companies, roles, durations, key achievements)
-- Skills (technical and soft)
-- Education (degrees, institutions)
-- Certifications
-- Projects and achievements
+    app_config = app_config or get_app_config()
+    config = app_config.document.summarizer
+    chunk_tokens = _chunk_token_budget(app_config)
+    semaphore = asyncio.Semaphore(max(1, config.max_concurrency))
+    stats = SummaryStats(input_tokens=count_tokens(text))
 
-Keep the summary comprehensive but concise. Do not lose critical details.""",
-        "job_description": """Summarize this job description, preserving ALL requirements:
-- Role title and level
-- Required skills and experience
-- Must-have vs nice-to-have requirements
-- Deal-breakers and mandatory qualifications
-- Education and certification requirements
+    async def run(stage: str, stage_text: str, **kwargs) -> str:
+        async with semaphore:
+            stats.llm_calls += 1
+            return await _generate_summary(stage_text, doc_type, stage, **kwargs)
+
+    started = time.perf_counter()
+    chunks = split_text_by_tokens(text, chunk_tokens)
+    stats.chunks = len(chunks)
+    stats.record("split", started)
+
+    notes = chunks
+    if len(chunks) > 1:
+        started = time.perf_counter()
+        notes = list(
+            await asyncio.gather(
+                *(
+                    run("map", chunk, part=i, total=len(chunks))
+                    for i, chunk in enumerate(chunks, start=1)
+                )
+            )
+        )
+        stats.record("map", started)
+
+    started = time.perf_counter()
+    while len(notes) > 1 and count_tokens("\n\n".join(notes)) > chunk_tokens:
+        groups = _group_by_tokens(notes, chunk_tokens)
+        notes = list(
+            await asyncio.gather(*(run("reduce", "\n\n".join(g)) for g in groups))
+        )
+        stats.reduce_levels += 1
+    stats.record("reduce", started)
+
+    started = time.perf_counter()
+    summary = await run("final", "\n\n".join(notes))
+    stats.record("final", started)
+    stats.output_tokens = count_tokens(summary)
+
+    return SummaryResult(text=summary, stats=stats)
+
+
+def _chunk_token_budget(app_config: AppConfig) -> int:
+    """Chunk size that leaves room for the prompt and the response."""
+    context_window = app_config.inference.active_config().context_window
+    return max(
+        256, min(app_config.document.summarizer.chunk_tokens, context_window // 2)
+    )
 
-Be thorough - include all specific requirements.""",
-        "document": """Summarize this document comprehensively, preserving all key information and important details.""",
-    }
 
-    prompt_template = prompts.get(doc_type, prompts["document"])
+def _group_by_tokens(notes: list[str], max_tokens: int) -> list[list[str]]:
+    """Group consecutive notes so each group fits max_tokens, merging at least pairs."""
+    groups: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
 
-    prompt = f"""{prompt_template}
+    for note in notes:
+        note_tokens = count_tokens(note)
+        if current and current_tokens + note_tokens > max_tokens:
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(note)
+        current_tokens += note_tokens
+
+    if current:
+        groups.append(current)
+
+    # Notes that are individually too large would never shrink; merge pairs.
+    if len(groups) == len(notes):
+        groups = [notes[i : i + 2] for i in range(0, len(notes), 2)]
+
+    return groups
+
+
+async def _generate_summary(
+    text: str,
+    doc_type: str,
+    stage: str = "final",
+    part: int = 1,
+    total: int = 1,
+) -> str:
+    """
+    Generate a summary using LLM.
+
+    Args:
+        text: The text to summarize.
+        doc_type: Type of document for context-aware summarization.
+        stage: "map" for a single chunk, "reduce" to merge chunk notes, or
+            "final" for the structured summary.
+        part: Position of the chunk, for the map stage.
+        total: Number of chunks, for the map stage.
+
+    Returns:
+        Summarized text.
+    """
+    doc_label = doc_type.replace("_", " ")
+
+    match stage:
+        case "map":
+            instructions = MAP_INSTRUCTIONS.format(
+                part=part, total=total, doc_type=doc_label
+            )
+        case "reduce":
+            instructions = REDUCE_INSTRUCTIONS.format(doc_type=doc_label)
+        case _:
+            instructions = SUMMARY_PROMPTS.get(doc_type, SUMMARY_PROMPTS["document"])
+
+    prompt = f"""{instructions}
 
 <document>
 {text}
@@ -94,19 +291,25 @@ Be thorough - include all specific requirements.""",
 
 Provide a clear, structured summary that retains all important information."""
 
-    try:
-        inference = Inference()
-        messages = [
-            SystemMessage(
-                content="You are a document summarization expert. Preserve all critical information."
-            ),
-            HumanMessage(content=prompt),
-        ]
-        summary = await inference.chat(messages)
-        return summary.strip()
-    except Exception as e:
-        logger.error(f"LLM summarization failed: {str(e)}", exc_info=True)
-        raise
+    async def call() -> str:
+        try:
+            inference = Inference()
+            messages = [
+                SystemMessage(
+                    content="You are a document summarization expert. Preserve all critical information."
+                ),
+                HumanMessage(content=prompt),
+            ]
+            summary = await inference.chat(messages)
+            return summary.strip()
+        except Exception as e:
+            logger.error(f"LLM summarization failed: {str(e)}", exc_info=True)
+            raise
+
+    # The same document uploaded twice at once is summarized once
+    return await summary_flights.do(
+        xxhash.xxh3_128_hexdigest(prompt.encode("utf-8")), call
+    )
 
 
 async def prepare_document_for_analysis(
@@ -1,44 +1,128 @@
 """DOCX Text Extractor - Extracts text from Microsoft Word documents."""
 
 import logging
+import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List
-
-from docx import Document
+from typing import IO, Iterator, List
 
 logger = logging.getLogger(__name__)
 
+DOCUMENT_PART = "word/document.xml"
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+_PARAGRAPH = f"{_W_NS}p"
+_TABLE = f"{_W_NS}tbl"
+_ROW = f"{_W_NS}tr"
+_CELL = f"{_W_NS}tc"
+_TEXT = f"{_W_NS}t"
+_TAB = f"{_W_NS}tab"
+_BREAKS = (f"{_W_NS}br", f"{_W_NS}cr")
+_BODY = f"{_W_NS}body"
+# Alternate renderings duplicate the content of the preferred mc:Choice
+_FALLBACK = f"{_MC_NS}Fallback"
+
+
+def iter_docx_blocks(document_xml: IO[bytes]) -> Iterator[str]:
+    """
+    Stream text blocks from a WordprocessingML document part in document order.
+
+    Paragraphs are yielded as their text and table rows as their non-empty cell
+    texts joined with " | ". Parsed elements are discarded as soon as they have
+    been consumed so memory use does not grow with the document size.
+
+    Args:
+        document_xml: File object of the ``word/document.xml`` part.
+
+    Yields:
+        Stripped, non-empty text blocks.
+    """
+    body = None
+    skip_depth = 0
+    # One buffer per open paragraph; text boxes nest paragraphs inside runs
+    paragraphs: List[List[str]] = []
+    # One list of rows per open table, each row being a list of cell texts
+    tables: List[List[List[str]]] = []
+    cells: List[List[str]] = []
+
+    for event, elem in ET.iterparse(document_xml, events=("start", "end")):
+        tag = elem.tag
+
+        if event == "start":
+            if tag == _FALLBACK:
+                skip_depth += 1
+            elif skip_depth:
+                continue
+            elif tag == _BODY:
+                body = elem
+            elif tag == _PARAGRAPH:
+                paragraphs.append([])
+            elif tag == _TABLE:
+                tables.append([])
+            elif tag == _ROW and tables:
+                tables[-1].append([])
+            elif tag == _CELL:
+                cells.append([])
+            continue
+
+        if tag == _FALLBACK:
+            skip_depth -= 1
+        elif skip_depth:
+            continue
+        elif tag == _TEXT and paragraphs:
+            paragraphs[-1].append(elem.text or "")
+        elif tag == _TAB and paragraphs:
+            paragraphs[-1].append("\t")
+        elif tag in _BREAKS and paragraphs:
+            paragraphs[-1].append("\n")
+        elif tag == _PARAGRAPH and paragraphs:
+            text = "".join(paragraphs.pop()).strip()
+            if text:
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    yield text
+        elif tag == _CELL and cells:
+            cell_text = "\n".join(cells.pop()).strip()
+            if tables and tables[-1]:
+                tables[-1][-1].append(cell_text)
+        elif tag == _TABLE and tables:
+            row_texts = [
+                " | ".join(cell for cell in row if cell) for row in tables.pop()
+            ]
+            row_texts = [row_text for row_text in row_texts if row_text]
+            if cells:
+                # Nested table: its rows belong to the enclosing cell
+                cells[-1].extend(row_texts)
+            else:
+                yield from row_texts
+
+        # Drop fully consumed top-level blocks to keep memory flat
+        if body is not None and not paragraphs and not tables and tag != _BODY:
+            body.clear()
+
 
 def extract_text_from_docx(docx_path: str | Path) -> str:
     """
     Extract all text content from a DOCX file.
 
+    The ``word/document.xml`` part is streamed straight from the archive, so
+    media and other parts are never decompressed.
+
     Args:
         docx_path: Path to the DOCX file.
 
     Returns:
-        Concatenated text extracted from all paragraphs and tables.
+        Text of all paragraphs and tables, in document order.
     """
     docx_path = Path(docx_path)
-    text_chunks: List[str] = []
 
     try:
-        doc = Document(str(docx_path))
-
-        # Extract text from paragraphs
-        for paragraph in doc.paragraphs:
-            text = paragraph.text.strip()
-            if text:
-                text_chunks.append(text)
-
-        # Extract text from tables
-        for table in doc.tables:
-            for row in table.rows:
-                row_text = " | ".join(
-                    cell.text.strip() for cell in row.cells if cell.text.strip()
-                )
-                if row_text:
-                    text_chunks.append(row_text)
+        with zipfile.ZipFile(docx_path) as archive:
+            with archive.open(DOCUMENT_PART) as document_xml:
+                text_chunks = list(iter_docx_blocks(document_xml))
 
         extracted_text = "\n\n".join(text_chunks).strip()
 
@@ -4,11 +4,18 @@ PDF Text Extractor
 Extracts text (and link annotations) from a PDF file and saves it as a .txt file.
 """
 
+import re
+import math
 import logging
 from pathlib import Path
-from typing import List, Optional
+from statistics import median
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Union
 
-from PyPDF2 import PdfReader
+from PyPDF2 import PdfReader, PageObject
+from PyPDF2._cmap import build_char_map
+
+from utils.text_normalizer import PAGE_BREAK
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +28,7 @@ def extract_text_from_pdf(pdf_path: str | Path) -> str:
         pdf_path: Path to the PDF file.
 
     Returns:
-        Concatenated text extracted from all pages.
+        Text extracted from all pages, separated by PAGE_BREAK.
     """
     pdf_path = Path(pdf_path)
     reader = PdfReader(str(pdf_path))
@@ -29,27 +36,527 @@ def extract_text_from_pdf(pdf_path: str | Path) -> str:
 
     for i, page in enumerate(reader.pages, start=1):
         page_text = page.extract_text() or ""
-        annotations = page.get("/Annots")
+        page_text += "".join(f"\n[Link: {uri}]" for uri in _page_links(page, i))
 
-        # Extract link annotations (if any)
-        if annotations:
-            for annot in annotations:
-                try:
-                    annot_obj = annot.get_object()
-                    action = annot_obj.get("/A")
-                    if action:
-                        uri = action.get("/URI")
-                        if uri:
-                            page_text += f"\n[Link: {uri}]"
-                except Exception as e:
-                    logger.debug(f"Warning: Failed to read annotation on page {i}: {e}")
+        if page_text.strip():
+            text_chunks.append(page_text)
+        else:
+            logger.debug(f"No text found on page {i}")
+
+    return PAGE_BREAK.join(text_chunks).strip()
+
+
+def extract_text_from_pdf_layout(pdf_path: str | Path) -> str:
+    """
+    Extract text (and links) from a PDF file in reading order.
+
+    Reads the positioned text runs of each page's content stream directly,
+    groups them into lines, and splits multi-column layouts at their gutters
+    so each column is read top to bottom before the next one. Pages whose text
+    cannot be read this way (e.g. Type3 fonts) fall back to PyPDF2.
+
+    Args:
+        pdf_path: Path to the PDF file.
+
+    Returns:
+        Text extracted from all pages, separated by PAGE_BREAK.
+    """
+    pdf_path = Path(pdf_path)
+    reader = PdfReader(str(pdf_path))
+    text_chunks: List[str] = []
+
+    for i, page in enumerate(reader.pages, start=1):
+        try:
+            page_text = _layout_page_text(page)
+        except Exception as e:
+            logger.warning(f"Layout extraction failed on page {i}, using PyPDF2: {e}")
+            page_text = ""
+        if not page_text.strip():
+            logger.info(f"No layout text on page {i} of {pdf_path.name}, using PyPDF2")
+            page_text = page.extract_text() or ""
+        page_text += "".join(f"\n[Link: {uri}]" for uri in _page_links(page, i))
 
         if page_text.strip():
             text_chunks.append(page_text)
         else:
             logger.debug(f"No text found on page {i}")
 
-    return "\n\n".join(text_chunks).strip()
+    return PAGE_BREAK.join(text_chunks).strip()
+
+
+def _page_links(page: PageObject, page_number: int) -> List[str]:
+    """URIs of the link annotations of a page."""
+    links = []
+    for annot in page.get("/Annots") or []:
+        try:
+            action = annot.get_object().get("/A")
+            if action and action.get("/URI"):
+                links.append(action.get("/URI"))
+        except Exception as e:
+            logger.debug(
+                f"Warning: Failed to read annotation on page {page_number}: {e}"
+            )
+    return links
+
+
+# Content stream tokens, by group number. Whitespace is skipped by finditer.
+# Literal strings with nested parentheses are finished by _read_literal and
+# inline image data is skipped by _skip_inline_image.
+_TOKEN = re.compile(
+    rb"""
+    (%[^\r\n]*)
+    |(\((?:[^()\\]|\\.)*\))
+    |(\()
+    |(<[0-9A-Fa-f\s]*>)
+    |(<<|>>)
+    |([\[\]])
+    |(/[^\s/\[\]()<>{}%]*)
+    |([+-]?(?:\d+\.?\d*|\.\d+))
+    |([^\s/\[\]()<>{}%]+)
+    """,
+    re.X | re.S,
+)
+(
+    _COMMENT,
+    _LITERAL,
+    _OPEN,
+    _HEX,
+    _DICT,
+    _ARRAY,
+    _NAME,
+    _NUMBER,
+    _OPERATOR,
+) = range(1, 10)
+_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+_ESCAPE = re.compile(rb"\\([0-7]{1,3}|\r\n|.)", re.S)
+
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+_MAX_FORM_DEPTH = 5
+
+
+@dataclass
+class _Run:
+    """A string drawn by a text-showing operator, in page coordinates."""
+
+    x0: float
+    x1: float
+    y: float  # baseline
+    size: float
+    text: str
+
+
+@dataclass
+class _Font:
+    """Decoding and glyph widths of a page font."""
+
+    code_bytes: int
+    encoding: Union[str, Dict[int, str]]
+    to_unicode: Dict[Any, str]
+    widths: Dict[int, float]
+    default_width: float
+    measured: Dict[bytes, tuple] = field(default_factory=dict, repr=False)
+
+    def measure(self, raw: bytes) -> tuple[str, float, int, int]:
+        """Text of a string, its glyph widths sum, its code count and its spaces."""
+        measured = self.measured.get(raw)
+        if measured is None:
+            n = self.code_bytes
+            codes = [
+                int.from_bytes(raw[i : i + n], "big") for i in range(0, len(raw), n)
+            ]
+            width = sum(self.widths.get(c, self.default_width) for c in codes)
+            spaces = codes.count(32) if n == 1 else 0
+            measured = (self.decode(raw), width, len(codes), spaces)
+            self.measured[raw] = measured
+        return measured
+
+    def decode(self, raw: bytes) -> str:
+        if isinstance(self.encoding, str):
+            try:
+                text = raw.decode(self.encoding, "surrogatepass")
+            except Exception:
+                fallback = "utf-16-be" if self.encoding == "charmap" else "charmap"
+                text = raw.decode(fallback, "surrogatepass")
+        else:
+            text = "".join(self.encoding.get(b, chr(b)) for b in raw)
+        return "".join(self.to_unicode.get(c, c) for c in text)
+
+
+def _resolve(value: Any) -> Any:
+    """Follow an indirect object reference; direct objects are returned as is."""
+    return value.get_object() if hasattr(value, "get_object") else value
+
+
+def _get(obj: Any, key: str, default: Any = None) -> Any:
+    """Resolved value of a dictionary entry, which may be an indirect reference."""
+    return _resolve(_resolve(obj).get(key, default))
+
+
+def _resolve_array(array: Any) -> List[Any]:
+    return [_resolve(item) for item in _resolve(array) or []]
+
+
+def _load_font(resources: Any, name: str) -> _Font:
+    resources = _resolve(resources)
+    font_dict = _get(_get(resources, "/Font"), name)
+    _, _, encoding, to_unicode, _ = build_char_map(
+        name, 200.0, {"/Resources": resources}
+    )
+
+    widths: Dict[int, float] = {}
+    if "/DescendantFonts" in font_dict:
+        descendant = _resolve(_resolve_array(font_dict["/DescendantFonts"])[0])
+        default_width = float(_get(descendant, "/DW", 1000))
+        entries = _resolve_array(_get(descendant, "/W", []))
+        while len(entries) >= 2:
+            first, second = int(entries[0]), entries[1]
+            if isinstance(second, list):
+                for offset, width in enumerate(_resolve_array(second)):
+                    widths[first + offset] = float(width)
+                entries = entries[2:]
+            elif len(entries) >= 3:
+                for code in range(first, int(second) + 1):
+                    widths[code] = float(entries[2])
+                entries = entries[3:]
+            else:
+                break
+        return _Font(2, encoding, to_unicode, widths, default_width)
+
+    first_char = int(_get(font_dict, "/FirstChar", 0))
+    for offset, width in enumerate(_resolve_array(_get(font_dict, "/Widths", []))):
+        widths[first_char + offset] = float(width)
+    descriptor = _get(font_dict, "/FontDescriptor")
+    missing = float(_get(descriptor, "/MissingWidth", 0)) if descriptor else 0.0
+    return _Font(1, encoding, to_unicode, widths, missing or 500.0)
+
+
+def _multiply(m: Sequence[float], n: Sequence[float]) -> tuple:
+    return (
+        m[0] * n[0] + m[1] * n[2],
+        m[0] * n[1] + m[1] * n[3],
+        m[2] * n[0] + m[3] * n[2],
+        m[2] * n[1] + m[3] * n[3],
+        m[4] * n[0] + m[5] * n[2] + n[4],
+        m[4] * n[1] + m[5] * n[3] + n[5],
+    )
+
+
+def _read_literal(data: bytes, start: int) -> tuple[bytes, int]:
+    """Read a literal string with nested parentheses starting at data[start] == "("."""
+    depth, i = 0, start
+    while i < len(data):
+        char = data[i]
+        if char == 0x5C:  # backslash
+            i += 2
+            continue
+        if char == 0x28:
+            depth += 1
+        elif char == 0x29:
+            depth -= 1
+            if depth == 0:
+                return data[start + 1 : i], i + 1
+        i += 1
+    return data[start + 1 :], len(data)
+
+
+def _unescape(raw: bytes) -> bytes:
+    def replace(match: re.Match) -> bytes:
+        escaped = match.group(1)
+        if escaped[:1].isdigit():
+            return bytes((int(escaped, 8) & 0xFF,))
+        if escaped in (b"\n", b"\r", b"\r\n"):
+            return b""  # line continuation
+        return _ESCAPES.get(escaped, escaped)
+
+    return _ESCAPE.sub(replace, raw) if b"\\" in raw else raw
+
+
+def _hex_string(digits: bytes) -> bytes:
+    try:
+        return bytes.fromhex(digits.decode("latin-1"))
+    except ValueError:  # odd number of digits; the last one is followed by 0
+        digits = re.sub(rb"\s", b"", digits)
+        return bytes.fromhex((digits + b"0" * (len(digits) % 2)).decode("latin-1"))
+
+
+def _skip_inline_image(data: bytes, position: int) -> int:
+    end = re.compile(rb"\sEI(?=\s|$)").search(data, position)
+    return end.end() if end else len(data)
+
+
+def _collect_runs(
+    data: bytes,
+    resources: Any,
+    ctm: Sequence[float],
+    runs: List[_Run],
+    depth: int = 0,
+) -> None:
+    """Interpret a content stream, appending every string drawn to runs."""
+    fonts: Dict[str, _Font] = {}
+    font: Optional[_Font] = None
+    size = 12.0
+    char_spacing = word_spacing = leading = 0.0
+    scale = 1.0
+    tm = tlm = _IDENTITY
+    stack: List[Sequence[float]] = []
+    operands: List[Any] = []
+    arrays: List[int] = []
+
+    def show(strings: List[Any]) -> None:
+        nonlocal tm
+        if font is None:
+            return
+        a, b, c, d, e, f = tm
+        A, B, C, D, E, F = ctm
+        height = size * math.hypot(c * A + d * C, c * B + d * D)
+
+        for item in strings:
+            if isinstance(item, float):
+                advance = -item / 1000 * size * scale
+            else:
+                text, width, count, spaces = font.measure(item)
+                advance = (
+                    width / 1000 * size + char_spacing * count + word_spacing * spaces
+                ) * scale
+                x0 = e * A + f * C + E
+                x1 = (e + advance * a) * A + (f + advance * b) * C + E
+                runs.append(_Run(x0, x1, e * B + f * D + F, height, text))
+            e += advance * a
+            f += advance * b
+
+        tm = (a, b, c, d, e, f)
+
+    def next_line(tx: float, ty: float) -> None:
+        nonlocal tm, tlm
+        a, b, c, d, e, f = tlm
+        tm = tlm = (a, b, c, d, tx * a + ty * c + e, tx * b + ty * d + f)
+
+    position = 0
+    while position < len(data):
+        restart = len(data)
+        for match in _TOKEN.finditer(data, position):
+            kind = match.lastindex
+
+            if kind == _NUMBER:
+                operands.append(float(match.group()))
+            elif kind == _OPERATOR:
+                operator = match.group()
+                try:
+                    if operator == b"Tj" or operator == b"TJ":
+                        show(operands[-1] if operator == b"TJ" else operands[-1:])
+                    elif operator == b"Td":
+                        next_line(operands[-2], operands[-1])
+                    elif operator == b"TD":
+                        leading = -operands[-1]
+                        next_line(operands[-2], operands[-1])
+                    elif operator == b"Tm":
+                        tm = tlm = tuple(operands[-6:])
+                    elif operator == b"T*":
+                        next_line(0, -leading)
+                    elif operator == b"'":
+                        next_line(0, -leading)
+                        show(operands[-1:])
+                    elif operator == b'"':
+                        word_spacing, char_spacing = operands[-3], operands[-2]
+                        next_line(0, -leading)
+                        show(operands[-1:])
+                    elif operator == b"Tf":
+                        name, size = operands[-2], operands[-1]
+                        if name not in fonts:
+                            fonts[name] = _load_font(resources, name)
+                        font = fonts[name]
+                    elif operator == b"Tc":
+                        char_spacing = operands[-1]
+                    elif operator == b"Tw":
+                        word_spacing = operands[-1]
+                    elif operator == b"Tz":
+                        scale = operands[-1] / 100
+                    elif operator == b"TL":
+                        leading = operands[-1]
+                    elif operator == b"BT":
+                        tm = tlm = _IDENTITY
+                    elif operator == b"q":
+                        stack.append(ctm)
+                    elif operator == b"Q":
+                        ctm = stack.pop() if stack else ctm
+                    elif operator == b"cm":
+                        ctm = _multiply(tuple(operands[-6:]), ctm)
+                    elif operator == b"Do" and depth < _MAX_FORM_DEPTH:
+                        _collect_form_runs(resources, operands[-1], ctm, runs, depth)
+                    elif operator == b"ID":
+                        restart = _skip_inline_image(data, match.end())
+                        break
+                except (IndexError, KeyError, TypeError, ValueError) as e:
+                    logger.debug(f"Skipping malformed {operator!r} operation: {e}")
+                finally:
+                    operands.clear()
+                    arrays.clear()
+            elif kind == _LITERAL:
+                operands.append(_unescape(match.group()[1:-1]))
+            elif kind == _HEX:
+                operands.append(_hex_string(match.group()[1:-1]))
+            elif kind == _NAME:
+                operands.append(match.group().decode("latin-1"))
+            elif kind == _ARRAY:
+                if match.group() == b"[":
+                    arrays.append(len(operands))
+                elif arrays:
+                    start = arrays.pop()
+                    operands[start:] = [operands[start:]]
+            elif kind == _OPEN:
+                raw, restart = _read_literal(data, match.start())
+                operands.append(_unescape(raw))
+                break
+        position = restart
+
+
+def _collect_form_runs(
+    resources: Any, name: str, ctm: Sequence[float], runs: List[_Run], depth: int
+) -> None:
+    xobject = _get(_get(resources, "/XObject"), name)
+    if _get(xobject, "/Subtype") != "/Form":
+        return
+    matrix = tuple(
+        float(v) for v in _resolve_array(_get(xobject, "/Matrix", _IDENTITY))
+    )
+    _collect_runs(
+        xobject.get_data(),
+        _get(xobject, "/Resources") or resources,
+        _multiply(matrix, ctm),
+        runs,
+        depth + 1,
+    )
+
+
+def _layout_page_text(page: PageObject) -> str:
+    resources = _get(page, "/Resources")
+    contents = _get(page, "/Contents")
+    if resources is None or contents is None:
+        return ""
+
+    # /Contents is a stream or an array of streams read as one
+    if isinstance(contents, list):
+        data = b"\n".join(_resolve(part).get_data() for part in contents)
+    else:
+        data = contents.get_data()
+
+    runs: List[_Run] = []
+    _collect_runs(data, resources, _IDENTITY, runs)
+
+    fragments = _merge_runs([r for r in runs if r.text.strip() or r.text == " "])
+    return "\n".join(
+        _render_lines(block) for block in _reading_order(fragments) if block
+    )
+
+
+def _merge_runs(runs: List[_Run]) -> List[_Run]:
+    """Join runs drawn next to each other on the same baseline into fragments."""
+    fragments: List[_Run] = []
+    for run in sorted(runs, key=lambda r: (-round(r.y, 1), r.x0)):
+        previous = fragments[-1] if fragments else None
+        if (
+            previous is not None
+            and abs(previous.y - run.y) <= 0.3 * run.size
+            and -0.5 * run.size <= run.x0 - previous.x1 <= 1.0 * run.size
+        ):
+            gap = run.x0 - previous.x1
+            separator = (
+                " " if gap > 0.2 * run.size and not previous.text.endswith(" ") else ""
+            )
+            previous.text += separator + run.text
+            previous.x1 = max(previous.x1, run.x1)
+            previous.size = max(previous.size, run.size)
+        else:
+            fragments.append(_Run(run.x0, run.x1, run.y, run.size, run.text))
+
+    for fragment in fragments:
+        fragment.text = " ".join(fragment.text.split())
+    return [f for f in fragments if f.text]
+
+
+def _reading_order(fragments: List[_Run], depth: int = 0) -> List[List[_Run]]:
+    """
+    Split fragments into blocks to be read one after another.
+
+    Looks for a gutter: a vertical band of whitespace at least two characters
+    wide, with text on both sides, that at most a few fragments (full-width
+    headings, a name across the top) cross. Fragments crossing it separate the
+    page into horizontal bands. In each band the left side is read before the
+    right side, and each side is split again for pages with more columns.
+    """
+    gutter = _find_gutter(fragments) if depth < 3 else None
+    if gutter is None:
+        return [fragments]
+
+    left, right = gutter
+    blocks: List[List[_Run]] = []
+    band: List[_Run] = []
+
+    def flush() -> None:
+        if band:
+            blocks.extend(_reading_order([f for f in band if f.x1 <= right], depth + 1))
+            blocks.extend(_reading_order([f for f in band if f.x1 > right], depth + 1))
+            band.clear()
+
+    for fragment in sorted(fragments, key=lambda f: (-f.y, f.x0)):
+        if fragment.x0 < left and fragment.x1 > right:
+            flush()
+            blocks.append([fragment])
+        else:
+            band.append(fragment)
+    flush()
+    return blocks
+
+
+def _find_gutter(fragments: List[_Run]) -> Optional[tuple[float, float]]:
+    if len(fragments) < 6:
+        return None
+
+    size = median(f.size for f in fragments)
+    allowed = max(1, len(fragments) // 20)
+    page_left = min(f.x0 for f in fragments)
+    page_right = max(f.x1 for f in fragments)
+
+    # Sweep the x-projection for bands covered by at most `allowed` fragments
+    events = sorted([(f.x0, 1) for f in fragments] + [(f.x1, -1) for f in fragments])
+    best: Optional[tuple[float, float]] = None
+    covered, gap_start = 0, None
+    for x, change in events:
+        covered += change
+        if covered <= allowed and gap_start is None:
+            gap_start = x
+        elif covered > allowed and gap_start is not None:
+            if (
+                x - gap_start >= 2 * size
+                and gap_start > page_left
+                and (best is None or x - gap_start > best[1] - best[0])
+            ):
+                best = (gap_start, x)
+            gap_start = None
+
+    if best is None or best[1] >= page_right:
+        return None
+
+    left_count = sum(1 for f in fragments if f.x1 <= best[0])
+    right_count = sum(1 for f in fragments if f.x0 >= best[1])
+    minimum = max(2, len(fragments) // 10)
+    if left_count < minimum or right_count < minimum:
+        return None
+    return best
+
+
+def _render_lines(fragments: List[_Run]) -> str:
+    """Group fragments into lines by baseline and join each line left to right."""
+    lines: List[List[_Run]] = []
+    for fragment in sorted(fragments, key=lambda f: -f.y):
+        if lines and abs(lines[-1][0].y - fragment.y) <= 0.5 * fragment.size:
+            lines[-1].append(fragment)
+        else:
+            lines.append([fragment])
+
+    return "\n".join(
+        " ".join(f.text for f in sorted(line, key=lambda f: f.x0)) for line in lines
+    )
 
 
 def save_extracted_text(
@@ -0,0 +1,458 @@
+"""Deterministic section parser for resumes and job descriptions."""
+
+import re
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Preamble before the first recognized heading (name, role title, ...)
+HEADER_SECTION = "header"
+# Contact lines of the preamble (email, phone, links)
+CONTACT_SECTION = "contact"
+
+# Canonical section name -> headings that introduce it, normalized by _normalize_heading
+SECTION_HEADINGS: dict[str, tuple[str, ...]] = {
+    "summary": (
+        "summary",
+        "professional summary",
+        "career summary",
+        "profile",
+        "professional profile",
+        "objective",
+        "career objective",
+        "about me",
+    ),
+    "skills": (
+        "skills",
+        "key skills",
+        "technical skills",
+        "core skills",
+        "soft skills",
+        "skills and tools",
+        "skills and technologies",
+        "core competencies",
+        "competencies",
+        "technologies",
+        "tech stack",
+        "tools and technologies",
+    ),
+    "experience": (
+        "experience",
+        "work experience",
+        "professional experience",
+        "relevant experience",
+        "employment",
+        "employment history",
+        "work history",
+        "career history",
+    ),
+    "education": (
+        "education",
+        "education and training",
+        "academic background",
+        "academic qualifications",
+    ),
+    "certifications": (
+        "certifications",
+        "certificates",
+        "licenses",
+        "licenses and certifications",
+        "certifications and licenses",
+    ),
+    "projects": ("projects", "key projects", "personal projects", "selected projects"),
+    "achievements": (
+        "achievements",
+        "accomplishments",
+        "awards",
+        "honors",
+        "honors and awards",
+        "awards and recognition",
+        "awards and honors",
+    ),
+    "additional": (
+        "additional information",
+        "languages",
+        "publications",
+        "volunteer",
+        "volunteering",
+        "volunteer experience",
+        "interests",
+        "hobbies",
+        "activities",
+        "affiliations",
+        "memberships",
+    ),
+    "references": ("references",),
+    "about": (
+        "about us",
+        "about the company",
+        "who we are",
+        "company overview",
+        "our company",
+    ),
+    "role": (
+        "about the role",
+        "the role",
+        "role overview",
+        "overview",
+        "job summary",
+        "position summary",
+        "job description",
+        "the opportunity",
+    ),
+    "responsibilities": (
+        "responsibilities",
+        "key responsibilities",
+        "duties",
+        "what you will do",
+        "what you'll do",
+        "your responsibilities",
+        "day to day",
+    ),
+    "requirements": (
+        "requirements",
+        "qualifications",
+        "required qualifications",
+        "minimum qualifications",
+        "basic qualifications",
+        "must have",
+        "must haves",
+        "what you bring",
+        "what you will bring",
+        "what you'll bring",
+        "what we are looking for",
+        "what we're looking for",
+        "who you are",
+    ),
+    "preferred": (
+        "preferred qualifications",
+        "preferred skills",
+        "desired skills",
+        "nice to have",
+        "nice to haves",
+        "bonus points",
+        "pluses",
+    ),
+    "compensation": ("compensation", "salary", "pay range", "salary range"),
+    "benefits": (
+        "benefits",
+        "perks",
+        "perks and benefits",
+        "benefits and perks",
+        "what we offer",
+        "compensation and benefits",
+    ),
+    "equal_opportunity": (
+        "equal opportunity",
+        "equal opportunity employer",
+        "eeo statement",
+        "diversity and inclusion",
+    ),
+    "application": ("how to apply", "application process", "to apply"),
+}
+
+_HEADING_TO_SECTION = {
+    heading: section
+    for section, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+
+# Dictionary of skills recognized anywhere in a document, by canonical name
+SKILL_DICTIONARY: tuple[str, ...] = (
+    # Languages
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C", "C++", "C#",
+    "Ruby", "PHP", "Kotlin", "Swift", "Scala", "R", "SQL", "Bash", "HTML", "CSS",
+    # Frameworks and libraries
+    "Django", "Flask", "FastAPI", "Spring", "React", "Angular", "Vue", "Node.js",
+    "Next.js", ".NET", "Pandas", "NumPy", "PyTorch", "TensorFlow", "Scikit-learn",
+    "LangChain", "Spark", "Hadoop", "Kafka", "Airflow",
+    # Data stores
+    "PostgreSQL", "MySQL", "SQLite", "MongoDB", "Redis", "Elasticsearch",
+    "Cassandra", "DynamoDB", "Snowflake", "BigQuery",
+    # Platforms and tools
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "Ansible", "Linux",
+    "Git", "Jenkins", "GitHub Actions", "CI/CD", "REST", "GraphQL", "gRPC",
+    "Microservices", "Machine Learning", "Deep Learning", "NLP", "Data Analysis",
+    "Business Intelligence", "Tableau", "Power BI", "Excel", "Salesforce", "SAP",
+    "Jira", "Confluence", "Trello", "Asana", "Figma", "Microsoft Office",
+    "Google Workspace",
+    # Practices
+    "Agile", "Scrum", "Kanban", "Waterfall", "DevOps", "TDD", "Project Management",
+    "Risk Management", "Budgeting", "Product Management",
+    # Soft skills
+    "Leadership", "Communication", "Problem-Solving", "Teamwork", "Collaboration",
+    "Time Management", "Mentoring", "Stakeholder Management", "Negotiation",
+)  # fmt: skip
+
+_SKILL_BY_LOWER = {skill.lower(): skill for skill in SKILL_DICTIONARY}
+_SKILL_ORDER = {skill: position for position, skill in enumerate(SKILL_DICTIONARY)}
+# One alternation, longest first, with word boundaries that also work for
+# skills starting or ending in symbols (C++, .NET, Node.js)
+_SKILLS = re.compile(
+    r"(?<![\w+#.])(?:"
+    + "|".join(re.escape(s) for s in sorted(SKILL_DICTIONARY, key=len, reverse=True))
+    + r")(?![\w+#]|\.\w)",
+    re.I,
+)
+# Single letters and words that are common English are only matched in their exact case
+_CASE_SENSITIVE_SKILLS = {"C", "R", "Go", "Spring", "Excel", "REST", "Git"}
+
+_RULE = re.compile(r"-{3,}|_{3,}|={3,}|─{3,}")
+_BULLET = re.compile(r"^(?:[•●▪■◦‣∙·*\-–—]|\d{1,2}[.)])\s+")
+_CONTACT = re.compile(
+    r"@|https?://|www\.|linkedin|github\.com|\burl\b|\+?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}",
+    re.I,
+)
+_PAGE_NUMBER = re.compile(r"^(?:page\s+)?\d{1,3}(?:\s+of\s+\d{1,3})?$", re.I)
+_TERMINAL = re.compile(r"[.!?:;]$")
+
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|"
+    r"aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?"
+)
+
+
+def _date(name: str) -> str:
+    """A month and year, a numeric month/year or a bare year, capturing the year."""
+    return (
+        rf"(?:{_MONTH}\s+(?P<{name}_y1>\d{{4}})"
+        rf"|\d{{1,2}}/(?P<{name}_y2>\d{{4}})"
+        rf"|(?P<{name}_y3>\d{{4}}))"
+    )
+
+
+_DATE_RANGE = re.compile(
+    rf"\b{_date('start')}\s*(?:-|–|—|to|until)\s*"
+    rf"(?:(?P<present>present|current|now|today)\b|{_date('end')})",
+    re.I,
+)
+
+
+@dataclass
+class DateRange:
+    """A period found in the text, e.g. "OCTOBER 2020 – PRESENT"."""
+
+    text: str
+    section: str
+    start_year: int
+    end_year: Optional[int]  # None while ongoing
+
+
+@dataclass
+class ParsedSections:
+    """Section map of a document with deterministic extractions."""
+
+    sections: dict[str, str] = field(default_factory=dict)
+    skills: list[str] = field(default_factory=list)
+    date_ranges: list[DateRange] = field(default_factory=list)
+
+    @property
+    def is_structured(self) -> bool:
+        """Whether enough headings were recognized to trust the section map."""
+        recognized = set(self.sections) - {HEADER_SECTION, CONTACT_SECTION}
+        return len(recognized) >= 2
+
+    def text(self, sections: Optional[Iterable[str]] = None) -> str:
+        """
+        Render sections as text, in document order, each under its heading.
+
+        Args:
+            sections: Names of the sections to include. Includes all if None.
+
+        Returns:
+            Text of the selected sections.
+        """
+        wanted = None if sections is None else set(sections)
+        parts = []
+        for name, body in self.sections.items():
+            if wanted is not None and name not in wanted:
+                continue
+            if name == HEADER_SECTION or name == CONTACT_SECTION:
+                parts.append(body)
+            else:
+                parts.append(f"{name.replace('_', ' ').upper()}\n{body}")
+        return "\n\n".join(parts)
+
+
+def parse_sections(
+    text: str, inline_sections: Optional[Iterable[str]] = None
+) -> ParsedSections:
+    """
+    Split a resume or job description into canonical sections.
+
+    Headings are recognized from SECTION_HEADINGS, either on a line of their
+    own (starting that section) or as an inline "Heading: content" prefix
+    (adding just that line to the section, if it is one of inline_sections).
+    Text before the first heading is the header, with its contact lines split
+    out. Bullets are normalized to "- " and lines wrapped by the extractor are
+    joined back. Unrecognized headings stay part of the section they appear in.
+
+    Args:
+        text: Extracted document text.
+        inline_sections: Sections an inline "Heading: content" line may be
+            moved to. Other inline lines, e.g. "Responsibilities: ..." in a
+            resume job entry, stay in the current section. All sections if None.
+
+    Returns:
+        ParsedSections with the section map, dictionary skills and date ranges.
+    """
+    inline_sections = None if inline_sections is None else set(inline_sections)
+    lines: dict[str, list[str]] = {}
+    current = HEADER_SECTION
+
+    for raw_line in _RULE.sub("\n", text).splitlines():
+        line = " ".join(raw_line.split())
+        if not line or _PAGE_NUMBER.match(line):
+            continue
+
+        bullet = _BULLET.match(line)
+        if bullet:
+            line = "- " + line[bullet.end() :]
+
+        section, inline = _match_heading(line.removeprefix("- "))
+        if section is not None and not inline:
+            current = section
+            lines.setdefault(current, [])
+            continue
+
+        if section is not None and (
+            inline_sections is None or section in inline_sections
+        ):
+            # "Technologies: React, Node.js" under a project belongs to skills,
+            # but the lines after it still belong to the project
+            lines.setdefault(section, []).append(line)
+            continue
+
+        if current == HEADER_SECTION and _CONTACT.search(line):
+            lines.setdefault(CONTACT_SECTION, []).append(line)
+            continue
+
+        section_lines = lines.setdefault(current, [])
+        if not bullet and section_lines and _is_continuation(section_lines[-1], line):
+            section_lines[-1] += " " + line
+        else:
+            section_lines.append(line)
+
+    parsed = ParsedSections(
+        sections={name: "\n".join(body) for name, body in lines.items() if body}
+    )
+    parsed.skills = find_skills(text)
+    parsed.date_ranges = [
+        date_range
+        for name, body in parsed.sections.items()
+        for date_range in find_date_ranges(body, name)
+    ]
+    return parsed
+
+
+def find_skills(text: str) -> list[str]:
+    """
+    Find the skills of SKILL_DICTIONARY mentioned in a text.
+
+    Args:
+        text: Text to search.
+
+    Returns:
+        Canonical names of the skills found, in dictionary order.
+    """
+    found = set()
+    for match in _SKILLS.finditer(text):
+        skill = _SKILL_BY_LOWER[match.group().lower()]
+        if skill not in _CASE_SENSITIVE_SKILLS or match.group() == skill:
+            found.add(skill)
+    return sorted(found, key=_SKILL_ORDER.__getitem__)
+
+
+def find_date_ranges(text: str, section: str = "") -> list[DateRange]:
+    """
+    Find date ranges such as "Jan 2019 - Mar 2021", "06/2017 to 2020" or "2020 – Present".
+
+    Args:
+        text: Text to search.
+        section: Section the text belongs to, recorded on each range.
+
+    Returns:
+        Date ranges in the order they appear.
+    """
+    ranges = []
+    for match in _DATE_RANGE.finditer(text):
+        start = _year(match, "start")
+        end = None if match.group("present") else _year(match, "end")
+        if start is None or (end is not None and end < start):
+            continue
+        ranges.append(DateRange(match.group(), section, start, end))
+    return ranges
+
+
+def compact_for_prompt(text: str, sections: Iterable[str]) -> str:
+    """
+    Reduce a document to the sections a prompt needs.
+
+    Falls back to the whole document when too few headings are recognized to
+    trust the section map. Dictionary skills that only appear in dropped
+    sections are listed at the end, so no explicit skill evidence is lost.
+
+    Args:
+        text: Extracted document text.
+        sections: Names of the sections the prompt needs.
+
+    Returns:
+        Text to put in the prompt.
+    """
+    sections = list(sections)
+    # Inline lines are only moved to sections the prompt keeps, so a
+    # "Responsibilities: ..." line of a resume job entry stays in experience
+    parsed = parse_sections(text, inline_sections=sections)
+    if not parsed.is_structured:
+        return text
+
+    compact = parsed.text(sections)
+
+    kept = set(find_skills(compact))
+    omitted = [skill for skill in parsed.skills if skill not in kept]
+    if omitted:
+        compact += f"\n\nSKILLS MENTIONED ELSEWHERE\n{', '.join(omitted)}"
+
+    logger.debug(
+        f"Compacted document from {len(text)} to {len(compact)} characters "
+        f"(kept {[s for s in parsed.sections if s in sections]}, "
+        f"dropped {[s for s in parsed.sections if s not in sections]})"
+    )
+    return compact
+
+
+def _normalize_heading(text: str) -> str:
+    text = text.lower().replace("&", " and ").replace("’", "'")
+    text = re.sub(r"[^\w' ]+", " ", text)
+    return " ".join(text.split())
+
+
+def _match_heading(line: str) -> tuple[Optional[str], bool]:
+    """Section a line is a heading of, and whether the heading is inline."""
+    if len(line) <= 60:
+        section = _HEADING_TO_SECTION.get(_normalize_heading(line))
+        if section is not None:
+            return section, False
+
+    label, colon, content = line.partition(":")
+    if colon and content.strip() and len(label) <= 40:
+        return _HEADING_TO_SECTION.get(_normalize_heading(label)), True
+
+    return None, False
+
+
+def _is_continuation(previous: str, line: str) -> bool:
+    """Whether a line continues the previous one, wrapped by the extractor."""
+    if _TERMINAL.search(previous) or _DATE_RANGE.search(line):
+        return False
+    return line[0].islower() or (previous.startswith("- ") and not line[0].isupper())
+
+
+def _year(match: re.Match, prefix: str) -> Optional[int]:
+    for group in ("y1", "y2", "y3"):
+        year = match.group(f"{prefix}_{group}")
+        if year:
+            return int(year)
+    return None
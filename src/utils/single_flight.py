@@ -0,0 +1,74 @@
+"""Coalesce concurrent identical async calls into one."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Table of in-flight calls, so concurrent identical calls share one result.
+
+    The first caller of a key starts the call; callers arriving while it runs
+    await the same task instead of starting their own. The entry is removed
+    when the call finishes, so later callers start a new call (pair it with a
+    cache to reuse finished results). A caller being cancelled does not cancel
+    the call the others are waiting on.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0  # calls started
+        self.shared = 0  # callers that joined a call in flight
+
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a call unless an identical one is in flight, and return its result.
+
+        Args:
+            key: Identifies identical calls.
+            call: Starts the call; only invoked if none is in flight for key.
+
+        Returns:
+            Result of the call, or of the identical call already in flight.
+            Its exception is raised to every caller.
+        """
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.calls += 1
+        else:
+            self.shared += 1
+            logger.debug(f"Joined in-flight {self.name} call ({self.shared} shared)")
+
+        return await asyncio.shield(task)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls running."""
+        return len(self._in_flight)
+
+    def stats(self) -> dict[str, Any]:
+        """Counts of started and shared calls since startup."""
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "in_flight": self.in_flight,
+        }
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so a call whose callers were all cancelled does
+            # not log "exception was never retrieved"
+            logger.debug(f"{self.name} call failed: {task.exception()}")
@@ -0,0 +1,142 @@
+"""Compressed in-memory storage of large texts with a small decompressed LRU."""
+
+import zlib
+import logging
+import threading
+from typing import Optional
+from collections import OrderedDict
+
+from utils.app_config import AppConfig, TextStorageConfig
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, zlib is used instead
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# One-byte header identifying how a blob is encoded
+CODEC_RAW = b"r"
+CODEC_ZLIB = b"z"
+CODEC_ZSTD = b"s"
+
+# Below this size compression does not pay for its header and frame overhead
+MIN_COMPRESS_BYTES = 256
+
+_config: Optional[TextStorageConfig] = None
+_text_cache: Optional["DecompressedTextCache"] = None
+
+
+def _get_config() -> TextStorageConfig:
+    global _config
+
+    if _config is None:
+        _config = AppConfig.load_default().document.text_storage
+        if _config.codec == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed, compressing text with zlib")
+
+    return _config
+
+
+def compress_text(text: str) -> bytes:
+    """
+    Encode text as UTF-8 and compress it with the configured codec.
+
+    Args:
+        text: Text to compress.
+
+    Returns:
+        Blob with a codec header, to be read back with decompress_text.
+    """
+    data = text.encode("utf-8")
+    if len(data) < MIN_COMPRESS_BYTES:
+        return CODEC_RAW + data
+
+    config = _get_config()
+    if config.codec == "zstd" and zstandard is not None:
+        return CODEC_ZSTD + zstandard.ZstdCompressor(level=config.level).compress(data)
+
+    return CODEC_ZLIB + zlib.compress(data, min(config.level, 9))
+
+
+def decompress_text(blob: bytes) -> str:
+    """
+    Decompress a blob produced by compress_text.
+
+    Args:
+        blob: Compressed blob.
+
+    Returns:
+        The original text.
+    """
+    codec, payload = blob[:1], blob[1:]
+
+    match codec:
+        case b"r" | b"":
+            data = payload
+        case b"z":
+            data = zlib.decompress(payload)
+        case b"s":
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read zstd text blobs")
+            data = zstandard.ZstdDecompressor().decompress(payload)
+        case _:
+            raise ValueError(f"Unknown text blob codec: {codec!r}")
+
+    return data.decode("utf-8")
+
+
+class DecompressedTextCache:
+    """LRU of recently decompressed texts so repeated reads skip decompression."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, key: str, blob: bytes) -> str:
+        """
+        Get the text of a blob, decompressing it on a miss.
+
+        Args:
+            key: Identifier unique to the blob.
+            blob: Compressed blob.
+
+        Returns:
+            Decompressed text.
+        """
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return text
+            self.misses += 1
+
+        text = decompress_text(blob)
+
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[key] = text
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return text
+
+    def discard(self, key: str) -> None:
+        """Forget the text of a blob, e.g. when its document is deleted."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+def get_text_cache() -> DecompressedTextCache:
+    """Get the process-wide decompressed text cache."""
+    global _text_cache
+
+    if _text_cache is None:
+        _text_cache = DecompressedTextCache(_get_config().cache_entries)
+
+    return _text_cache
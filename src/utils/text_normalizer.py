@@ -0,0 +1,281 @@
+"""Clean extracted document text before it is stored and sent to the LLM."""
+
+import re
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from utils.app_config import NormalizerConfig, get_app_config
+from utils.token_counter import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Extractors separate the pages of paged formats (PDF) with a form feed so
+# repeated headers and footers can be found; it is replaced by a blank line.
+PAGE_BREAK = "\f"
+
+# Bump whenever normalization output changes to invalidate cached summaries
+NORMALIZER_VERSION = "2"
+
+# Lines this far from the top or bottom of a page may be headers or footers
+EDGE_LINES = 3
+
+# Only a letter before the hyphen: "2019-\npresent" is a date range, not a word
+_HYPHENATED = re.compile(r"([^\W\d_])[-\u00ad]\n[ \t]*([a-z])")
+_PAGE_NUMBER = re.compile(
+    r"(?:page\s*)?[-–(]?\s*\d{1,3}\s*(?:(?:of|/)\s*\d{1,3})?\s*[-–)]?", re.I
+)
+_DIGITS = re.compile(r"\d+")
+_RULE = re.compile(r"[ \t]*[-_=~*]{4,}[ \t]*")
+_DOT_LEADER = re.compile(r"\.{4,}")
+_INVISIBLE = re.compile(r"[\u00ad\u200b\u200c\u200d\u2060\ufeff]")
+_SPACES = re.compile(r"[ \t\u00a0\u2000-\u200a\u202f\u205f\u3000]+")
+_SPACE_BEFORE_PUNCTUATION = re.compile(r" +([.,;:!?])(?=\s|$)")
+_BLANK_LINES = re.compile(r"\n{3,}")
+_LINK_ANNOTATION = re.compile(r"^\[Link: (.+?)\]$\n?", re.M)
+_URL = re.compile(r"\b(?:https?://|www\.)[^\s<>\[\]()\"']+", re.I)
+
+# Query parameters that only track where a click came from
+_TRACKING_PARAMS = re.compile(
+    r"utm_\w+|fbclid|gclid|msclkid|mc_[ce]id|trk\w*|tracking\w*|ref(?:id|src)?|src",
+    re.I,
+)
+
+
+@dataclass
+class NormalizationStats:
+    """Size of a text before and after normalization."""
+
+    chars_before: int = 0
+    chars_after: int = 0
+    tokens_before: int = 0
+    tokens_after: int = 0
+    repeated_lines_removed: int = 0
+    links_removed: int = 0
+
+    @property
+    def chars_saved(self) -> int:
+        return self.chars_before - self.chars_after
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+    def to_dict(self) -> dict:
+        """Statistics as a plain dict, for document metadata."""
+        return {
+            "chars_before": self.chars_before,
+            "chars_after": self.chars_after,
+            "chars_saved": self.chars_saved,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "tokens_saved": self.tokens_saved,
+            "repeated_lines_removed": self.repeated_lines_removed,
+            "links_removed": self.links_removed,
+        }
+
+
+@dataclass
+class NormalizedText:
+    """Normalized text and the statistics of what was removed."""
+
+    text: str
+    stats: NormalizationStats
+
+
+def normalizer_version(config: Optional[NormalizerConfig] = None) -> str:
+    """
+    Version of the normalization applied with the given configuration.
+
+    Args:
+        config: Normalizer configuration. Defaults to the app config.
+
+    Returns:
+        Version string to include in cache keys of anything derived from
+        normalized text.
+    """
+    config = config or get_app_config().document.normalizer
+    if not config.enabled:
+        return "raw"
+
+    steps = "".join(
+        flag
+        for flag, enabled in (
+            ("h", config.remove_repeated_lines),
+            ("u", config.shorten_urls),
+        )
+        if enabled
+    )
+    return f"norm{NORMALIZER_VERSION}{steps}"
+
+
+def normalize_text(
+    text: str, config: Optional[NormalizerConfig] = None
+) -> NormalizedText:
+    """
+    Normalize extracted text so it costs fewer tokens without losing content.
+
+    In order:
+
+    1. lines repeated at the top or bottom of most pages (running headers and
+       footers) and bare page numbers are removed,
+    2. words hyphenated across line breaks are joined,
+    3. URLs lose their scheme, "www.", tracking parameters and trailing
+       slash, and link annotations whose URL already appears in the text or
+       was already listed are dropped,
+    4. horizontal rules, dot leaders, invisible characters and runs of
+       whitespace are collapsed.
+
+    Args:
+        text: Extracted text, with pages separated by PAGE_BREAK.
+        config: Normalizer configuration. Defaults to the app config.
+
+    Returns:
+        NormalizedText with the text and the characters and tokens saved.
+    """
+    config = config or get_app_config().document.normalizer
+    stats = NormalizationStats(chars_before=len(text), tokens_before=count_tokens(text))
+
+    if not config.enabled:
+        text = text.replace(PAGE_BREAK, "\n\n")
+    else:
+        pages = text.split(PAGE_BREAK)
+        if config.remove_repeated_lines and len(pages) > 1:
+            pages, stats.repeated_lines_removed = _remove_repeated_lines(pages)
+        text = "\n\n".join(pages)
+
+        text = _HYPHENATED.sub(r"\1\2", text)
+        if config.shorten_urls:
+            text, stats.links_removed = _shorten_urls(text)
+        text = _collapse_whitespace(text)
+
+    stats.chars_after = len(text)
+    stats.tokens_after = count_tokens(text)
+    return NormalizedText(text=text, stats=stats)
+
+
+def _line_keys(line: str, page_number: int, pages: int) -> tuple[str, str]:
+    """
+    Keys under which a header/footer line repeats: the line itself, and the
+    line with the page number and page count masked.
+    """
+    line = " ".join(line.lower().split())
+    masked = _DIGITS.sub(
+        lambda m: "#" if int(m.group()) in (page_number, pages) else m.group(), line
+    )
+    return line, masked
+
+
+def _edge_lines(lines: list[str]) -> list[int]:
+    """Indexes of the first and last EDGE_LINES non-empty lines of a page."""
+    filled = [i for i, line in enumerate(lines) if line.strip()]
+    return sorted(set(filled[:EDGE_LINES] + filled[-EDGE_LINES:]))
+
+
+def _remove_repeated_lines(pages: list[str]) -> tuple[list[str], int]:
+    """Drop running headers, footers and page numbers from the edges of pages."""
+    page_lines = [page.split("\n") for page in pages]
+    edge_keys = [
+        {i: _line_keys(lines[i], page_number, len(pages)) for i in _edge_lines(lines)}
+        for page_number, lines in enumerate(page_lines, 1)
+    ]
+
+    counts = Counter(
+        key for keys in edge_keys for key in {k for pair in keys.values() for k in pair}
+    )
+    # A line must repeat on at least half of the pages, and on two at least
+    threshold = max(2, (len(pages) + 1) // 2)
+
+    # The first occurrence stays: on page one a running header is often the
+    # candidate's name or the job title
+    kept: set[str] = set()
+    removed = 0
+    cleaned = []
+    for lines, keys in zip(page_lines, edge_keys):
+        drop = set()
+        for i, (line_key, masked_key) in keys.items():
+            if line_key.endswith("-"):  # continues on the next line, not a header
+                continue
+            if _PAGE_NUMBER.fullmatch(line_key):
+                drop.add(i)
+                continue
+
+            key = line_key if counts[line_key] >= threshold else masked_key
+            if counts[key] >= threshold:
+                if key in kept:
+                    drop.add(i)
+                kept.add(key)
+
+        removed += len(drop)
+        cleaned.append("\n".join(line for i, line in enumerate(lines) if i not in drop))
+
+    return cleaned, removed
+
+
+def shorten_url(url: str) -> str:
+    """
+    Drop the parts of a URL that carry no meaning for a reader.
+
+    Args:
+        url: URL, with or without a scheme.
+
+    Returns:
+        The URL without scheme, "www.", tracking parameters, fragment or
+        trailing slash, e.g. "linkedin.com/in/jane-doe".
+    """
+    if url.lower().startswith("mailto:"):
+        return url[7:].split("?")[0]
+
+    parts = urlsplit(url if "://" in url else f"http://{url}")
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode(
+        [
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _TRACKING_PARAMS.fullmatch(name)
+        ]
+    )
+    path = parts.path.rstrip("/")
+
+    return f"{host}{path}" + (f"?{query}" if query else "")
+
+
+def _shorten_urls(text: str) -> tuple[str, int]:
+    """Shorten URLs and drop link annotations that repeat what the text says."""
+    removed = 0
+    seen: set[str] = set()
+
+    def annotation(match: re.Match) -> str:
+        nonlocal removed
+        target = shorten_url(match.group(1).strip())
+        if target in seen or target.lower() in body:
+            removed += 1
+            return ""
+        seen.add(target)
+        return f"[Link: {target}]" + ("\n" if match.group(0).endswith("\n") else "")
+
+    text = _URL.sub(lambda m: _shorten_in_text(m.group(0)), text)
+
+    # Compare annotations with the text they annotate, not with each other
+    body = _LINK_ANNOTATION.sub("", text).lower()
+    return _LINK_ANNOTATION.sub(annotation, text), removed
+
+
+def _shorten_in_text(url: str) -> str:
+    """Shorten a URL found in running text, keeping trailing punctuation out."""
+    trailing = ""
+    while url and url[-1] in ".,;:!?":
+        url, trailing = url[:-1], url[-1] + trailing
+    return shorten_url(url) + trailing
+
+
+def _collapse_whitespace(text: str) -> str:
+    text = _INVISIBLE.sub("", text)
+    text = _RULE.sub("\n", text)
+    text = _DOT_LEADER.sub(" ", text)
+    text = _SPACES.sub(" ", text)
+    text = _SPACE_BEFORE_PUNCTUATION.sub(r"\1", text)
+    text = "\n".join(line.strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", text).strip()
@@ -0,0 +1,149 @@
+"""Token counting helpers used to budget LLM prompts."""
+
+import re
+import logging
+from typing import Optional, Any
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+
+# Approximates BPE pieces when the tiktoken encoding cannot be loaded
+# (e.g. offline hosts without a cached encoding file).
+_FALLBACK_PIECES = re.compile(r"\w{1,4}|[^\w\s]", re.UNICODE)
+_FALLBACK_CHARS_PER_TOKEN = 4
+
+_encoding: Optional[Any] = None
+_encoding_unavailable = False
+
+
+def _get_encoding() -> Optional[Any]:
+    """Load the tiktoken encoding once, remembering failures."""
+    global _encoding, _encoding_unavailable
+
+    if _encoding is None and not _encoding_unavailable:
+        try:
+            _encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+        except Exception as e:
+            _encoding_unavailable = True
+            logger.warning(
+                f"tiktoken encoding {DEFAULT_ENCODING} unavailable, "
+                f"using approximate token counts: {str(e)}"
+            )
+
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens of a text.
+
+    Args:
+        text: Text to count.
+
+    Returns:
+        Number of tokens.
+    """
+    if not text:
+        return 0
+
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    return len(_FALLBACK_PIECES.findall(text))
+
+
+def split_text_by_tokens(text: str, max_tokens: int) -> list[str]:
+    """
+    Split text into chunks of at most max_tokens tokens.
+
+    Splits prefer section boundaries (blank lines), then line breaks, then
+    words, so chunks stay readable on their own.
+
+    Args:
+        text: Text to split.
+        max_tokens: Maximum tokens per chunk.
+
+    Returns:
+        List of chunks, in order.
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+
+    return _pack(text, max_tokens, ("\n\n", "\n", " "))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to at most max_tokens tokens on a word boundary.
+
+    Args:
+        text: Text to truncate.
+        max_tokens: Maximum tokens to keep.
+
+    Returns:
+        Truncated text.
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    chunks = split_text_by_tokens(text, max_tokens)
+    return chunks[0] if chunks else ""
+
+
+def _pack(text: str, max_tokens: int, separators: tuple[str, ...]) -> list[str]:
+    """Greedily pack pieces split on the first separator into chunks."""
+    if count_tokens(text) <= max_tokens:
+        return [text] if text.strip() else []
+
+    if not separators:
+        return _hard_split(text, max_tokens)
+
+    separator, rest = separators[0], separators[1:]
+    chunks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    separator_tokens = count_tokens(separator)
+
+    for piece in text.split(separator):
+        if not piece.strip():
+            continue
+
+        piece_tokens = count_tokens(piece)
+        if piece_tokens > max_tokens:
+            if current:
+                chunks.append(separator.join(current))
+                current, current_tokens = [], 0
+            chunks.extend(_pack(piece, max_tokens, rest))
+            continue
+
+        added_tokens = piece_tokens + (separator_tokens if current else 0)
+        if current and current_tokens + added_tokens > max_tokens:
+            chunks.append(separator.join(current))
+            current, current_tokens = [], 0
+            added_tokens = piece_tokens
+
+        current.append(piece)
+        current_tokens += added_tokens
+
+    if current:
+        chunks.append(separator.join(current))
+
+    return chunks
+
+
+def _hard_split(text: str, max_tokens: int) -> list[str]:
+    """Split a single unbreakable piece by encoded tokens."""
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        return [
+            encoding.decode(tokens[i : i + max_tokens])
+            for i in range(0, len(tokens), max_tokens)
+        ]
+
+    step = max_tokens * _FALLBACK_CHARS_PER_TOKEN
+    return [text[i : i + step] for i in range(0, len(text), step)]
@@ -1,8 +1,23 @@
+import io
 import os
 import pathlib
+from datetime import datetime, timedelta
 from unittest import TestCase
 
-from job_analyzer.database.models import LayOff
+import pytest
+import pytest_asyncio
+import xxhash
+from sqlalchemy import func, select
+
+from utils.app_config import RetentionConfig
+from job_analyzer.database.models import Base, LayOff
+from job_analyzer.document_storage import blob_store as blob_store_module
+from job_analyzer.document_storage.blob_store import BlobStore
+from job_analyzer.document_storage.janitor import DocumentJanitor
+
+LAYOFF_FILE_PATH = (
+    pathlib.Path(__file__).parent.parent / "testfiles" / "lay_off_test_file.csv"
+)
 
 
 class TestDataModel(TestCase):
@@ -38,3 +53,84 @@ class TestDataModel(TestCase):
         )
 
         self.assertEqual(temp_data_str, LayOff.as_context([self.parsed_model_list[0]]))
+
+
+@pytest_asyncio.fixture
+async def layoff_session(monkeypatch, tmp_path):
+    pytest.importorskip("aiosqlite")
+    monkeypatch.setenv("LAYOFF_DB_URL", "sqlite+aiosqlite://")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'layoffs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reimport_after_sweep_adds_no_rows(monkeypatch, tmp_path, layoff_session):
+    """Test re-importing a CSV whose blob was garbage collected adds no rows."""
+    from job_analyzer.database.layoff_db import add_layoff_bulk
+
+    store = BlobStore(tmp_path / "uploaded_files")
+    monkeypatch.setattr(blob_store_module, "_blob_store", store)
+    contents = LAYOFF_FILE_PATH.read_bytes()
+
+    async def import_csv() -> int:
+        digest = store.put(contents)
+        return await add_layoff_bulk(
+            LayOff.from_csv(store.path_for(digest)), layoff_session
+        )
+
+    async def row_count() -> int:
+        result = await layoff_session.execute(select(func.count(LayOff.id)))
+        return result.scalar_one()
+
+    assert await import_csv() == 8
+    DocumentJanitor(RetentionConfig(ttl_minutes=1)).sweep(
+        datetime.now() + timedelta(minutes=5)
+    )
+    assert not store.exists(xxhash.xxh64(contents).hexdigest())
+
+    assert await import_csv() == 0
+    assert await row_count() == 8
+
+
+@pytest.mark.asyncio
+async def test_upload_duplicates_are_detected_by_import_record(
+    monkeypatch, tmp_path, layoff_session
+):
+    """Test a CSV is a duplicate once imported, even after its blob is swept."""
+    from fastapi import UploadFile
+
+    from job_analyzer.database.layoff_db import layoff_db_context
+    from routes.models import APISTATUS
+    from routes.router_helper import handle_layoff_file_upload
+
+    store = BlobStore(tmp_path / "uploaded_files")
+    monkeypatch.setattr(blob_store_module, "_blob_store", store)
+    contents = LAYOFF_FILE_PATH.read_bytes()
+    token = layoff_db_context.set(layoff_session)
+
+    async def upload() -> APISTATUS:
+        return await handle_layoff_file_upload(
+            UploadFile(io.BytesIO(contents), filename="layoffs.csv")
+        )
+
+    try:
+        store.put(contents)  # e.g. a document upload with the same bytes
+        assert await upload() == APISTATUS.OK
+
+        DocumentJanitor(RetentionConfig(ttl_minutes=1)).sweep(
+            datetime.now() + timedelta(minutes=5)
+        )
+        assert not store.exists(xxhash.xxh64(contents).hexdigest())
+        assert await upload() == APISTATUS.DUPLICATE
+    finally:
+        layoff_db_context.reset(token)
+
+    result = await layoff_session.execute(select(func.count(LayOff.id)))
+    assert result.scalar_one() == 8
@@ -0,0 +1,62 @@
+"""Tests for the content-addressed blob store."""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from job_analyzer.document_storage.blob_store import BlobStore
+
+
+def test_put_shards_by_digest_and_deduplicates(tmp_path):
+    """Test blobs land in ab/cd/<digest> and identical content is stored once."""
+    store = BlobStore(tmp_path)
+
+    digest = store.put(b"resume content")
+    path = store.path_for(digest)
+
+    assert path == tmp_path / digest[:2] / digest[2:4] / digest
+    assert path.read_bytes() == b"resume content"
+    assert store.put(b"resume content") == digest
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == [path]
+
+    with pytest.raises(ValueError):
+        store.path_for("../../etc/passwd")
+
+
+def test_garbage_collection_keeps_referenced_and_recent_blobs(tmp_path):
+    """Test only old, unreferenced files are collected, including legacy ones."""
+    store = BlobStore(tmp_path)
+    kept = store.put(b"held by a document")
+    dropped = store.put(b"no longer used")
+    recent = store.put(b"just uploaded")
+    legacy = tmp_path / "temp_0123abcd..csv"
+    legacy.write_bytes(b"company,date")
+
+    store.acquire(kept)
+    old = time.time() - 3600
+    for path in (store.path_for(kept), store.path_for(dropped), legacy):
+        os.utime(path, (old, old))
+
+    deleted, freed = store.collect_garbage(datetime.now() - timedelta(minutes=5))
+
+    assert deleted == 2
+    assert freed == len(b"no longer used") + len(b"company,date")
+    assert store.exists(kept) and store.exists(recent)
+    assert not store.exists(dropped) and not legacy.exists()
+
+
+def test_discard_respects_references(tmp_path):
+    """Test a blob is only deleted once its last reference is released."""
+    store = BlobStore(tmp_path)
+    digest = store.put(b"shared content")
+    store.acquire(digest)
+    store.acquire(digest)
+
+    assert store.release(digest) == 1
+    assert not store.discard(digest)
+    assert store.release(digest) == 0
+    assert store.discard(digest)
+    assert not store.exists(digest)
+    assert list(tmp_path.iterdir()) == []
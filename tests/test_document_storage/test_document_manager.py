@@ -0,0 +1,197 @@
+"""Tests for document storage and background summarization."""
+
+import asyncio
+
+import pytest
+import xxhash
+
+from job_analyzer.document_storage import document_manager
+
+
+@pytest.fixture(autouse=True)
+def no_disk_cache(monkeypatch):
+    monkeypatch.setattr(document_manager, "get_extraction_cache", lambda: None)
+
+
+@pytest.mark.asyncio
+async def test_long_text_is_summarized_in_background(monkeypatch):
+    """Test the document is returned before summarization completes."""
+    summary_started = asyncio.Event()
+    release_summary = asyncio.Event()
+
+    async def slow_summary(text, doc_type="document"):
+        summary_started.set()
+        await release_summary.wait()
+        return "short summary"
+
+    monkeypatch.setattr(
+        document_manager, "needs_summarization", lambda text, **kwargs: True
+    )
+    monkeypatch.setattr(document_manager, "prepare_document_for_analysis", slow_summary)
+
+    document = await document_manager.save_text_document(
+        "long resume text " * 10, doc_type="resume"
+    )
+
+    assert document.status == "extracted"
+    assert document.analysis_text == document.extracted_text
+
+    await summary_started.wait()
+    assert document.status == "summarizing"
+
+    waiter = asyncio.create_task(document_manager.get_ready_document(document.id))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    release_summary.set()
+    ready = await waiter
+
+    assert ready is document
+    assert document.status == "ready"
+    assert document.analysis_text == "short summary"
+    document_manager.delete_document(document.id)
+
+
+@pytest.mark.asyncio
+async def test_short_text_is_ready_immediately(monkeypatch):
+    """Test documents that fit the context are ready without an LLM call."""
+
+    async def fail_summary(*args, **kwargs):
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(document_manager, "prepare_document_for_analysis", fail_summary)
+
+    document = await document_manager.save_text_document("Python developer", "resume")
+
+    assert document.status == "ready"
+    assert await document_manager.get_ready_document(document.id) is document
+    document_manager.delete_document(document.id)
+
+
+@pytest.mark.asyncio
+async def test_get_ready_document_timeout(monkeypatch):
+    """Test waiting for a summary can time out without cancelling it."""
+
+    async def never_finishes(text, doc_type="document"):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(
+        document_manager, "needs_summarization", lambda text, **kwargs: True
+    )
+    monkeypatch.setattr(
+        document_manager, "prepare_document_for_analysis", never_finishes
+    )
+
+    document = await document_manager.save_text_document("another long text", "other")
+    ready = await document_manager.get_ready_document(document.id, timeout=0.01)
+
+    assert ready is document
+    assert document.id in document_manager._summary_tasks
+    document_manager.delete_document(document.id)
+    assert document.id not in document_manager._summary_tasks
+
+
+@pytest.mark.asyncio
+async def test_batch_upload_zip_dedups_and_reports_errors(monkeypatch, tmp_path):
+    """Test zip entries are stored once per content and bad entries are reported."""
+    import io
+    import zipfile
+
+    from fastapi import UploadFile
+
+    from job_analyzer.document_storage import blob_store
+    from job_analyzer.document_storage.blob_store import BlobStore
+
+    store = BlobStore(tmp_path)
+    monkeypatch.setattr(blob_store, "_blob_store", store)
+    monkeypatch.setattr(
+        document_manager, "needs_summarization", lambda text, **kwargs: False
+    )
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("resumes/", "")
+        zf.writestr("resumes/alice.txt", "Alice batch resume")
+        zf.writestr("resumes/alice_copy.txt", "Alice batch resume")
+        zf.writestr("resumes/bob.txt", "Bob batch resume")
+        zf.writestr("resumes/photo.png", "not a document")
+        zf.writestr("__MACOSX/resumes/._alice.txt", "metadata")
+    archive.seek(0)
+
+    results = await document_manager.save_uploaded_documents_batch(
+        [UploadFile(file=archive, filename="resumes.zip")], doc_type="resume"
+    )
+
+    assert [(r.filename, r.status) for r in results] == [
+        ("alice.txt", "created"),
+        ("alice_copy.txt", "duplicate"),
+        ("bob.txt", "created"),
+        ("photo.png", "error"),
+    ]
+    assert results[1].document_id == results[0].document_id
+    assert "Unsupported file format" in results[3].error
+
+    alice = document_manager.get_document(results[0].document_id)
+    assert alice.extracted_text == "Alice batch resume"
+    assert alice.status == "ready"
+    assert store.refcount(alice.file_hash) == 1
+    assert store.exists(alice.file_hash)
+
+    for result in results:
+        if result.status == "created":
+            document_manager.delete_document(result.document_id)
+
+    assert not store.exists(alice.file_hash)
+
+
+@pytest.mark.asyncio
+async def test_open_document_file_holds_blob(monkeypatch, tmp_path):
+    """Test an opened source file survives deletion of its document until closed."""
+    from job_analyzer.document_storage import blob_store
+    from job_analyzer.document_storage.blob_store import BlobStore
+
+    store = BlobStore(tmp_path)
+    monkeypatch.setattr(blob_store, "_blob_store", store)
+
+    document = await document_manager.save_document_bytes(
+        b"Source resume bytes", "resume.txt", summarize=False
+    )
+    assert document.metadata["file_hash"] == document.file_hash
+    assert document.metadata["file_size"] == len(b"Source resume bytes")
+
+    opened, file_path = document_manager.open_document_file(document.id)
+    assert opened is document
+    assert file_path.read_bytes() == b"Source resume bytes"
+
+    document_manager.delete_document(document.id)
+    assert file_path.exists()
+
+    document_manager.close_document_file(opened)
+    assert store.refcount(document.file_hash) == 0
+
+    pasted = await document_manager.save_text_document("pasted", summarize=False)
+    assert document_manager.open_document_file(pasted.id) is None
+    document_manager.delete_document(pasted.id)
+
+
+@pytest.mark.asyncio
+async def test_failed_normalization_releases_blob(monkeypatch, tmp_path):
+    """Test the blob reference is dropped when text normalization fails."""
+    from job_analyzer.document_storage import blob_store
+    from job_analyzer.document_storage.blob_store import BlobStore
+
+    store = BlobStore(tmp_path)
+    monkeypatch.setattr(blob_store, "_blob_store", store)
+
+    async def fail_normalize(text, filename):
+        raise RuntimeError("normalizer crashed")
+
+    monkeypatch.setattr(document_manager, "_normalize", fail_normalize)
+
+    with pytest.raises(RuntimeError, match="normalizer crashed"):
+        await document_manager.save_document_bytes(
+            b"Resume bytes", "resume.txt", summarize=False
+        )
+
+    digest = xxhash.xxh64(b"Resume bytes").hexdigest()
+    assert store.refcount(digest) == 0
@@ -0,0 +1,75 @@
+import os
+import zlib
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from job_analyzer.document_storage.extraction_cache import ExtractionCache
+
+
+class TestExtractionCache(TestCase):
+    """Test cases for the content-addressed extraction cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_put_and_get(self):
+        """Test cached text round-trips through compression."""
+        cache = ExtractionCache(self.cache_dir, max_size_bytes=1024 * 1024)
+        key = ExtractionCache.make_key("abc123", "text", "pypdf2-1")
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, "Jane Doe — Senior Engineer")
+
+        self.assertEqual(cache.get(key), "Jane Doe — Senior Engineer")
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_version_is_part_of_key(self):
+        """Test entries from another extractor version are not returned."""
+        cache = ExtractionCache(self.cache_dir, max_size_bytes=1024 * 1024)
+        cache.put(ExtractionCache.make_key("abc123", "text", "v1"), "old")
+
+        self.assertIsNone(cache.get(ExtractionCache.make_key("abc123", "text", "v2")))
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted once over the size limit."""
+        texts = {f"key{i}": os.urandom(1000).hex() for i in range(3)}
+        entry_size = len(zlib.compress(texts["key0"].encode("utf-8"), 6))
+        cache = ExtractionCache(self.cache_dir, max_size_bytes=int(entry_size * 2.5))
+
+        cache.put("key0", texts["key0"])
+        cache.put("key1", texts["key1"])
+        cache.get("key0")  # key1 becomes least recently used
+        cache.put("key2", texts["key2"])
+
+        self.assertLessEqual(cache.total_size, cache.max_size_bytes)
+        self.assertIsNone(cache.get("key1"))
+        self.assertEqual(cache.get("key0"), texts["key0"])
+        self.assertEqual(cache.get("key2"), texts["key2"])
+
+    def test_entries_survive_restart(self):
+        """Test a new cache instance picks up entries written by another one."""
+        ExtractionCache(self.cache_dir, max_size_bytes=1024 * 1024).put("key", "text")
+
+        cache = ExtractionCache(self.cache_dir, max_size_bytes=1024 * 1024)
+
+        self.assertEqual(cache.get("key"), "text")
+        self.assertGreater(cache.total_size, 0)
+
+    def test_delete_content(self):
+        """Test every entry derived from a content hash is deleted."""
+        cache = ExtractionCache(self.cache_dir, max_size_bytes=1024 * 1024)
+        cache.put(ExtractionCache.make_key("abc", "text", "v1"), "text")
+        cache.put(ExtractionCache.make_key("abc", "summary-resume", "v1+1"), "summary")
+        cache.put(ExtractionCache.make_key("def", "text", "v1"), "other")
+
+        self.assertEqual(cache.delete_content("abc"), 2)
+        self.assertIsNone(cache.get(ExtractionCache.make_key("abc", "text", "v1")))
+        self.assertEqual(
+            cache.get(ExtractionCache.make_key("def", "text", "v1")), "other"
+        )
@@ -0,0 +1,105 @@
+"""Tests for document expiry and quota enforcement."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.app_config import RetentionConfig
+from job_analyzer.document_storage import document_manager
+from job_analyzer.document_storage import blob_store as blob_store_module
+from job_analyzer.document_storage.blob_store import BlobStore
+from job_analyzer.document_storage.extraction_cache import ExtractionCache
+from job_analyzer.document_storage.janitor import DocumentJanitor
+
+KB = 1024
+
+
+@pytest.fixture(autouse=True)
+def isolated_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(document_manager, "get_extraction_cache", lambda: None)
+    monkeypatch.setattr(
+        blob_store_module, "_blob_store", BlobStore(tmp_path / "uploaded_files")
+    )
+    yield
+    for document in document_manager.list_documents():
+        document_manager.delete_document(document.id)
+
+
+async def save(name: str, size_kb: int, session_id: str, age_minutes: int = 0):
+    document = await document_manager.save_text_document(
+        name, filename=f"{name}.txt", session_id=session_id, summarize=False
+    )
+    document.file_size = size_kb * KB - document.storage_bytes
+    document.last_accessed = datetime.now() - timedelta(minutes=age_minutes)
+    return document
+
+
+@pytest.mark.asyncio
+async def test_sweep_evicts_expired_documents():
+    """Test documents idle for longer than the TTL are deleted."""
+    janitor = DocumentJanitor(RetentionConfig(ttl_minutes=60))
+    stale = await save("stale", 1, "s1", age_minutes=90)
+    fresh = await save("fresh", 1, "s1", age_minutes=10)
+
+    assert janitor.sweep() == 1
+
+    assert document_manager.get_document(stale.id) is None
+    assert document_manager.get_document(fresh.id) is fresh
+    assert janitor.metrics.evictions["expired"] == 1
+    assert janitor.metrics.bytes_freed >= KB
+
+
+@pytest.mark.asyncio
+async def test_eviction_keeps_cached_extraction(monkeypatch, tmp_path):
+    """Test evictions keep the cached entries and only a purge deletes them."""
+    cache = ExtractionCache(tmp_path / "extraction_cache", max_size_bytes=KB * KB)
+    monkeypatch.setattr(document_manager, "get_extraction_cache", lambda: cache)
+    janitor = DocumentJanitor(RetentionConfig(ttl_minutes=60))
+    stale = await save("stale", 1, "s1", age_minutes=90)
+    deleted = await save("deleted", 1, "s1", age_minutes=10)
+    for document in (stale, deleted):
+        cache.put(ExtractionCache.make_key(document.file_hash, "text", "v1"), "text")
+
+    assert janitor.sweep() == 1
+    assert document_manager.delete_document(deleted.id, purge_cache=True)
+
+    assert cache.get(ExtractionCache.make_key(stale.file_hash, "text", "v1")) == "text"
+    assert cache.get(ExtractionCache.make_key(deleted.file_hash, "text", "v1")) is None
+
+
+@pytest.mark.asyncio
+async def test_quotas_evict_least_recently_used():
+    """Test session and global quotas evict the least recently used documents."""
+    janitor = DocumentJanitor(RetentionConfig(session_quota_mb=1, global_quota_mb=1))
+    await save("a-old", 400, "a", age_minutes=30)
+    await save("a-mid", 400, "a", age_minutes=20)
+    a_new = await save("a-new", 400, "a", age_minutes=10)
+    await save("b-old", 300, "b", age_minutes=40)
+    b_new = await save("b-new", 300, "b", age_minutes=5)
+
+    # Session a holds 1200 KB (> 1 MB): its oldest document goes. The store
+    # then holds 1400 KB (> 1 MB): b-old and then a-mid go.
+    assert janitor.enforce_quotas() == 3
+
+    remaining = {d.id for d in document_manager.list_documents()}
+    assert remaining == {a_new.id, b_new.id}
+    assert janitor.metrics.evictions == {
+        "expired": 0,
+        "session_quota": 1,
+        "global_quota": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_orphan_files_are_deleted(tmp_path):
+    """Test files no document references are removed once older than the TTL."""
+    janitor = DocumentJanitor(RetentionConfig(ttl_minutes=1))
+    upload_dir = tmp_path / "uploaded_files"
+    upload_dir.mkdir()
+    orphan = upload_dir / "orphan.pdf"
+    orphan.write_bytes(b"%PDF")
+
+    janitor.sweep(now=datetime.now() + timedelta(minutes=5))
+
+    assert not orphan.exists()
+    assert janitor.metrics.orphan_files_deleted == 1
@@ -0,0 +1,136 @@
+"""Tests for the two-stage fit scoring pipeline."""
+
+import json
+
+import pytest
+
+from job_analyzer.analysis import fit_pipeline
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.external_api import llm_analysis
+from utils.app_config import AppConfig
+
+JD_TEXT = "Senior Python Developer. Requirements: 5+ years of Python, AWS."
+JD_RESPONSE = {
+    "role_title": "Senior Python Developer",
+    "technical_skills": ["Python", "AWS"],
+    "experience_requirements": "5+ years",
+}
+RESUME_RESPONSE = {"candidate_name": "Jane Doe", "technical_skills": ["Python"]}
+FIT_RESPONSE = {
+    "overall_score": 70,
+    "score_breakdown": {
+        "hard_skills": 30,
+        "experience": 20,
+        "education": 5,
+        "soft_skills": 15,
+    },
+    "deal_breakers_found": [],
+    "reasoning_trace": "Python matches, AWS missing.",
+    "final_recommendation": "Potential Fit",
+    "data_sufficiency": "Medium",
+}
+
+
+def document(doc_id: str, file_type: str, text: str) -> UploadedDocument:
+    return UploadedDocument(
+        id=doc_id,
+        file_hash=doc_id,
+        original_filename=f"{doc_id}.txt",
+        file_type=file_type,
+        file_format="txt",
+        extracted_text=text,
+    )
+
+
+@pytest.fixture
+def prompts(monkeypatch):
+    prompts = {"jd": [], "resume": [], "fit": []}
+
+    async def fake_call(prompt):
+        if "<job_description>" in prompt:
+            prompts["jd"].append(prompt)
+            return json.dumps(JD_RESPONSE)
+        if "<candidate_resume>" in prompt:
+            prompts["resume"].append(prompt)
+            return json.dumps(RESUME_RESPONSE)
+        prompts["fit"].append(prompt)
+        return json.dumps(FIT_RESPONSE)
+
+    monkeypatch.setattr(llm_analysis, "_call_llm_for_analysis", fake_call)
+    monkeypatch.setattr(llm_analysis, "get_response_cache", lambda: None)
+    return prompts
+
+
+def scoring_config(engine: str) -> AppConfig:
+    app_config = AppConfig.load_default().model_copy(deep=True)
+    app_config.document.scoring.engine = engine
+    return app_config
+
+
+@pytest.mark.asyncio
+async def test_scoring_prompt_gets_compact_extractions(prompts):
+    """Test the scoring prompt holds the extracted JSON, not the raw documents."""
+    jd = document("jd-1", "job_description", JD_TEXT)
+    resume = document("resume-1", "resume", "Jane Doe\nPython developer since 2015.")
+
+    fit = await fit_pipeline.score_documents(
+        resume, jd, app_config=scoring_config("llm")
+    )
+
+    assert fit.overall_score == 70
+    scoring_prompt = prompts["fit"][0]
+    assert '"technical_skills":["Python","AWS"]' in scoring_prompt
+    assert "Python developer since 2015" not in scoring_prompt
+    assert "nice_to_have_requirements" not in scoring_prompt
+
+
+@pytest.mark.asyncio
+async def test_extractions_are_reused_per_document(prompts):
+    """Test a JD scored against several resumes is extracted once."""
+    jd = document("jd-1", "job_description", JD_TEXT)
+    resumes = [document(f"resume-{i}", "resume", f"Candidate {i}") for i in range(3)]
+
+    app_config = scoring_config("llm")
+
+    for resume in resumes:
+        await fit_pipeline.score_documents(resume, jd, app_config=app_config)
+    await fit_pipeline.score_documents(resumes[0], jd, app_config=app_config)
+
+    assert len(prompts["jd"]) == 1
+    assert len(prompts["resume"]) == 3
+    assert len(prompts["fit"]) == 4
+    assert (
+        jd.metadata[fit_pipeline.STRUCTURED_METADATA_KEY]["result"]["role_title"]
+        == "Senior Python Developer"
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_engine_skips_scoring_prompt(prompts):
+    """Test the local engine scores the extractions without an LLM call."""
+    jd = document("jd-1", "job_description", JD_TEXT)
+    resume = document("resume-1", "resume", "Jane Doe\nPython developer since 2015.")
+
+    fit = await fit_pipeline.score_documents(
+        resume, jd, app_config=scoring_config("local")
+    )
+
+    assert prompts["fit"] == []
+    assert fit.score_breakdown.hard_skills == 20  # Python of Python, AWS
+    assert "missing aws" in fit.reasoning_trace
+
+
+@pytest.mark.asyncio
+async def test_failed_extractions_are_not_stored(monkeypatch, prompts):
+    """Test a JD whose extraction failed is extracted again next time."""
+
+    async def failing_call(prompt):
+        return "not json"
+
+    monkeypatch.setattr(llm_analysis, "_call_llm_for_analysis", failing_call)
+    jd = document("jd-1", "job_description", JD_TEXT)
+
+    analysis = await fit_pipeline.structured_job_description(jd)
+
+    assert analysis.role_title in llm_analysis.EXTRACTION_FAILED_TITLES
+    assert fit_pipeline.STRUCTURED_METADATA_KEY not in jd.metadata
@@ -0,0 +1,128 @@
+"""Tests for ranking many resumes against one job description."""
+
+import json
+import asyncio
+
+import pytest
+
+from job_analyzer.analysis import ranking
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.external_api import llm_analysis
+from job_analyzer.external_api.models import JobDescriptionAnalysis
+
+JD_RESPONSE = {
+    "role_title": "Backend Engineer",
+    "must_have_requirements": ["Python"],
+    "technical_skills": ["Python", "PostgreSQL", "Docker"],
+}
+RESUME_TEXTS = {
+    "python-postgres-docker": "Built services in Python on Postgres, shipped with Docker.",
+    "python-only": "Python scripting for data pipelines.",
+    "frontend": "React and TypeScript user interfaces.",
+    "python-docker": "Python APIs deployed with Docker.",
+}
+
+
+def document(doc_id: str, file_type: str, text: str) -> UploadedDocument:
+    return UploadedDocument(
+        id=doc_id,
+        file_hash=doc_id,
+        original_filename=f"{doc_id}.txt",
+        file_type=file_type,
+        file_format="txt",
+        extracted_text=text,
+    )
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    calls = {"resume": 0, "in_flight": 0, "max_in_flight": 0}
+
+    async def fake_call(prompt):
+        if "<job_description>" in prompt:
+            return json.dumps(JD_RESPONSE)
+
+        calls["resume"] += 1
+        calls["in_flight"] += 1
+        calls["max_in_flight"] = max(calls["max_in_flight"], calls["in_flight"])
+        await asyncio.sleep(0.01)
+        calls["in_flight"] -= 1
+        skills = [s for s in ("Python", "Docker") if s in prompt]
+        return json.dumps({"technical_skills": skills})
+
+    monkeypatch.setattr(llm_analysis, "_call_llm_for_analysis", fake_call)
+    monkeypatch.setattr(llm_analysis, "get_response_cache", lambda: None)
+    return calls
+
+
+def test_shortlist_orders_by_skill_overlap():
+    """Test the pre-filter keeps the resumes mentioning the most JD skills."""
+    jd = JobDescriptionAnalysis(**JD_RESPONSE)
+    resumes = [
+        document(doc_id, "resume", text) for doc_id, text in RESUME_TEXTS.items()
+    ]
+
+    shortlisted = ranking.shortlist(jd, resumes, top_k=3)
+
+    assert [(resume.id, round(overlap, 2)) for resume, overlap in shortlisted] == [
+        ("python-postgres-docker", 1.0),
+        ("python-docker", 0.75),  # Python counts twice as a must-have
+        ("python-only", 0.5),
+    ]
+    assert resumes[0].metadata[ranking.SKILLS_METADATA_KEY] == [
+        "docker",
+        "postgresql",
+        "python",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rank_streams_shortlist_then_scores(llm):
+    """Test only the shortlist is extracted, with bounded concurrency."""
+    jd = document("jd-1", "job_description", "Backend Engineer, Python")
+    resumes = [
+        document(doc_id, "resume", text) for doc_id, text in RESUME_TEXTS.items()
+    ]
+    app_config = ranking.AppConfig.load_default().model_copy(deep=True)
+    app_config.document.ranking.max_concurrency = 2
+
+    events = [
+        event
+        async for event in ranking.rank_candidates(
+            jd, resumes, 3, app_config=app_config
+        )
+    ]
+
+    assert [event["event"] for event in events] == ["shortlist"] + ["score"] * 3 + [
+        "done"
+    ]
+    assert events[0]["candidates"] == 4
+    assert "frontend" not in {event.get("resume_id") for event in events}
+    assert llm["resume"] == 3
+    assert llm["max_in_flight"] == 2
+    assert events[-1]["scored"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_candidate_streams_error(monkeypatch, llm):
+    """Test a candidate whose scoring raises does not stop the ranking."""
+    jd = document("jd-1", "job_description", "Backend Engineer, Python")
+    resumes = [
+        document(doc_id, "resume", text) for doc_id, text in RESUME_TEXTS.items()
+    ]
+    score_documents = ranking.score_documents
+
+    async def flaky(resume, *args):
+        if resume.id == "python-only":
+            raise RuntimeError("provider down")
+        return await score_documents(resume, *args)
+
+    monkeypatch.setattr(ranking, "score_documents", flaky)
+
+    events = [event async for event in ranking.rank_candidates(jd, resumes, 3)]
+
+    errors = [event for event in events if event["event"] == "error"]
+    assert errors == [
+        {"event": "error", "resume_id": "python-only", "detail": "provider down"}
+    ]
+    assert events[-1]["scored"] == 2
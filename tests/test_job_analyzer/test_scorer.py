@@ -0,0 +1,153 @@
+"""Tests for the rule-based fit scorer."""
+
+import pytest
+
+from job_analyzer.scoring import scorer
+from job_analyzer.scoring.skills import mentioned_skills, skill_keys
+from job_analyzer.external_api.models import (
+    Education,
+    JobDescriptionAnalysis,
+    ResumeReview,
+    WorkExperience,
+)
+
+JD = JobDescriptionAnalysis(
+    role_title="Senior Backend Engineer",
+    must_have_requirements=["5+ years building services in Python", "Kubernetes"],
+    technical_skills=["Python", "PostgreSQL", "Kubernetes", "AWS"],
+    soft_skills=["Communication", "Mentoring"],
+    experience_requirements="5+ years of backend development",
+    education_requirements="Bachelor's degree in Computer Science",
+    industry_domain="Fintech",
+)
+
+STRONG = ResumeReview(
+    candidate_name="Jane Doe",
+    work_experience=[
+        WorkExperience(
+            job_title="Senior Software Engineer",
+            company="PayCo Fintech",
+            duration="Jan 2018 - Present",
+            responsibilities="Ran Postgres 14 and k8s clusters on Amazon Web Services.",
+        )
+    ],
+    technical_skills=["python3", "Docker"],
+    soft_skills=["communication skills", "mentorship"],
+    education=[Education(degree="B.Sc. Computer Science")],
+)
+
+WEAK = ResumeReview(
+    candidate_name="John Roe",
+    work_experience=[
+        WorkExperience(
+            job_title="Junior Developer",
+            duration="2023 - 2024",
+            responsibilities="Built landing pages.",
+        )
+    ],
+    technical_skills=["JavaScript", "HTML"],
+)
+
+
+def test_skill_synonyms_normalize_to_one_key():
+    """Test spellings of a skill match one another."""
+    assert skill_keys("Postgres 14") == skill_keys("PostgreSQL") == {"postgresql"}
+    assert skill_keys("Strong Python skills") == {"python"}
+    assert skill_keys("Experience with AWS or GCP") == {"aws", "gcp"}
+    assert {"kubernetes", "postgresql"} <= mentioned_skills(
+        "Operated k8s, backed by postgres."
+    )
+
+
+def test_strong_candidate_scores_high():
+    """Test a resume meeting the requirements under other names scores as a strong fit."""
+    fit = scorer.score_fit(JD, STRONG)
+
+    assert fit.score_breakdown.hard_skills == 40
+    assert fit.score_breakdown.soft_skills == 20
+    assert fit.score_breakdown.education == 10
+    assert fit.score_breakdown.experience == 30
+    assert fit.overall_score == 100
+    assert fit.final_recommendation == "Strong Fit"
+
+
+def test_must_have_skills_weigh_more():
+    """Test missing a must-have skill costs more than missing another skill."""
+    no_aws = STRONG.model_copy(update={"work_experience": []})
+    no_aws.technical_skills = ["Python", "PostgreSQL", "Kubernetes"]
+    no_kubernetes = no_aws.model_copy(
+        update={"technical_skills": ["Python", "PostgreSQL", "AWS"]}
+    )
+
+    without_aws, without_kubernetes = scorer.score_resumes(JD, [no_aws, no_kubernetes])
+
+    assert without_aws.score_breakdown.hard_skills == 33  # 5 of 6 weights
+    assert without_kubernetes.score_breakdown.hard_skills == 27  # 4 of 6 weights
+    assert "kubernetes (must-have)" in without_kubernetes.reasoning_trace
+
+
+def test_batch_matches_single_scores():
+    """Test scoring a batch gives each resume the score it gets alone."""
+    batch = scorer.score_resumes(JD, [STRONG, WEAK])
+
+    assert batch == [scorer.score_fit(JD, STRONG), scorer.score_fit(JD, WEAK)]
+    assert batch[1].overall_score < 40
+    assert batch[1].final_recommendation == "No Fit"
+
+
+def test_missing_deal_breaker_zeroes_score():
+    """Test a deal breaker the resume does not show sets the score to 0."""
+    jd = JD.model_copy(update={"deal_breakers": ["Must have Kubernetes", "Go"]})
+
+    fit = scorer.score_fit(jd, STRONG)
+
+    assert fit.overall_score == 0
+    assert fit.deal_breakers_found == ["Go"]
+    assert fit.final_recommendation == "No Fit"
+    assert fit.score_breakdown.hard_skills == 40  # breakdown is kept
+
+
+def test_years_overlap_counted_once():
+    """Test overlapping jobs do not add up to more years than they span."""
+    resume = ResumeReview(
+        work_experience=[
+            WorkExperience(job_title="Engineer", duration="2015 - 2019"),
+            WorkExperience(job_title="Consultant", duration="2017 - 2020"),
+            WorkExperience(job_title="Engineer", duration="2 years"),
+        ]
+    )
+
+    assert scorer._years_of_experience(resume) == 7
+
+
+def test_unstated_requirements_get_full_points():
+    """Test categories the JD does not state are not held against the candidate."""
+    jd = JobDescriptionAnalysis(role_title="Engineer", technical_skills=["Go"])
+
+    fit = scorer.score_fit(jd, WEAK)
+
+    assert fit.score_breakdown.hard_skills == 0
+    assert fit.score_breakdown.experience == 30
+    assert fit.score_breakdown.education == 10
+    assert fit.score_breakdown.soft_skills == 20
+    assert fit.data_sufficiency == "Medium"
+
+
+@pytest.mark.asyncio
+async def test_narrated_reasoning_keeps_scores(monkeypatch):
+    """Test the LLM only replaces the reasoning trace."""
+
+    class FakeInference:
+        async def chat(self, messages):
+            assert "Senior Backend Engineer" in messages[-1].content
+            return "Jane meets every requirement."
+
+    monkeypatch.setattr(scorer, "Inference", FakeInference)
+    fit = scorer.score_fit(JD, STRONG)
+
+    narrated = await scorer.narrate_reasoning(JD, STRONG, fit)
+
+    assert narrated.reasoning_trace == "Jane meets every requirement."
+    assert narrated.model_dump(exclude={"reasoning_trace"}) == fit.model_dump(
+        exclude={"reasoning_trace"}
+    )
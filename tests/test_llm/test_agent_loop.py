@@ -0,0 +1,119 @@
+"""Tests for the tool-calling agent loop shared by the inference engines."""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    ToolMessage,
+)
+
+from llm.base.inference import BaseInference
+from utils.app_config import AppConfig
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_text(self, text: str):
+        self.sent.append(text)
+
+
+class ScriptedModel:
+    """Streams one scripted turn per call: text, or a call to a tool."""
+
+    def __init__(self, turns: list[str | tuple[str, str]]):
+        self.turns = turns
+        self.calls: list[list] = []
+
+    async def astream(self, messages, config=None):
+        self.calls.append(list(messages))
+        turn = self.turns[min(len(self.calls), len(self.turns)) - 1]
+        if isinstance(turn, str):
+            yield AIMessageChunk(content=turn)
+            return
+
+        name, args = turn
+        tool_id = f"call_{len(self.calls)}"
+        yield AIMessageChunk(
+            content="",
+            tool_call_chunks=[{"name": name, "id": tool_id, "args": "", "index": 0}],
+        )
+        yield AIMessageChunk(
+            content="",
+            tool_call_chunks=[{"name": None, "id": None, "args": args, "index": 0}],
+        )
+
+
+def engine(model: ScriptedModel, **agent) -> BaseInference:
+    config = AppConfig()
+    for name, value in agent.items():
+        setattr(config.inference.agent, name, value)
+
+    async def handler(tool_id: str, tool_name: str, args: str) -> ToolMessage:
+        await asyncio.sleep(0.05)
+        return ToolMessage(tool_call_id=tool_id, content=f"{tool_name} {args}")
+
+    return BaseInference(config).bound_tools(model).tools_handler(handler)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_loop_runs_tools_then_streams_answer():
+    """Test tool results are appended to one buffer and the answer is streamed."""
+    model = ScriptedModel([("get_layoffs", '{"company": "Acme"}'), "No layoffs."])
+    websocket = FakeWebSocket()
+    history = [HumanMessage(content="Any layoffs at Acme?")]
+
+    response = await engine(model).stream(websocket, history)
+
+    assert response == "No layoffs."
+    assert websocket.sent == ["No layoffs."]
+    assert len(history) == 1
+    second_call = model.calls[1]
+    assert isinstance(second_call[1], AIMessage)
+    assert second_call[1].tool_calls[0]["args"] == {"company": "Acme"}
+    assert second_call[2].content == 'get_layoffs {"company": "Acme"}'
+
+
+@pytest.mark.asyncio
+async def test_loop_reports_new_messages():
+    """Test the tool turn, its results and the answer are handed back."""
+    model = ScriptedModel([("get_layoffs", "{}"), "No layoffs."])
+    new_messages = []
+
+    await engine(model).stream(
+        FakeWebSocket(), [HumanMessage(content="Layoffs?")], new_messages
+    )
+
+    assert [type(message) for message in new_messages] == [
+        AIMessage,
+        ToolMessage,
+        AIMessage,
+    ]
+    assert new_messages[-1].content == "No layoffs."
+
+
+@pytest.mark.asyncio
+async def test_loop_stops_at_max_depth():
+    """Test a model that keeps calling tools is called max_depth times."""
+    model = ScriptedModel([("get_news", "{}")])
+
+    await engine(model, max_depth=3).stream(FakeWebSocket(), [])
+
+    assert len(model.calls) == 3
+    assert len(model.calls[-1]) == 4
+
+
+@pytest.mark.asyncio
+async def test_loop_stops_when_budget_is_spent():
+    """Test no turn starts after the wall-clock budget is spent."""
+    model = ScriptedModel([("get_news", "{}")])
+
+    await engine(model, max_depth=10, turn_budget_seconds=0.08).stream(
+        FakeWebSocket(), []
+    )
+
+    assert len(model.calls) == 2
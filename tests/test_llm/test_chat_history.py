@@ -0,0 +1,123 @@
+"""Tests for the token-budgeted chat history."""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from llm import chat_history as chat_history_module
+from llm.chat_history import TRUNCATED_TOOL_OUTPUT, ChatHistory, message_tokens
+from utils.app_config import AppConfig, ChatHistoryConfig
+from utils.token_counter import count_tokens
+
+WORDS = " ".join(f"word{i}" for i in range(200))
+
+
+def history(max_tokens: int = 10_000, **config) -> ChatHistory:
+    return ChatHistory(
+        "You are a helpful assistant.", max_tokens, ChatHistoryConfig(**config)
+    )
+
+
+def answer(text: str) -> list:
+    return [
+        AIMessage(
+            content="",
+            tool_calls=[{"id": "call_1", "name": "search", "args": {"q": "x"}}],
+        ),
+        ToolMessage(tool_call_id="call_1", content=WORDS),
+        AIMessage(content=text),
+    ]
+
+
+def test_budget_leaves_room_for_the_response():
+    """Test the budget is the context window less the response and reserve."""
+    app_config = AppConfig()
+    model = app_config.inference.active_config()
+    model.context_window, model.max_tokens = 16_000, 2_000
+
+    assert ChatHistory.budget(app_config) == 16_000 - 2_000 - 1024
+
+    model.context_window, model.max_tokens = 4096, 4096  # response capped at half
+    assert ChatHistory.budget(app_config) == 4096 - 2048 - 1024
+
+    app_config.inference.chat_history.max_tokens = 3000
+    assert ChatHistory.budget(app_config) == 3000
+
+
+def test_consumed_tool_output_is_truncated():
+    """Test tool results are cut once the turn is answered, keeping call pairing."""
+    chat = history(tool_output_tokens=20, summarize=False)
+    chat.add_user_message("Search something")
+    chat.add_messages(answer("Found it."))
+
+    messages = chat.messages()
+
+    assert [type(m) for m in messages] == [
+        SystemMessage,
+        HumanMessage,
+        AIMessage,
+        ToolMessage,
+        AIMessage,
+    ]
+    assert messages[3].tool_call_id == "call_1"
+    assert messages[3].content.endswith(TRUNCATED_TOOL_OUTPUT)
+    assert count_tokens(messages[3].content) < count_tokens(WORDS)
+    assert chat.token_count == sum(message_tokens(m) for m in messages)
+
+
+def test_compact_drops_oldest_whole_turns():
+    """Test the oldest turns leave first and the latest turn always stays."""
+    chat = history(max_tokens=0, summarize=False)
+    chat.add_user_message("first", document_ids=["resume-1"])
+    chat.add_messages(answer("one"))
+    chat.add_user_message("second")
+    chat.add_messages(answer("two"))
+    chat.add_user_message("third", document_ids=["jd-1"])
+
+    forgotten = chat.compact()
+
+    assert forgotten == {"resume-1"}
+    assert [m.content for m in chat.messages()[1:]] == ["third"]
+
+
+def test_compact_keeps_history_under_budget():
+    """Test a long conversation stays under its budget."""
+    chat = history(max_tokens=600, tool_output_tokens=30, summarize=False)
+
+    for turn in range(20):
+        chat.add_user_message(f"question {turn}")
+        chat.add_messages(answer(f"answer {turn}"))
+        chat.compact()
+        assert chat.token_count <= 600
+
+    assert chat.messages()[-1].content == "answer 19"
+    assert isinstance(chat.messages()[1], HumanMessage)
+
+
+@pytest.mark.asyncio
+async def test_dropped_turns_are_summarized_in_background(monkeypatch):
+    """Test dropped turns are summarized into the system prompt without blocking."""
+    prompts = []
+
+    class FakeInference:
+        async def chat(self, messages):
+            prompts.append(messages[-1].content)
+            await asyncio.sleep(0.01)
+            return f"Summary {len(prompts)}"
+
+    monkeypatch.setattr(chat_history_module, "Inference", FakeInference)
+    chat = history(max_tokens=0)
+    chat.add_user_message("My name is Ada")
+    chat.add_messages([AIMessage(content="Hi Ada")])
+    chat.add_user_message("What is my name?")
+
+    chat.compact()
+    assert chat.summary == ""  # compacting does not wait for the summary
+
+    await chat.wait_for_summary()
+
+    assert "User: My name is Ada" in prompts[0]
+    assert "Assistant: Hi Ada" in prompts[0]
+    assert chat.summarized_turns == 1
+    assert chat.messages()[0].content.endswith("Summary 1")
@@ -0,0 +1,75 @@
+"""Tests for the process-wide pool of LLM clients."""
+
+import pytest
+from langchain_core.tools import tool
+
+from llm.inference import InferenceRegistry
+from utils.app_config import AppConfig, InferenceEngine, InferencePoolConfig
+
+
+@tool
+def lookup_salary(role: str) -> str:
+    """Look up the salary range of a role."""
+    return role
+
+
+@tool
+def lookup_layoffs(company: str) -> str:
+    """Look up recent layoffs at a company."""
+    return company
+
+
+def openai_config(model: str = "gpt-test") -> AppConfig:
+    config = AppConfig()
+    config.inference.inference_engine = InferenceEngine.OPENAI
+    config.inference.inference_config.openai.model = model
+    return config
+
+
+@pytest.fixture(autouse=True)
+def openai_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_KEY", "test-key")
+
+
+@pytest.mark.asyncio
+async def test_engines_share_one_client_per_model():
+    """Test requests get their own engine around a single pooled client."""
+    registry = InferenceRegistry(InferencePoolConfig())
+
+    first = registry.engine(openai_config())
+    second = registry.engine(openai_config())
+    other_model = registry.engine(openai_config("gpt-other"))
+
+    assert first is not second
+    assert first.get_llm() is second.get_llm()
+    assert other_model.get_llm() is not first.get_llm()
+    assert first.get_llm().http_async_client is other_model.get_llm().http_async_client
+
+    await registry.aclose()
+    assert first.get_llm().http_async_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_tool_bindings_are_cached_per_tool_set():
+    """Test binding the same tools to the same client happens once."""
+    registry = InferenceRegistry(InferencePoolConfig())
+    llm = registry.client(openai_config())
+
+    binding = registry.bind_tools(llm, [lookup_salary, lookup_layoffs])
+
+    assert registry.bind_tools(llm, [lookup_salary, lookup_layoffs]) is binding
+    assert registry.bind_tools(llm, [lookup_salary]) is not binding
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_tolerates_unreachable_endpoint():
+    """Test warm-up creates the client and logs instead of failing offline."""
+    config = openai_config()
+    config.inference.inference_config.openai.api_base = "http://127.0.0.1:9/v1"
+    registry = InferenceRegistry(InferencePoolConfig())
+
+    await registry.warm_up(config)
+
+    assert registry.client(config) is registry.client(config)
+    await registry.aclose()
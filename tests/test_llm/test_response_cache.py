@@ -0,0 +1,116 @@
+"""Tests for the LLM response cache and its use by the analysis APIs."""
+
+import pytest
+
+from llm.response_cache import ResponseCache
+from job_analyzer.external_api import llm_analysis
+
+JD_RESPONSE = (
+    '{"role_title": "Senior Python Developer", "technical_skills": ["Python"]}'
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3", 2, 3)
+    yield cache
+    cache.close()
+
+
+def key(prompt: str, version: str = "1", temperature: float = 0.0) -> str:
+    return ResponseCache.make_key(
+        "jd_analysis", version, "gpt-test", temperature, prompt
+    )
+
+
+def test_memory_tier_is_checked_before_disk(cache):
+    """Test a fresh entry is served from memory, an evicted one from SQLite."""
+    for prompt in ("a", "b", "c"):
+        cache.put(key(prompt), prompt.upper())
+
+    assert cache.get(key("c")) == "C"
+    assert cache.get(key("a")) == "A"
+    assert cache.get(key("missing")) is None
+    assert (cache.memory_hits, cache.disk_hits, cache.misses) == (1, 1, 1)
+    assert cache.hit_rate == pytest.approx(2 / 3)
+
+
+def test_disk_tier_survives_restart_and_is_bounded(tmp_path, cache):
+    """Test entries persist across instances, keeping the most recently used."""
+    for prompt in ("a", "b", "c", "d"):
+        cache.put(key(prompt), prompt.upper())
+
+    reopened = ResponseCache(tmp_path / "responses.sqlite3", 2, 3)
+    try:
+        assert reopened.get(key("a")) is None
+        assert reopened.get(key("d")) == "D"
+        assert reopened.stats()["disk_entries"] == 3
+    finally:
+        reopened.close()
+
+
+def test_key_covers_template_version_and_model_settings():
+    """Test any change to the version, temperature or prompt changes the key."""
+    keys = {key("jd"), key("jd", version="2"), key("jd", temperature=0.7), key("jd ")}
+
+    assert len(keys) == 4
+
+
+@pytest.mark.asyncio
+async def test_analysis_hit_skips_the_llm(monkeypatch, cache):
+    """Test a repeated analysis is answered from the cache unless bypassed."""
+    calls = []
+
+    async def fake_call(prompt):
+        calls.append(prompt)
+        return JD_RESPONSE
+
+    monkeypatch.setattr(llm_analysis, "_call_llm_for_analysis", fake_call)
+    monkeypatch.setattr(llm_analysis, "get_response_cache", lambda: cache)
+
+    first = await llm_analysis.analyze_job_description_api("Senior Python Developer")
+    second = await llm_analysis.analyze_job_description_api("Senior Python Developer")
+    assert len(calls) == 1
+    assert second == first
+
+    await llm_analysis.analyze_job_description_api(
+        "Senior Python Developer", bypass_cache=True
+    )
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unparseable_responses_are_not_cached(monkeypatch, cache):
+    """Test a response without JSON is retried on the next call."""
+    calls = []
+
+    async def fake_call(prompt):
+        calls.append(prompt)
+        return "Sorry, I cannot help with that."
+
+    monkeypatch.setattr(llm_analysis, "_call_llm_for_analysis", fake_call)
+    monkeypatch.setattr(llm_analysis, "get_response_cache", lambda: cache)
+
+    await llm_analysis.review_resume_api("Jane Doe, Python developer")
+    await llm_analysis.review_resume_api("Jane Doe, Python developer")
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_responses_are_not_cached(monkeypatch, cache):
+    """Test JSON that does not match the analysis schema is retried next call."""
+    calls = []
+
+    async def fake_call(prompt):
+        calls.append(prompt)
+        return '{"overall_score": "high"}'
+
+    monkeypatch.setattr(llm_analysis, "_call_llm_for_analysis", fake_call)
+    monkeypatch.setattr(llm_analysis, "get_response_cache", lambda: cache)
+
+    first = await llm_analysis.calculate_fit_score_api("Python", "Python")
+    await llm_analysis.calculate_fit_score_api("Python", "Python")
+
+    assert first.overall_score == 0
+    assert len(calls) == 2
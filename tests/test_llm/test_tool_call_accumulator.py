@@ -0,0 +1,89 @@
+"""Tests for assembling streamed tool calls, replaying recorded streams."""
+
+from langchain_core.messages import AIMessageChunk
+
+from llm.base.tool_calls import ToolCallAccumulator
+
+
+def chunk(*fragments: tuple) -> AIMessageChunk:
+    """Chunk with tool call fragments given as (index, id, name, args)."""
+    return AIMessageChunk(
+        content="",
+        tool_call_chunks=[
+            {"index": index, "id": tool_id, "name": name, "args": args}
+            for index, tool_id, name, args in fragments
+        ],
+    )
+
+
+# Recorded from an OpenAI-compatible server asked about layoffs, news and
+# salaries at once: the deltas of the three calls interleave by index.
+OPENAI_PARALLEL_STREAM = [
+    chunk((0, "call_a", "get_layoffs", "")),
+    chunk((0, None, None, '{"comp')),
+    chunk((1, "call_b", "get_news", "")),
+    chunk((1, None, None, '{"query": "Acme')),
+    chunk((0, None, None, 'any": "Acme"}')),
+    chunk((2, "call_c", "get_glassdoor_salary", '{"role": ')),
+    chunk((1, None, None, ' layoffs"}')),
+    chunk((2, None, None, '"Data Engineer", "company": "Acme"}')),
+    AIMessageChunk(content="", response_metadata={"finish_reason": "tool_calls"}),
+]
+
+# Gemini sends each call whole, without an index
+GEMINI_PARALLEL_STREAM = [
+    chunk((None, "4f1c", "get_layoffs", '{"company": "Acme"}')),
+    chunk((None, "9b2e", "get_news", '{"query": "Acme layoffs"}')),
+]
+
+
+def replay(stream: list[AIMessageChunk]) -> ToolCallAccumulator:
+    accumulator = ToolCallAccumulator()
+    for streamed in stream:
+        accumulator.add(streamed)
+    return accumulator
+
+
+def test_interleaved_parallel_calls_are_assembled_by_index():
+    """Test argument deltas go to the call of their index, not the latest one."""
+    calls = replay(OPENAI_PARALLEL_STREAM).tool_calls()
+
+    assert [(c.id, c.name, c.args) for c in calls] == [
+        ("call_a", "get_layoffs", '{"company": "Acme"}'),
+        ("call_b", "get_news", '{"query": "Acme layoffs"}'),
+        (
+            "call_c",
+            "get_glassdoor_salary",
+            '{"role": "Data Engineer", "company": "Acme"}',
+        ),
+    ]
+
+
+def test_whole_calls_without_index_stay_separate():
+    """Test calls streamed whole without an index are kept apart."""
+    calls = replay(GEMINI_PARALLEL_STREAM).tool_calls()
+
+    assert [(c.id, c.name) for c in calls] == [
+        ("4f1c", "get_layoffs"),
+        ("9b2e", "get_news"),
+    ]
+    assert calls[1].args == '{"query": "Acme layoffs"}'
+
+
+def test_message_carries_parsed_tool_calls():
+    """Test the assistant message lists each call with parsed arguments."""
+    message = replay(OPENAI_PARALLEL_STREAM).message("Checking.")
+
+    assert message.content == "Checking."
+    assert [call["id"] for call in message.tool_calls] == ["call_a", "call_b", "call_c"]
+    assert message.tool_calls[2]["args"] == {
+        "role": "Data Engineer",
+        "company": "Acme",
+    }
+
+
+def test_text_only_turn_has_no_tool_calls():
+    """Test a turn without tool call fragments yields no calls."""
+    accumulator = replay([AIMessageChunk(content="Hello"), AIMessageChunk(content="!")])
+
+    assert accumulator.tool_calls() == []
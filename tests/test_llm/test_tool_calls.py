@@ -0,0 +1,72 @@
+"""Tests for running the tool calls of a model turn."""
+
+import time
+import asyncio
+
+import pytest
+from langchain_core.messages import ToolMessage
+
+from llm.base.inference import BaseInference
+from utils.app_config import AgentConfig, AppConfig
+
+
+def engine_with_handler(delays: dict[str, float]) -> BaseInference:
+    async def handler(tool_id: str, tool_name: str, args: str) -> ToolMessage:
+        if tool_name == "broken":
+            raise RuntimeError("service down")
+        await asyncio.sleep(delays.get(tool_name, 0))
+        return ToolMessage(tool_call_id=tool_id, content=f"{tool_name}:{args}")
+
+    engine = BaseInference(AppConfig())
+    engine.function_call_handler = handler
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently_in_order():
+    """Test a turn costs the slowest call, and results keep the call order."""
+    engine = engine_with_handler({"layoffs": 0.2, "news": 0.1, "salary": 0.05})
+    calls = [("1", "layoffs", "{}"), ("2", "news", "{}"), ("3", "salary", "{}")]
+
+    started = time.perf_counter()
+    messages = await engine.call_tools(calls, AgentConfig())
+    elapsed = time.perf_counter() - started
+
+    assert [m.tool_call_id for m in messages] == ["1", "2", "3"]
+    assert [m.content for m in messages] == ["layoffs:{}", "news:{}", "salary:{}"]
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_respect_concurrency_cap():
+    """Test at most max_parallel_tool_calls calls run at a time."""
+    running = peak = 0
+
+    async def handler(tool_id: str, tool_name: str, args: str) -> ToolMessage:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return ToolMessage(tool_call_id=tool_id, content="ok")
+
+    engine = BaseInference(AppConfig())
+    engine.function_call_handler = handler
+
+    calls = [(str(i), "news", "{}") for i in range(6)]
+    await engine.call_tools(calls, AgentConfig(max_parallel_tool_calls=2))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_and_slow_tool_calls_become_errors():
+    """Test a failing or timed out call yields an error message, not a failed turn."""
+    engine = engine_with_handler({"slow": 1.0})
+    calls = [("1", "broken", "{}"), ("2", "slow", "{}"), ("3", "news", "{}")]
+
+    messages = await engine.call_tools(calls, AgentConfig(tool_timeout_seconds=0.05))
+
+    assert [m.status for m in messages] == ["error", "error", "success"]
+    assert "service down" in messages[0].content
+    assert "timed out" in messages[1].content
@@ -0,0 +1,61 @@
+"""Tests for the in-memory embedding index."""
+
+import unittest
+
+import numpy as np
+
+from job_analyzer.retrieval.index import EmbeddingIndex
+
+
+class TestEmbeddingIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = EmbeddingIndex(ann_enabled=False)
+        self.rng = np.random.default_rng(7)
+
+    def test_search_matches_exhaustive_ranking(self):
+        """Test top-k results equal a full sort of cosine similarities."""
+        vectors = self.rng.normal(size=(200, 16)).astype(np.float32)
+        self.index.add("doc", [f"doc:{i}" for i in range(200)], vectors)
+        query = self.rng.normal(size=16).astype(np.float32)
+
+        results = self.index.search(query, k=5)
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        scores = normalized @ (query / np.linalg.norm(query))
+        expected = [f"doc:{i}" for i in np.argsort(-scores)[:5]]
+        self.assertEqual([key for key, _ in results], expected)
+        self.assertAlmostEqual(results[0][1], float(scores.max()), places=5)
+
+    def test_search_limited_to_owners(self):
+        """Test searches only return vectors of the requested owners."""
+        self.index.add("a", ["a:0", "a:1"], self.rng.normal(size=(2, 8)))
+        self.index.add("b", ["b:0", "b:1", "b:2"], self.rng.normal(size=(3, 8)))
+
+        results = self.index.search(self.rng.normal(size=8), k=10, owners=["b"])
+
+        self.assertEqual(sorted(key for key, _ in results), ["b:0", "b:1", "b:2"])
+        self.assertEqual(self.index.search(np.ones(8), k=3, owners=["c"]), [])
+
+    def test_remove_and_replace(self):
+        """Test removing an owner compacts the index and re-adding replaces vectors."""
+        self.index.add("a", ["a:0"], np.eye(4)[[0]])
+        self.index.add("b", ["b:0", "b:1"], np.eye(4)[[1, 2]])
+
+        self.assertEqual(self.index.remove("a"), 1)
+        self.assertEqual(len(self.index), 2)
+        self.assertFalse(self.index.contains("a"))
+        self.assertEqual(self.index.search(np.eye(4)[2], k=1)[0][0], "b:1")
+
+        self.index.add("b", ["b:0"], np.eye(4)[[3]])
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.search(np.eye(4)[3], k=2), [("b:0", 1.0)])
+
+    def test_dimension_mismatch(self):
+        """Test vectors of another dimension are rejected."""
+        self.index.add("a", ["a:0"], np.ones((1, 4)))
+        with self.assertRaises(ValueError):
+            self.index.add("b", ["b:0"], np.ones((1, 5)))
+
+
+if __name__ == "__main__":
+    unittest.main()
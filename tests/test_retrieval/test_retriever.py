@@ -0,0 +1,246 @@
+"""Tests for document chunking and retrieval."""
+
+import json
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from llm.embedding import HashingEmbedder
+from utils.app_config import RetrievalConfig
+from job_analyzer.document_storage.models import UploadedDocument
+from job_analyzer.retrieval.chunker import chunk_text
+from job_analyzer.retrieval.index import EmbeddingIndex
+from job_analyzer.retrieval.retriever import DocumentRetriever
+
+SECTIONS = {
+    "experience": "Senior engineer at Acme building Kafka streaming pipelines and Spark jobs.",
+    "education": "Master of Science in Computer Science from State University, 2015.",
+    "certifications": "AWS Certified Solutions Architect and Certified Kubernetes Administrator.",
+    "volunteering": "Taught weekend coding classes at the community library.",
+}
+
+
+def make_document(text: str) -> UploadedDocument:
+    return UploadedDocument(
+        id="doc-1",
+        file_hash="hash-1",
+        original_filename="resume.txt",
+        file_type="resume",
+        file_format="txt",
+        extracted_text=text,
+    )
+
+
+def long_resume() -> str:
+    filler = "Collaborated with cross functional teams on quarterly planning."
+    return "\n\n".join(
+        f"{name.upper()}\n{body}\n" + "\n".join([filler] * 12)
+        for name, body in SECTIONS.items()
+    )
+
+
+def test_chunk_text_overlaps_previous_chunk():
+    """Test chunks are bounded and start with the tail of the previous chunk."""
+    text = "\n\n".join(f"Paragraph {i} " + "word " * 40 for i in range(6))
+    chunks = chunk_text("doc", text, chunk_tokens=60, overlap_tokens=10)
+
+    assert len(chunks) > 1
+    assert [c.index for c in chunks] == list(range(len(chunks)))
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.text.split("\n")[0].split()[-1] == previous.text.split()[-1]
+        assert chunk.token_count <= 60 + 10 + 2
+
+
+@pytest.mark.asyncio
+async def test_long_document_context_is_relevant_chunks():
+    """Test only the chunks matching the question are sent for long documents."""
+    config = RetrievalConfig(
+        chunk_tokens=120, chunk_overlap_tokens=0, top_k=1, full_text_max_tokens=100
+    )
+    retriever = DocumentRetriever(HashingEmbedder(), EmbeddingIndex(), config)
+    document = make_document(long_resume())
+
+    context = await retriever.document_context(
+        "Which cloud certifications like AWS or Kubernetes does the candidate hold?",
+        document,
+    )
+
+    assert SECTIONS["certifications"] in context
+    assert SECTIONS["education"] not in context
+    assert len(context) < len(document.extracted_text) / 2
+
+    retriever.remove_document(document)
+    assert len(retriever.index) == 0
+
+
+@pytest.mark.asyncio
+async def test_short_document_is_sent_whole():
+    """Test documents under the full text limit skip retrieval."""
+    retriever = DocumentRetriever(
+        HashingEmbedder(), EmbeddingIndex(), RetrievalConfig(full_text_max_tokens=1000)
+    )
+    document = make_document(SECTIONS["education"])
+
+    context = await retriever.document_context("education?", document)
+
+    assert context == document.extracted_text
+    assert len(retriever.index) == 0
+
+
+@pytest.mark.asyncio
+async def test_stored_vectors_are_reused_by_other_workers(tmp_path):
+    """Test a retriever sharing the on-disk store does not re-embed a document."""
+    from job_analyzer.retrieval.vector_store import MmapVectorStore
+
+    class CountingEmbedder(HashingEmbedder):
+        calls = 0
+
+        async def aembed_documents(self, texts):
+            CountingEmbedder.calls += 1
+            return await super().aembed_documents(texts)
+
+    config = RetrievalConfig(chunk_tokens=120, top_k=1, full_text_max_tokens=100)
+    document = make_document(long_resume())
+    query = "Which AWS or Kubernetes certifications does the candidate hold?"
+
+    first = DocumentRetriever(CountingEmbedder(), MmapVectorStore(tmp_path), config)
+    second = DocumentRetriever(CountingEmbedder(), MmapVectorStore(tmp_path), config)
+
+    assert await first.document_context(query, document) == (
+        await second.document_context(query, document)
+    )
+    assert CountingEmbedder.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_new_document_context_skips_what_was_sent(monkeypatch):
+    """Test a conversation receives each document, or each chunk, only once."""
+    from job_analyzer.retrieval import retriever as retriever_module
+
+    config = RetrievalConfig(
+        chunk_tokens=120, chunk_overlap_tokens=0, top_k=1, full_text_max_tokens=100
+    )
+    monkeypatch.setattr(
+        retriever_module,
+        "_document_retriever",
+        DocumentRetriever(HashingEmbedder(), EmbeddingIndex(), config),
+    )
+    certifications = "Which AWS or Kubernetes certifications does the candidate hold?"
+    education = "Did the candidate study a Master of Science at State University?"
+
+    sent: set[int] = set()
+    document = make_document(long_resume())
+    first = await retriever_module.retrieve_new_document_context(
+        certifications, document, sent
+    )
+    repeated = await retriever_module.retrieve_new_document_context(
+        certifications, document, sent
+    )
+    follow_up = await retriever_module.retrieve_new_document_context(
+        education, document, sent
+    )
+
+    assert SECTIONS["certifications"] in first
+    assert repeated is None
+    assert SECTIONS["education"] in follow_up
+    assert SECTIONS["certifications"] not in follow_up
+    assert len(sent) == 2
+
+    sent = set()
+    short = make_document(SECTIONS["education"])
+    whole = await retriever_module.retrieve_new_document_context(education, short, sent)
+    again = await retriever_module.retrieve_new_document_context(education, short, sent)
+
+    assert whole == short.extracted_text
+    assert again is None
+    assert sent == {retriever_module.WHOLE_DOCUMENT}
+
+
+@pytest_asyncio.fixture
+async def summarizing_document(monkeypatch):
+    """A long stored document whose background summary does not finish."""
+    from job_analyzer.document_storage import document_manager
+    from job_analyzer.retrieval import retriever as retriever_module
+
+    release_summary = asyncio.Event()
+
+    async def slow_summary(text, doc_type="document"):
+        await release_summary.wait()
+        return "short summary"
+
+    monkeypatch.setattr(document_manager, "get_extraction_cache", lambda: None)
+    monkeypatch.setattr(
+        document_manager, "needs_summarization", lambda text, **kwargs: True
+    )
+    monkeypatch.setattr(document_manager, "prepare_document_for_analysis", slow_summary)
+    config = RetrievalConfig(
+        chunk_tokens=120,
+        chunk_overlap_tokens=0,
+        top_k=1,
+        full_text_max_tokens=100,
+        summary_wait_seconds=0.05,
+    )
+    monkeypatch.setattr(
+        retriever_module,
+        "_document_retriever",
+        DocumentRetriever(HashingEmbedder(), EmbeddingIndex(), config),
+    )
+    document = await document_manager.save_text_document(
+        long_resume(), doc_type="resume"
+    )
+
+    yield document, config
+
+    release_summary.set()
+    await document_manager.get_ready_document(document.id)
+    document_manager.delete_document(document.id)
+
+
+@pytest.mark.asyncio
+async def test_document_tool_does_not_wait_for_summary(summarizing_document):
+    """Test a query is answered from chunks while the summary is still running."""
+    from llm.tools.document_tools import document_retrieval_call_handler
+
+    document, config = summarizing_document
+
+    async def tool_content(query: str) -> str:
+        message = await asyncio.wait_for(
+            document_retrieval_call_handler(
+                "call_1",
+                "get_uploaded_document_tool",
+                json.dumps({"document_id": document.id, "query": query}),
+            ),
+            timeout=1,
+        )
+        return json.loads(message.content)["content"]
+
+    content = await tool_content("Which AWS certifications does the candidate hold?")
+    assert SECTIONS["certifications"] in content
+    assert document.status == "summarizing"
+
+    # Sent whole, the document waits for its summary only a bounded time
+    config.enabled = False
+    assert await tool_content("Anything?") == document.extracted_text
+
+
+@pytest.mark.asyncio
+async def test_chat_attachment_does_not_wait_for_summary(
+    monkeypatch, summarizing_document
+):
+    """Test a chat message with an attached document is not held by its summary."""
+    pytest.importorskip("aiosqlite")
+    monkeypatch.setenv("LAYOFF_DB_URL", "sqlite+aiosqlite://")
+    from routes.router_helper import ConnectionManager
+
+    document, _ = summarizing_document
+    question = "Which AWS certifications does the candidate hold?"
+
+    message = await asyncio.wait_for(
+        ConnectionManager().attach_documents(object(), question, resume_id=document.id),
+        timeout=1,
+    )
+
+    assert message.startswith("[RESUME CONTENT]")
+    assert SECTIONS["certifications"] in message
+    assert message.endswith(question)
@@ -0,0 +1,106 @@
+"""Tests for the memory-mapped vector store."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from job_analyzer.retrieval.vector_store import MmapVectorStore
+
+
+class TestMmapVectorStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "store"
+        self.rng = np.random.default_rng(11)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_search_matches_exhaustive_ranking(self):
+        """Test top-k results equal a full sort of cosine similarities."""
+        store = MmapVectorStore(self.path)
+        vectors = self.rng.normal(size=(300, 32)).astype(np.float32)
+        store.add("a", [f"a:{i}" for i in range(150)], vectors[:150])
+        store.add("b", [f"b:{i}" for i in range(150)], vectors[150:])
+        query = self.rng.normal(size=32)
+
+        results = store.search(query, k=7)
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        order = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:7]
+        expected = [f"a:{i}" if i < 150 else f"b:{i - 150}" for i in order]
+        self.assertEqual([key for key, _ in results], expected)
+        self.assertTrue(
+            all(key.startswith("b:") for key, _ in store.search(query, 5, ["b"]))
+        )
+
+    def test_persists_and_shares_between_instances(self):
+        """Test a second instance (another worker) sees the first one's writes."""
+        writer = MmapVectorStore(self.path)
+        reader = MmapVectorStore(self.path)
+
+        writer.add("a", ["a:0", "a:1"], np.eye(3)[[0, 1]])
+        self.assertTrue(reader.contains("a"))
+        self.assertEqual(reader.search(np.eye(3)[1], k=1)[0][0], "a:1")
+
+        reader.add("b", ["b:0"], np.eye(3)[[2]])
+        writer.remove("a")
+
+        reopened = MmapVectorStore(self.path)
+        self.assertEqual(len(reopened), 1)
+        self.assertEqual(reopened.search(np.ones(3), k=5)[0][0], "b:0")
+        self.assertEqual(reopened.dimension, 3)
+
+    def test_failed_log_write_does_not_shift_rows(self):
+        """Test vector bytes of a failed add do not shift the rows added after it."""
+        store = MmapVectorStore(self.path)
+        store.add("a", ["a0"], np.eye(3)[[0]])
+        append_log = store._append_log
+
+        def fail_midway(records):
+            with open(store._log_path(), "a", encoding="utf-8") as f:
+                f.write('{"op": "add", "ke')
+            raise OSError("disk full")
+
+        store._append_log = fail_midway
+        with self.assertRaises(OSError):
+            store.add("b", ["b0"], np.eye(3)[[1]])
+        store._append_log = append_log
+
+        store.add("c", ["c0"], np.eye(3)[[2]])
+
+        key, score = store.search(np.eye(3)[2], k=1)[0]
+        self.assertEqual(key, "c0")
+        self.assertAlmostEqual(score, 1.0, places=5)
+        self.assertEqual(len(MmapVectorStore(self.path)), 2)
+
+    def test_replace_and_compaction(self):
+        """Test deletes are compacted away without changing search results."""
+        store = MmapVectorStore(
+            self.path, compact_min_dead_ratio=0.5, compact_min_rows=4
+        )
+        other = MmapVectorStore(self.path)
+
+        for owner in "abcd":
+            store.add(owner, [f"{owner}:0"], self.rng.normal(size=(1, 8)))
+        store.add("a", ["a:0", "a:1"], np.eye(8)[[0, 1]])  # replace
+        store.remove("b")
+        store.remove("c")  # 3 dead of 6 rows: compacts
+
+        self.assertEqual(len(store), 3)
+        self.assertEqual(len(list(self.path.glob("vectors-*.f32"))), 1)
+        self.assertEqual(other.search(np.eye(8)[1], k=1)[0], ("a:1", 1.0))
+        self.assertEqual(len(other), 3)
+
+    def test_dimension_mismatch(self):
+        """Test vectors of another dimension are rejected."""
+        store = MmapVectorStore(self.path)
+        store.add("a", ["a:0"], np.ones((1, 4)))
+        with self.assertRaises(ValueError):
+            store.add("b", ["b:0"], np.ones((1, 5)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 import os
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
-from utils.app_config import AppConfig, LogLevel
+import utils.app_config as app_config_module
+from utils.app_config import AppConfig, LogLevel, get_app_config
 
 
 class TestAppConfig(TestCase):
@@ -41,3 +43,16 @@ class TestAppConfig(TestCase):
         self.assertEqual(loaded_config.app_setting.app_name, "Test App")
 
         os.remove(test_config_path)
+
+    def test_get_app_config_loads_once(self):
+        """Test the shared configuration is read from disk only once."""
+        with (
+            patch.object(app_config_module, "_app_config", None),
+            patch.object(
+                AppConfig, "load_default", return_value=self.app_config
+            ) as load_default,
+        ):
+            self.assertIs(get_app_config(), self.app_config)
+            self.assertIs(get_app_config(), self.app_config)
+
+        load_default.assert_called_once()
@@ -118,3 +118,160 @@ async def test_unsupported_format():
 
     test_file.unlink()  # Clean up
     print("Unsupported format handling works")
+
+
+def test_docx_extractor_preserves_document_order(tmp_path):
+    """Test paragraphs and tables are extracted in document order."""
+    from docx import Document
+
+    doc = Document()
+    doc.add_paragraph("Experience")
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Company"
+    table.cell(0, 1).text = "Role"
+    table.cell(1, 0).text = "Acme"
+    table.cell(1, 1).text = "Engineer"
+    doc.add_paragraph("Education")
+    docx_path = tmp_path / "ordered.docx"
+    doc.save(str(docx_path))
+
+    text = extract_text_from_docx(docx_path)
+
+    assert text.split("\n\n") == [
+        "Experience",
+        "Company | Role",
+        "Acme | Engineer",
+        "Education",
+    ]
+
+
+def test_docx_extractor_rejects_invalid_archive(tmp_path):
+    """Test a file that is not a DOCX archive raises RuntimeError."""
+    docx_path = tmp_path / "broken.docx"
+    docx_path.write_bytes(b"not a zip file")
+
+    with pytest.raises(RuntimeError):
+        extract_text_from_docx(docx_path)
+
+
+def _write_pdf(path: Path, content: bytes) -> Path:
+    """Write a one-page PDF drawing content with Helvetica as /F1."""
+    from PyPDF2 import PdfWriter, PageObject
+    from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    page = PageObject.create_blank_page(width=612, height=792)
+    page[NameObject("/Resources")] = DictionaryObject(
+        {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+    )
+    stream = DecodedStreamObject()
+    stream.set_data(content)
+    page[NameObject("/Contents")] = stream
+
+    writer = PdfWriter()
+    writer.add_page(page)
+    writer.write(str(path))
+    return path
+
+
+def test_layout_pdf_extractor_reads_columns_in_order(tmp_path):
+    """Test a two-column page is read column by column, below a full-width header."""
+    from utils.pdf_extractor import extract_text_from_pdf_layout
+
+    operations = [b"BT /F1 16 Tf 50 740 Td (JANE DOE - Senior Data Engineer) Tj ET"]
+    for i in range(6):
+        # Drawn row by row across both columns, as many Word exports do
+        y = 700 - i * 16
+        operations.append(b"BT /F1 10 Tf 50 %d Td (Skill %d) Tj ET" % (y, i))
+        operations.append(
+            b"BT /F1 10 Tf 320 %d Td [(Led) -250 (project %d)] TJ ET" % (y, i)
+        )
+    pdf_path = _write_pdf(tmp_path / "columns.pdf", b"\n".join(operations))
+
+    lines = extract_text_from_pdf_layout(pdf_path).split("\n")
+
+    assert lines == (
+        ["JANE DOE - Senior Data Engineer"]
+        + [f"Skill {i}" for i in range(6)]
+        + [f"Led project {i}" for i in range(6)]
+    )
+
+
+def test_layout_pdf_extractor_keeps_single_column_lines(tmp_path):
+    """Test right-aligned dates stay on their line in a single-column page."""
+    from utils.pdf_extractor import extract_text_from_pdf_layout
+
+    operations = [
+        b"BT /F1 10 Tf 14 TL 50 700 Td (Senior Engineer, Acme) Tj ET",
+        b"BT /F1 10 Tf 480 700 Td (2020 - Present) Tj ET",
+        b"BT /F1 10 Tf 14 TL 50 686 Td",
+    ]
+    for i in range(6):
+        operations.append(
+            b"(Built and operated the streaming platform used by team %d) ' " % i
+        )
+    operations.append(b"ET")
+    pdf_path = _write_pdf(tmp_path / "single.pdf", b"\n".join(operations))
+
+    lines = extract_text_from_pdf_layout(pdf_path).split("\n")
+
+    assert lines[0] == "Senior Engineer, Acme 2020 - Present"
+    assert len(lines) == 7
+    assert lines[-1].endswith("team 5")
+
+
+def test_layout_pdf_extractor_resolves_indirect_objects(tmp_path):
+    """Test indirect resources, fonts and widths and split contents are read."""
+    from PyPDF2 import PdfWriter, PageObject
+    from PyPDF2.generic import (
+        ArrayObject,
+        DecodedStreamObject,
+        DictionaryObject,
+        NameObject,
+        NumberObject,
+    )
+
+    from utils.pdf_extractor import _layout_page_text
+
+    writer = PdfWriter()
+    widths = writer._add_object(ArrayObject([NumberObject(600)] * 95))
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Courier"),
+                NameObject("/FirstChar"): NumberObject(32),
+                NameObject("/LastChar"): NumberObject(126),
+                NameObject("/Widths"): widths,
+            }
+        )
+    )
+    fonts = writer._add_object(DictionaryObject({NameObject("/F1"): font}))
+    page = PageObject.create_blank_page(width=612, height=792)
+    page[NameObject("/Resources")] = writer._add_object(
+        DictionaryObject({NameObject("/Font"): fonts})
+    )
+
+    # pdfTeX and multi-stream exports split a page over an array of streams
+    streams = []
+    for content in (b"BT /F1 10 Tf 50 700 Td", b"(Jane Doe, LaTeX resume) Tj ET"):
+        stream = DecodedStreamObject()
+        stream.set_data(content)
+        streams.append(writer._add_object(stream))
+    page[NameObject("/Contents")] = ArrayObject(streams)
+
+    writer.add_page(page)
+    pdf_path = tmp_path / "indirect.pdf"
+    writer.write(str(pdf_path))
+
+    from PyPDF2 import PdfReader
+
+    reader_page = PdfReader(str(pdf_path)).pages[0]
+    assert _layout_page_text(reader_page) == "Jane Doe, LaTeX resume"
@@ -0,0 +1,81 @@
+"""Tests for map-reduce document summarization."""
+
+import asyncio
+
+import pytest
+
+from utils import document_summarizer
+from utils.app_config import AppConfig
+from utils.token_counter import count_tokens
+
+
+def _app_config(chunk_tokens: int = 300, max_concurrency: int = 2) -> AppConfig:
+    app_config = AppConfig()
+    app_config.document.summarizer.chunk_tokens = chunk_tokens
+    app_config.document.summarizer.max_concurrency = max_concurrency
+    return app_config
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_respects_concurrency_and_budget(monkeypatch):
+    """Test chunks are summarized concurrently under the cap and fit the budget."""
+    in_flight = 0
+    max_in_flight = 0
+    calls = []
+
+    async def fake_generate_summary(text, doc_type, stage="final", **kwargs):
+        nonlocal in_flight, max_in_flight
+        calls.append((stage, count_tokens(text)))
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return f"{stage} notes " * 10
+
+    monkeypatch.setattr(document_summarizer, "_generate_summary", fake_generate_summary)
+    text = "\n\n".join(
+        f"ROLE {i}\n" + "Led delivery of projects. " * 60 for i in range(8)
+    )
+
+    result = await document_summarizer.map_reduce_summarize(
+        text, "resume", app_config=_app_config()
+    )
+
+    map_calls = [tokens for stage, tokens in calls if stage == "map"]
+    assert len(map_calls) == result.stats.chunks > 1
+    assert all(tokens <= 300 for _, tokens in calls)
+    assert max_in_flight <= 2
+    assert calls[-1][0] == "final"
+    assert result.stats.llm_calls == len(calls)
+    assert {"split", "map", "reduce", "final"} <= set(result.stats.stage_latency_ms)
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_reduces_hierarchically(monkeypatch):
+    """Test notes that do not fit one prompt are merged over several levels."""
+
+    async def fake_generate_summary(text, doc_type, stage="final", **kwargs):
+        return "dense notes " * 60
+
+    monkeypatch.setattr(document_summarizer, "_generate_summary", fake_generate_summary)
+    text = "\n\n".join("Shipped features with Python and SQL. " * 50 for _ in range(16))
+
+    result = await document_summarizer.map_reduce_summarize(
+        text, "resume", app_config=_app_config()
+    )
+
+    assert result.stats.reduce_levels >= 2
+    assert result.text == "dense notes " * 60
+
+
+@pytest.mark.asyncio
+async def test_short_document_is_not_summarized(monkeypatch):
+    """Test documents under the token limit are returned unchanged."""
+
+    async def fail_generate_summary(*args, **kwargs):
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(document_summarizer, "_generate_summary", fail_generate_summary)
+
+    text = "Experienced Python Developer."
+    assert await document_summarizer.summarize_document(text, "resume") == text
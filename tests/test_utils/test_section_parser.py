@@ -0,0 +1,176 @@
+"""Tests for the resume and job description section parser."""
+
+from pathlib import Path
+
+import pytest
+
+from job_analyzer.external_api import llm_analysis
+from utils.document_extractor import extract_document_text_sync
+from utils.section_parser import (
+    compact_for_prompt,
+    find_date_ranges,
+    find_skills,
+    parse_sections,
+)
+
+TEST_FILES = Path(__file__).resolve().parents[1] / "test_files"
+
+JOB_DESCRIPTION = """Senior Python Developer
+Acme Analytics · Remote (EU)
+
+About Us
+Acme builds forecasting software for retailers.
+
+What you'll do
+• Design and build FastAPI services on AWS
+• Mentor two junior engineers
+
+Requirements
+• 5+ years of professional Python experience
+• Experience with PostgreSQL and Docker
+
+Nice to have
+• Kubernetes
+
+Benefits
+• 30 days of paid leave, home office budget, Kafka training
+
+Equal Opportunity Employer
+Acme is an equal opportunity employer and values diversity.
+"""
+
+
+@pytest.mark.parametrize("extension", ["txt", "pdf", "docx"])
+def test_parses_resume_fixtures(extension):
+    """Test every resume format yields the same section map."""
+    text = extract_document_text_sync(str(TEST_FILES / f"test_resume.{extension}"))
+    parsed = parse_sections(text)
+
+    assert list(parsed.sections) == [
+        "header",
+        "contact",
+        "summary",
+        "skills",
+        "experience",
+        "education",
+        "achievements",
+    ]
+    assert parsed.sections["header"] == "JANE DOE"
+    assert "jane.doe@email.com" in parsed.sections["contact"]
+    assert "Agile" in parsed.skills and "Time Management" in parsed.skills
+    assert [(d.section, d.start_year, d.end_year) for d in parsed.date_ranges] == [
+        ("experience", 2020, None),
+        ("experience", 2017, 2020),
+        ("education", 2013, 2017),
+    ]
+    # Lines wrapped by the PDF extractor are joined back
+    assert (
+        "Led a team of 15 engineers and designers in the successful launch of "
+        "three major software products, resulting in a 20% increase"
+    ) in parsed.sections["experience"]
+
+
+def test_parses_job_description():
+    """Test job description headings map to canonical sections."""
+    parsed = parse_sections(JOB_DESCRIPTION)
+
+    assert list(parsed.sections) == [
+        "header",
+        "about",
+        "responsibilities",
+        "requirements",
+        "preferred",
+        "benefits",
+        "equal_opportunity",
+    ]
+    assert parsed.sections["requirements"] == (
+        "- 5+ years of professional Python experience\n"
+        "- Experience with PostgreSQL and Docker"
+    )
+
+
+def test_compact_for_prompt_keeps_needed_sections():
+    """Test dropped sections are left out but their dictionary skills are kept."""
+    compact = compact_for_prompt(JOB_DESCRIPTION, llm_analysis.JD_ANALYSIS_SECTIONS)
+
+    assert "Senior Python Developer" in compact
+    assert "REQUIREMENTS\n- 5+ years" in compact
+    assert "paid leave" not in compact and "diversity" not in compact
+    assert compact.endswith("SKILLS MENTIONED ELSEWHERE\nKafka")
+
+
+def test_inline_label_of_dropped_section_stays_in_place():
+    """Test an inline "Responsibilities:" line in a job entry stays in experience."""
+    resume = (
+        "Jane Doe\nExperience\nSenior Engineer, Acme 2020 - Present\n"
+        "Responsibilities: Owned the billing platform and its on-call rota\n"
+        "Technologies: Kafka, Go\nEducation\nBSc Computer Science"
+    )
+
+    compact = compact_for_prompt(resume, llm_analysis.RESUME_REVIEW_SECTIONS)
+
+    assert (
+        "EXPERIENCE\nSenior Engineer, Acme 2020 - Present\n"
+        "Responsibilities: Owned the billing platform and its on-call rota"
+    ) in compact
+    assert "SKILLS\nTechnologies: Kafka, Go" in compact
+
+
+def test_compact_for_prompt_keeps_unstructured_text_whole():
+    """Test text without recognizable headings is sent whole."""
+    text = "Experienced Python developer.\nSkills: Python, Django"
+
+    assert compact_for_prompt(text, ["skills"]) == text
+
+
+def test_inline_heading_does_not_end_section():
+    """Test an inline "Heading: content" line does not capture the lines after it."""
+    parsed = parse_sections(
+        "Projects\nForecast API\nTechnologies: FastAPI, Redis\n"
+        "- Served 1M requests per day\nEducation\nBSc Computer Science"
+    )
+
+    assert parsed.sections["projects"] == "Forecast API\n- Served 1M requests per day"
+    assert parsed.sections["skills"] == "Technologies: FastAPI, Redis"
+
+
+def test_skill_and_date_matching():
+    """Test skills match on word boundaries and date ranges in several formats."""
+    assert find_skills("C++, Go and Node.js; going to React conf") == [
+        "Go",
+        "C++",
+        "React",
+        "Node.js",
+    ]
+    assert find_skills("we rest, then git commit in excel") == []
+
+    ranges = find_date_ranges("Jan 2019 - Mar 2021, 06/2015 to 2018, 2021 – Present")
+    assert [(d.start_year, d.end_year) for d in ranges] == [
+        (2019, 2021),
+        (2015, 2018),
+        (2021, None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_analysis_prompts_send_compacted_documents(monkeypatch):
+    """Test the analysis APIs send only the needed sections to the LLM."""
+    prompts = []
+
+    async def fake_call(prompt):
+        prompts.append(prompt)
+        return '{"role_title": "Senior Python Developer"}'
+
+    monkeypatch.setattr(llm_analysis, "_call_llm_for_analysis", fake_call)
+    monkeypatch.setattr(llm_analysis, "get_response_cache", lambda: None)
+    resume = (TEST_FILES / "test_resume.txt").read_text()
+
+    result = await llm_analysis.analyze_job_description_api(JOB_DESCRIPTION)
+    await llm_analysis.review_resume_api(resume)
+
+    assert result.role_title == "Senior Python Developer"
+    assert "<job_description>\nSenior Python Developer" in prompts[0]
+    assert "paid leave" not in prompts[0]
+    assert "JANE DOE" in prompts[1]
+    assert "jane.doe@email.com" not in prompts[1]
+    assert "Highly motivated" in prompts[1]  # the summary states 5+ years
@@ -0,0 +1,126 @@
+"""Tests for coalescing concurrent identical async calls."""
+
+import asyncio
+
+import pytest
+
+from utils import document_summarizer
+from utils.single_flight import SingleFlight
+from job_analyzer.external_api import llm_analysis
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_call():
+    """Test callers of a key in flight await the first caller's call."""
+    flights = SingleFlight("test")
+    started = []
+
+    async def call():
+        started.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(flights.do("jd", call) for _ in range(10)))
+
+    assert results == ["result"] * 10
+    assert len(started) == 1
+    assert (flights.calls, flights.shared, flights.in_flight) == (1, 9, 0)
+
+
+@pytest.mark.asyncio
+async def test_finished_and_different_calls_are_not_shared():
+    """Test a key starts a new call once the previous one finished."""
+    flights = SingleFlight("test")
+
+    async def call():
+        return "result"
+
+    await flights.do("a", call)
+    await flights.do("a", call)
+    await flights.do("b", call)
+
+    assert flights.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller():
+    """Test a failed call raises its exception to each waiting caller."""
+    flights = SingleFlight("test")
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("provider down")
+
+    results = await asyncio.gather(
+        *(flights.do("jd", call) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flights.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_shared_call():
+    """Test the other callers still get the result when the first is cancelled."""
+    flights = SingleFlight("test")
+
+    async def call():
+        await asyncio.sleep(0.02)
+        return "result"
+
+    first = asyncio.create_task(flights.do("jd", call))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(flights.do("jd", call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "result"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_jd_analyses_make_one_llm_call(monkeypatch):
+    """Test a batch analyzing the same JD at once calls the LLM once."""
+    calls = []
+
+    async def fake_call(prompt):
+        calls.append(prompt)
+        await asyncio.sleep(0.01)
+        return '{"role_title": "Senior Python Developer"}'
+
+    monkeypatch.setattr(llm_analysis, "_call_llm_for_analysis", fake_call)
+    monkeypatch.setattr(llm_analysis, "get_response_cache", lambda: None)
+
+    results = await asyncio.gather(
+        *(
+            llm_analysis.analyze_job_description_api("Senior Python Developer")
+            for _ in range(20)
+        )
+    )
+
+    assert len(calls) == 1
+    assert {r.role_title for r in results} == {"Senior Python Developer"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_summaries_make_one_llm_call(monkeypatch):
+    """Test the same text summarized concurrently calls the LLM once."""
+    calls = []
+
+    class FakeInference:
+        async def chat(self, messages):
+            calls.append(messages)
+            await asyncio.sleep(0.01)
+            return " Summary. "
+
+    monkeypatch.setattr(document_summarizer, "Inference", FakeInference)
+
+    summaries = await asyncio.gather(
+        *(
+            document_summarizer._generate_summary("Long JD", "job_description")
+            for _ in range(5)
+        ),
+        document_summarizer._generate_summary("Other JD", "job_description"),
+    )
+
+    assert summaries == ["Summary."] * 6
+    assert len(calls) == 2
@@ -0,0 +1,67 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from utils import text_compression
+from utils.app_config import TextStorageConfig
+from utils.text_compression import (
+    DecompressedTextCache,
+    compress_text,
+    decompress_text,
+)
+from job_analyzer.document_storage.models import UploadedDocument
+
+RESUME = (
+    "José Müller — Senior Backend Engineer\n"
+    "Zürich · München · 東京\n\n"
+    + "Built event-driven services with Kafka and Python; cut p99 latency by 40%.\n"
+    * 40
+)
+
+
+class TestTextCompression(TestCase):
+    """Test cases for compressed text storage."""
+
+    def test_round_trip_with_each_codec(self):
+        """Test text survives compression with zstd, zlib and raw storage."""
+        for codec in ("zstd", "zlib"):
+            with patch.object(
+                text_compression, "_config", TextStorageConfig(codec=codec)
+            ):
+                blob = compress_text(RESUME)
+                self.assertLess(len(blob), len(RESUME.encode("utf-8")) / 4)
+                self.assertEqual(decompress_text(blob), RESUME)
+
+        short = compress_text("Ünïcode")
+        self.assertTrue(short.startswith(text_compression.CODEC_RAW))
+        self.assertEqual(decompress_text(short), "Ünïcode")
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test the decompressed cache keeps only the most recently read texts."""
+        cache = DecompressedTextCache(max_entries=2)
+        blobs = {key: compress_text(key * 300) for key in "abc"}
+
+        for key in "abba":
+            self.assertEqual(cache.get(key, blobs[key]), key * 300)
+        cache.get("c", blobs["c"])  # evicts b, the least recently used
+        cache.get("a", blobs["a"])
+        cache.get("b", blobs["b"])
+
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 4)
+
+    def test_document_holds_compressed_text(self):
+        """Test documents keep only the blob and decompress on access."""
+        document = UploadedDocument(
+            id="doc-1",
+            file_hash="hash-1",
+            original_filename="resume.txt",
+            file_type="resume",
+            file_format="txt",
+            extracted_text=RESUME,
+        )
+
+        self.assertNotIn("extracted_text", document.__dict__)
+        self.assertEqual(document.text_length, len(RESUME))
+        self.assertLess(document.storage_bytes, len(RESUME))
+        self.assertEqual(document.extracted_text, RESUME)
+        self.assertEqual(document.analysis_text, RESUME)
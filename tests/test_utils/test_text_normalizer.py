@@ -0,0 +1,77 @@
+"""Tests for extracted text normalization."""
+
+from utils.app_config import NormalizerConfig
+from utils.section_parser import find_date_ranges
+from utils.text_normalizer import PAGE_BREAK, normalize_text, shorten_url
+
+PAGES = [
+    "ACME Corp — Senior Data Engineer\nPosted 2024\n\nResponsibilities\n"
+    "Build and main-\ntain data pipelines.\n\nConfidential · Page 1 of 3",
+    "ACME Corp — Senior Data Engineer\nRequirements\nPython and SQL.\n"
+    "Apply at https://www.acme.example/jobs/42/?utm_source=board&id=7\n\n"
+    "Confidential · Page 2 of 3",
+    "ACME Corp — Senior Data Engineer\nBenefits\nRemote   first,  " "4 day week .\n\n3",
+]
+
+
+def test_removes_running_headers_and_footers():
+    """Test lines repeated on page edges are kept once and page numbers dropped."""
+    result = normalize_text(PAGE_BREAK.join(PAGES), NormalizerConfig())
+    text = result.text
+
+    assert text.count("ACME Corp — Senior Data Engineer") == 1
+    assert text.startswith("ACME Corp — Senior Data Engineer")
+    assert text.count("Confidential") == 1
+    assert "\n3" not in text
+    assert PAGE_BREAK not in text
+    assert result.stats.repeated_lines_removed == 4
+
+
+def test_joins_hyphenation_and_collapses_whitespace():
+    """Test broken words are joined and spacing is tidied."""
+    text = normalize_text(PAGE_BREAK.join(PAGES), NormalizerConfig()).text
+
+    assert "maintain data pipelines." in text
+    assert "Remote first, 4 day week." in text
+    assert "\n\n\n" not in text
+
+
+def test_keeps_hyphen_of_open_ended_date_range():
+    """Test a date range broken after its hyphen is not joined like a word."""
+    text = normalize_text(
+        "Senior Engineer, Acme 2019-\npresent", NormalizerConfig()
+    ).text
+
+    assert find_date_ranges(text)[0].start_year == 2019
+    assert find_date_ranges(text)[0].end_year is None
+
+
+def test_shortens_urls_and_drops_redundant_links():
+    """Test URLs lose noise and link annotations repeating the text are dropped."""
+    text = (
+        "Jane Doe | linkedin.com/in/jane-doe | jane@example.com\n"
+        "[Link: https://www.linkedin.com/in/jane-doe/]\n"
+        "[Link: mailto:jane@example.com]\n"
+        "[Link: https://github.com/janedoe?trk=profile]\n"
+        "[Link: https://github.com/janedoe]"
+    )
+    result = normalize_text(text, NormalizerConfig())
+
+    assert result.text == (
+        "Jane Doe | linkedin.com/in/jane-doe | jane@example.com\n"
+        "[Link: github.com/janedoe]"
+    )
+    assert result.stats.links_removed == 3
+    assert result.stats.tokens_saved > 0
+    assert shorten_url("https://acme.example/jobs?id=7&utm_medium=x#apply") == (
+        "acme.example/jobs?id=7"
+    )
+
+
+def test_disabled_only_replaces_page_breaks():
+    """Test the raw text is kept when normalization is disabled."""
+    raw = PAGE_BREAK.join(PAGES)
+    result = normalize_text(raw, NormalizerConfig(enabled=False))
+
+    assert result.text == raw.replace(PAGE_BREAK, "\n\n")
+    assert result.stats.tokens_saved == 0
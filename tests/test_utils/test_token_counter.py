@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from utils.token_counter import count_tokens, split_text_by_tokens, truncate_to_tokens
+
+
+class TestTokenCounter(TestCase):
+    """Test cases for token counting and token-budgeted splitting."""
+
+    def test_count_tokens(self):
+        """Test token counts are positive and grow with text length."""
+        self.assertEqual(count_tokens(""), 0)
+        short = count_tokens("Senior Python Developer")
+        self.assertGreater(short, 0)
+        self.assertGreater(count_tokens("Senior Python Developer " * 10), short)
+
+    def test_split_respects_budget(self):
+        """Test every chunk fits the token budget and no text is lost."""
+        sections = [
+            f"SECTION {i}\n" + "Built APIs with FastAPI. " * 40 for i in range(6)
+        ]
+        text = "\n\n".join(sections)
+
+        chunks = split_text_by_tokens(text, 120)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(count_tokens(chunk), 120)
+        self.assertEqual(" ".join(chunks).split(), text.split())
+
+    def test_split_prefers_section_boundaries(self):
+        """Test small sections are packed together without being broken up."""
+        text = "EXPERIENCE\nAcme\n\nEDUCATION\nState University\n\nSKILLS\nPython"
+
+        self.assertEqual(split_text_by_tokens(text, 1000), [text])
+        self.assertEqual(
+            split_text_by_tokens(text, count_tokens("EDUCATION\nState University")),
+            ["EXPERIENCE\nAcme", "EDUCATION\nState University", "SKILLS\nPython"],
+        )
+
+    def test_truncate_to_tokens(self):
+        """Test truncation keeps the beginning of the text within budget."""
+        text = "word " * 500
+
+        truncated = truncate_to_tokens(text, 50)
+
+        self.assertLessEqual(count_tokens(truncated), 50)
+        self.assertTrue(text.startswith(truncated))